@@ -54,7 +54,7 @@ setup(
     include_package_data=True,
     
     # Python sürüm gereksinimleri
-    python_requires=">=3.8",
+    python_requires=">=3.9",
     
     # Temel bağımlılıklar
     install_requires=[
@@ -123,7 +123,6 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
         "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
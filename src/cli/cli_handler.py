@@ -9,28 +9,45 @@ PDF işlemleri için komut satırı arayüzü
 import os
 import sys
 import json
+import time
 import click
 from pathlib import Path
-from typing import List, Optional, Dict, Any
-
-# PDF işleme kütüphaneleri - gerçek implementasyon için
-try:
-    import PyPDF2
-    import pypdf
-    from reportlab.pdfgen import canvas
-    from reportlab.lib.pagesizes import letter
-except ImportError as e:
-    print(f"Uyarı: PDF kütüphaneleri yüklenmedi: {e}")
+from typing import TYPE_CHECKING, List, Optional, Dict, Any
 
 from pypdf_tools._version import __version__, APP_NAME
+from pypdf_tools.core.engines import engine_names
+from pypdf_tools.core.metrics import format_size
+
+# İşlem modülleri PDF kütüphanelerini yükler; `pypdf --help` gibi
+# komutların hızlı açılması için her komut kendi modülünü içe aktarır
+if TYPE_CHECKING:
+    from pypdf_tools.core.cache import DocumentCache
+
+# core.text.TEXT_FORMATS ile aynı; modül yalnızca extract-text'te yüklenir
+TEXT_FORMATS = ('txt', 'json', 'ndjson', 'csv')
+
+
+class CommandGroup(click.Group):
+    """Ayrıştırılan komut satırını daemon'a iletmek için saklayan grup"""
 
+    def parse_args(self, ctx: click.Context, args: List[str]) -> List[str]:
+        ctx.meta['pypdf.argv'] = list(args)
+        return super().parse_args(ctx, args)
 
-@click.group()
+
+@click.group(cls=CommandGroup)
 @click.version_option(version=__version__, prog_name=APP_NAME)
 @click.option('--verbose', '-v', is_flag=True, help='Ayrıntılı çıktı göster')
 @click.option('--config', '-c', type=click.Path(), help='Yapılandırma dosyası yolu')
+@click.option('--no-cache', is_flag=True,
+              help='Metin ve metadata önbelleğini kullanma')
+@click.option('--engine', type=click.Choice(engine_names()),
+              help='PDF okuma motoru (varsayılan: ilk kurulu motor)')
+@click.option('--connect', metavar='SOCKET', envvar='PYPDF_DAEMON_SOCKET',
+              help='Komutu `pypdf serve` daemon\'ında çalıştır')
 @click.pass_context
-def cli(ctx, verbose: bool, config: Optional[str]):
+def cli(ctx, verbose: bool, config: Optional[str], no_cache: bool,
+        engine: Optional[str], connect: Optional[str]):
     """
     PyPDF-Tools - Hibrit PDF yönetim ve düzenleme uygulaması
     
@@ -39,8 +56,21 @@ def cli(ctx, verbose: bool, config: Optional[str]):
     """
     # Context objesini oluştur
     ctx.ensure_object(dict)
+
+    if connect and ctx.invoked_subcommand != 'serve' and not ctx.obj.get('daemon_worker'):
+        from pypdf_tools.cli.daemon import forward_command
+        exit_code = forward_command(connect, ctx.meta['pypdf.argv'], ctx.info_name)
+        if exit_code is not None:
+            ctx.exit(exit_code)
+        # Daemon çalışmıyorsa komut yerelde çalıştırılır
+
     ctx.obj['verbose'] = verbose
     ctx.obj['config'] = config
+    ctx.obj['cache'] = not no_cache
+
+    if engine:
+        # İşçi süreçleri de aynı motoru kullansın diye ortam üzerinden aktarılır
+        os.environ['PYPDF_ENGINE'] = engine
     
     if verbose:
         click.echo(f"{APP_NAME} v{__version__} - CLI Modu")
@@ -72,6 +102,9 @@ def merge(ctx, input_files: tuple, output: str, bookmarks: bool):
             if ctx.obj['verbose']:
                 click.echo(f"  Toplam sayfa: {result.get('total_pages', 'bilinmiyor')}")
                 click.echo(f"  Dosya boyutu: {result.get('file_size', 'bilinmiyor')}")
+                click.echo(f"  Tekilleştirilen nesne: {result.get('deduplicated_objects', 0)}")
+                click.echo(f"  Hız: {result.get('pages_per_second', 0):.1f} sayfa/sn")
+                click.echo(f"  Tepe bellek (RSS): {format_size(result.get('peak_rss'))}")
         else:
             click.echo(f"Hata: {result.get('error', 'Bilinmeyen hata')}", err=True)
             sys.exit(1)
@@ -89,9 +122,11 @@ def merge(ctx, input_files: tuple, output: str, bookmarks: bool):
               help='Sayfa aralığı (örn: 1-5, 3,7,9-12)')
 @click.option('--prefix', default='page_',
               help='Çıktı dosya öneki')
+@click.option('--jobs', '-j', type=click.IntRange(min=1),
+              help='Paralel işçi sayısı (varsayılan: çekirdek sayısı)')
 @click.pass_context
 def split(ctx, input_file: str, output_dir: Optional[str], 
-          page_range: Optional[str], prefix: str):
+          page_range: Optional[str], prefix: str, jobs: Optional[int]):
     """
     PDF dosyasını sayfalara veya belirtilen aralıklara böl.
     
@@ -99,6 +134,7 @@ def split(ctx, input_file: str, output_dir: Optional[str],
     pypdf split document.pdf -d ./pages/
     pypdf split document.pdf -r 1-10 -o first_10_pages.pdf
     pypdf split document.pdf -r 1,3,5-7 --prefix chapter_
+    pypdf split document.pdf -d ./pages/ --jobs 4
     """
     input_path = Path(input_file)
     
@@ -112,14 +148,16 @@ def split(ctx, input_file: str, output_dir: Optional[str],
         if page_range:
             # Belirtilen aralıkları böl
             result = split_pdf_range(input_file, str(output_dir), 
-                                   page_range, prefix)
+                                   page_range, prefix, jobs=jobs)
         else:
             # Her sayfayı ayrı dosya yap
-            result = split_pdf_pages(input_file, str(output_dir), prefix)
+            result = split_pdf_pages(input_file, str(output_dir), prefix, jobs=jobs)
         
         if result['success']:
             click.echo(f"✓ PDF başarıyla bölündü: {result['files_created']} dosya oluşturuldu")
             if ctx.obj['verbose']:
+                click.echo(f"  İşçi sayısı: {result.get('jobs', 1)}")
+                click.echo(f"  Hız: {result.get('pages_per_second', 0):.1f} sayfa/sn")
                 for file_info in result.get('files', []):
                     click.echo(f"  - {file_info['name']}: {file_info['pages']} sayfa")
         else:
@@ -132,24 +170,44 @@ def split(ctx, input_file: str, output_dir: Optional[str],
 
 
 @cli.command()
-@click.argument('input_file', type=click.Path(exists=True))
+@click.argument('input_file', type=click.Path(exists=True), required=False)
 @click.option('--output', '-o', type=click.Path(),
               help='Çıktı dosyası (varsayılan: input_encrypted.pdf)')
-@click.option('--password', '-p', prompt=True, hide_input=True,
+@click.option('--password', '-p', hide_input=True,
               help='Şifre')
-@click.option('--owner-password', prompt=True, hide_input=True,
+@click.option('--owner-password', hide_input=True,
               help='Sahip şifresi')
 @click.option('--permissions', type=click.Choice(['print', 'modify', 'copy', 'annotate']),
               multiple=True, help='İzinler')
+@click.option('--batch', 'manifest', type=click.Path(exists=True, dir_okay=False),
+              help='Toplu şifreleme listesi (CSV: input,output,password,owner_password,permissions)')
+@click.option('--jobs', '-j', type=click.IntRange(min=1),
+              help='Toplu modda paralel işçi sayısı (varsayılan: çekirdek sayısı)')
 @click.pass_context
-def encrypt(ctx, input_file: str, output: Optional[str], password: str,
-           owner_password: str, permissions: tuple):
+def encrypt(ctx, input_file: Optional[str], output: Optional[str], password: Optional[str],
+           owner_password: Optional[str], permissions: tuple, manifest: Optional[str],
+           jobs: Optional[int]):
     """
-    PDF dosyasını şifrele ve izinleri ayarla.
+    PDF dosyasını AES-256 ile şifrele ve izinleri ayarla.
+    
+    Toplu modda manifest'te şifresi veya izinleri belirtilmeyen satırlar
+    için komut satırındaki değerler kullanılır.
     
     Örnek:
     pypdf encrypt document.pdf -o secure_document.pdf --permissions print copy
+    pypdf encrypt --batch manifest.csv --jobs 8
     """
+    if manifest:
+        encrypt_pdf_batch(ctx, manifest, password, owner_password, list(permissions), jobs)
+        return
+
+    if not input_file:
+        raise click.UsageError("INPUT_FILE veya --batch gerekli")
+    if password is None:
+        password = click.prompt('Password', hide_input=True)
+    if owner_password is None:
+        owner_password = click.prompt('Owner password', hide_input=True)
+
     if not output:
         input_path = Path(input_file)
         output = str(input_path.with_stem(f"{input_path.stem}_encrypted"))
@@ -161,6 +219,7 @@ def encrypt(ctx, input_file: str, output: Optional[str], password: str,
         if result['success']:
             click.echo(f"✓ PDF başarıyla şifrelendi: {output}")
             if ctx.obj['verbose']:
+                click.echo(f"  Algoritma: {result.get('algorithm', 'AES-256')}")
                 click.echo(f"  İzinler: {', '.join(permissions) or 'Yok'}")
         else:
             click.echo(f"Hata: {result.get('error', 'Bilinmeyen hata')}", err=True)
@@ -171,6 +230,42 @@ def encrypt(ctx, input_file: str, output: Optional[str], password: str,
         sys.exit(1)
 
 
+def encrypt_pdf_batch(ctx, manifest: str, password: Optional[str],
+                      owner_password: Optional[str], permissions: List[str],
+                      jobs: Optional[int]):
+    """Manifest'teki dosyaları paralel şifrele ve satır satır raporla"""
+    from pypdf_tools.core.encryption import batch_summary, encrypt_batch, read_manifest
+
+    started = time.perf_counter()
+    results = []
+
+    try:
+        entries = read_manifest(manifest)
+        for result in encrypt_batch(entries, jobs=jobs, password=password,
+                                    owner_password=owner_password,
+                                    permissions=permissions):
+            results.append({key: result[key] for key in ('success', 'pages')
+                            if key in result})
+            if result['success']:
+                click.echo(f"✓ {result['output']}")
+            else:
+                click.echo(f"✗ {result['input']} (satır {result['line']}): "
+                           f"{result['error']}", err=True)
+    except (OSError, ValueError) as e:
+        click.echo(f"Toplu şifreleme hatası: {str(e)}", err=True)
+        sys.exit(1)
+
+    summary = batch_summary(results, time.perf_counter() - started)
+    click.echo(f"✓ {summary['files'] - summary['errors']} dosya şifrelendi, "
+               f"{summary['errors']} hata ({summary['files_per_second']:.1f} dosya/sn)")
+    if ctx.obj['verbose']:
+        click.echo(f"  Toplam sayfa: {summary['pages']}")
+        click.echo(f"  Süre: {summary['elapsed']:.2f} sn")
+
+    if summary['errors']:
+        sys.exit(1)
+
+
 @cli.command()
 @click.argument('input_file', type=click.Path(exists=True))
 @click.option('--output', '-o', type=click.Path(),
@@ -209,64 +304,86 @@ def decrypt(ctx, input_file: str, output: Optional[str], password: str):
               help='Çıktı metin dosyası')
 @click.option('--pages', '-p', 
               help='Belirtilen sayfalar (örn: 1-5, 3,7,9-12)')
-@click.option('--format', '-f', type=click.Choice(['txt', 'json', 'csv']),
+@click.option('--format', '-f', type=click.Choice(list(TEXT_FORMATS)),
               default='txt', help='Çıktı formatı')
+@click.option('--jobs', '-j', type=click.IntRange(min=1), default=1,
+              help='Paralel işçi sayısı (varsayılan: 1)')
 @click.pass_context
 def extract_text(ctx, input_file: str, output: Optional[str], 
-                pages: Optional[str], format: str):
+                pages: Optional[str], format: str, jobs: int):
     """
     PDF'den metin çıkar.
     
+    Sayfalar çıkarıldıkça yazılır; büyük belgelerde bellek kullanımı
+    tek sayfa ile sınırlıdır.
+    
     Örnekler:
     pypdf extract-text document.pdf
     pypdf extract-text document.pdf -p 1-10 -f json -o extracted.json
+    pypdf extract-text document.pdf -f ndjson -o pages.ndjson
+    pypdf extract-text large.pdf --jobs 8 -o large.txt
     """
+    from pypdf_tools.core.text import PageTextStream, write_page_text
+
+    document_cache = open_document_cache(ctx)
     try:
-        result = extract_pdf_text(input_file, pages, format)
-        
-        if result['success']:
+        with PageTextStream(input_file, pages, jobs=jobs,
+                            cache=document_cache) as page_stream:
             if output:
-                # Dosyaya yaz
-                output_path = Path(output)
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    if format == 'json':
-                        json.dump(result['text'], f, ensure_ascii=False, indent=2)
-                    else:
-                        f.write(result['text'])
+                # Dosyaya sayfa sayfa yaz
+                newline = '' if format == 'csv' else None
+                with open(output, 'w', encoding='utf-8', newline=newline) as f:
+                    result = write_page_text(page_stream, f, format)
                 click.echo(f"✓ Metin çıkarıldı: {output}")
             else:
-                # Konsola yazdır
-                if format == 'json':
-                    click.echo(json.dumps(result['text'], ensure_ascii=False, indent=2))
-                else:
-                    click.echo(result['text'])
-                    
-            if ctx.obj['verbose']:
-                click.echo(f"  İşlenen sayfa sayısı: {result.get('pages_processed', 0)}")
-                click.echo(f"  Toplam karakter: {len(str(result['text']))}")
-        else:
-            click.echo(f"Hata: {result.get('error', 'Bilinmeyen hata')}", err=True)
-            sys.exit(1)
-            
+                # Konsola sayfa sayfa yaz
+                result = write_page_text(page_stream, click.get_text_stream('stdout'),
+                                         format)
+
+        if ctx.obj['verbose']:
+            click.echo(f"  İşlenen sayfa sayısı: {result['pages_processed']}", err=True)
+            click.echo(f"  Toplam karakter: {result['characters']}", err=True)
+            click.echo(f"  İşçi sayısı: {jobs}", err=True)
+            echo_cache_counters(document_cache)
+
+    except (PermissionError, ValueError) as e:
+        click.echo(f"Hata: {str(e)}", err=True)
+        sys.exit(1)
     except Exception as e:
         click.echo(f"Metin çıkarma hatası: {str(e)}", err=True)
         sys.exit(1)
+    finally:
+        if document_cache is not None:
+            document_cache.close()
 
 
 @cli.command()
 @click.argument('input_file', type=click.Path(exists=True))
 @click.option('--format', '-f', type=click.Choice(['json', 'yaml', 'txt']),
               default='json', help='Çıktı formatı')
+@click.option('--recursive', '-r', is_flag=True,
+              help='Dizin verilirse alt dizinleri de tara')
+@click.option('--jobs', '-j', type=click.IntRange(min=1),
+              help='Dizin taramasında paralel işçi sayısı (varsayılan: çekirdek sayısı)')
 @click.pass_context
-def info(ctx, input_file: str, format: str):
+def info(ctx, input_file: str, format: str, recursive: bool, jobs: Optional[int]):
     """
     PDF dosyası hakkında bilgi göster.
     
+    Dizin verilirse içindeki tüm PDF'ler taranır ve her dosya için bir
+    JSON satırı (NDJSON) yazılır. Hatalı dosyalar taramayı durdurmaz.
+    
     Örnek:
     pypdf info document.pdf --format yaml
+    pypdf info --recursive ./arsiv/ --jobs 8 > arsiv.ndjson
     """
+    if Path(input_file).is_dir():
+        scan_pdf_directory(ctx, input_file, recursive, jobs)
+        return
+
+    document_cache = open_document_cache(ctx)
     try:
-        result = get_pdf_info(input_file)
+        result = get_pdf_info(input_file, cache=document_cache)
         
         if result['success']:
             info_data = result['info']
@@ -286,6 +403,9 @@ def info(ctx, input_file: str, format: str):
                 click.echo("-" * 40)
                 for key, value in info_data.items():
                     click.echo(f"{key.capitalize()}: {value}")
+
+            if ctx.obj['verbose']:
+                echo_cache_counters(document_cache)
         else:
             click.echo(f"Hata: {result.get('error', 'Bilinmeyen hata')}", err=True)
             sys.exit(1)
@@ -293,109 +413,353 @@ def info(ctx, input_file: str, format: str):
     except Exception as e:
         click.echo(f"Bilgi alma hatası: {str(e)}", err=True)
         sys.exit(1)
+    finally:
+        if document_cache is not None:
+            document_cache.close()
+
+
+def scan_pdf_directory(ctx, directory: str, recursive: bool, jobs: Optional[int]):
+    """Dizindeki PDF'lerin bilgilerini NDJSON olarak akıt"""
+    from pypdf_tools.core.scan import DirectoryScanner
+
+    scanner = DirectoryScanner(directory, recursive=recursive, jobs=jobs)
+
+    try:
+        for record in scanner:
+            click.echo(json.dumps(record, ensure_ascii=False, default=str))
+    except OSError as e:
+        click.echo(f"Tarama hatası: {str(e)}", err=True)
+        sys.exit(1)
 
+    # Özet stderr'e yazılır; stdout yalnızca NDJSON kayıtlarını içerir
+    summary = scanner.summary()
+    click.echo(
+        f"✓ {summary['files']} dosya tarandı, {summary['errors']} hata "
+        f"({summary['files_per_second']:.1f} dosya/sn, "
+        f"{summary['mb_per_second']:.1f} MB/sn)",
+        err=True
+    )
+    if ctx.obj['verbose']:
+        click.echo(f"  Toplam boyut: {format_size(summary['bytes'])}", err=True)
+        click.echo(f"  Süre: {summary['elapsed']:.2f} sn", err=True)
+        click.echo(f"  İşçi sayısı: {scanner.jobs}", err=True)
+
+
+@cli.command()
+@click.argument('pipeline_file', type=click.Path(exists=True, dir_okay=False),
+                required=False)
+@click.option('--jobs', '-j', type=click.IntRange(min=1),
+              help='Aynı anda işlenecek belge sayısı (varsayılan: dosyadaki jobs '
+                   'veya çekirdek sayısı)')
+@click.option('--report', type=click.Path(dir_okay=False),
+              help='Aşama sürelerini JSON rapor olarak yaz')
+@click.pass_context
+def run(ctx, pipeline_file: Optional[str], jobs: Optional[int], report: Optional[str]):
+    """
+    İşlem hattı dosyasındaki aşamaları belgeler üzerinde çalıştır.
+    
+    Her belge bir kez açılır; birleştirme, sayfa seçimi, şifreleme ve
+    metin çıkarma aşamaları ara dosya yazmadan birbirine bağlanır.
+    Dosya verilmezse --config ile verilen dosya kullanılır.
+    
+    Örnekler:
+    pypdf run pipeline.yaml --jobs 4
+    pypdf --config pipeline.yaml run --report timings.json
+    """
+    from pypdf_tools.core.pipeline import load_pipeline, pipeline_report, run_pipeline
 
-# Yardımcı fonksiyonlar - gerçek implementasyon gerekir
+    pipeline_file = pipeline_file or ctx.obj.get('config')
+    if not pipeline_file:
+        raise click.UsageError("PIPELINE_FILE veya --config gerekli")
+
+    started = time.perf_counter()
+    results = []
+    try:
+        pipeline = load_pipeline(pipeline_file)
+        for result in run_pipeline(pipeline, jobs=jobs):
+            results.append(result)
+            if result['success']:
+                click.echo(f"✓ {result['name']} ({result['elapsed']:.2f} sn)")
+            else:
+                click.echo(f"✗ {result['name']}: {result['error']}", err=True)
+            if ctx.obj['verbose']:
+                for stage in result['stages']:
+                    click.echo(f"  {stage['id']} [{stage['op']}]: {stage['pages']} sayfa, "
+                               f"{stage['seconds'] * 1000:.1f} ms")
+    except (OSError, ValueError) as e:
+        click.echo(f"İşlem hattı hatası: {str(e)}", err=True)
+        sys.exit(1)
+
+    summary = pipeline_report(results, time.perf_counter() - started)
+    click.echo(f"✓ {summary['documents'] - summary['errors']} belge işlendi, "
+               f"{summary['errors']} hata ({summary['elapsed']:.2f} sn)")
+    for op, totals in summary['operations'].items():
+        click.echo(f"  {op}: {totals['count']} aşama, {totals['seconds']:.2f} sn")
+
+    if report:
+        with open(report, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2, ensure_ascii=False, default=str)
+
+    if summary['errors']:
+        sys.exit(1)
+
+
+@cli.command()
+@click.option('--socket', 'socket_path', type=click.Path(dir_okay=False), required=True,
+              help='Dinlenecek Unix soket yolu')
+@click.option('--workers', '-j', type=click.IntRange(min=1),
+              help='Sıcak işçi süreci sayısı (varsayılan: çekirdek sayısı)')
+@click.pass_context
+def serve(ctx, socket_path: str, workers: Optional[int]):
+    """
+    Komutları sıcak işçi süreçlerinde çalıştıran daemon'u başlat.
+    
+    İstemciler --connect (veya PYPDF_DAEMON_SOCKET) ile aynı komutları
+    daemon'a iletir; çıktı ve çıkış kodu değişmez. Daemon şifreyi
+    terminalden soramaz: şifreyi seçenekle veya stdin'den verin.
+    Daemon'a bağlanılamazsa komut yerelde çalışır.
+    
+    Örnek:
+    pypdf serve --socket /run/pypdf.sock --workers 4
+    pypdf --connect /run/pypdf.sock info document.pdf
+    """
+    import socket
+
+    if not hasattr(socket, 'AF_UNIX'):
+        click.echo("Hata: Daemon modu Unix soketleri gerektirir", err=True)
+        sys.exit(1)
+
+    from pypdf_tools.cli.daemon import PDFDaemon
+
+    try:
+        daemon = PDFDaemon(socket_path, workers)
+    except OSError as e:
+        click.echo(f"Daemon hatası: {str(e)}", err=True)
+        sys.exit(1)
+
+    click.echo(f"✓ Daemon dinliyor: {socket_path} ({daemon.workers} işçi)", err=True)
+    try:
+        daemon.serve_until_stopped()
+    finally:
+        daemon.server_close()
+
+    click.echo(f"✓ Daemon durduruldu ({daemon.requests} istek işlendi)", err=True)
+
+
+@cli.group()
+def cache():
+    """
+    Metin ve metadata önbelleğini yönet.
+    
+    Örnekler:
+    pypdf cache stats
+    pypdf cache clear
+    """
+
+
+@cache.command('stats')
+def cache_stats():
+    """Önbellek istatistiklerini göster."""
+    import sqlite3
+    from pypdf_tools.core.cache import DocumentCache
+
+    try:
+        with DocumentCache() as document_cache:
+            stats = document_cache.stats()
+    except (OSError, sqlite3.Error) as e:
+        click.echo(f"Önbellek hatası: {str(e)}", err=True)
+        sys.exit(1)
+
+    click.echo(f"Konum: {stats['path']}")
+    click.echo(f"Belge sayısı: {stats['documents']}")
+    click.echo(f"Sayfa sayısı: {stats['pages']}")
+    click.echo(f"Karo sayısı: {stats['tiles']}")
+    click.echo(f"Küçük resim paketi: {stats['thumbnail_packs']}")
+    click.echo(f"Aranabilir sayfa: {stats['search_pages']}")
+    click.echo(f"Boyut: {format_size(stats['bytes'])} / {format_size(stats['max_bytes'])}")
+    click.echo(f"Disk kullanımı: {format_size(stats['disk_bytes'])}")
+
+
+@cache.command('clear')
+def cache_clear():
+    """Önbellekteki tüm kayıtları sil."""
+    import sqlite3
+    from pypdf_tools.core.cache import DocumentCache
+
+    try:
+        with DocumentCache() as document_cache:
+            document_cache.clear()
+    except (OSError, sqlite3.Error) as e:
+        click.echo(f"Önbellek hatası: {str(e)}", err=True)
+        sys.exit(1)
+
+    click.echo("✓ Önbellek temizlendi")
+
+
+def open_document_cache(ctx) -> Optional['DocumentCache']:
+    """--no-cache verilmediyse kalıcı önbelleği hazırla"""
+    if not ctx.obj.get('cache', True):
+        return None
+
+    from pypdf_tools.core.cache import DocumentCache
+    return DocumentCache()
+
+
+def echo_cache_counters(document_cache: Optional['DocumentCache']):
+    """Önbellek isabet/ıskalama sayılarını yaz"""
+    if document_cache is None:
+        click.echo("  Önbellek: kapalı", err=True)
+    else:
+        click.echo(f"  Önbellek: {document_cache.hits} isabet, "
+                   f"{document_cache.misses} ıskalama", err=True)
+
+
+# Yardımcı fonksiyonlar - komutları core motorlarına bağlar
 
 def merge_pdfs(input_files: List[str], output: str, 
                keep_bookmarks: bool = False) -> Dict[str, Any]:
     """PDF birleştirme implementasyonu"""
-    # Geçici implementasyon - PyPDF2 kullanılmalı
+    from pypdf_tools.core.merge import merge_documents
+
+    try:
+        stats = merge_documents(input_files, output, keep_bookmarks=keep_bookmarks)
+    except PermissionError as e:
+        return {'success': False, 'error': str(e)}
+
     return {
         'success': True,
-        'total_pages': len(input_files) * 10,  # Placeholder
-        'file_size': '1.2 MB'  # Placeholder
+        'total_pages': stats['total_pages'],
+        'file_size': format_size(stats['file_size']),
+        'deduplicated_objects': stats['deduplicated_objects'],
+        'pages_per_second': stats['pages_per_second'],
+        'peak_rss': stats['peak_rss'],
     }
 
 
 def split_pdf_pages(input_file: str, output_dir: str, 
-                   prefix: str) -> Dict[str, Any]:
+                   prefix: str, jobs: Optional[int] = None) -> Dict[str, Any]:
     """PDF sayfa bölme implementasyonu"""
-    # Geçici implementasyon
-    return {
-        'success': True,
-        'files_created': 10,
-        'files': [
-            {'name': f'{prefix}001.pdf', 'pages': 1},
-            {'name': f'{prefix}002.pdf', 'pages': 1},
-        ]
-    }
+    from pypdf_tools.core.split import split_pages
+
+    try:
+        result = split_pages(input_file, output_dir, prefix, jobs=jobs)
+    except PermissionError as e:
+        return {'success': False, 'error': str(e)}
+
+    return {'success': True, **result}
 
 
 def split_pdf_range(input_file: str, output_dir: str, 
-                   page_range: str, prefix: str) -> Dict[str, Any]:
+                   page_range: str, prefix: str,
+                   jobs: Optional[int] = None) -> Dict[str, Any]:
     """PDF aralık bölme implementasyonu"""
-    # Geçici implementasyon
-    return {
-        'success': True,
-        'files_created': 3,
-        'files': [
-            {'name': f'{prefix}1-5.pdf', 'pages': 5},
-            {'name': f'{prefix}6-10.pdf', 'pages': 5},
-        ]
-    }
+    from pypdf_tools.core.split import split_ranges
+
+    try:
+        result = split_ranges(input_file, output_dir, page_range, prefix, jobs=jobs)
+    except (PermissionError, ValueError) as e:
+        return {'success': False, 'error': str(e)}
+
+    return {'success': True, **result}
 
 
 def encrypt_pdf(input_file: str, output: str, password: str, 
                owner_password: str, permissions: List[str]) -> Dict[str, Any]:
     """PDF şifreleme implementasyonu"""
-    # Geçici implementasyon
-    return {'success': True}
+    from pypdf_tools.core.encryption import encrypt_document
+
+    try:
+        stats = encrypt_document(input_file, output, password,
+                                 owner_password or None, permissions)
+    except (PermissionError, ValueError) as e:
+        return {'success': False, 'error': str(e)}
+
+    return {
+        'success': True,
+        'pages': stats['pages'],
+        'algorithm': stats['algorithm'],
+        'file_size': format_size(stats['file_size']),
+    }
 
 
 def decrypt_pdf(input_file: str, output: str, password: str) -> Dict[str, Any]:
     """PDF şifre kaldırma implementasyonu"""
-    # Geçici implementasyon
-    return {'success': True}
+    from pypdf_tools.core.encryption import decrypt_document
+
+    try:
+        stats = decrypt_document(input_file, output, password)
+    except (PermissionError, ValueError) as e:
+        return {'success': False, 'error': str(e)}
+
+    return {
+        'success': True,
+        'pages': stats['pages'],
+        'file_size': format_size(stats['file_size']),
+    }
 
 
 def extract_pdf_text(input_file: str, pages: Optional[str], 
                     format: str) -> Dict[str, Any]:
     """PDF metin çıkarma implementasyonu"""
-    # Geçici implementasyon
-    sample_text = "Bu örnek PDF metnidir. Gerçek implementasyon gereklidir."
-    
+    from pypdf_tools.core.text import PageTextStream
+
+    try:
+        with PageTextStream(input_file, pages) as page_stream:
+            content = [{'page': number, 'text': text} for number, text in page_stream]
+            selected = page_stream.selected
+    except (PermissionError, ValueError) as e:
+        return {'success': False, 'error': str(e)}
+
     if format == 'json':
         text_data = {
             'file': input_file,
-            'pages': pages or 'all',
-            'content': [
-                {'page': 1, 'text': sample_text},
-                {'page': 2, 'text': sample_text}
-            ]
+            'pages': selected.to_expression() or 'all',
+            'content': content
         }
-        return {'success': True, 'text': text_data, 'pages_processed': 2}
+        return {'success': True, 'text': text_data, 'pages_processed': len(content)}
     else:
-        return {'success': True, 'text': sample_text, 'pages_processed': 2}
+        text = '\n\n'.join(item['text'] for item in content)
+        return {'success': True, 'text': text, 'pages_processed': len(content)}
 
 
-def get_pdf_info(input_file: str) -> Dict[str, Any]:
+def get_pdf_info(input_file: str,
+                 cache: Optional['DocumentCache'] = None) -> Dict[str, Any]:
     """PDF bilgi çıkarma implementasyonu"""
-    # Geçici implementasyon
-    file_path = Path(input_file)
+    from pypdf_tools.core.cache import cached_pdf_metadata
+    from pypdf_tools.core.metadata import read_pdf_metadata
+
+    if cache is not None:
+        metadata = cached_pdf_metadata(cache, input_file)
+    else:
+        metadata = read_pdf_metadata(input_file)
     return {
         'success': True,
         'info': {
-            'filename': file_path.name,
-            'file_size': file_path.stat().st_size,
-            'pages': 10,  # Placeholder
-            'title': 'Örnek PDF',
-            'author': 'Bilinmiyor',
-            'subject': '',
-            'creator': 'PyPDF-Tools',
-            'producer': 'PyPDF-Tools',
-            'creation_date': '2024-01-01',
-            'modification_date': '2024-01-01',
-            'encrypted': False,
-            'permissions': ['print', 'copy', 'modify', 'annotate']
+            'filename': metadata['filename'],
+            'file_size': metadata['file_size'],
+            'pages': metadata['pages'],
+            'title': metadata['title'],
+            'author': metadata['author'],
+            'subject': metadata['subject'],
+            'keywords': metadata['keywords'],
+            'creator': metadata['creator'],
+            'producer': metadata['producer'],
+            'creation_date': metadata['creation_date'],
+            'modification_date': metadata['modification_date'],
+            'pdf_version': metadata['pdf_version'],
+            'encrypted': metadata['encrypted'],
+            'encryption': metadata['encryption'],
+            'permissions': metadata['permissions'],
+            'xmp': metadata['xmp'],
         }
     }
 
 
-def cli_main():
+def cli_main(args: Optional[List[str]] = None, prog_name: Optional[str] = None,
+             **extra):
     """CLI ana giriş noktası"""
     try:
-        cli()
+        cli(args=args, prog_name=prog_name, **extra)
     except KeyboardInterrupt:
         click.echo("\nİşlem iptal edildi.", err=True)
         sys.exit(1)
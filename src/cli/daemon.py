@@ -0,0 +1,458 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools Daemon Modu
+Komutları önceden ısıtılmış işçi süreçlerinde çalıştıran Unix soket sunucusu
+
+`pypdf serve --socket PATH` yorumlayıcıyı, click'i, işlem modüllerini
+ve PDF motorunu bir kez yüklemiş işçi süreçleri başlatır. İstemci
+(`pypdf --connect PATH ...`) komut satırını, çalışma dizinini, PYPDF_*
+ortam değişkenlerini ve stdin terminal değilse EOF'a kadar okunan
+içeriğini sokete iletir; işçi aynı `cli` grubunu çalıştırır. Çıktı ve
+çıkış kodu tek seferlik çalıştırmayla aynıdır.
+
+Soket üzerindeki her çerçeve 1 byte tür ve 8 byte uzunluk önekiyle
+gönderilir: JSON mesajı, stdout veya stderr parçası. İşçi çıktısını
+istek başına açılan bir kanal soketine parça parça yazar; sunucu
+parçaları geldikçe istemciye aktarır ve en son çıkış kodunu gönderir.
+Böylece extract-text gibi akışlı komutların bellek kullanımı daemon
+üzerinden de sınırlı kalır; yavaş istemci soket tamponu dolunca işçiyi
+bekletir.
+
+İşçiler kendi işlem havuzlarını (--jobs) açabilir; bu, havuz
+işçilerinin daemon süreç olmadığı Python 3.9 ve sonrasını gerektirir.
+"""
+
+import io
+import json
+import os
+import shutil
+import signal
+import socket
+import socketserver
+import stat
+import struct
+import sys
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import click
+from click import termui
+
+
+# İstemcinin iletmediği, yalnızca kendisini yönlendiren değişken
+SOCKET_ENV = 'PYPDF_DAEMON_SOCKET'
+
+# Çerçeve başlığı: tür, uzunluk
+_HEADER = struct.Struct('>BQ')
+
+# Çerçeve türleri
+MESSAGE, STDOUT, STDERR = 0, 1, 2
+
+# İşçide çıktının parça olarak gönderilmeden önce toplandığı en fazla byte
+_CHUNK_BYTES = 64 * 1024
+
+# Kanal bağlantısı beklenirken işçinin durumuna bakma aralığı (saniye)
+_ACCEPT_POLL = 0.1
+
+
+def send_frame(sock: socket.socket, kind: int, data: bytes) -> None:
+    """Veriyi tür ve uzunluk önekli çerçeve olarak gönder"""
+    sock.sendall(_HEADER.pack(kind, len(data)) + data)
+
+
+def recv_frame(sock: socket.socket) -> Optional[Tuple[int, bytes]]:
+    """(tür, veri) çerçevesi oku; bağlantı çerçeve arasında kapandıysa None"""
+    header = _recv_exact(sock, _HEADER.size)
+    if header is None:
+        return None
+    kind, size = _HEADER.unpack(header)
+    data = _recv_exact(sock, size)
+    if data is None:
+        raise ConnectionError("Mesaj tamamlanmadan bağlantı kapandı")
+    return kind, data
+
+
+def send_message(sock: socket.socket, payload: Dict[str, Any]) -> None:
+    """Sözlüğü JSON çerçevesi olarak gönder"""
+    send_frame(sock, MESSAGE, json.dumps(payload, ensure_ascii=False).encode('utf-8'))
+
+
+def recv_message(sock: socket.socket) -> Optional[Dict[str, Any]]:
+    """JSON çerçevesi oku; bağlantı kapandıysa None"""
+    frame = recv_frame(sock)
+    if frame is None:
+        return None
+    kind, data = frame
+    if kind != MESSAGE:
+        raise ConnectionError(f"Beklenmeyen çerçeve türü: {kind}")
+    return json.loads(data.decode('utf-8'))
+
+
+def _recv_exact(sock: socket.socket, size: int) -> Optional[bytes]:
+    """Tam olarak size byte oku; hiç veri gelmeden kapanırsa None"""
+    buffer = bytearray()
+    while len(buffer) < size:
+        chunk = sock.recv(min(size - len(buffer), 1024 * 1024))
+        if not chunk:
+            return None
+        buffer.extend(chunk)
+    return bytes(buffer)
+
+
+# İşçi tarafı
+
+def _warm_worker() -> None:
+    """İşçi sürecinde komut modüllerini ve PDF motorunu önceden yükle"""
+    import pypdf_tools.cli.cli_handler  # noqa: F401
+    from pypdf_tools.core import cache, encryption, merge, scan, split, text  # noqa: F401
+    from pypdf_tools.core.engines import get_engine
+
+    get_engine().module
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+class _ChannelWriter(io.RawIOBase):
+    """Yazılanları kanal soketine tek türde çerçeveler olarak gönderen akış"""
+
+    def __init__(self, sock: socket.socket, kind: int):
+        super().__init__()
+        self._sock = sock
+        self._kind = kind
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        send_frame(self._sock, self._kind, bytes(data))
+        return len(data)
+
+
+def run_command(argv: List[str], prog_name: Optional[str], cwd: str,
+                stdin: str = '', env: Optional[Dict[str, str]] = None,
+                channel: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Komutu bu süreçte tek seferlik CLI gibi çalıştır
+
+    Standart akışlar, çalışma dizini ve PYPDF_* ortam değişkenleri
+    komut süresince istemcininkilerle değiştirilir ve sonra geri alınır.
+    channel verilirse stdout ve stderr bu Unix soketine parça parça
+    gönderilir ve yalnızca çıkış kodu döner; verilmezse çıktılar
+    toplanıp sonuçla birlikte döndürülür.
+    """
+    from pypdf_tools.cli.cli_handler import cli_main
+
+    sock = None
+    if channel is not None:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.connect(channel)
+        outputs = (io.BufferedWriter(_ChannelWriter(sock, STDOUT), _CHUNK_BYTES),
+                   io.BufferedWriter(_ChannelWriter(sock, STDERR), _CHUNK_BYTES))
+    else:
+        outputs = (io.BytesIO(), io.BytesIO())
+
+    saved_streams = (sys.stdin, sys.stdout, sys.stderr)
+    saved_cwd = os.getcwd()
+    saved_env = dict(os.environ)
+    saved_prompt = termui.hidden_prompt_func
+    # Sarmalayıcılar toplanınca alttaki tamponu kapatır; sonuna kadar tutulur
+    streams = (
+        io.TextIOWrapper(io.BytesIO(stdin.encode('utf-8')), encoding='utf-8'),
+        *(io.TextIOWrapper(output, encoding='utf-8', write_through=True)
+          for output in outputs),
+    )
+
+    sys.stdin, sys.stdout, sys.stderr = streams
+    try:
+        for key in [key for key in os.environ if key.startswith('PYPDF_')]:
+            del os.environ[key]
+        os.environ.update(env or {})
+        os.chdir(cwd)
+
+        # Gizli sorular işçinin terminali yerine iletilen stdin'den okunur
+        termui.hidden_prompt_func = _hidden_prompt
+        try:
+            cli_main(argv, prog_name, obj={'daemon_worker': True})
+            exit_code = 0
+        except SystemExit as e:
+            exit_code = _exit_code(e.code)
+    finally:
+        sys.stdin, sys.stdout, sys.stderr = saved_streams
+        os.chdir(saved_cwd)
+        os.environ.clear()
+        os.environ.update(saved_env)
+        termui.hidden_prompt_func = saved_prompt
+
+        try:
+            for stream in streams[1:]:
+                stream.flush()
+        except OSError:
+            # İstemci çıktının sonunu beklemeden ayrıldı
+            pass
+        if sock is not None:
+            sock.close()
+
+    if sock is not None:
+        return {'exit_code': exit_code}
+    return {
+        'exit_code': exit_code,
+        'stdout': outputs[0].getvalue().decode('utf-8', errors='replace'),
+        'stderr': outputs[1].getvalue().decode('utf-8', errors='replace'),
+    }
+
+
+def _hidden_prompt(prompt: str) -> str:
+    """getpass'in terminal olmadığında yaptığı gibi soruyu stderr'e yaz, stdin'den oku"""
+    sys.stderr.write(prompt)
+    sys.stderr.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip('\n')
+
+
+def _exit_code(code: Any) -> int:
+    """sys.exit() değerini yorumlayıcının yapacağı gibi çıkış koduna çevir"""
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    # Metin verilirse yorumlayıcı onu stderr'e yazar ve 1 ile çıkar
+    print(code, file=sys.stderr)
+    return 1
+
+
+# Sunucu tarafı
+
+class _CommandHandler(socketserver.BaseRequestHandler):
+    """Bağlantı başına bir komut isteğini işçi havuzunda çalıştır"""
+
+    def handle(self) -> None:
+        request = recv_message(self.request)
+        if request is None:
+            return
+
+        try:
+            self.server.execute(request, self.request)
+        except OSError:
+            # İstemci yanıtı beklemeden ayrıldı
+            pass
+
+
+class PDFDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Sıcak işçi havuzlu komut sunucusu
+
+    Her bağlantı ayrı bir iş parçacığında karşılanır, komut havuzdaki
+    boş bir işçi sürecinde çalışır; aynı anda en fazla `workers` komut
+    çalışır, diğerleri sırada bekler. Bir işçi çökerse havuz yeniden
+    kurulur ve etkilenen istekler 1 çıkış koduyla yanıtlanır.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, socket_path: Union[str, Path], workers: Optional[int] = None):
+        from pypdf_tools.core.split import default_jobs
+
+        self.socket_path = str(socket_path)
+        self.workers = workers or default_jobs()
+        self.requests = 0
+
+        _remove_stale_socket(self.socket_path)
+        super().__init__(self.socket_path, _CommandHandler)
+        os.chmod(self.socket_path, 0o600)
+
+        # İşçilerin çıktı kanalı soketleri; yalnızca daemon sahibi erişebilir
+        self._channel_dir = tempfile.mkdtemp(prefix='pypdf-daemon-')
+        self._lock = threading.Lock()
+        self._pool = self._start_pool()
+
+    def _start_pool(self) -> ProcessPoolExecutor:
+        """İşçileri başlat ve hepsinin ısınmasını bekle"""
+        pool = ProcessPoolExecutor(max_workers=self.workers, initializer=_warm_worker)
+        for future in [pool.submit(_ping) for _ in range(self.workers)]:
+            future.result()
+        return pool
+
+    def execute(self, request: Dict[str, Any], client: socket.socket) -> int:
+        """
+        İsteği işçi havuzunda çalıştır, çıktıyı geldikçe istemciye aktar
+
+        Son çerçeve {'exit_code'} mesajıdır. Çıkış kodunu döndürür.
+        """
+        with self._lock:
+            self.requests += 1
+            pool = self._pool
+            channel_path = os.path.join(self._channel_dir, f'{self.requests}.sock')
+
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            listener.bind(channel_path)
+            listener.listen(1)
+            listener.settimeout(_ACCEPT_POLL)
+            future = pool.submit(
+                run_command, request['argv'], request.get('prog_name'),
+                request['cwd'], request.get('stdin', ''), request.get('env'), channel_path
+            )
+            connection = _accept_channel(listener, future)
+            if connection is not None:
+                with connection:
+                    _relay(connection, client)
+            exit_code = future.result()['exit_code']
+        except BrokenProcessPool as e:
+            self._restart_pool(pool)
+            exit_code = 1
+            send_frame(client, STDERR,
+                       f"Daemon işçisi beklenmedik şekilde sonlandı: {e}\n".encode('utf-8'))
+        except OSError:
+            raise
+        except Exception as e:
+            exit_code = 1
+            send_frame(client, STDERR, f"Daemon hatası: {e}\n".encode('utf-8'))
+        finally:
+            listener.close()
+            try:
+                os.unlink(channel_path)
+            except FileNotFoundError:
+                pass
+
+        send_message(client, {'exit_code': exit_code})
+        return exit_code
+
+    def _restart_pool(self, broken: ProcessPoolExecutor) -> None:
+        """Çöken havuzu bir kez yenisiyle değiştir"""
+        with self._lock:
+            if self._pool is broken:
+                broken.shutdown(wait=False)
+                self._pool = self._start_pool()
+
+    def serve_until_stopped(self) -> None:
+        """SIGTERM veya Ctrl+C gelene kadar istekleri karşıla"""
+        def stop(signum, frame):
+            # shutdown() serve_forever'dan farklı bir iş parçacığından çağrılmalı
+            threading.Thread(target=self.shutdown, daemon=True).start()
+
+        previous = signal.signal(signal.SIGTERM, stop)
+        try:
+            self.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            signal.signal(signal.SIGTERM, previous)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self._pool.shutdown(wait=True)
+        shutil.rmtree(self._channel_dir, ignore_errors=True)
+        try:
+            os.unlink(self.socket_path)
+        except FileNotFoundError:
+            pass
+
+
+def _accept_channel(listener: socket.socket, future: Any) -> Optional[socket.socket]:
+    """İşçinin kanal bağlantısını bekle; işçi bağlanmadan biterse None"""
+    while True:
+        try:
+            connection, _address = listener.accept()
+        except socket.timeout:
+            if future.done():
+                return None
+            continue
+        connection.settimeout(None)
+        return connection
+
+
+def _relay(connection: socket.socket, client: socket.socket) -> None:
+    """
+    İşçinin çıktı çerçevelerini kanal kapanana kadar istemciye aktar
+
+    İşçi çökerse kanal yarıda kapanır; hata havuz sonucundan raporlanır.
+    İstemci ayrılırsa kanal kapatılır ve işçinin yazması hata verir.
+    """
+    while True:
+        try:
+            frame = recv_frame(connection)
+        except (ConnectionError, OSError):
+            return
+        if frame is None:
+            return
+        send_frame(client, *frame)
+
+
+def _remove_stale_socket(path: str) -> None:
+    """Dinleyeni kalmamış eski soket dosyasını sil; çalışan daemon varsa hata ver"""
+    if not os.path.exists(path):
+        return
+
+    if not stat.S_ISSOCK(os.stat(path).st_mode):
+        raise OSError(f"Soket yolunda başka bir dosya var: {path}")
+
+    probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        probe.connect(path)
+    except ConnectionRefusedError:
+        os.unlink(path)
+        return
+    finally:
+        probe.close()
+    raise OSError(f"Soket kullanımda, başka bir daemon çalışıyor: {path}")
+
+
+# İstemci tarafı
+
+def read_stdin() -> str:
+    """
+    İletilecek stdin içeriğini oku
+
+    Terminalden veri beklenmez; boru veya dosya EOF'a kadar okunur,
+    tek seferlik çalıştırmada olduğu gibi yazan taraf kapanana kadar
+    beklenir.
+    """
+    stream = click.get_text_stream('stdin')
+    if stream.isatty():
+        return ''
+    return stream.read()
+
+
+def forward_command(socket_path: str, argv: List[str], prog_name: Optional[str] = None,
+                    stdin: Optional[str] = None) -> Optional[int]:
+    """
+    Komutu daemon'a ilet, çıktısını geldikçe yaz ve çıkış kodunu döndür
+
+    stdin verilmezse istemcinin stdin'i (terminal değilse) bağlantı
+    kurulduktan sonra okunup iletilir; böylece daemon yokken yerelde
+    çalışan komut stdin'i okunmamış bulur. Daemon'a bağlanılamazsa None
+    döner; çağıran komutu yerelde çalıştırır.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(socket_path)
+        except (FileNotFoundError, ConnectionRefusedError):
+            return None
+
+        send_message(sock, {
+            'argv': argv,
+            'prog_name': prog_name,
+            'cwd': os.getcwd(),
+            'env': {key: value for key, value in os.environ.items()
+                    if key.startswith('PYPDF_') and key != SOCKET_ENV},
+            'stdin': read_stdin() if stdin is None else stdin,
+        })
+
+        while True:
+            frame = recv_frame(sock)
+            if frame is None:
+                raise ConnectionError("Daemon yanıt vermeden bağlantıyı kapattı")
+            kind, data = frame
+            if kind == MESSAGE:
+                return json.loads(data.decode('utf-8'))['exit_code']
+            click.echo(data, nl=False, err=kind == STDERR)
@@ -21,16 +21,16 @@ from pypdf_tools._version import (
     APP_URL
 )
 
-# Ana bileşenleri export et
-from pypdf_tools.main import MainWindow, create_app
-from pypdf_tools.features.pdf_viewer import (
-    PDFViewerWidget, 
-    PDFViewerContainer,
-    PDFJSBridge
-)
-
-# CLI handler
-from pypdf_tools.cli.cli_handler import cli
+# Ana bileşenler ilk erişimde yüklenir; CLI ve sağlık kontrolü
+# Qt'yi hiç içe aktarmadan paketi kullanabilir
+_LAZY_ATTRIBUTES = {
+    'MainWindow': 'pypdf_tools.main',
+    'create_app': 'pypdf_tools.main',
+    'PDFViewerWidget': 'pypdf_tools.features.pdf_viewer',
+    'PDFViewerContainer': 'pypdf_tools.features.pdf_viewer',
+    'PDFJSBridge': 'pypdf_tools.features.pdf_viewer',
+    'cli': 'pypdf_tools.cli.cli_handler',
+}
 
 # Public API
 __all__ = [
@@ -66,22 +66,49 @@ __url__ = APP_URL
 # Compatibility check
 import sys
 
-if sys.version_info < (3, 8):
+if sys.version_info < (3, 9):
     raise RuntimeError(
-        f"{APP_DISPLAY_NAME} requires Python 3.8 or higher. "
+        f"{APP_DISPLAY_NAME} requires Python 3.9 or higher. "
         f"You are running Python {sys.version_info.major}.{sys.version_info.minor}."
     )
 
-# PyQt6 availability check
-try:
-    from PyQt6.QtCore import QT_VERSION_STR
-    from PyQt6.QtWebEngineWidgets import QWebEngineView
-    _QT_AVAILABLE = True
-    _QT_VERSION = QT_VERSION_STR
-except ImportError as e:
-    _QT_AVAILABLE = False
-    _QT_VERSION = None
-    _QT_IMPORT_ERROR = str(e)
+_qt_status_cache = None
+
+
+def _qt_status():
+    """PyQt6 ve WebEngine durumunu ilk çağrıda kontrol et: (mevcut, sürüm, hata)"""
+    global _qt_status_cache
+    if _qt_status_cache is None:
+        try:
+            from PyQt6.QtCore import QT_VERSION_STR
+            from PyQt6.QtWebEngineWidgets import QWebEngineView
+            _qt_status_cache = (True, QT_VERSION_STR, None)
+        except ImportError as e:
+            _qt_status_cache = (False, None, str(e))
+    return _qt_status_cache
+
+
+def __getattr__(name):
+    """Ağır bileşenleri ilk erişimde içe aktar"""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is not None:
+        import importlib
+        value = getattr(importlib.import_module(module_name), name)
+        globals()[name] = value
+        return value
+
+    # Eski modül düzeyi Qt durumu değişkenleri
+    if name in ('_QT_AVAILABLE', '_QT_VERSION', '_QT_IMPORT_ERROR'):
+        available, version, error = _qt_status()
+        return {'_QT_AVAILABLE': available, '_QT_VERSION': version,
+                '_QT_IMPORT_ERROR': error}[name]
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
+
 
 def get_version_info():
     """Paket sürüm ve bağımlılık bilgilerini döndür."""
@@ -94,12 +121,13 @@ def get_version_info():
         'architecture': platform.architecture(),
     }
     
-    if _QT_AVAILABLE:
-        info['qt_version'] = _QT_VERSION
+    qt_available, qt_version, qt_error = _qt_status()
+    if qt_available:
+        info['qt_version'] = qt_version
         info['pyqt6_available'] = True
     else:
         info['pyqt6_available'] = False
-        info['pyqt6_error'] = _QT_IMPORT_ERROR
+        info['pyqt6_error'] = qt_error
     
     # PDF processing libraries
     try:
@@ -122,7 +150,7 @@ def check_dependencies():
     warnings = []
     
     # Critical dependencies
-    if not _QT_AVAILABLE:
+    if not _qt_status()[0]:
         missing_deps.append(('PyQt6 & PyQt6-WebEngine', 'GUI functionality'))
     
     try:
@@ -151,29 +179,45 @@ def check_dependencies():
         'all_good': len(missing_deps) == 0
     }
 
-# İlk import sırasında temel kontroller
-_dep_check = check_dependencies()
-if not _dep_check['all_good']:
-    import warnings as _warnings
-    for dep, purpose in _dep_check['missing_critical']:
-        _warnings.warn(
-            f"Missing dependency: {dep} (needed for {purpose})",
-            ImportWarning,
-            stacklevel=2
-        )
+# Bağımlılık kontrolü import sırasında değil, GUI ilk kullanıldığında yapılır
+_dependencies_checked = False
+
+
+def _warn_missing_dependencies():
+    """Eksik kritik bağımlılıkları bir kez uyar"""
+    global _dependencies_checked
+    if _dependencies_checked:
+        return
+    _dependencies_checked = True
+
+    dep_check = check_dependencies()
+    if not dep_check['all_good']:
+        import warnings as _warnings
+        for dep, purpose in dep_check['missing_critical']:
+            _warnings.warn(
+                f"Missing dependency: {dep} (needed for {purpose})",
+                ImportWarning,
+                stacklevel=3
+            )
 
 # Module-level convenience functions
 def create_application():
     """PyQt uygulamasını oluştur ve döndür."""
-    if not _QT_AVAILABLE:
+    _warn_missing_dependencies()
+    if not _qt_status()[0]:
         raise ImportError("PyQt6 is required to create GUI application")
+
+    from pypdf_tools.main import create_app
     return create_app()
 
 def launch_gui(file_path=None):
     """GUI uygulamasını başlat."""
-    if not _QT_AVAILABLE:
+    _warn_missing_dependencies()
+    if not _qt_status()[0]:
         raise ImportError("PyQt6 is required for GUI functionality")
     
+    from pypdf_tools.main import MainWindow
+
     app = create_application()
     main_window = MainWindow()
     
@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools Arka Plan İşleri
+Ağır araç işlemlerini (bölme, birleştirme, şifreleme, metin çıkarma)
+GUI iş parçacığının dışında çalıştıran iş kuyruğu
+
+İşler sınırlı sayıda iş parçacığı olan bir QThreadPool'da çalışır;
+fazlası sırada bekler. İlerleme ve sonuç JSON olarak sinyallerle
+bildirilir; sinyaller yöneticinin yaşadığı GUI iş parçacığına kuyrukla
+iletilir. İptal, sıradaki iş için havuzdan çıkarma, çalışan iş için bir
+sonraki ilerleme bildiriminde JobCancelled fırlatma ile yapılır.
+"""
+
+import io
+import itertools
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+
+# Aynı anda çalışabilecek varsayılan iş sayısı
+DEFAULT_MAX_JOBS = 2
+
+# İki ilerleme sinyali arasındaki en kısa süre (saniye)
+PROGRESS_INTERVAL = 0.1
+
+# İş durumları
+JOB_QUEUED = 'queued'
+JOB_RUNNING = 'running'
+JOB_DONE = 'done'
+JOB_FAILED = 'failed'
+JOB_CANCELLED = 'cancelled'
+
+
+class JobCancelled(Exception):
+    """Çalışan iş kullanıcı tarafından iptal edildi"""
+
+
+class JobContext:
+    """
+    Çalışan işe verilen ilerleme ve iptal arayüzü
+
+    progress() core fonksiyonlarının ProgressCallback'i olarak
+    verilebilir; iptal istendiyse JobCancelled fırlatır.
+    """
+
+    def __init__(self, job_id: str, emit: Callable[[int, int], None]):
+        self.job_id = job_id
+        self._emit = emit
+        self._cancelled = threading.Event()
+        self._last_emit = 0.0
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self) -> None:
+        self._cancelled.set()
+
+    def check_cancelled(self) -> None:
+        """İptal istendiyse işi durdur"""
+        if self._cancelled.is_set():
+            raise JobCancelled(self.job_id)
+
+    def progress(self, done: int, total: int) -> None:
+        """İlerlemeyi bildir; sinyaller PROGRESS_INTERVAL ile seyreltilir"""
+        self.check_cancelled()
+        now = time.monotonic()
+        if done >= total or now - self._last_emit >= PROGRESS_INTERVAL:
+            self._last_emit = now
+            self._emit(done, total)
+
+
+class _JobRunnable(QRunnable):
+    """Havuzda tek bir işi çalıştıran görev"""
+
+    def __init__(self, manager: 'JobManager', job: Dict[str, Any]):
+        super().__init__()
+        # Havuz görevi silmesin; iptal için tryTake ile geri alınabilmeli
+        self.setAutoDelete(False)
+        self._manager = manager
+        self._job = job
+
+    def run(self) -> None:
+        self._manager._run(self._job)
+
+
+class JobManager(QObject):
+    """
+    Sınırlı eşzamanlılıkla arka plan işlerini yöneten kuyruk
+
+    submit() işi sıraya alıp hemen iş kimliğini döndürür. Sinyaller
+    JSON metin taşır; böylece QWebChannel üzerinden doğrudan React'e
+    iletilebilir.
+    """
+
+    jobStarted = pyqtSignal(str)   # {'jobId', 'toolId'}
+    jobProgress = pyqtSignal(str)  # {'jobId', 'toolId', 'done', 'total', 'percent'}
+    jobFinished = pyqtSignal(str)  # {'jobId', 'toolId', 'status', 'success', 'result' | 'error'}
+
+    def __init__(self, max_jobs: Optional[int] = None, parent=None):
+        super().__init__(parent)
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(max(1, max_jobs or DEFAULT_MAX_JOBS))
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+
+    @property
+    def max_jobs(self) -> int:
+        return self._pool.maxThreadCount()
+
+    def submit(self, tool_id: str, function: Callable[[JobContext, Dict[str, Any]], Any],
+               data: Dict[str, Any]) -> str:
+        """İşi sıraya al ve kimliğini döndür"""
+        job_id = f"job-{next(self._ids)}"
+        job = {
+            'id': job_id,
+            'tool_id': tool_id,
+            'function': function,
+            'data': data,
+            'status': JOB_QUEUED,
+            'context': JobContext(job_id, lambda done, total: self._emit_progress(
+                job_id, tool_id, done, total)),
+        }
+        job['runnable'] = _JobRunnable(self, job)
+
+        with self._lock:
+            self._jobs[job_id] = job
+        self._pool.start(job['runnable'])
+        return job_id
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        İşi iptal et
+
+        Sıradaki iş hemen iptal edilir; çalışan iş bir sonraki ilerleme
+        bildiriminde durur. Bilinmeyen veya bitmiş işlerde False döner.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None:
+                return False
+            job['context'].cancel()
+            queued = job['status'] == JOB_QUEUED and self._pool.tryTake(job['runnable'])
+
+        if queued:
+            self._finish(job, JOB_CANCELLED, error='İş iptal edildi')
+        return True
+
+    def cancel_all(self) -> None:
+        """Sıradaki ve çalışan tüm işleri iptal et"""
+        with self._lock:
+            job_ids = list(self._jobs)
+        for job_id in job_ids:
+            self.cancel(job_id)
+
+    def status(self, job_id: str) -> Optional[str]:
+        """İşin durumu; bitmiş veya bilinmeyen işlerde None"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return job['status'] if job else None
+
+    def active_jobs(self) -> List[str]:
+        """Sıradaki ve çalışan işlerin kimlikleri"""
+        with self._lock:
+            return list(self._jobs)
+
+    def wait(self, msecs: int = -1) -> bool:
+        """Çalışan işlerin bitmesini bekle"""
+        return self._pool.waitForDone(msecs)
+
+    def _run(self, job: Dict[str, Any]) -> None:
+        """Havuz iş parçacığında işi çalıştır, sonucu bildir"""
+        with self._lock:
+            if job['context'].cancelled:
+                status = JOB_CANCELLED
+            else:
+                job['status'] = status = JOB_RUNNING
+        if status == JOB_CANCELLED:
+            self._finish(job, JOB_CANCELLED, error='İş iptal edildi')
+            return
+
+        self.jobStarted.emit(json.dumps({'jobId': job['id'], 'toolId': job['tool_id']}))
+        try:
+            result = job['function'](job['context'], job['data'])
+        except JobCancelled:
+            self._finish(job, JOB_CANCELLED, error='İş iptal edildi')
+        except Exception as e:
+            self._finish(job, JOB_FAILED, error=str(e))
+        else:
+            self._finish(job, JOB_DONE, result=result)
+
+    def _emit_progress(self, job_id: str, tool_id: str, done: int, total: int) -> None:
+        self.jobProgress.emit(json.dumps({
+            'jobId': job_id,
+            'toolId': tool_id,
+            'done': done,
+            'total': total,
+            'percent': round(100 * done / total, 1) if total else 0.0,
+        }))
+
+    def _finish(self, job: Dict[str, Any], status: str, result: Any = None,
+                error: Optional[str] = None) -> None:
+        with self._lock:
+            self._jobs.pop(job['id'], None)
+        job['status'] = status
+
+        message = {'jobId': job['id'], 'toolId': job['tool_id'], 'status': status,
+                   'success': status == JOB_DONE}
+        if status == JOB_DONE:
+            message['result'] = result
+        else:
+            message['error'] = error
+        self.jobFinished.emit(json.dumps(message, ensure_ascii=False, default=str))
+
+
+# İş fonksiyonları
+# React tarafı camelCase anahtarlar gönderir; 'file' verilmezse köprü
+# açık belgenin yolunu ekler.
+
+def _required(data: Dict[str, Any], key: str) -> Any:
+    value = data.get(key)
+    if not value:
+        raise ValueError(f"Eksik parametre: {key}")
+    return value
+
+
+def merge_job(context: JobContext, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Dosyaları birleştir: files, output, keepBookmarks"""
+    from pypdf_tools.core.merge import merge_documents
+
+    files = list(data.get('files') or [])
+    if data.get('file') and data['file'] not in files:
+        files.insert(0, data['file'])
+    if len(files) < 2:
+        raise ValueError("Birleştirme için en az iki dosya gerekli")
+
+    return merge_documents(files, _required(data, 'output'),
+                           keep_bookmarks=bool(data.get('keepBookmarks')),
+                           password=data.get('password'), progress=context.progress)
+
+
+def split_job(context: JobContext, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Belgeyi böl: file, outputDir, pages (aralık ifadesi), prefix"""
+    from pypdf_tools.core.split import split_pages, split_ranges
+
+    input_file = _required(data, 'file')
+    output_dir = Path(_required(data, 'outputDir'))
+    output_dir.mkdir(parents=True, exist_ok=True)
+    prefix = data.get('prefix') or 'page_'
+    # GUI sürecinden fork etmemek için bölme iş parçacığında tek işçiyle yapılır
+    if data.get('pages'):
+        return split_ranges(input_file, output_dir, data['pages'], prefix=prefix,
+                            jobs=1, password=data.get('password'),
+                            progress=context.progress)
+    return split_pages(input_file, output_dir, prefix=prefix, jobs=1,
+                       password=data.get('password'), progress=context.progress)
+
+
+def encrypt_job(context: JobContext, data: Dict[str, Any]) -> Dict[str, Any]:
+    """AES-256 ile şifrele: file, output, password, ownerPassword, permissions"""
+    from pypdf_tools.core.encryption import encrypt_document
+
+    return encrypt_document(_required(data, 'file'), _required(data, 'output'),
+                            _required(data, 'password'), data.get('ownerPassword'),
+                            permissions=data.get('permissions') or (),
+                            input_password=data.get('inputPassword'),
+                            progress=context.progress)
+
+
+def decrypt_job(context: JobContext, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Şifreyi kaldır: file, output, password"""
+    from pypdf_tools.core.encryption import decrypt_document
+
+    return decrypt_document(_required(data, 'file'), _required(data, 'output'),
+                            _required(data, 'password'), progress=context.progress)
+
+
+def extract_text_job(context: JobContext, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Metin çıkar: file, output, format, pages; output yoksa metin döndürülür"""
+    from pypdf_tools.core.text import PageTextStream, write_page_text
+
+    input_file = _required(data, 'file')
+    text_format = data.get('format') or 'txt'
+
+    with PageTextStream(input_file, data.get('pages'), data.get('password')) as pages:
+        if data.get('output'):
+            with open(data['output'], 'w', encoding='utf-8', newline='') as stream:
+                result = write_page_text(pages, stream, text_format, context.progress)
+            result['output'] = data['output']
+            return result
+
+        buffer = io.StringIO()
+        result = write_page_text(pages, buffer, text_format, context.progress)
+        result['text'] = buffer.getvalue()
+        return result
+
+
+# Araç kimliği -> arka planda çalışan iş fonksiyonu
+JOB_FUNCTIONS: Dict[str, Callable[[JobContext, Dict[str, Any]], Any]] = {
+    'split': split_job,
+    'merge': merge_job,
+    'encrypt': encrypt_job,
+    'decrypt': decrypt_job,
+    'extract': extract_text_job,
+}
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools Belge Açıcı
+Belgeyi GUI iş parçacığını bloklamadan arka planda açan ve açılışın
+aşamalarını sinyallerle bildiren yükleyici
+
+Aşamalar sırasıyla:
+    headerParsed    dosya bilgileri ve trailer/katalog metadata'sı
+    pageCountKnown  QtPdf ile açılan belgenin özeti ve sayfa boyutları
+    firstPageReady  ilk sayfanın karoları önbellekte
+    outlineReady    yer işaretleri
+    loadFinished    açılış tamamlandı (hata durumunda loadFailed)
+
+Şifreli belgeler karo servisinde açılamadığından sayfa aşamaları atlanır.
+
+Son belgeler deposu verilirse (boyut, mtime) parmak izi değişmemiş belgenin
+metadata'sı ve yer işaretleri dosyadan okunmaz, depodan alınır; dosya
+bilgilerine son görüntülenen sayfa (lastPage) eklenir. Depoda olmayan
+veya değişmiş belge okunduktan sonra ilk sayfa küçük resmiyle kaydedilir.
+
+Her istek artan bir kimlik alır; yeni istek öncekini geçersiz kılar. Eski
+istek bir sonraki aşamadan önce durur, sinyal göndermez ve açtığı belge
+görüntülenen belge değilse kapatılır. Sinyaller kuyrukla iletildiğinden
+alıcı is_current() ile kimliği ayrıca denetlemelidir.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+from pypdf_tools.core.engines import get_engine
+from pypdf_tools.core.metadata import read_pdf_metadata
+from pypdf_tools.core.reader import open_stream
+from pypdf_tools.core.writer import outline_entries
+from pypdf_tools.features.recent import RECENT_THUMBNAIL_WIDTH, RecentDocuments
+from pypdf_tools.features.render import TileRenderer, encode_png, page_pixel_size, tile_grid
+from pypdf_tools.features.workers import PRIORITY_LOAD, SerialQueue
+
+
+# İlk sayfa için önden işlenen en fazla karo sayısı (satır sırasıyla)
+FIRST_PAGE_TILES = 12
+
+
+def viewer_metadata(path: Path, metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """read_pdf_metadata sonucunu React tarafının beklediği biçime çevir"""
+    return {
+        'title': metadata['title'] or path.stem,
+        'author': metadata['author'] or '',
+        'subject': metadata['subject'] or '',
+        'keywords': metadata['keywords'] or '',
+        'creator': metadata['creator'] or '',
+        'producer': metadata['producer'] or '',
+        'creationDate': metadata['creation_date'] or '',
+        'modificationDate': metadata['modification_date'] or '',
+        'permissions': metadata['permissions']
+    }
+
+
+def read_outline(path: Union[str, Path]) -> List[Dict[str, Any]]:
+    """Yer işaretlerini [{'title', 'page', 'level'}] olarak oku; sayfa 1 tabanlı"""
+    with open_stream(path) as stream:
+        reader = get_engine().PdfReader(stream)
+        if reader.is_encrypted and not reader.decrypt(''):
+            return []
+        return [{'title': title, 'page': index + 1, 'level': level}
+                for title, index, level in outline_entries(reader)]
+
+
+class _LoadTask(QRunnable):
+    def __init__(self, loader: 'DocumentLoader', request: int, path: Path,
+                 zoom: int, rotation: int):
+        super().__init__()
+        self._args = (request, path, zoom, rotation)
+        self._loader = loader
+
+    def run(self) -> None:
+        self._loader._load(*self._args)
+
+
+class _ReleaseTask(QRunnable):
+    def __init__(self, loader: 'DocumentLoader', digest: str):
+        super().__init__()
+        self._loader = loader
+        self._digest = digest
+
+    def run(self) -> None:
+        self._loader._release(self._digest)
+
+
+class DocumentLoader(QObject):
+    """
+    Belgeleri paylaşımlı havuzda sırayla açan yükleyici
+
+    Açılış ve bırakma görevleri aynı kuyrukta sırayla çalışır; böylece
+    bir belge başka bir istek tarafından kullanılırken kapatılmaz. Belgeler
+    karo servisine yükleyici adına kaydedilir; aynı içerikli belgeyi açan
+    diğer görüntüleyicilerin kaydı etkilenmez.
+    """
+
+    headerParsed = pyqtSignal(int, dict)    # İstek, dosya bilgileri ve metadata
+    pageCountKnown = pyqtSignal(int, dict)  # İstek, {'digest', 'pages'}
+    firstPageReady = pyqtSignal(int, str)   # İstek, belge özeti
+    outlineReady = pyqtSignal(int, list)    # İstek, yer işaretleri
+    loadFinished = pyqtSignal(int)          # İstek
+    loadFailed = pyqtSignal(int, str)       # İstek, hata mesajı
+
+    def __init__(self, renderer: TileRenderer, parent: Optional[QObject] = None,
+                 recent: Optional[RecentDocuments] = None):
+        super().__init__(parent)
+        self.renderer = renderer
+        self.recent = recent
+        self._pool = SerialQueue(PRIORITY_LOAD)
+        self._request = 0
+        self._keep: Optional[str] = None
+        # Son güncel isteğin açtığı belge; görüntüleyici henüz almamış olabilir
+        self._opened: Optional[str] = None
+
+    def load(self, path: Union[str, Path], zoom: int = 100, rotation: int = 0) -> int:
+        """Belgeyi arka planda aç ve istek kimliğini döndür; önceki istek iptal edilir"""
+        self._request += 1
+        self._pool.start(_LoadTask(self, self._request, Path(path), zoom, rotation))
+        return self._request
+
+    def cancel(self) -> None:
+        """Süren açılışı iptal et"""
+        self._request += 1
+
+    def is_current(self, request: int) -> bool:
+        return request == self._request
+
+    def keep(self, digest: Optional[str]) -> None:
+        """Görüntülenen belgeyi bildir; eski istekler bu belgeyi kapatmaz"""
+        self._keep = digest
+
+    def release(self, digest: str) -> None:
+        """Eski isteğin açtığı belgeyi, kullanılmıyorsa, sırası gelince kapat"""
+        self._pool.start(_ReleaseTask(self, digest))
+
+    def wait(self, msecs: int = -1) -> bool:
+        """Görevlerin bitmesini bekle (testler ve kapanış için)"""
+        return self._pool.wait(msecs)
+
+    def _release(self, digest: str) -> None:
+        if digest not in (self._keep, self._opened):
+            self.renderer.close_document(digest, owner=self)
+
+    def _load(self, request: int, path: Path, zoom: int, rotation: int) -> None:
+        if not self.is_current(request):
+            return
+        self._opened = digest = None
+        thumbnail = None
+        try:
+            stat = path.stat()
+            cached = None
+            if self.recent is not None:
+                cached = self.recent.lookup(str(path), stat.st_size, stat.st_mtime_ns)
+
+            if cached is not None:
+                info = dict(cached['info'], lastPage=cached['last_page'])
+                outline = cached['outline']
+            else:
+                metadata = read_pdf_metadata(path)
+                info = {
+                    'filePath': str(path),
+                    'fileName': path.name,
+                    'fileSize': stat.st_size,
+                    'totalPages': metadata['pages'] or 0,
+                    'metadata': viewer_metadata(path, metadata),
+                    'encrypted': metadata['encrypted'],
+                    'lastModified': stat.st_mtime
+                }
+                outline = None
+            if not self.is_current(request):
+                return
+            self.headerParsed.emit(request, info)
+
+            if not info['encrypted']:
+                document = self.renderer.open_document(path, owner=self)
+                digest = document['digest']
+                if not self.is_current(request):
+                    return
+                self._opened = digest
+                self.pageCountKnown.emit(request, document)
+
+                if document['pages'] and not self._warm_first_page(
+                        request, digest, document['pages'][0], zoom, rotation):
+                    return
+                self.firstPageReady.emit(request, digest)
+
+                if cached is None and self.recent is not None and document['pages']:
+                    thumbnail = encode_png(
+                        self.renderer.render_page(digest, 1, RECENT_THUMBNAIL_WIDTH))
+
+            if outline is None:
+                outline = read_outline(path) if metadata['decrypted'] else []
+            if not self.is_current(request):
+                return
+            self.outlineReady.emit(request, outline)
+            if cached is None and self.recent is not None:
+                self.recent.record(str(path), stat.st_size, stat.st_mtime_ns,
+                                   info, outline, thumbnail)
+            self.loadFinished.emit(request)
+        except Exception as e:
+            if self.is_current(request):
+                self.loadFailed.emit(request, f"PDF yükleme hatası: {str(e)}")
+        finally:
+            if digest is not None and not self.is_current(request):
+                self._opened = None
+                self._release(digest)
+
+    def _warm_first_page(self, request: int, digest: str, size: List[float],
+                         zoom: int, rotation: int) -> bool:
+        """İlk sayfanın üst karolarını işle; istek eskidiyse False"""
+        width, height = page_pixel_size(size[0], size[1], zoom, rotation)
+        cols, rows = tile_grid(width, height)
+        tiles = [(col, row) for row in range(rows) for col in range(cols)]
+        for col, row in tiles[:FIRST_PAGE_TILES]:
+            if not self.is_current(request):
+                return False
+            self.renderer.tile(digest, 1, zoom, rotation, col, row)
+        return self.is_current(request)
@@ -8,19 +8,40 @@ React tabanlı hibrit PDF görüntüleyici bileşeni
 
 import json
 import os
+import sqlite3
 import sys
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Callable
+from typing import Dict, Any, Optional, List, Callable, Tuple
 
 from PyQt6.QtCore import (
-    QObject, pyqtSignal, pyqtSlot, QUrl, QTimer,
-    QThread, QMutex, QMutexLocker
+    QObject, pyqtSignal, pyqtSlot, QUrl,
+    QThread, QMutex, QMutexLocker, QTimer
 )
 from PyQt6.QtWebEngineWidgets import QWebEngineView
 from PyQt6.QtWebChannel import QWebChannel
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QMessageBox
 from PyQt6.QtGui import QIcon
 
+from pypdf_tools.features.jobs import JOB_FUNCTIONS, JobManager
+from pypdf_tools.features.loader import DocumentLoader
+from pypdf_tools.features.prefetch import PrefetchScheduler
+from pypdf_tools.features.recent import LAST_PAGE_SAVE_DELAY_MS, default_recent_documents
+from pypdf_tools.features.search import SearchService
+from pypdf_tools.features.render import (
+    TILE_SIZE, ZOOM_MAX, ZOOM_MIN, ZOOM_STEP, default_renderer
+)
+from pypdf_tools.features.startup import (
+    BRIDGE_READY, FIRST_PAGE, PAGE_LOADED, startup_metrics
+)
+from pypdf_tools.features.state import StateStore
+from pypdf_tools.features.thumbnails import default_thumbnail_service
+from pypdf_tools.features.tile_scheme import (
+    install_tile_handler, thumbnail_base_url, tile_base_url
+)
+from pypdf_tools.features.web_profile import (
+    ViewerPage, default_web_profile, find_web_build_path, index_url, take_prewarmed_page
+)
+
 
 class PDFJSBridge(QObject):
     """
@@ -29,20 +50,40 @@ class PDFJSBridge(QObject):
     """
     
     # Python'dan React'e sinyal gönderme
-    pdfDataChanged = pyqtSignal(str)  # JSON formatında PDF verisi
+    pdfDataChanged = pyqtSignal(str)  # Tam anlık görüntü: {'version', 'data'}
+    pdfDataPatched = pyqtSignal(str)  # JSON Patch: {'baseVersion', 'version', 'patch'}
     themeChanged = pyqtSignal(str)    # Tema değişikliği
     settingsChanged = pyqtSignal(str) # Ayarlar değişikliği
+    jobStarted = pyqtSignal(str)      # Arka plan işi başladı (JSON)
+    jobProgress = pyqtSignal(str)     # Arka plan işi ilerlemesi (JSON)
+    jobFinished = pyqtSignal(str)     # Arka plan işi sonucu (JSON)
+    searchResults = pyqtSignal(str)   # Arama sonuç parçası (JSON)
+    searchIndexProgress = pyqtSignal(str)  # Arama dizini ilerlemesi (JSON)
+    
+    # React'in hazır olma ve ilk çizim bildirimleri
+    ready = pyqtSignal()              # React QWebChannel'a bağlandı
+    firstPagePainted = pyqtSignal()   # İlk sayfa karosu çizildi
     
     # React'den gelen işlemler için sinyaller
     toolActionRequested = pyqtSignal(str, dict)  # Tool ID ve data
     pageChanged = pyqtSignal(int)                # Sayfa değişikliği
+    viewChanged = pyqtSignal(int, int, int)      # Sayfa, zoom, döndürme
+    thumbnailsRequested = pyqtSignal(int, int)   # Kenar çubuğunda görünen sayfa aralığı
     annotationAdded = pyqtSignal(dict)           # Yeni annotation
     bookmarkAdded = pyqtSignal(dict)             # Yeni bookmark
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, max_jobs: Optional[int] = None):
         super().__init__(parent)
         self._pdf_data: Optional[Dict[str, Any]] = None
+        self._state = StateStore()
         self._mutex = QMutex()
+        self._search: Optional[SearchService] = None
+        
+        # Ağır araçlar GUI iş parçacığını bloklamadan arka planda çalışır
+        self._jobs = JobManager(max_jobs, self)
+        self._jobs.jobStarted.connect(self.jobStarted)
+        self._jobs.jobProgress.connect(self.jobProgress)
+        self._jobs.jobFinished.connect(self.jobFinished)
         
         # Tool action handlers
         self._tool_handlers: Dict[str, Callable] = {
@@ -83,6 +124,16 @@ class PDFJSBridge(QObject):
         except Exception as e:
             return json.dumps({'success': False, 'error': str(e)})
     
+    @pyqtSlot()
+    def bridgeReady(self) -> None:
+        """React QWebChannel'a bağlandı ve sinyalleri dinliyor"""
+        self.ready.emit()
+    
+    @pyqtSlot()
+    def onFirstPagePainted(self) -> None:
+        """React ilk sayfanın karosunu çizdi"""
+        self.firstPagePainted.emit()
+    
     @pyqtSlot(str)
     def onPageChange(self, page_data: str) -> None:
         """React'den sayfa değişikliği bildirimi"""
@@ -90,9 +141,19 @@ class PDFJSBridge(QObject):
             data = json.loads(page_data)
             page_number = data.get('page', 1)
             self.pageChanged.emit(page_number)
+            self.viewChanged.emit(page_number, data.get('zoom', 100), data.get('rotation', 0))
         except Exception as e:
             print(f"Page change error: {e}")
     
+    @pyqtSlot(str)
+    def requestThumbnails(self, range_data: str) -> None:
+        """Kenar çubuğunda görünen aralık; küçük resimler buradan başlayarak üretilir"""
+        try:
+            data = json.loads(range_data)
+            self.thumbnailsRequested.emit(int(data['first']), int(data['last']))
+        except Exception as e:
+            print(f"Thumbnail request error: {e}")
+    
     @pyqtSlot(str)
     def onAnnotationAdd(self, annotation_data: str) -> None:
         """React'den yeni annotation bildirimi"""
@@ -102,11 +163,63 @@ class PDFJSBridge(QObject):
         except Exception as e:
             print(f"Annotation add error: {e}")
     
-    def update_pdf_data(self, pdf_data: Dict[str, Any]) -> None:
-        """PDF verisini güncelle ve React'e gönder"""
+    def set_search_service(self, service: SearchService) -> None:
+        """Arama servisini bağla; sonuçlar doğrudan React'e iletilir"""
+        self._search = service
+        service.searchResults.connect(self.searchResults)
+        service.indexProgress.connect(self.searchIndexProgress)
+    
+    @pyqtSlot(str, result=str)
+    def search(self, query_data: str) -> str:
+        """Aramayı başlat; sonuçlar searchResults sinyaliyle parça parça gelir"""
+        try:
+            if self._search is None:
+                raise RuntimeError("Arama servisi bağlı değil")
+            data = json.loads(query_data)
+            query_id = self._search.search(str(data.get('query', '')))
+            return json.dumps({'success': True, 'queryId': query_id})
+        except Exception as e:
+            return json.dumps({'success': False, 'error': str(e)})
+    
+    @pyqtSlot()
+    def cancelSearch(self) -> None:
+        """Süren aramayı iptal et"""
+        if self._search is not None:
+            self._search.cancel_search()
+    
+    @pyqtSlot(str, result=str)
+    def cancelJob(self, job_id: str) -> str:
+        """React'den arka plan işi iptal isteği"""
+        if self._jobs.cancel(job_id):
+            return json.dumps({'success': True, 'jobId': job_id})
+        return json.dumps({'success': False, 'error': f'İş bulunamadı: {job_id}'})
+    
+    def cancel_all_jobs(self, wait_msecs: int = -1) -> bool:
+        """Tüm arka plan işlerini iptal et ve bitmelerini bekle"""
+        self._jobs.cancel_all()
+        return self._jobs.wait(wait_msecs)
+    
+    @pyqtSlot(result=str)
+    def requestPdfSnapshot(self) -> str:
+        """React'in sürüm uyuşmazlığında istediği tam anlık görüntü"""
+        return self._state.snapshot()
+    
+    def update_pdf_data(self, pdf_data: Dict[str, Any], resync: bool = False) -> None:
+        """
+        PDF verisini güncelle ve React'e yalnızca farkı gönder
+        
+        Yeni belge, resync veya çok büyük fark için tam anlık görüntü
+        pdfDataChanged ile, diğer durumlarda yama pdfDataPatched ile gider.
+        """
         with QMutexLocker(self._mutex):
-            self._pdf_data = pdf_data
-            self.pdfDataChanged.emit(json.dumps(pdf_data))
+            previous = self._pdf_data or {}
+            resync = resync or previous.get('filePath') != pdf_data.get('filePath')
+            kind, message = self._state.update(pdf_data, resync=resync)
+            self._pdf_data = self._state.state
+            if kind == 'snapshot':
+                self.pdfDataChanged.emit(message)
+            elif kind == 'patch':
+                self.pdfDataPatched.emit(message)
     
     def update_theme(self, theme: str) -> None:
         """Tema değişikliğini React'e bildir"""
@@ -120,13 +233,13 @@ class PDFJSBridge(QObject):
     def _handle_zoom_in(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Yakınlaştırma işlemi"""
         current_zoom = data.get('zoom', 100)
-        new_zoom = min(500, current_zoom + 25)
+        new_zoom = min(ZOOM_MAX, current_zoom + ZOOM_STEP)
         return {'zoom': new_zoom}
     
     def _handle_zoom_out(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Uzaklaştırma işlemi"""
         current_zoom = data.get('zoom', 100)
-        new_zoom = max(25, current_zoom - 25)
+        new_zoom = max(ZOOM_MIN, current_zoom - ZOOM_STEP)
         return {'zoom': new_zoom}
     
     def _handle_rotate(self, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -135,21 +248,28 @@ class PDFJSBridge(QObject):
         new_rotation = (current_rotation + 90) % 360
         return {'rotation': new_rotation}
     
+    def _submit_job(self, tool_id: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Ağır aracı arka plan kuyruğuna al; sonuç jobFinished ile gelir"""
+        data = dict(data)
+        if not data.get('file') and self._pdf_data:
+            data['file'] = self._pdf_data.get('filePath')
+        return {'jobId': self._jobs.submit(tool_id, JOB_FUNCTIONS[tool_id], data)}
+    
     def _handle_split(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """PDF bölme işlemi - gerçek implementasyon gerekir"""
-        return {'message': 'Split functionality will be implemented'}
+        """PDF bölme işlemi (arka planda)"""
+        return self._submit_job('split', data)
     
     def _handle_merge(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """PDF birleştirme işlemi - gerçek implementasyon gerekir"""
-        return {'message': 'Merge functionality will be implemented'}
+        """PDF birleştirme işlemi (arka planda)"""
+        return self._submit_job('merge', data)
     
     def _handle_encrypt(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """PDF şifreleme işlemi"""
-        return {'message': 'Encryption functionality will be implemented'}
+        """PDF şifreleme işlemi (arka planda)"""
+        return self._submit_job('encrypt', data)
     
     def _handle_decrypt(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """PDF şifre kaldırma işlemi"""
-        return {'message': 'Decryption functionality will be implemented'}
+        """PDF şifre kaldırma işlemi (arka planda)"""
+        return self._submit_job('decrypt', data)
     
     def _handle_highlight(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """Vurgulama işlemi"""
@@ -164,8 +284,8 @@ class PDFJSBridge(QObject):
         return {'message': 'AI summarization will be implemented'}
     
     def _handle_text_extract(self, data: Dict[str, Any]) -> Dict[str, Any]:
-        """Metin çıkarma işlemi"""
-        return {'message': 'Text extraction will be implemented'}
+        """Metin çıkarma işlemi (arka planda)"""
+        return self._submit_job('extract', data)
 
 
 class PDFViewerWidget(QWebEngineView):
@@ -178,20 +298,60 @@ class PDFViewerWidget(QWebEngineView):
     pdfLoaded = pyqtSignal(dict)
     toolActionPerformed = pyqtSignal(str, dict)
     errorOccurred = pyqtSignal(str)
+    ready = pyqtSignal()             # React köprüye bağlandı
+    firstPagePainted = pyqtSignal()  # İlk sayfa karosu çizildi
     
     def __init__(self, parent=None):
         super().__init__(parent)
         
-        # JavaScript köprüsü
+        # Kalıcı profildeki sayfa; React önceden yüklenmeye başlamışsa o sayfa devralınır
+        page = take_prewarmed_page()
+        self._prewarmed = page is not None
+        if page is None:
+            page = ViewerPage(default_web_profile())
+        page.setParent(self)
+        self.setPage(page)
+        
+        # JavaScript köprüsü; React bağlanmadan (olay döngüsünden önce) kaydedilmeli
         self._bridge = PDFJSBridge(self)
-        self._channel = QWebChannel()
+        self._channel = page.webChannel()
         self._channel.registerObject('pdfBridge', self._bridge)
-        self.page().setWebChannel(self._channel)
+        
+        # Sayfalar Python tarafında karolar halinde işlenir (pdftile: şeması)
+        self._renderer = default_renderer()
+        self._thumbnails = default_thumbnail_service()
+        install_tile_handler(self.page().profile(), self._renderer, self._thumbnails)
+        self._current_digest: Optional[str] = None
+        
+        # Sıradaki sayfaların karoları okuma sırasında önceden işlenir
+        self._prefetch = PrefetchScheduler(self._renderer, self)
+        self._view = (100, 0)
+        
+        # Belgeler arka planda açılır; aşamalar geldikçe React'e gönderilir.
+        # Son belgeler deposundaki değişmemiş belgeler yeniden okunmaz.
+        self._recent = default_recent_documents()
+        self._loader = DocumentLoader(self._renderer, self, recent=self._recent)
+        self._last_page = 1
+        
+        # Son sayfa kaydırma sırasında her sayfada değil, durulunca yazılır
+        self._unsaved_page: Optional[Tuple[str, int]] = None
+        self._last_page_timer = QTimer(self)
+        self._last_page_timer.setSingleShot(True)
+        self._last_page_timer.setInterval(LAST_PAGE_SAVE_DELAY_MS)
+        self._last_page_timer.timeout.connect(self.save_last_page)
+        
+        self._pdf_data: Optional[Dict[str, Any]] = None
+        
+        # Arama dizini belge açılınca arka planda oluşturulur
+        self._search = SearchService(self._renderer, parent=self)
+        self._bridge.set_search_service(self._search)
         
         # Widget durumu
         self._is_initialized = False
+        self._active = True
         self._current_pdf_path: Optional[str] = None
         self._current_theme = 'light'
+        self._settings: Dict[str, Any] = {}
         
         # React build dizinini bul
         self._web_build_path = self._find_web_build_path()
@@ -204,94 +364,94 @@ class PDFViewerWidget(QWebEngineView):
     
     def _find_web_build_path(self) -> str:
         """React build dizinini bul"""
-        # PyPI paketi olarak kurulmuşsa
-        try:
-            import pypdf_tools
-            pkg_path = Path(pypdf_tools.__file__).parent
-            build_path = pkg_path / "web" / "build"
-            if build_path.exists():
-                return str(build_path)
-        except ImportError:
-            pass
-        
-        # Geliştirme ortamında
-        current_dir = Path(__file__).parent.parent.parent.parent
-        build_path = current_dir / "web" / "build"
-        if build_path.exists():
-            return str(build_path)
-        
-        # Son çare - mevcut dizinde ara
-        build_path = Path.cwd() / "web" / "build"
-        if build_path.exists():
-            return str(build_path)
-        
-        raise FileNotFoundError("React build dizini bulunamadı!")
+        return str(find_web_build_path())
     
     def _connect_signals(self) -> None:
         """İç sinyalleri bağla"""
         self._bridge.toolActionRequested.connect(self.toolActionPerformed)
         self._bridge.pageChanged.connect(self._on_page_changed)
+        self._bridge.viewChanged.connect(self._on_view_changed)
+        self._bridge.thumbnailsRequested.connect(self._on_thumbnails_requested)
         self._bridge.annotationAdded.connect(self._on_annotation_added)
+        self._bridge.ready.connect(self._on_bridge_ready)
+        self._bridge.firstPagePainted.connect(self._on_first_page_painted)
+        
+        # Belge açılış aşamaları
+        self._loader.headerParsed.connect(self._on_header_parsed)
+        self._loader.pageCountKnown.connect(self._on_page_count_known)
+        self._loader.firstPageReady.connect(self._on_first_page_ready)
+        self._loader.outlineReady.connect(self._on_outline_ready)
+        self._loader.loadFinished.connect(self._on_document_loaded)
+        self._loader.loadFailed.connect(self._on_document_failed)
         
         # Web sayfası yükleme durumu
+        self.loadStarted.connect(self._on_load_started)
         self.loadFinished.connect(self._on_load_finished)
     
     def _initialize_widget(self) -> None:
         """Widget'ı başlat ve React uygulamasını yükle"""
         try:
-            index_path = Path(self._web_build_path) / "index.html"
-            if not index_path.exists():
-                raise FileNotFoundError(f"index.html bulunamadı: {index_path}")
+            url = index_url(Path(self._web_build_path))
+            
+            # Önceden yüklenmeye başlayan sayfa aynı adresteyse ve hâlâ yükleniyorsa bekle
+            prewarmed, self._prewarmed = self._prewarmed, False
+            page = self.page()
+            if prewarmed and page.requestedUrl() == url and page.load_result is None:
+                return
             
             # HTML dosyasını yükle
-            url = QUrl.fromLocalFile(str(index_path))
             self.load(url)
             
         except Exception as e:
             self.errorOccurred.emit(f"Widget başlatma hatası: {str(e)}")
     
+    def _on_load_started(self) -> None:
+        """Sayfa (yeniden) yükleniyor; React hazır olana kadar güncellemeler bekletilir"""
+        self._is_initialized = False
+    
     def _on_load_finished(self, success: bool) -> None:
-        """Web sayfası yüklendiğinde çağrılır"""
+        """Web sayfası yüklendiğinde çağrılır; React hazır olduğunu bridgeReady ile bildirir"""
         if success:
-            self._is_initialized = True
-            # React uygulamasının hazır olmasını bekle
-            QTimer.singleShot(1000, self._post_load_setup)
+            startup_metrics().mark(PAGE_LOADED)
         else:
             self.errorOccurred.emit("React uygulaması yüklenemedi")
     
+    def _on_bridge_ready(self) -> None:
+        """React sinyalleri dinliyor: bekleyen güncellemeleri hemen gönder"""
+        startup_metrics().mark(BRIDGE_READY)
+        self._is_initialized = True
+        self._post_load_setup()
+        self.ready.emit()
+    
     def _post_load_setup(self) -> None:
         """Yükleme sonrası kurulum işlemleri"""
         # Varsayılan tema ayarla
         self._bridge.update_theme(self._current_theme)
+        if self._settings:
+            self._bridge.update_settings(self._settings)
         
-        # Eğer PDF varsa yükle
-        if self._current_pdf_path:
-            self.load_pdf(self._current_pdf_path)
+        # Açılmış veya açılmakta olan belge varsa gönder; sonraki aşamalar kendiliğinden gelir
+        if self._pdf_data:
+            self._bridge.update_pdf_data(self._pdf_data, resync=True)
+    
+    def _on_first_page_painted(self) -> None:
+        """Süreç başlangıcından ilk sayfanın çizilmesine kadar geçen süreyi kaydet"""
+        if startup_metrics().mark(FIRST_PAGE) is not None:
+            self.firstPagePainted.emit()
     
     def load_pdf(self, file_path: str) -> bool:
-        """PDF dosyasını yükle"""
+        """
+        PDF dosyasını arka planda açmaya başla
+        
+        Dosya bulunamazsa False döner; açılış hataları errorOccurred ile,
+        tamamlanma pdfLoaded ile bildirilir. Yeni çağrı süren açılışı iptal eder.
+        """
         try:
             pdf_path = Path(file_path)
             if not pdf_path.exists():
                 raise FileNotFoundError(f"PDF dosyası bulunamadı: {file_path}")
             
-            # PDF metadata'sını çıkar (basit implementasyon)
-            pdf_data = {
-                'filePath': str(pdf_path),
-                'fileName': pdf_path.name,
-                'fileSize': pdf_path.stat().st_size,
-                'totalPages': self._get_pdf_page_count(pdf_path),
-                'metadata': self._extract_pdf_metadata(pdf_path),
-                'lastModified': pdf_path.stat().st_mtime
-            }
-            
-            self._current_pdf_path = file_path
-            
-            # React'e PDF verisini gönder
-            if self._is_initialized:
-                self._bridge.update_pdf_data(pdf_data)
-            
-            self.pdfLoaded.emit(pdf_data)
+            self._loader.load(pdf_path, *self._view)
             return True
             
         except Exception as e:
@@ -299,24 +459,97 @@ class PDFViewerWidget(QWebEngineView):
             self.errorOccurred.emit(error_msg)
             return False
     
-    def _get_pdf_page_count(self, pdf_path: Path) -> int:
-        """PDF sayfa sayısını al - gerçek implementasyon gerekir"""
-        # Geçici implementasyon - PyPDF2 kullanılmalı
-        return 10  # Placeholder
-    
-    def _extract_pdf_metadata(self, pdf_path: Path) -> Dict[str, Any]:
-        """PDF metadata'sını çıkar - gerçek implementasyon gerekir"""
-        # Geçici implementasyon
-        return {
-            'title': pdf_path.stem,
-            'author': 'Unknown',
-            'subject': '',
-            'keywords': '',
-            'creator': 'PyPDF-Tools',
-            'producer': 'PyPDF-Tools',
-            'creationDate': '',
-            'modificationDate': ''
-        }
+    def _publish(self, **changes: Any) -> None:
+        """Açılmakta olan belgenin verisini güncelle ve React'e gönder"""
+        self._pdf_data = {**self._pdf_data, **changes}
+        if self._is_initialized:
+            self._bridge.update_pdf_data(self._pdf_data)
+    
+    def _on_header_parsed(self, request: int, info: Dict[str, Any]) -> None:
+        """Dosya bilgileri hazır: React belge başlığını ve sayfa sayısını gösterir"""
+        if not self._loader.is_current(request):
+            return
+        
+        # Önceki belgenin arka plan işleri yeni belgeyle karışmasın
+        self._prefetch.set_document(None)
+        self._search.set_document(None)
+        
+        # Şifreli belgeler karo servisinde açılamaz; sayfa boyutları olmadan gönderilir
+        if info['encrypted']:
+            self._release_document()
+            self._current_digest = None
+            self._loader.keep(None)
+        
+        self.save_last_page()
+        self._current_pdf_path = info['filePath']
+        self._last_page = info.get('lastPage', 1)
+        self._pdf_data = {}
+        self._publish(**info, loadStage='header')
+    
+    def _on_page_count_known(self, request: int, document: Dict[str, Any]) -> None:
+        """Belge açıldı: karo adresleri ve sayfa boyutları gönderilir"""
+        digest = document['digest']
+        if not self._loader.is_current(request):
+            if digest != self._current_digest:
+                self._loader.release(digest)
+            return
+        
+        self._thumbnails.open_document(digest, len(document['pages']), owner=self)
+        self._release_document(keep=digest)
+        self._current_digest = digest
+        self._loader.keep(digest)
+        self._renderer.set_active(digest, self._active, owner=self._loader)
+        self._prefetch.set_document(digest, document['pages'])
+        self._search.set_document(digest, len(document['pages']))
+        self._publish(
+            totalPages=len(document['pages']),
+            tileUrl=tile_base_url(digest),
+            tileSize=TILE_SIZE,
+            pageSizes=document['pages'],
+            thumbnailUrl=thumbnail_base_url(digest),
+            loadStage='pages',
+        )
+    
+    def _on_first_page_ready(self, request: int, digest: str) -> None:
+        """İlk sayfanın karoları önbellekte"""
+        if self._loader.is_current(request):
+            self._publish(loadStage='firstPage')
+    
+    def _on_outline_ready(self, request: int, outline: List[Dict[str, Any]]) -> None:
+        """Yer işaretleri okundu"""
+        if self._loader.is_current(request):
+            self._publish(outline=outline)
+    
+    def _on_document_loaded(self, request: int) -> None:
+        """Açılış tamamlandı"""
+        if self._loader.is_current(request):
+            self._publish(loadStage='ready')
+            self.pdfLoaded.emit(self._pdf_data)
+    
+    def _on_document_failed(self, request: int, error: str) -> None:
+        """Açılış hatası"""
+        if self._loader.is_current(request):
+            self.errorOccurred.emit(error)
+    
+    def _release_document(self, keep: Optional[str] = None) -> None:
+        """Önceki belgenin karo ve küçük resim kaydını bırak; belge yükleyici adına açılmıştır"""
+        if self._current_digest not in (None, keep):
+            self._thumbnails.close_document(self._current_digest, owner=self)
+            self._renderer.close_document(self._current_digest, owner=self._loader)
+    
+    def set_active(self, active: bool) -> None:
+        """
+        Görüntüleyicinin görünür sekme olup olmadığını bildir
+
+        Arka plana geçen belgenin önden yüklemesi durur, karoları belge
+        bütçesine iner; etkinleşince karolar istendikçe geri yüklenir.
+        """
+        self._active = active
+        if not active:
+            self._prefetch.cancel()
+            self.save_last_page()
+        if self._current_digest is not None:
+            self._renderer.set_active(self._current_digest, active, owner=self._loader)
     
     def set_theme(self, theme: str) -> None:
         """Tema değiştir"""
@@ -327,6 +560,7 @@ class PDFViewerWidget(QWebEngineView):
     
     def update_settings(self, settings: Dict[str, Any]) -> None:
         """Ayarları güncelle"""
+        self._settings.update(settings)
         if self._is_initialized:
             self._bridge.update_settings(settings)
     
@@ -334,6 +568,37 @@ class PDFViewerWidget(QWebEngineView):
         """Sayfa değişikliği handler"""
         print(f"Sayfa değişti: {page_number}")
     
+    def _on_view_changed(self, page_number: int, zoom: int, rotation: int) -> None:
+        """Sayfa, zoom veya döndürme değişince sıradaki sayfaları önden işle"""
+        try:
+            self._prefetch.page_changed(page_number, zoom, rotation)
+            self._view = (zoom, rotation)
+        except ValueError as e:
+            print(f"Prefetch error: {e}")
+        
+        # Son görüntülenen sayfa yeniden açılışta geri yüklenir
+        if self._current_pdf_path and page_number != self._last_page:
+            self._last_page = page_number
+            self._unsaved_page = (self._current_pdf_path, page_number)
+            self._last_page_timer.start()
+    
+    def save_last_page(self) -> None:
+        """Bekleyen son sayfayı son belgeler deposuna yaz"""
+        self._last_page_timer.stop()
+        if self._unsaved_page is None:
+            return
+        path, page_number = self._unsaved_page
+        self._unsaved_page = None
+        try:
+            self._recent.set_last_page(path, page_number)
+        except sqlite3.Error as e:
+            print(f"Recent documents error: {e}")
+    
+    def _on_thumbnails_requested(self, first: int, last: int) -> None:
+        """Görünen aralıktan başlayarak eksik küçük resimleri arka planda üret"""
+        if self._current_digest is not None:
+            self._thumbnails.request(self._current_digest, first, last)
+    
     def _on_annotation_added(self, annotation: Dict[str, Any]) -> None:
         """Yeni annotation handler"""
         print(f"Yeni annotation eklendi: {annotation}")
@@ -351,6 +616,20 @@ class PDFViewerWidget(QWebEngineView):
         self._is_initialized = False
         self._initialize_widget()
 
+    def closeEvent(self, event) -> None:
+        """Kapanırken arka plan işlerini iptal et"""
+        self._bridge.cancel_all_jobs(5000)
+        self._loader.cancel()
+        self._loader.wait(5000)
+        self._prefetch.cancel()
+        self._prefetch.wait(5000)
+        self._thumbnails.cancel()
+        self._search.close()
+        self.save_last_page()
+        self._release_document()
+        self._current_digest = None
+        super().closeEvent(event)
+
 
 class PDFViewerContainer(QWidget):
     """
@@ -369,6 +648,9 @@ class PDFViewerContainer(QWidget):
         self.pdf_viewer = PDFViewerWidget(self)
         layout.addWidget(self.pdf_viewer)
         
+        # Bu sekmede açılan dosya (açılış sürerken de dolu)
+        self.file_path: Optional[str] = None
+        
         # Hata durumları için sinyal bağlantıları
         self.pdf_viewer.errorOccurred.connect(self._show_error)
         
@@ -378,8 +660,15 @@ class PDFViewerContainer(QWidget):
     
     def load_pdf(self, file_path: str) -> bool:
         """PDF yükle"""
-        return self.pdf_viewer.load_pdf(file_path)
+        success = self.pdf_viewer.load_pdf(file_path)
+        if success:
+            self.file_path = file_path
+        return success
     
     def set_theme(self, theme: str) -> None:
         """Tema ayarla"""
         self.pdf_viewer.set_theme(theme)
+    
+    def set_active(self, active: bool) -> None:
+        """Sekme görünür veya arka planda"""
+        self.pdf_viewer.set_active(active)
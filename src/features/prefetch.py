@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools Sayfa Önden Yükleme
+Sayfa değişimlerinin hızına ve yönüne bakarak sıradaki sayfaların
+karolarını düşük öncelikli arka plan havuzunda önceden işleyen zamanlayıcı
+
+Sakin okumada DEFAULT_DEPTH sayfa, hızlı gezinmede önümüzdeki
+PREFETCH_HORIZON saniyede ulaşılacak sayfa sayısı kadar (en çok
+MAX_DEPTH) önden işlenir; geri dönüşler için bir sayfa da geride tutulur.
+Karolar TileRenderer önbelleğine yazılır; sayfa çevrildiğinde
+pdftile: istekleri doğrudan önbellekten yanıtlanır.
+
+Her sayfa değişiminde sırada bekleyen görevler atılır. Atlamada
+(JUMP_PAGES'ten uzak sayfa) veya zoom/döndürme değişiminde çalışan
+görev de bir sonraki karodan önce durdurulur.
+"""
+
+import math
+import threading
+import time
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Sequence, Tuple
+
+from PyQt6.QtCore import QObject, QRunnable, QThread
+
+from pypdf_tools.features.render import (
+    TileRenderer, page_pixel_size, tile_grid, validate_rotation, validate_zoom
+)
+from pypdf_tools.features.workers import PRIORITY_BACKGROUND, SerialQueue
+
+
+# Sakin okumada önden işlenen sayfa sayısı
+DEFAULT_DEPTH = 2
+
+# Hızlı gezinmede önden işlenen en fazla sayfa
+MAX_DEPTH = 8
+
+# Derinlik, bu kadar saniye içinde ulaşılacak sayfaları kapsar
+PREFETCH_HORIZON = 1.0
+
+# Hız hesabında kullanılan en eski değişim (saniye)
+VELOCITY_WINDOW = 2.0
+
+# Bundan uzak sayfa değişimi atlama sayılır
+JUMP_PAGES = 5
+
+
+class PagePredictor:
+    """
+    Sayfa değişimlerinden yönü ve hızı izleyip önden işlenecek
+    sayfaları sıralayan yardımcı (Qt'den bağımsız)
+    """
+
+    def __init__(self, depth: int = DEFAULT_DEPTH, max_depth: int = MAX_DEPTH,
+                 jump_pages: int = JUMP_PAGES,
+                 clock: Callable[[], float] = time.monotonic):
+        self.depth = depth
+        self.max_depth = max(depth, max_depth)
+        self.jump_pages = jump_pages
+        self._clock = clock
+        self._history: Deque[Tuple[float, int]] = deque(maxlen=8)
+        self.direction = 1
+
+    def reset(self) -> None:
+        self._history.clear()
+        self.direction = 1
+
+    def velocity(self) -> float:
+        """Son değişimlerdeki hız (sayfa/saniye)"""
+        if len(self._history) < 2:
+            return 0.0
+        (start, first), (end, last) = self._history[0], self._history[-1]
+        return abs(last - first) / max(end - start, 1e-3)
+
+    def update(self, page: int, total_pages: int) -> Tuple[List[int], bool]:
+        """
+        Yeni sayfayı kaydet; (önden işlenecek sayfalar, atlama mı) döndür
+
+        Sayfalar öncelik sırasındadır: ilerleme yönünde yakından uzağa,
+        sonda geride kalan bir sayfa.
+        """
+        now = self._clock()
+        jumped = False
+
+        if self._history:
+            delta = page - self._history[-1][1]
+            if abs(delta) > self.jump_pages:
+                jumped = True
+                self.reset()
+            elif delta:
+                direction = 1 if delta > 0 else -1
+                if direction != self.direction:
+                    # Yön değişince eski hız geçersiz
+                    self._history.clear()
+                    self.direction = direction
+
+        if not self._history or self._history[-1][1] != page:
+            self._history.append((now, page))
+        while len(self._history) > 2 and now - self._history[0][0] > VELOCITY_WINDOW:
+            self._history.popleft()
+
+        depth = math.ceil(self.velocity() * PREFETCH_HORIZON)
+        depth = min(self.max_depth, max(self.depth, depth))
+
+        pages = [page + self.direction * step for step in range(1, depth + 1)]
+        pages.append(page - self.direction)
+        return [number for number in pages if 1 <= number <= total_pages], jumped
+
+
+class _PrefetchPage(QRunnable):
+    """Bir sayfanın tüm karolarını önbelleğe işleyen görev"""
+
+    def __init__(self, scheduler: 'PrefetchScheduler', generation: int,
+                 digest: str, page: int, zoom: int, rotation: int,
+                 grid: Tuple[int, int]):
+        super().__init__()
+        self._scheduler = scheduler
+        self._generation = generation
+        self._key = (digest, page, zoom, rotation)
+        self._grid = grid
+
+    def run(self) -> None:
+        cols, rows = self._grid
+        for row in range(rows):
+            for col in range(cols):
+                # Atlama veya görünüm değişiminden sonra kalan karoları işleme
+                if self._scheduler._generation != self._generation:
+                    self._scheduler._count('cancelled')
+                    return
+                try:
+                    self._scheduler.renderer.tile(*self._key, col, row)
+                except Exception as e:
+                    print(f"Prefetch error: {e}")
+                    return
+                self._scheduler._count('tiles')
+        self._scheduler._count('pages')
+
+
+class PrefetchScheduler(QObject):
+    """
+    Görüntüleyicinin sayfa değişimlerine göre karo önden yükleyicisi
+
+    Görevler paylaşımlı havuzda en düşük öncelikli bir kuyrukta sırayla
+    çalışır; böylece görünür karo istekleriyle yalnızca işleme kilidinde
+    yarışır.
+    """
+
+    def __init__(self, renderer: TileRenderer, parent: Optional[QObject] = None,
+                 predictor: Optional[PagePredictor] = None, enabled: bool = True):
+        super().__init__(parent)
+        self.renderer = renderer
+        self.predictor = predictor or PagePredictor()
+        self.enabled = enabled
+        self._pool = SerialQueue(PRIORITY_BACKGROUND, QThread.Priority.LowestPriority)
+        self._generation = 0
+        self._digest: Optional[str] = None
+        self._page_sizes: Sequence[Sequence[float]] = ()
+        self._view: Optional[Tuple[int, int]] = None
+        self._lock = threading.Lock()
+        self._stats = {'pages': 0, 'tiles': 0, 'cancelled': 0}
+
+    def set_document(self, digest: Optional[str],
+                     page_sizes: Sequence[Sequence[float]] = ()) -> None:
+        """Önden yüklenecek belgeyi değiştir; None önden yüklemeyi durdurur"""
+        self.cancel()
+        self._digest = digest
+        self._page_sizes = page_sizes
+        self._view = None
+        self.predictor.reset()
+
+    def page_changed(self, page: int, zoom: int, rotation: int) -> List[int]:
+        """Sayfa değişimini işle; sıraya alınan sayfaları döndür"""
+        if not self.enabled or self._digest is None:
+            return []
+
+        zoom, rotation = validate_zoom(zoom), validate_rotation(rotation)
+        pages, jumped = self.predictor.update(page, len(self._page_sizes))
+        # Sıradaki görevler her değişimde yenilenir; çalışan görev yalnızca
+        # atlamada veya görünüm değişiminde durdurulur
+        self._pool.clear()
+        if jumped or self._view != (zoom, rotation):
+            self._generation += 1
+        self._view = (zoom, rotation)
+
+        # En yakın sayfa en yüksek öncelikle verilir
+        for index, number in enumerate(pages):
+            width, height = self._page_sizes[number - 1]
+            grid = tile_grid(*page_pixel_size(width, height, zoom, rotation))
+            self._pool.start(_PrefetchPage(self, self._generation, self._digest,
+                                           number, zoom, rotation, grid), len(pages) - index)
+        return pages
+
+    def cancel(self) -> None:
+        """Sıradaki görevleri at, çalışan görevi durdur"""
+        self._pool.clear()
+        self._generation += 1
+
+    def wait(self, msecs: int = -1) -> bool:
+        """Görevlerin bitmesini bekle (testler ve kapanış için)"""
+        return self._pool.wait(msecs)
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self._stats)
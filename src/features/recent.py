@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools Son Belgeler
+Son açılan belgelerin yolunu, (boyut, mtime) parmak izini, açılış
+bilgilerini, ilk sayfa küçük resmini ve son görüntülenen sayfayı
+saklayan SQLite deposu
+
+Parmak izi değişmemiş belge yeniden açılırken metadata ve yer işaretleri
+dosyadan okunmaz; depodaki açılış bilgileri kullanılır.
+
+Menüdeki yolların varlığı PathProbe ile arka plan iş parçacıklarında
+denetlenir. Erişilemeyen ağ bağlantılarında os.stat uzun süre
+bloklayabilir; EXISTS_TIMEOUT içinde yanıt gelmezse yol erişilemez
+sayılır ve iş parçacığı bırakılır.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Union
+
+from PyQt6.QtCore import QObject, QTimer, pyqtSignal
+
+from pypdf_tools.core.paths import app_data_dir
+
+
+# Saklanan en fazla belge
+RECENT_LIMIT = 10
+
+# Varlık denetiminin zaman aşımı (saniye)
+EXISTS_TIMEOUT = 2.0
+
+# Menü simgesi olarak saklanan küçük resmin genişliği (piksel)
+RECENT_THUMBNAIL_WIDTH = 64
+
+# Son sayfa, sayfa değişimleri bu süre durulunca yazılır (ms)
+LAST_PAGE_SAVE_DELAY_MS = 1000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS recent (
+    path TEXT PRIMARY KEY,
+    size INTEGER,
+    mtime_ns INTEGER,
+    info TEXT,
+    outline TEXT,
+    thumbnail BLOB,
+    last_page INTEGER NOT NULL DEFAULT 1,
+    opened_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS recent_opened_at ON recent (opened_at);
+"""
+
+
+class RecentDocuments:
+    """
+    Son belgeler deposu
+
+    Birden fazla iş parçacığından kullanılabilir; erişim iç kilitle
+    sıralanır. Yollar olduğu gibi saklanır, diske erişilmez.
+    """
+
+    def __init__(self, path: Optional[Union[str, Path]] = None, limit: int = RECENT_LIMIT):
+        self.path = Path(path) if path is not None else app_data_dir() / 'recent.db'
+        self.limit = limit
+        self._connection: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def _db(self) -> sqlite3.Connection:
+        """Bağlantıyı ilk kullanımda aç; kilit altında çağrılmalı"""
+        if self._connection is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(str(self.path), timeout=10, check_same_thread=False)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            connection.executescript(_SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def entries(self) -> List[Dict[str, Any]]:
+        """Belgeler en son açılandan başlayarak"""
+        with self._lock:
+            rows = self._db().execute(
+                'SELECT path, thumbnail, last_page, opened_at FROM recent '
+                'ORDER BY opened_at DESC LIMIT ?', (self.limit,)
+            ).fetchall()
+        return [{'path': path, 'thumbnail': thumbnail, 'last_page': last_page,
+                 'opened_at': opened_at} for path, thumbnail, last_page, opened_at in rows]
+
+    def paths(self) -> List[str]:
+        return [entry['path'] for entry in self.entries()]
+
+    def touch(self, path: str) -> None:
+        """Belgeyi en son açılan olarak işaretle; sınırı aşan eski kayıtlar silinir"""
+        with self._lock:
+            db = self._db()
+            db.execute(
+                'INSERT INTO recent (path, opened_at) VALUES (?, ?) '
+                'ON CONFLICT(path) DO UPDATE SET opened_at = excluded.opened_at',
+                (path, time.time())
+            )
+            self._trim(db)
+            db.commit()
+
+    def import_paths(self, paths: Iterable[str]) -> int:
+        """Eski QSettings listesini (en yeni başta) aktar; eklenen kayıt sayısını döndür"""
+        paths = list(paths)[:self.limit]
+        now = time.time()
+        with self._lock:
+            db = self._db()
+            added = 0
+            for index, path in enumerate(paths):
+                cursor = db.execute(
+                    'INSERT OR IGNORE INTO recent (path, opened_at) VALUES (?, ?)',
+                    (path, now - index)
+                )
+                added += cursor.rowcount
+            self._trim(db)
+            db.commit()
+        return added
+
+    def remove(self, path: str) -> None:
+        with self._lock:
+            self._db().execute('DELETE FROM recent WHERE path = ?', (path,))
+            self._db().commit()
+
+    def lookup(self, path: str, size: int, mtime_ns: int) -> Optional[Dict[str, Any]]:
+        """
+        Parmak izi değişmemiş belgenin saklı açılış bilgileri
+
+        {'info', 'outline', 'last_page', 'thumbnail'} döndürür; belge
+        kayıtlı değilse veya değişmişse None.
+        """
+        with self._lock:
+            row = self._db().execute(
+                'SELECT size, mtime_ns, info, outline, last_page, thumbnail '
+                'FROM recent WHERE path = ?', (path,)
+            ).fetchone()
+        if row is None or row[2] is None or tuple(row[:2]) != (size, mtime_ns):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return {'info': json.loads(row[2]), 'outline': json.loads(row[3]),
+                'last_page': row[4], 'thumbnail': row[5]}
+
+    def record(self, path: str, size: int, mtime_ns: int, info: Dict[str, Any],
+               outline: List[Dict[str, Any]], thumbnail: Optional[bytes] = None) -> None:
+        """Belgenin açılış bilgilerini parmak iziyle sakla; değişmiş belgede son sayfa sıfırlanır"""
+        encoded = (json.dumps(info, ensure_ascii=False, default=str),
+                   json.dumps(outline, ensure_ascii=False))
+        with self._lock:
+            db = self._db()
+            db.execute(
+                'INSERT INTO recent (path, size, mtime_ns, info, outline, thumbnail, opened_at) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?) '
+                'ON CONFLICT(path) DO UPDATE SET '
+                'last_page = CASE WHEN size = excluded.size AND mtime_ns = excluded.mtime_ns '
+                'THEN last_page ELSE 1 END, '
+                'size = excluded.size, mtime_ns = excluded.mtime_ns, info = excluded.info, '
+                'outline = excluded.outline, thumbnail = excluded.thumbnail',
+                (path, size, mtime_ns, *encoded, thumbnail, time.time())
+            )
+            self._trim(db)
+            db.commit()
+
+    def set_last_page(self, path: str, page: int) -> None:
+        """Son görüntülenen sayfayı sakla"""
+        with self._lock:
+            db = self._db()
+            db.execute('UPDATE recent SET last_page = ? WHERE path = ? AND last_page != ?',
+                       (page, path, page))
+            db.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+    def _trim(self, db: sqlite3.Connection) -> None:
+        db.execute(
+            'DELETE FROM recent WHERE path NOT IN '
+            '(SELECT path FROM recent ORDER BY opened_at DESC LIMIT ?)', (self.limit,)
+        )
+
+
+class PathProbe(QObject):
+    """
+    Yolların varlığını GUI iş parçacığını bloklamadan denetleyen yardımcı
+
+    Her yol ayrı bir daemon iş parçacığında os.stat ile denetlenir.
+    Sonuç checked(yol, True/False) ile bildirilir; timeout içinde yanıt
+    gelmezse checked(yol, None) gönderilir. Geç gelen yanıt yine
+    bildirilir. Yanıt beklenen yol için yeni iş parçacığı açılmaz.
+    """
+
+    checked = pyqtSignal(str, object)
+    _probed = pyqtSignal(str, bool)
+
+    def __init__(self, timeout: float = EXISTS_TIMEOUT, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.timeout = timeout
+        self._pending: Dict[str, float] = {}
+        self._expired: Set[str] = set()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._expire)
+        self._probed.connect(self._on_probed)
+
+    def check(self, paths: Iterable[str]) -> None:
+        """Yolları arka planda denetle"""
+        deadline = time.monotonic() + self.timeout
+        for path in paths:
+            if path in self._pending:
+                continue
+            self._pending[path] = deadline
+            threading.Thread(target=self._probe, args=(path,), daemon=True,
+                             name='pypdf-path-probe').start()
+        self._schedule()
+
+    def pending(self) -> List[str]:
+        return list(self._pending)
+
+    def _probe(self, path: str) -> None:
+        try:
+            os.stat(path)
+            exists = True
+        except (OSError, ValueError):
+            exists = False
+        self._probed.emit(path, exists)
+
+    def _on_probed(self, path: str, exists: bool) -> None:
+        self._pending.pop(path, None)
+        self._expired.discard(path)
+        self.checked.emit(path, exists)
+        self._schedule()
+
+    def _expire(self) -> None:
+        now = time.monotonic()
+        for path, deadline in self._pending.items():
+            if deadline <= now and path not in self._expired:
+                self._expired.add(path)
+                self.checked.emit(path, None)
+        self._schedule()
+
+    def _schedule(self) -> None:
+        """Zaman aşımı dolmamış en yakın yol için zamanlayıcıyı kur"""
+        deadlines = [deadline for path, deadline in self._pending.items()
+                     if path not in self._expired]
+        if not deadlines:
+            self._timer.stop()
+            return
+        self._timer.start(max(0, int((min(deadlines) - time.monotonic()) * 1000) + 1))
+
+
+@lru_cache(maxsize=None)
+def default_recent_documents() -> RecentDocuments:
+    """Uygulamanın son belgeler deposu"""
+    return RecentDocuments()
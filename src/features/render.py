@@ -0,0 +1,492 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools Sayfa Karoları
+Sayfaları yakınlaştırma düzeyine göre karolara bölerek QtPdf ile
+işleyen ve bellek + disk LRU önbelleğinde saklayan görüntüleyici arka ucu
+
+Karo anahtarı (dosya özeti, sayfa, zoom, döndürme, sütun, satır)
+şeklindedir. Önce süreç içi bellek önbelleğine, sonra DocumentCache
+içindeki tiles tablosuna bakılır; yalnızca ikisinde de olmayan karolar
+işlenir. Disk kayıtları belge başına LRU ile diğer önbellek verileriyle
+birlikte silinir.
+
+Bellek önbelleği tüm belgeler için ortaktır. Görünür (etkin) belgeler
+yalnızca toplam sınırla, arka plandaki belgeler ayrıca belge başına
+BACKGROUND_DOCUMENT_BYTES ile sınırlıdır. Açık QtPdf belgesi sayısı
+MAX_OPEN_DOCUMENTS'ı aşınca en uzun süredir arka planda olan belgeler
+askıya alınır: çözümlenmiş sayfaları ve karoları bırakılır, ilk
+karo isteğinde dosyadan yeniden açılır.
+
+Aynı içerikli dosyalar aynı özeti paylaşır. Belgeyi açan her sahip
+(görüntüleyici) ayrı kaydedilir; belge son sahibi bıraktığında kapanır,
+sahiplerden biri görünürse belge etkin sayılır.
+
+Geometri React tarafıyla aynıdır: %100'de 1 pt = 96/72 CSS pikseli,
+sayfa TILE_SIZE karelik ızgaraya bölünür, kenar karoları daha küçüktür.
+"""
+
+import math
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Hashable, List, Optional, Set, Tuple, Union
+
+from PyQt6.QtCore import QBuffer, QCoreApplication, QIODevice, QRect, QSize, Qt
+from PyQt6.QtGui import QImage, QPainter, QTransform
+
+from pypdf_tools.core.cache import DocumentCache
+
+
+# _handle_zoom_in/_handle_zoom_out ile aynı aralık ve adım
+ZOOM_MIN = 25
+ZOOM_MAX = 500
+ZOOM_STEP = 25
+
+ROTATIONS = (0, 90, 180, 270)
+
+# Karo kenarı (CSS pikseli)
+TILE_SIZE = 512
+
+# %100 yakınlaştırmada nokta başına CSS pikseli
+CSS_SCALE = 96 / 72
+
+# Süreç içi karo önbelleğinin varsayılan boyutu
+DEFAULT_MEMORY_BYTES = 64 * 1024 * 1024
+
+# Arka plandaki belgenin bellekte tutabileceği karo boyutu
+BACKGROUND_DOCUMENT_BYTES = 4 * 1024 * 1024
+
+# Bundan fazla açık belgede arka plandakiler askıya alınır
+MAX_OPEN_DOCUMENTS = 6
+
+# (özet, sayfa, zoom, döndürme, sütun, satır)
+TileKey = Tuple[str, int, int, int, int, int]
+
+
+def validate_zoom(zoom: int) -> int:
+    """Zoom değerini doğrula; yalnızca araç çubuğunun adımları kabul edilir"""
+    zoom = int(zoom)
+    if not ZOOM_MIN <= zoom <= ZOOM_MAX or zoom % ZOOM_STEP:
+        raise ValueError(f"Geçersiz zoom: {zoom} ({ZOOM_MIN}-{ZOOM_MAX}, adım {ZOOM_STEP})")
+    return zoom
+
+
+def validate_rotation(rotation: int) -> int:
+    rotation = int(rotation)
+    if rotation not in ROTATIONS:
+        raise ValueError(f"Geçersiz döndürme: {rotation}")
+    return rotation
+
+
+def page_pixel_size(width: float, height: float, zoom: int,
+                    rotation: int = 0) -> Tuple[int, int]:
+    """Nokta cinsinden sayfa boyutunu döndürülmüş piksel boyutuna çevir"""
+    scale = zoom / 100 * CSS_SCALE
+    # JavaScript Math.round ile aynı yuvarlama
+    pixels = (int(width * scale + 0.5), int(height * scale + 0.5))
+    return pixels if rotation in (0, 180) else (pixels[1], pixels[0])
+
+
+def tile_grid(width: int, height: int) -> Tuple[int, int]:
+    """Piksel boyutundaki sayfanın (sütun, satır) karo sayısı"""
+    return math.ceil(width / TILE_SIZE), math.ceil(height / TILE_SIZE)
+
+
+def parse_tile_path(path: str) -> TileKey:
+    """
+    '/<özet>/<sayfa>/<zoom>/<döndürme>/<sütun>_<satır>.png' yolunu çözümle
+
+    Sayfa 1 tabanlıdır. Geçersiz yollarda ValueError fırlatılır.
+    """
+    parts = path.strip('/').split('/')
+    if len(parts) != 5 or not parts[4].endswith('.png'):
+        raise ValueError(f"Geçersiz karo yolu: {path}")
+    digest, page, zoom, rotation, name = parts
+    col, _, row = name[:-len('.png')].partition('_')
+    return (digest, int(page), validate_zoom(int(zoom)), validate_rotation(int(rotation)),
+            int(col), int(row))
+
+
+class TileMemoryCache:
+    """
+    Toplam byte sınırlı, iş parçacığı güvenli LRU karo önbelleği
+
+    Belgelere ayrıca byte bütçesi verilebilir; bütçesini aşan belgenin
+    önce kendi en eski karoları çıkarılır.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MEMORY_BYTES):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._tiles: 'OrderedDict[TileKey, bytes]' = OrderedDict()
+        self._document_bytes: Dict[str, int] = {}
+        self._budgets: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._tiles)
+
+    def get(self, key: TileKey) -> Optional[bytes]:
+        with self._lock:
+            data = self._tiles.get(key)
+            if data is not None:
+                self._tiles.move_to_end(key)
+            return data
+
+    def document_bytes(self, digest: str) -> int:
+        with self._lock:
+            return self._document_bytes.get(digest, 0)
+
+    def put(self, key: TileKey, data: bytes) -> None:
+        with self._lock:
+            self._pop(key)
+            self._tiles[key] = data
+            self.bytes += len(data)
+            self._document_bytes[key[0]] = self._document_bytes.get(key[0], 0) + len(data)
+            self._trim_document(key[0], keep=key)
+            while self.bytes > self.max_bytes and len(self._tiles) > 1:
+                self._pop(next(iter(self._tiles)))
+
+    def set_budget(self, digest: str, max_bytes: Optional[int]) -> None:
+        """Belgenin bellek bütçesini ayarla ve uygula; None yalnızca toplam sınırı bırakır"""
+        with self._lock:
+            if max_bytes is None:
+                self._budgets.pop(digest, None)
+            else:
+                self._budgets[digest] = max_bytes
+                self._trim_document(digest)
+
+    def discard_document(self, digest: str) -> None:
+        """Belgeye ait tüm karoları bırak"""
+        with self._lock:
+            for key in [key for key in self._tiles if key[0] == digest]:
+                self._pop(key)
+
+    def _trim_document(self, digest: str, keep: Optional[TileKey] = None) -> None:
+        """Bütçesini aşan belgenin en eski karolarını çıkar; kilit altında çağrılmalı"""
+        budget = self._budgets.get(digest)
+        if budget is None or self._document_bytes.get(digest, 0) <= budget:
+            return
+        for key in [key for key in self._tiles if key[0] == digest and key != keep]:
+            self._pop(key)
+            if self._document_bytes.get(digest, 0) <= budget:
+                return
+
+    def _pop(self, key: TileKey) -> None:
+        data = self._tiles.pop(key, None)
+        if data is None:
+            return
+        self.bytes -= len(data)
+        remaining = self._document_bytes[key[0]] - len(data)
+        if remaining:
+            self._document_bytes[key[0]] = remaining
+        else:
+            del self._document_bytes[key[0]]
+
+
+class TileRenderer:
+    """
+    Belge karolarını önbellekten veya QtPdf ile işleyerek üreten servis
+
+    tile() herhangi bir iş parçacığından çağrılabilir. QtPdf (pdfium)
+    iş parçacığı güvenli olmadığından işleme tek kilitle sıralanır;
+    PNG kodlama ve önbellek erişimi kilit dışında yapılır.
+    """
+
+    def __init__(self, cache: Optional[DocumentCache] = None,
+                 memory_bytes: int = DEFAULT_MEMORY_BYTES,
+                 background_bytes: int = BACKGROUND_DOCUMENT_BYTES,
+                 max_open_documents: int = MAX_OPEN_DOCUMENTS):
+        self._disk = cache if cache is not None else DocumentCache(shared=True)
+        if not self._disk.shared:
+            raise ValueError("TileRenderer paylaşımlı (shared=True) önbellek gerektirir")
+        self._memory = TileMemoryCache(memory_bytes)
+        self.background_bytes = background_bytes
+        self.max_open_documents = max_open_documents
+        # Açık QtPdf belgeleri; askıya alınan belgeler yalnızca _owners'ta kalır
+        self._documents: Dict[str, Any] = {}
+        # Belgeyi açan sahipler ve açtıkları yol; görünür sahipler ayrıca
+        self._owners: Dict[str, Dict[Hashable, Path]] = {}
+        self._active: Dict[str, Set[Hashable]] = {}
+        # Kayıtlı belgeler en uzun süredir arka planda olandan başlayarak
+        self._recent: 'OrderedDict[str, bool]' = OrderedDict()
+        self._disk_lock = threading.Lock()
+        self._render_lock = threading.Lock()
+
+        # İstatistikler
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.renders = 0
+        self.suspended = 0
+        self.reopened = 0
+
+    def open_document(self, path: Union[str, Path],
+                      owner: Hashable = None) -> Dict[str, Any]:
+        """
+        Belgeyi owner adına karo servisine kaydet
+
+        {'digest', 'pages': [[genişlik, yükseklik], ...]} döndürür;
+        boyutlar nokta cinsindendir ve React ızgarayı bunlardan hesaplar.
+        Yeni sahip görünür sayılır.
+        """
+        with self._disk_lock:
+            digest = self._disk.fingerprint(path)
+
+        with self._render_lock:
+            document = self._documents.get(digest)
+            if document is None:
+                document = self._documents[digest] = _load_document(path)
+            owners = self._owners.setdefault(digest, {})
+            active = self._active.setdefault(digest, set())
+            if owner not in owners:
+                active.add(owner)
+            # Askıdaki belge en son kaydedilen yoldan yeniden açılır
+            owners.pop(owner, None)
+            owners[owner] = Path(path)
+            self._recent.setdefault(digest, True)
+            self._recent[digest] = visible = bool(active)
+            suspended = self._suspend_background()
+
+            pages = []
+            for index in range(document.pageCount()):
+                size = document.pagePointSize(index)
+                pages.append([round(size.width(), 2), round(size.height(), 2)])
+
+        self._memory.set_budget(digest, None if visible else self.background_bytes)
+        _close_documents(suspended)
+        return {'digest': digest, 'pages': pages}
+
+    def close_document(self, digest: str, owner: Hashable = None) -> None:
+        """
+        owner'ın kaydını bırak; son sahip bırakınca belgeyi kapat ve
+        bellekteki karolarını at, disk kayıtları kalır
+        """
+        with self._render_lock:
+            owners = self._owners.get(digest, {})
+            owners.pop(owner, None)
+            if owners:
+                active = self._active[digest]
+                active.discard(owner)
+                self._recent[digest] = bool(active)
+                budget = None if active else self.background_bytes
+                document = None
+            else:
+                document = self._documents.pop(digest, None)
+                self._owners.pop(digest, None)
+                self._active.pop(digest, None)
+                self._recent.pop(digest, None)
+        if owners:
+            self._memory.set_budget(digest, budget)
+            return
+        if document is not None:
+            document.close()
+        self._memory.set_budget(digest, None)
+        self._memory.discard_document(digest)
+
+    def set_active(self, digest: str, active: bool, owner: Hashable = None) -> None:
+        """
+        owner için belgenin görünür olup olmadığını bildir
+
+        Hiçbir sahibinde görünmeyen belgenin karoları bütçesine indirilir;
+        açık belge sınırı aşılmışsa en uzun süredir arka planda olanlar
+        askıya alınır.
+        """
+        with self._render_lock:
+            if owner not in self._owners.get(digest, {}):
+                return
+            owners = self._active[digest]
+            if active:
+                owners.add(owner)
+            else:
+                owners.discard(owner)
+            self._recent.pop(digest, None)
+            self._recent[digest] = visible = bool(owners)
+            suspended = self._suspend_background()
+        self._memory.set_budget(digest, None if visible else self.background_bytes)
+        _close_documents(suspended)
+
+    def _suspend_background(self) -> List[Any]:
+        """Sınırı aşan arka plan belgelerini askıya al; _render_lock altında çağrılmalı"""
+        suspended = []
+        for digest, active in list(self._recent.items()):
+            if len(self._documents) <= self.max_open_documents:
+                break
+            if not active and digest in self._documents:
+                suspended.append(self._documents.pop(digest))
+                self._memory.discard_document(digest)
+                self.suspended += 1
+        return suspended
+
+    def tile(self, digest: str, page: int, zoom: int, rotation: int,
+             col: int, row: int) -> bytes:
+        """Karonun PNG verisini döndür; sayfa 1 tabanlıdır"""
+        key = (digest, page, validate_zoom(zoom), validate_rotation(rotation), col, row)
+
+        data = self._memory.get(key)
+        if data is not None:
+            self.memory_hits += 1
+            return data
+
+        with self._disk_lock:
+            data = self._disk.get_tile(*key)
+        if data is not None:
+            self.disk_hits += 1
+            self._memory.put(key, data)
+            return data
+
+        data = encode_png(self._render(*key))
+        self.renders += 1
+        self._memory.put(key, data)
+        with self._disk_lock:
+            self._disk.put_tile(*key, data)
+        return data
+
+    def _render(self, digest: str, page: int, zoom: int, rotation: int,
+                col: int, row: int) -> QImage:
+        """Karoyu döndürülmemiş sayfadan kırparak işle, sonra döndür"""
+        from PyQt6.QtPdf import QPdfDocumentRenderOptions
+
+        with self._render_lock:
+            document = self._open_page(digest, page)
+            size = document.pagePointSize(page - 1)
+            width, height = page_pixel_size(size.width(), size.height(), zoom)
+            clip = _source_rect(width, height, rotation, col, row)
+
+            options = QPdfDocumentRenderOptions()
+            options.setScaledSize(QSize(width, height))
+            options.setScaledClipRect(clip)
+            image = document.render(page - 1, clip.size(), options)
+
+        if rotation:
+            image = image.transformed(QTransform().rotate(rotation))
+        return image
+
+    def render_page(self, digest: str, page: int, width: int) -> QImage:
+        """Sayfanın tamamını beyaz zeminde verilen piksel genişliğinde işle"""
+        with self._render_lock:
+            document = self._open_page(digest, page)
+            size = document.pagePointSize(page - 1)
+            height = max(1, int(width * size.height() / size.width() + 0.5))
+            image = document.render(page - 1, QSize(width, height))
+
+        # Şeffaf zemin küçük resimlerde kenar boşluğunu kaybettirir
+        page_image = QImage(image.size(), QImage.Format.Format_RGB32)
+        page_image.fill(Qt.GlobalColor.white)
+        painter = QPainter(page_image)
+        painter.drawImage(0, 0, image)
+        painter.end()
+        return page_image
+
+    def page_text(self, digest: str, page: int) -> str:
+        """Sayfanın QtPdf metni; karakter konumları text_rects ile uyumludur"""
+        with self._render_lock:
+            return self._open_page(digest, page).getAllText(page - 1).text()
+
+    def text_rects(self, digest: str, page: int, start: int,
+                   length: int) -> List[List[float]]:
+        """
+        Metin aralığının satır başına [x, y, genişlik, yükseklik] kutuları
+
+        Koordinatlar döndürülmemiş sayfada, sol üst köşeden nokta cinsindendir.
+        """
+        with self._render_lock:
+            selection = self._open_page(digest, page).getSelectionAtIndex(page - 1, start, length)
+            rects = [polygon.boundingRect() for polygon in selection.bounds()]
+        return [[round(rect.x(), 2), round(rect.y(), 2),
+                 round(rect.width(), 2), round(rect.height(), 2)] for rect in rects]
+
+    def _open_page(self, digest: str, page: int) -> Any:
+        """Açık belgeyi döndür; _render_lock altında çağrılmalı"""
+        document = self._documents.get(digest)
+        if document is None:
+            if not self._owners.get(digest):
+                raise KeyError(f"Belge açık değil: {digest}")
+            # Askıya alınmış belge ilk istekte yeniden açılır
+            path = next(reversed(self._owners[digest].values()))
+            document = self._documents[digest] = _load_document(path)
+            self.reopened += 1
+        if not 1 <= page <= document.pageCount():
+            raise ValueError(f"Geçersiz sayfa: {page}")
+        return document
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'memory_hits': self.memory_hits,
+            'disk_hits': self.disk_hits,
+            'renders': self.renders,
+            'memory_tiles': len(self._memory),
+            'memory_bytes': self._memory.bytes,
+            'open_documents': len(self._documents),
+            'suspended_documents': len(self._owners) - len(self._documents),
+        }
+
+    def close(self) -> None:
+        """Belgeleri tüm sahipleri için kapat, bekleyen disk yazımlarını işle"""
+        with self._render_lock:
+            for owners in self._owners.values():
+                owners.clear()
+        for digest in list(self._owners):
+            self.close_document(digest)
+        with self._disk_lock:
+            self._disk.close()
+
+
+def _load_document(path: Union[str, Path]) -> Any:
+    """QtPdf belgesini aç; _render_lock altında çağrılmalı"""
+    from PyQt6.QtPdf import QPdfDocument
+
+    document = QPdfDocument(None)
+    error = document.load(str(path))
+    if error != QPdfDocument.Error.None_:
+        raise ValueError(f"Belge işlenemedi ({error.name}): {path}")
+    # Arka planda açılan belge, iş parçacığı bitince sahipsiz kalmasın
+    app = QCoreApplication.instance()
+    if app is not None:
+        document.moveToThread(app.thread())
+    return document
+
+
+def _close_documents(documents: List[Any]) -> None:
+    for document in documents:
+        document.close()
+
+
+def _source_rect(width: int, height: int, rotation: int, col: int, row: int) -> QRect:
+    """
+    Döndürülmüş sayfadaki karonun döndürülmemiş sayfadaki karşılığı
+
+    QtPdf kırpma dikdörtgenini döndürmeyle birlikte doğru uygulamadığı
+    için karo döndürülmemiş sayfadan kırpılır ve görüntü döndürülür.
+    """
+    rotated_width, rotated_height = (width, height) if rotation in (0, 180) else (height, width)
+    cols, rows = tile_grid(rotated_width, rotated_height)
+    if not (0 <= col < cols and 0 <= row < rows):
+        raise ValueError(f"Geçersiz karo: {col}_{row}")
+
+    x0, y0 = col * TILE_SIZE, row * TILE_SIZE
+    x1 = min(x0 + TILE_SIZE, rotated_width)
+    y1 = min(y0 + TILE_SIZE, rotated_height)
+
+    if rotation == 0:
+        return QRect(x0, y0, x1 - x0, y1 - y0)
+    if rotation == 90:
+        return QRect(y0, height - x1, y1 - y0, x1 - x0)
+    if rotation == 180:
+        return QRect(width - x1, height - y1, x1 - x0, y1 - y0)
+    return QRect(width - y1, x0, y1 - y0, x1 - x0)
+
+
+def encode_png(image: QImage) -> bytes:
+    buffer = QBuffer()
+    buffer.open(QIODevice.OpenModeFlag.WriteOnly)
+    image.save(buffer, 'PNG')
+    return bytes(buffer.data())
+
+
+@lru_cache(maxsize=None)
+def default_renderer() -> TileRenderer:
+    """Tüm görüntüleyicilerin paylaştığı karo servisi"""
+    return TileRenderer()
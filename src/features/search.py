@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools Belge İçi Arama
+Görüntüleyicinin arama kutusu için belge başına kalıcı ters dizin ve
+sonuçları parça parça React'e akıtan sorgu servisi
+
+Belge açıldığında sayfa metinleri arka planda, kaldığı yerden devam
+ederek DocumentCache içindeki FTS5 dizinine eklenir. Sorgu önce dizinden
+aday sayfaları alır; henüz dizinlenmemiş sayfalar doğrudan taranır.
+Eşleşmeler sayfa metninde yeniden bulunur ve QtPdf ile vurgu kutularına
+çevrilir.
+
+Sorgu sözdizimi: kelimeler ardışık aranır (öbek), son kelime önek olarak
+eşleşir; tırnak içindeki sorgu yalnızca tam kelimelerle eşleşir.
+Büyük/küçük harf ve aksanlar dikkate alınmaz.
+
+Mesajlar:
+    searchResults  {'queryId', 'query', 'results': [{'page', 'hits': [kutular, ...]}],
+                    'searched', 'total', 'done', 'truncated'}
+                   kutu: [x, y, genişlik, yükseklik], nokta cinsinden (TileRenderer.text_rects)
+    indexProgress  {'digest', 'indexed', 'total'}
+"""
+
+import itertools
+import json
+import re
+import threading
+import time
+import unicodedata
+from typing import Any, Dict, List, Optional, Tuple
+
+from PyQt6.QtCore import QObject, QRunnable, QThread, pyqtSignal
+
+from pypdf_tools.core.cache import DocumentCache
+from pypdf_tools.features.render import TileRenderer
+from pypdf_tools.features.workers import PRIORITY_BACKGROUND, PRIORITY_SEARCH, SerialQueue
+
+
+# Dizine tek işlemde eklenen sayfa sayısı
+INDEX_BATCH = 32
+
+# İki sonuç mesajı arasındaki en kısa süre (saniye)
+RESULT_INTERVAL = 0.1
+
+# Bundan fazla eşleşmede arama durdurulur
+MAX_HITS = 1000
+
+# FTS5 unicode61 ile uyumlu kelime: harf ve rakamlar
+_WORD = re.compile(r'[^\W_]+')
+
+
+def fold(text: str) -> str:
+    """Aksanları kaldır ve küçük harfe çevir (FTS5 remove_diacritics 2 ile uyumlu)"""
+    decomposed = unicodedata.normalize('NFD', text)
+    return ''.join(char for char in decomposed if not unicodedata.combining(char)).lower()
+
+
+def parse_query(query: str) -> Tuple[List[str], bool]:
+    """Sorguyu (katlanmış kelimeler, son kelime önek mi) olarak çözümle"""
+    query = query.strip()
+    exact = len(query) >= 2 and query[0] == query[-1] == '"'
+    return [fold(word) for word in _WORD.findall(query)], not exact
+
+
+def match_expression(tokens: List[str], prefix: bool) -> str:
+    """Kelimelerden FTS5 öbek sorgusu üret"""
+    phrase = '"' + ' '.join(tokens) + '"'
+    return f"{phrase} *" if prefix else phrase
+
+
+def find_hits(text: str, tokens: List[str], prefix: bool) -> List[Tuple[int, int]]:
+    """Sayfa metnindeki eşleşmelerin (başlangıç, bitiş) karakter aralıkları"""
+    words = [(fold(match.group()), match.start(), match.end())
+             for match in _WORD.finditer(text)]
+    count = len(tokens)
+    hits = []
+    for index in range(len(words) - count + 1):
+        if any(words[index + offset][0] != tokens[offset] for offset in range(count - 1)):
+            continue
+        last = words[index + count - 1][0]
+        if last == tokens[-1] or (prefix and last.startswith(tokens[-1])):
+            hits.append((words[index][1], words[index + count - 1][2]))
+    return hits
+
+
+class _IndexTask(QRunnable):
+    def __init__(self, service: 'SearchService', generation: int, digest: str, pages: int):
+        super().__init__()
+        self._args = (generation, digest, pages)
+        self._service = service
+
+    def run(self) -> None:
+        self._service._build_index(*self._args)
+
+
+class _SearchTask(QRunnable):
+    def __init__(self, service: 'SearchService', generation: int, query_id: str,
+                 query: str, digest: Optional[str], pages: int):
+        super().__init__()
+        self._args = (generation, query_id, query, digest, pages)
+        self._service = service
+
+    def run(self) -> None:
+        self._service._run_search(*self._args)
+
+
+class SearchService(QObject):
+    """
+    Görüntüleyici başına arama servisi
+
+    Dizin oluşturma ve sorgular paylaşımlı havuzda ayrı kuyruklarda
+    sırayla çalışır; dizin her görevde bir parti sayfa ekler ve kalanı
+    kuyruğa geri verir, böylece açık belgeler havuzu sırayla kullanır.
+    Yeni sorgu öncekini geçersiz kılar; eski sorgu bir sonraki
+    sayfadan önce durur ve sonuç göndermez.
+    """
+
+    searchResults = pyqtSignal(str)
+    indexProgress = pyqtSignal(str)
+
+    def __init__(self, renderer: TileRenderer, cache: Optional[DocumentCache] = None,
+                 parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.renderer = renderer
+        self._cache = cache if cache is not None else DocumentCache(shared=True)
+        self._cache_lock = threading.Lock()
+        self._index_pool = SerialQueue(PRIORITY_BACKGROUND, QThread.Priority.LowestPriority)
+        self._query_pool = SerialQueue(PRIORITY_SEARCH)
+        self._index_generation = 0
+        self._query_generation = 0
+        self._ids = itertools.count(1)
+        self._digest: Optional[str] = None
+        self._pages = 0
+
+    def set_document(self, digest: Optional[str], pages: int = 0) -> None:
+        """Aranacak belgeyi değiştir ve eksik sayfaların dizinlenmesini başlat"""
+        self.cancel_search()
+        self._index_pool.clear()
+        self._index_generation += 1
+        self._digest, self._pages = digest, pages
+        if digest is not None:
+            self._index_pool.start(_IndexTask(self, self._index_generation, digest, pages))
+
+    def search(self, query: str) -> str:
+        """Sorguyu başlat ve kimliğini döndür; önceki sorgu iptal edilir"""
+        self.cancel_search()
+        query_id = f"q-{next(self._ids)}"
+        self._query_pool.start(_SearchTask(self, self._query_generation, query_id,
+                                           query, self._digest, self._pages))
+        return query_id
+
+    def cancel_search(self) -> None:
+        """Sıradaki ve çalışan sorguyu iptal et"""
+        self._query_pool.clear()
+        self._query_generation += 1
+
+    def wait(self, msecs: int = -1) -> bool:
+        """Dizinleme ve sorguların bitmesini bekle (testler ve kapanış için)"""
+        return self._index_pool.wait(msecs) and self._query_pool.wait(msecs)
+
+    def close(self) -> None:
+        self.set_document(None)
+        self.wait()
+        with self._cache_lock:
+            self._cache.close()
+
+    def _progress(self, digest: str) -> int:
+        """Dizinlenmiş sayfa sayısı; FTS5 yoksa dizin kullanılmaz"""
+        with self._cache_lock:
+            progress = self._cache.search_progress(digest)
+            return progress if self._cache.search_available else 0
+
+    def _build_index(self, generation: int, digest: str, pages: int) -> None:
+        page = self._progress(digest) + 1
+        if not self._cache.search_available:
+            return
+        if page > pages or self._index_generation != generation:
+            return
+        try:
+            last = min(pages, page + INDEX_BATCH - 1)
+            texts = [self.renderer.page_text(digest, number)
+                     for number in range(page, last + 1)]
+            with self._cache_lock:
+                progress = self._cache.put_search_pages(digest, page, texts)
+            self.indexProgress.emit(json.dumps(
+                {'digest': digest, 'indexed': progress, 'total': pages}))
+        except KeyError:
+            # Belge bu arada kapatıldı
+            return
+        # Sonraki parti kuyruğun sonuna; araya diğer belgelerin görevleri girebilir
+        if progress < pages and self._index_generation == generation:
+            self._index_pool.start(_IndexTask(self, generation, digest, pages))
+
+    def _run_search(self, generation: int, query_id: str, query: str,
+                    digest: Optional[str], pages: int) -> None:
+        tokens, prefix = parse_query(query)
+        state: Dict[str, Any] = {'results': [], 'searched': 0, 'hits': 0, 'emitted': 0.0}
+
+        def emit(done: bool, truncated: bool = False) -> None:
+            if self._query_generation != generation:
+                return
+            self.searchResults.emit(json.dumps({
+                'queryId': query_id, 'query': query, 'results': state['results'],
+                'searched': state['searched'], 'total': pages,
+                'done': done, 'truncated': truncated,
+            }, ensure_ascii=False))
+            state['results'] = []
+            state['emitted'] = time.monotonic()
+
+        def add_page(page: int, text: str) -> bool:
+            """Sayfanın eşleşmelerini ekle; sonuç sınırına ulaşıldıysa False"""
+            hits = find_hits(text, tokens, prefix)[:MAX_HITS - state['hits']]
+            if hits:
+                state['hits'] += len(hits)
+                state['results'].append({'page': page, 'hits': [
+                    self.renderer.text_rects(digest, page, start, end - start)
+                    for start, end in hits
+                ]})
+            if time.monotonic() - state['emitted'] >= RESULT_INTERVAL:
+                emit(False)
+            return state['hits'] < MAX_HITS
+
+        if not tokens or digest is None:
+            emit(True)
+            return
+
+        try:
+            # Dizinlenmiş sayfalar: aday sayfalar FTS5'ten
+            progress = state['searched'] = self._progress(digest)
+            if progress:
+                with self._cache_lock:
+                    candidates = self._cache.search_pages(digest, match_expression(tokens, prefix))
+                for page, text in candidates:
+                    if self._query_generation != generation:
+                        return
+                    if not add_page(page, text):
+                        emit(True, truncated=True)
+                        return
+
+            # Henüz dizinlenmemiş sayfalar doğrudan taranır
+            for page in range(progress + 1, pages + 1):
+                if self._query_generation != generation:
+                    return
+                state['searched'] = page
+                if not add_page(page, self.renderer.page_text(digest, page)):
+                    emit(True, truncated=True)
+                    return
+        except KeyError:
+            # Belge bu arada kapatıldı
+            return
+
+        emit(True)
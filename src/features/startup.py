@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools Başlangıç Ölçümleri
+Başlangıç aşamalarının süreç başlangıcından itibaren zamanlarını tutar
+
+Süreç başlangıcı Linux'ta /proc'tan okunur; böylece yorumlayıcının ve
+importların süresi de ölçüme girer. Okunamazsa bu modülün yüklendiği an
+başlangıç sayılır.
+
+İlk sayfa süresi (FIRST_PAGE): süreç başlangıcından React'in ilk sayfanın
+karosunu çizdiğini bildirmesine kadar geçen süre. Ara aşamalar
+--profile-startup ile zaman çizelgesi olarak yazdırılır.
+"""
+
+import os
+import time
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
+
+_IMPORTED = time.monotonic()
+
+# Başlangıç aşamaları
+IMPORTS_DONE = 'imports_done'
+QT_INIT = 'qt_init'
+PROFILE_READY = 'profile_ready'
+WINDOW_BUILT = 'window_built'
+PAGE_LOADED = 'page_loaded'
+WINDOW_SHOWN = 'window_shown'
+BRIDGE_READY = 'bridge_ready'
+FIRST_PAGE = 'first_page'
+
+# Zaman çizelgesindeki aşama adları
+PHASE_LABELS = {
+    IMPORTS_DONE: 'Modüller yüklendi',
+    QT_INIT: 'Qt başlatıldı',
+    PROFILE_READY: 'WebEngine profili hazır',
+    WINDOW_BUILT: 'Ana pencere kuruldu',
+    PAGE_LOADED: 'Sayfa yüklendi',
+    WINDOW_SHOWN: 'Pencere gösterildi',
+    BRIDGE_READY: 'Köprü hazır',
+    FIRST_PAGE: 'İlk sayfa çizildi',
+}
+
+
+def process_start_time() -> float:
+    """Sürecin başladığı an, time.monotonic() ölçeğinde"""
+    try:
+        with open('/proc/self/stat') as file:
+            # comm alanı boşluk içerebilir; alanlar son ')' işaretinden sonra sayılır
+            fields = file.read().rsplit(')', 1)[1].split()
+        with open('/proc/uptime') as file:
+            uptime = float(file.read().split()[0])
+        started = int(fields[19]) / os.sysconf('SC_CLK_TCK')
+        return time.monotonic() - max(0.0, uptime - started)
+    except (OSError, ValueError, IndexError, AttributeError):
+        return _IMPORTED
+
+
+class StartupMetrics:
+    """
+    Adlandırılmış başlangıç aşamalarının süreleri
+
+    Her aşama yalnızca ilk kez işaretlendiğinde kaydedilir; böylece
+    ikinci belge veya sayfa yenilemesi ilk ölçümü bozmaz.
+    """
+
+    def __init__(self, origin: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        self.origin = process_start_time() if origin is None else origin
+        self._clock = clock
+        self._marks: Dict[str, float] = {}
+
+    def mark(self, name: str) -> Optional[float]:
+        """Aşamayı işaretle; başlangıçtan geçen saniyeyi, önceden işaretliyse None döndür"""
+        if name in self._marks:
+            return None
+        self._marks[name] = self._clock() - self.origin
+        return self._marks[name]
+
+    def elapsed(self, name: str) -> Optional[float]:
+        """Aşamanın başlangıçtan itibaren süresi (saniye)"""
+        return self._marks.get(name)
+
+    def marks(self) -> List[Tuple[str, float]]:
+        """İşaretlenen aşamalar zaman sırasıyla"""
+        return sorted(self._marks.items(), key=lambda item: item[1])
+
+    def report(self, labels: Optional[Dict[str, str]] = None) -> str:
+        """Aşamaları başlangıçtan itibaren ve bir öncekinden farkıyla (ms) listele"""
+        labels = PHASE_LABELS if labels is None else labels
+        lines = ["Başlangıç zaman çizelgesi:"]
+        previous = 0.0
+        for name, elapsed in self.marks():
+            lines.append(f"  {labels.get(name, name):<24} {elapsed * 1000:7.0f} ms"
+                         f"  (+{(elapsed - previous) * 1000:.0f})")
+            previous = elapsed
+        return '\n'.join(lines)
+
+
+@lru_cache(maxsize=None)
+def startup_metrics() -> StartupMetrics:
+    """Sürecin başlangıç ölçümleri"""
+    return StartupMetrics()
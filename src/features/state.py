@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools Sürümlü Görüntüleyici Durumu
+React'e gönderilen PDF durumunu sürümleyen ve yalnızca farkları
+JSON Patch (RFC 6902) olarak üreten depo
+
+Her güncellemede önceki durumla fark alınır; değişmeyen alt ağaçlar
+C düzeyindeki == karşılaştırmasıyla hızla atlanır. Fark çok büyükse,
+belge değiştiyse veya React eşitleme isterse tam anlık görüntü gönderilir.
+
+Mesajlar:
+    anlık görüntü  {'version': n, 'data': {...}}
+    yama           {'baseVersion': n - 1, 'version': n, 'patch': [...]}
+"""
+
+import json
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Bundan fazla işlem içeren yama yerine anlık görüntü gönderilir
+MAX_PATCH_OPS = 500
+
+Patch = List[Dict[str, Any]]
+
+
+def _copy(value: Any) -> Any:
+    """JSON uyumlu değeri derin kopyala (copy.deepcopy'den hızlı)"""
+    if isinstance(value, dict):
+        return {key: _copy(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_copy(item) for item in value]
+    return value
+
+
+def _escape(key: Any) -> str:
+    """JSON Pointer bileşenini kaçışla (RFC 6901)"""
+    return str(key).replace('~', '~0').replace('/', '~1')
+
+
+def _unescape(token: str) -> str:
+    return token.replace('~1', '/').replace('~0', '~')
+
+
+def diff(old: Any, new: Any, path: str = '') -> Patch:
+    """
+    old değerini new değerine dönüştüren JSON Patch işlemlerini üret
+
+    Sözlükler anahtar bazında, listeler indeks bazında karşılaştırılır;
+    listeye ekleme ve sondan silme add/remove, diğer farklar replace olur.
+    """
+    if old == new:
+        return []
+
+    if isinstance(old, dict) and isinstance(new, dict):
+        ops: Patch = []
+        for key in old:
+            if key not in new:
+                ops.append({'op': 'remove', 'path': f"{path}/{_escape(key)}"})
+        for key, value in new.items():
+            child = f"{path}/{_escape(key)}"
+            if key not in old:
+                ops.append({'op': 'add', 'path': child, 'value': value})
+            else:
+                ops.extend(diff(old[key], value, child))
+        return ops
+
+    if isinstance(old, list) and isinstance(new, list):
+        ops = []
+        common = min(len(old), len(new))
+        for index in range(common):
+            ops.extend(diff(old[index], new[index], f"{path}/{index}"))
+        for index in range(common, len(new)):
+            ops.append({'op': 'add', 'path': f"{path}/-", 'value': new[index]})
+        # Sondan başa silinir; böylece indeksler kaymaz
+        for index in range(len(old) - 1, common - 1, -1):
+            ops.append({'op': 'remove', 'path': f"{path}/{index}"})
+        return ops
+
+    return [{'op': 'replace', 'path': path, 'value': new}]
+
+
+def apply_patch(document: Any, patch: Patch) -> Any:
+    """
+    JSON Patch işlemlerini belgeye uygula ve yeni belgeyi döndür
+
+    add, remove ve replace desteklenir; belge yerinde değiştirilir.
+    """
+    for operation in patch:
+        op, path = operation['op'], operation['path']
+        if path == '':
+            if op == 'remove':
+                raise ValueError("Kök değer silinemez")
+            document = _copy(operation['value'])
+            continue
+
+        tokens = [_unescape(token) for token in path.split('/')[1:]]
+        parent = document
+        for token in tokens[:-1]:
+            parent = parent[int(token)] if isinstance(parent, list) else parent[token]
+        last = tokens[-1]
+
+        if isinstance(parent, list):
+            if op == 'add':
+                value = _copy(operation['value'])
+                if last == '-':
+                    parent.append(value)
+                else:
+                    parent.insert(int(last), value)
+            elif op == 'remove':
+                del parent[int(last)]
+            elif op == 'replace':
+                parent[int(last)] = _copy(operation['value'])
+            else:
+                raise ValueError(f"Desteklenmeyen yama işlemi: {op}")
+        else:
+            if op in ('add', 'replace'):
+                parent[last] = _copy(operation['value'])
+            elif op == 'remove':
+                del parent[last]
+            else:
+                raise ValueError(f"Desteklenmeyen yama işlemi: {op}")
+    return document
+
+
+class StateStore:
+    """
+    Sürümlü durum deposu
+
+    update() yeni durumu kaydeder ve React'e gönderilecek mesajı
+    döndürür. Depo kendi kopyasını tutar; çağıran sözlüğü sonradan
+    değiştirip tekrar gönderebilir.
+    """
+
+    def __init__(self, max_patch_ops: int = MAX_PATCH_OPS):
+        self.max_patch_ops = max_patch_ops
+        self.version = 0
+        self._state: Optional[Dict[str, Any]] = None
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> Optional[Dict[str, Any]]:
+        """Son kaydedilen durum (salt okunur kullanılmalı)"""
+        return self._state
+
+    def update(self, state: Dict[str, Any], resync: bool = False) -> Tuple[str, str]:
+        """
+        Yeni durumu kaydet; (tür, JSON mesaj) döndür
+
+        Tür 'snapshot', 'patch' veya değişiklik yoksa 'none' olur.
+        İlk güncelleme, resync ve MAX_PATCH_OPS'u aşan farklar anlık
+        görüntü olarak gönderilir.
+        """
+        with self._lock:
+            previous = self._state
+            patch = None if previous is None or resync else diff(previous, state)
+            if patch is not None and not patch:
+                return 'none', ''
+
+            # Yama, depodaki kopyaya uygulanır; tüm durum yeniden kopyalanmaz
+            self._state = _copy(state) if patch is None else apply_patch(previous, patch)
+            self.version += 1
+            if patch is None or len(patch) > self.max_patch_ops:
+                return 'snapshot', self._snapshot_message()
+            return 'patch', json.dumps({
+                'baseVersion': self.version - 1,
+                'version': self.version,
+                'patch': patch,
+            }, ensure_ascii=False)
+
+    def snapshot(self) -> str:
+        """Eşitleme için tam anlık görüntü mesajı"""
+        with self._lock:
+            return self._snapshot_message()
+
+    def _snapshot_message(self) -> str:
+        return json.dumps({'version': self.version, 'data': self._state},
+                          ensure_ascii=False)
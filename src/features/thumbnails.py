@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools Küçük Resimler
+Kenar çubuğu için düşük çözünürlüklü sayfa görüntülerini üreten ve
+belge başına tek bir paket dosyasında saklayan servis
+
+Paket biçimi (küçük-endian):
+    başlık  MAGIC | genişlik (uint32) | sayfa sayısı (uint32)
+    dizin   sayfa başına (konum uint64, uzunluk uint32); 0 uzunluk = yok
+    veri    PNG'ler sona eklenir
+
+Görüntüler pdftile:/<özet>/thumb/<sayfa>.png adresinden istenir; kenar
+çubuğu <img loading="lazy"> kullandığından yalnızca görünen sayfalar
+istenir. Arka planda görünen aralıktan başlayıp dışa doğru ilerleyerek
+kalan sayfalar da pakete işlenir.
+"""
+
+import struct
+import threading
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Hashable, List, Optional, Set, Tuple, Union
+
+from PyQt6.QtCore import QObject, QRunnable, QThread, QThreadPool
+
+from pypdf_tools.core.cache import DocumentCache
+from pypdf_tools.features.render import TileRenderer, default_renderer, encode_png
+
+
+# Küçük resim genişliği (piksel); kenar çubuğu 256 CSS pikseli genişliğinde
+THUMBNAIL_WIDTH = 200
+
+# Arka planda küçük resim üreten iş parçacığı sayısı
+DEFAULT_THUMBNAIL_THREADS = 2
+
+MAGIC = b'PPTHUMB1'
+_HEADER = struct.Struct('<8sII')
+_ENTRY = struct.Struct('<QI')
+
+
+def parse_thumbnail_path(path: str) -> Tuple[str, int]:
+    """'/<özet>/thumb/<sayfa>.png' yolunu (özet, sayfa) olarak çözümle"""
+    parts = path.strip('/').split('/')
+    if len(parts) != 3 or parts[1] != 'thumb' or not parts[2].endswith('.png'):
+        raise ValueError(f"Geçersiz küçük resim yolu: {path}")
+    return parts[0], int(parts[2][:-len('.png')])
+
+
+class ThumbnailPack:
+    """
+    Belgenin küçük resimlerini tutan tek dosyalık paket
+
+    Dizin açılışta belleğe okunur; okuma ve yazmalar tek kilitle
+    sıralanır. Veri dizinden önce yazıldığından yarıda kalan yazım
+    yalnızca sahipsiz byte bırakır.
+    """
+
+    def __init__(self, path: Union[str, Path], pages: int, width: int = THUMBNAIL_WIDTH):
+        self.path = Path(path)
+        self.pages = pages
+        self.width = width
+        self._lock = threading.Lock()
+        self._index: List[Tuple[int, int]] = []
+
+        # Yeni oluşturulan paketin başlık ve dizini de belge boyutuna sayılır
+        self.created = not self._load()
+        if self.created:
+            self._create()
+
+    def _load(self) -> bool:
+        """Uyumlu paket varsa dizinini oku"""
+        try:
+            file = open(self.path, 'r+b')
+        except OSError:
+            return False
+        header = file.read(_HEADER.size)
+        index = file.read(_ENTRY.size * self.pages)
+        if (len(header) != _HEADER.size or _HEADER.unpack(header) != (MAGIC, self.width, self.pages)
+                or len(index) != _ENTRY.size * self.pages):
+            file.close()
+            return False
+        self._file = file
+        self._index = list(_ENTRY.iter_unpack(index))
+        return True
+
+    def _create(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, 'w+b')
+        self._file.write(_HEADER.pack(MAGIC, self.width, self.pages))
+        self._file.write(bytes(_ENTRY.size * self.pages))
+        self._file.flush()
+        self._index = [(0, 0)] * self.pages
+
+    @property
+    def size(self) -> int:
+        """Dosyanın byte cinsinden boyutu"""
+        return _HEADER.size + _ENTRY.size * self.pages + sum(length for _o, length in self._index)
+
+    def __len__(self) -> int:
+        """Saklanan küçük resim sayısı"""
+        return sum(1 for _offset, length in self._index if length)
+
+    def __contains__(self, page: int) -> bool:
+        return 1 <= page <= self.pages and self._index[page - 1][1] > 0
+
+    def _check_page(self, page: int) -> None:
+        if not 1 <= page <= self.pages:
+            raise ValueError(f"Geçersiz sayfa: {page}")
+
+    def get(self, page: int) -> Optional[bytes]:
+        """Sayfanın PNG verisini döndür; yoksa None (sayfa 1 tabanlı)"""
+        self._check_page(page)
+        with self._lock:
+            offset, length = self._index[page - 1]
+            if not length:
+                return None
+            self._file.seek(offset)
+            return self._file.read(length)
+
+    def put(self, page: int, data: bytes) -> bool:
+        """Sayfayı pakete ekle; zaten varsa False döndür"""
+        self._check_page(page)
+        with self._lock:
+            if self._index[page - 1][1]:
+                return False
+            offset = self._file.seek(0, 2)
+            self._file.write(data)
+            self._file.seek(_HEADER.size + _ENTRY.size * (page - 1))
+            self._file.write(_ENTRY.pack(offset, len(data)))
+            self._file.flush()
+            self._index[page - 1] = (offset, len(data))
+            return True
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+class _ThumbnailTask(QRunnable):
+    """Tek sayfanın küçük resmini arka planda pakete işleyen görev"""
+
+    def __init__(self, service: 'ThumbnailService', generation: int, digest: str, page: int):
+        super().__init__()
+        self._service = service
+        self._generation = generation
+        self._digest = digest
+        self._page = page
+
+    def run(self) -> None:
+        if self._service._generation != self._generation:
+            return
+        try:
+            self._service.thumbnail(self._digest, self._page)
+        except (KeyError, ValueError):
+            # Belge bu arada kapatılmış olabilir
+            pass
+
+
+class ThumbnailService(QObject):
+    """
+    Küçük resimleri paketten veya TileRenderer ile işleyerek sağlayan servis
+
+    thumbnail() herhangi bir iş parçacığından çağrılabilir. QtPdf işlemesi
+    TileRenderer kilidiyle sıralanır; ölçekleme, PNG kodlama ve paket
+    yazımı paralel yürür.
+    """
+
+    def __init__(self, renderer: TileRenderer, cache: Optional[DocumentCache] = None,
+                 parent: Optional[QObject] = None, width: int = THUMBNAIL_WIDTH,
+                 threads: int = DEFAULT_THUMBNAIL_THREADS):
+        super().__init__(parent)
+        self.renderer = renderer
+        self.width = width
+        self._cache = cache if cache is not None else DocumentCache(shared=True)
+        self._cache_lock = threading.Lock()
+        self._packs: Dict[str, ThumbnailPack] = {}
+        # Paketi açan sahipler; aynı içerikli belgeler paketi paylaşır
+        self._owners: Dict[str, Set[Hashable]] = {}
+        self._lock = threading.Lock()
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(threads)
+        self._pool.setThreadPriority(QThread.Priority.LowPriority)
+        self._generation = 0
+
+        # İstatistikler
+        self.pack_hits = 0
+        self.renders = 0
+
+    def open_document(self, digest: str, pages: int, owner: Hashable = None) -> ThumbnailPack:
+        """Belgenin paketini owner adına aç veya oluştur"""
+        with self._lock:
+            self._owners.setdefault(digest, set()).add(owner)
+            pack = self._packs.get(digest)
+            if pack is None:
+                with self._cache_lock:
+                    path = self._cache.thumbnail_path(digest)
+                pack = ThumbnailPack(path, pages, self.width)
+                self._packs[digest] = pack
+                if pack.created:
+                    with self._cache_lock:
+                        self._cache.add_bytes(digest, pack.size)
+            return pack
+
+    def close_document(self, digest: str, owner: Hashable = None) -> None:
+        """
+        owner'ın kaydını bırak; son sahip bırakınca paketi kapat, bekleyen
+        arka plan görevlerini at ve boyutları işle
+        """
+        with self._lock:
+            owners = self._owners.get(digest, set())
+            owners.discard(owner)
+            if owners:
+                return
+            self._owners.pop(digest, None)
+            pack = self._packs.pop(digest, None)
+        self.cancel()
+        if pack is not None:
+            pack.close()
+        with self._cache_lock:
+            self._cache.flush()
+
+    def thumbnail(self, digest: str, page: int) -> bytes:
+        """Sayfanın küçük resim PNG verisini döndür; sayfa 1 tabanlıdır"""
+        with self._lock:
+            pack = self._packs.get(digest)
+        if pack is None:
+            raise KeyError(f"Belge açık değil: {digest}")
+
+        data = pack.get(page)
+        if data is not None:
+            self.pack_hits += 1
+            return data
+
+        data = encode_png(self.renderer.render_page(digest, page, self.width))
+        self.renders += 1
+        if pack.put(page, data):
+            with self._cache_lock:
+                self._cache.add_bytes(digest, len(data))
+        return data
+
+    def request(self, digest: str, first: int, last: int) -> List[int]:
+        """
+        Görünen aralıktan başlayarak eksik küçük resimleri arka planda üret
+
+        Önceki istekten kalan görevler atılır. Sıra: görünen aralık, sonra
+        aralığın iki yanından dönüşümlü olarak dışa doğru. Sıraya alınan
+        sayfaları döndürür.
+        """
+        with self._lock:
+            pack = self._packs.get(digest)
+        if pack is None:
+            return []
+
+        self.cancel()
+        first, last = max(1, first), min(pack.pages, last)
+        order = list(range(first, last + 1))
+        for distance in range(1, pack.pages):
+            order.extend(page for page in (last + distance, first - distance)
+                         if 1 <= page <= pack.pages)
+
+        pages = [page for page in order if page not in pack]
+        for index, page in enumerate(pages):
+            self._pool.start(_ThumbnailTask(self, self._generation, digest, page),
+                             len(pages) - index)
+        return pages
+
+    def cancel(self) -> None:
+        """Sıradaki arka plan görevlerini at"""
+        self._pool.clear()
+        self._generation += 1
+
+    def wait(self, msecs: int = -1) -> bool:
+        """Arka plan görevlerinin bitmesini bekle (testler ve kapanış için)"""
+        return self._pool.waitForDone(msecs)
+
+    def stats(self) -> Dict[str, int]:
+        return {'pack_hits': self.pack_hits, 'renders': self.renders}
+
+    def close(self) -> None:
+        """Görevleri durdur, paketleri kapat, bekleyen yazımları işle"""
+        self.cancel()
+        self.wait()
+        with self._lock:
+            self._owners.clear()
+        for digest in list(self._packs):
+            self.close_document(digest)
+        with self._cache_lock:
+            self._cache.close()
+
+
+@lru_cache(maxsize=None)
+def default_thumbnail_service() -> ThumbnailService:
+    """Tüm görüntüleyicilerin paylaştığı küçük resim servisi"""
+    return ThumbnailService(default_renderer())
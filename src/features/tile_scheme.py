@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools Karo URL Şeması
+pdftile:/<özet>/<sayfa>/<zoom>/<döndürme>/<sütun>_<satır>.png karo ve
+pdftile:/<özet>/thumb/<sayfa>.png küçük resim isteklerini yanıtlayan
+QWebEngine şema işleyicisi
+
+Karolar GUI iş parçacığını bloklamamak için iş havuzunda üretilir;
+yanıt kuyruklu sinyalle GUI iş parçacığında verilir. Görünümden çıkan
+<img> isteklerini tarayıcı iptal eder; henüz başlamamış işler atlanır.
+"""
+
+from typing import Optional
+
+from PyQt6 import sip
+from PyQt6.QtCore import QBuffer, QIODevice, QObject, QRunnable, QThreadPool, pyqtSignal
+from PyQt6.QtWebEngineCore import (
+    QWebEngineProfile, QWebEngineUrlRequestJob, QWebEngineUrlScheme,
+    QWebEngineUrlSchemeHandler
+)
+
+from pypdf_tools.features.render import TileRenderer, parse_tile_path
+from pypdf_tools.features.thumbnails import ThumbnailService, parse_thumbnail_path
+
+
+SCHEME = b'pdftile'
+
+# Aynı anda işlenen en fazla karo isteği
+DEFAULT_TILE_THREADS = 4
+
+
+def register_tile_scheme() -> None:
+    """Şemayı kaydet; QApplication oluşturulmadan önce çağrılmalı"""
+    if bytes(QWebEngineUrlScheme.schemeByName(SCHEME).name()) == SCHEME:
+        return
+    scheme = QWebEngineUrlScheme(SCHEME)
+    scheme.setSyntax(QWebEngineUrlScheme.Syntax.Path)
+    scheme.setFlags(QWebEngineUrlScheme.Flag.SecureScheme
+                    | QWebEngineUrlScheme.Flag.LocalAccessAllowed
+                    | QWebEngineUrlScheme.Flag.CorsEnabled)
+    QWebEngineUrlScheme.registerScheme(scheme)
+
+
+def tile_base_url(digest: str) -> str:
+    """React'in sayfa/zoom/döndürme/karo eklediği temel adres"""
+    return f"{SCHEME.decode()}:/{digest}"
+
+
+def thumbnail_base_url(digest: str) -> str:
+    """React'in <sayfa>.png eklediği küçük resim adresi"""
+    return f"{tile_base_url(digest)}/thumb"
+
+
+class _TileRequest(QRunnable):
+    """Tek bir karo isteğini havuzda üret"""
+
+    def __init__(self, handler: 'TileSchemeHandler', job: QWebEngineUrlRequestJob):
+        super().__init__()
+        self._handler = handler
+        self._job = job
+
+    def run(self) -> None:
+        # İstek beklerken iptal edildiyse işleme
+        if sip.isdeleted(self._job):
+            return
+        try:
+            data, error = self._handler.resolve(self._job.requestUrl().path()), ''
+        except Exception as e:
+            data, error = b'', str(e) or e.__class__.__name__
+        self._handler._tileReady.emit(self._job, data, error)
+
+
+class TileSchemeHandler(QWebEngineUrlSchemeHandler):
+    """pdftile: isteklerini karo servisine yönlendiren işleyici"""
+
+    _tileReady = pyqtSignal(object, bytes, str)
+
+    def __init__(self, renderer: TileRenderer, parent: Optional[QObject] = None,
+                 threads: int = DEFAULT_TILE_THREADS,
+                 thumbnails: Optional[ThumbnailService] = None):
+        super().__init__(parent)
+        self.renderer = renderer
+        self.thumbnails = thumbnails
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(threads)
+        self._tileReady.connect(self._reply)
+
+    def requestStarted(self, job: QWebEngineUrlRequestJob) -> None:
+        self._pool.start(_TileRequest(self, job))
+
+    def resolve(self, path: str) -> bytes:
+        """İstek yolunun PNG verisini üret (havuz iş parçacığında)"""
+        if '/thumb/' in path:
+            if self.thumbnails is None:
+                raise ValueError("Küçük resim servisi yok")
+            return self.thumbnails.thumbnail(*parse_thumbnail_path(path))
+        return self.renderer.tile(*parse_tile_path(path))
+
+    def _reply(self, job: QWebEngineUrlRequestJob, data: bytes, error: str) -> None:
+        """GUI iş parçacığında yanıtla; iş bu arada iptal edilmiş olabilir"""
+        if sip.isdeleted(job):
+            return
+        if error:
+            job.fail(QWebEngineUrlRequestJob.Error.UrlNotFound)
+            return
+        buffer = QBuffer(job)
+        buffer.setData(data)
+        buffer.open(QIODevice.OpenModeFlag.ReadOnly)
+        job.reply(b'image/png', buffer)
+
+
+def install_tile_handler(profile: QWebEngineProfile, renderer: TileRenderer,
+                         thumbnails: Optional[ThumbnailService] = None) -> TileSchemeHandler:
+    """Profilde işleyici yoksa kur; varsa mevcut olanı döndür"""
+    handler = profile.urlSchemeHandler(SCHEME)
+    if isinstance(handler, TileSchemeHandler):
+        return handler
+    handler = TileSchemeHandler(renderer, profile, thumbnails=thumbnails)
+    profile.installUrlSchemeHandler(SCHEME, handler)
+    return handler
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools WebEngine Profili
+Görüntüleyicinin kalıcı QWebEngineProfile'ı ve önceden yüklenen sayfası
+
+Profil, HTTP ve derlenmiş kod önbelleğini uygulama önbellek dizininde
+diskte tutar; yerel depolama kalıcı veri dizinindedir. Tüm görüntüleyiciler
+aynı profili paylaşır.
+
+prewarm_page() React uygulamasının yüklenmesini ana pencere kurulmadan
+başlatır. Chromium sayfayı kendi süreçlerinde yüklerken Python menüleri
+ve araç çubuğunu kurar. Görüntüleyici take_prewarmed_page() ile sayfayı
+devralır ve köprüyü bu sayfanın QWebChannel'ına kaydeder. Bu, olay
+döngüsü çalışmadan önce yapılmalıdır; aksi halde sayfa yeniden yüklenir.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from PyQt6.QtCore import QCoreApplication, QObject, QUrl
+from PyQt6.QtWebChannel import QWebChannel
+from PyQt6.QtWebEngineCore import QWebEnginePage, QWebEngineProfile
+
+from pypdf_tools.core.paths import app_data_dir, cache_dir
+
+
+PROFILE_NAME = 'pypdf-tools'
+
+# Disk HTTP önbelleğinin üst sınırı (byte)
+HTTP_CACHE_BYTES = 64 * 1024 * 1024
+
+_prewarmed: Optional['ViewerPage'] = None
+
+
+def find_web_build_path() -> Path:
+    """React build dizinini bul"""
+    # PyPI paketi olarak kurulmuşsa
+    try:
+        import pypdf_tools
+        build_path = Path(pypdf_tools.__file__).parent / "web" / "build"
+        if build_path.exists():
+            return build_path
+    except ImportError:
+        pass
+
+    # Geliştirme ortamında
+    build_path = Path(__file__).parent.parent.parent.parent / "web" / "build"
+    if build_path.exists():
+        return build_path
+
+    # Son çare - mevcut dizinde ara
+    build_path = Path.cwd() / "web" / "build"
+    if build_path.exists():
+        return build_path
+
+    raise FileNotFoundError("React build dizini bulunamadı!")
+
+
+def index_url(build_path: Path) -> QUrl:
+    """React uygulamasının giriş sayfası"""
+    index_path = Path(build_path) / "index.html"
+    if not index_path.exists():
+        raise FileNotFoundError(f"index.html bulunamadı: {index_path}")
+    return QUrl.fromLocalFile(str(index_path))
+
+
+@lru_cache(maxsize=None)
+def default_web_profile() -> QWebEngineProfile:
+    """Disk önbellekli kalıcı profil; QApplication'dan sonra çağrılmalı"""
+    profile = QWebEngineProfile(PROFILE_NAME, QCoreApplication.instance())
+    profile.setPersistentStoragePath(str(app_data_dir() / 'webengine'))
+    profile.setCachePath(str(cache_dir() / 'webengine'))
+    profile.setHttpCacheType(QWebEngineProfile.HttpCacheType.DiskHttpCache)
+    profile.setHttpCacheMaximumSize(HTTP_CACHE_BYTES)
+    return profile
+
+
+class ViewerPage(QWebEnginePage):
+    """Son yükleme sonucunu hatırlayan sayfa; yükleme sürerken None"""
+
+    def __init__(self, profile: QWebEngineProfile, parent: Optional[QObject] = None):
+        super().__init__(profile, parent)
+        self.load_result: Optional[bool] = None
+        self.setWebChannel(QWebChannel(self))
+        self.loadStarted.connect(self._on_load_started)
+        self.loadFinished.connect(self._on_load_finished)
+
+    def _on_load_started(self) -> None:
+        self.load_result = None
+
+    def _on_load_finished(self, success: bool) -> None:
+        self.load_result = success
+
+
+def prewarm_page(build_path: Optional[Path] = None) -> ViewerPage:
+    """React uygulamasını görüntüleyici oluşturulmadan yüklemeye başla"""
+    global _prewarmed
+    page = ViewerPage(default_web_profile())
+    page.load(index_url(build_path or find_web_build_path()))
+    _prewarmed = page
+    return page
+
+
+def take_prewarmed_page() -> Optional[ViewerPage]:
+    """Önceden yüklenen sayfayı devral; yoksa None"""
+    global _prewarmed
+    page, _prewarmed = _prewarmed, None
+    return page
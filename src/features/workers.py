@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools İş Parçacıkları
+Tüm belgelerin açma, önden işleme ve dizinleme görevlerinin paylaştığı
+iş parçacığı havuzu
+
+Her belgenin her servisi (yükleyici, önden yükleyici, arama) kendi
+SerialQueue'sunu kullanır: kuyruktaki görevler sırayla, aynı anda en
+fazla biri çalışacak şekilde paylaşımlı havuza verilir. Böylece açık
+belge sayısı ne olursa olsun iş parçacığı sayısı sabit kalır; bir
+servisin kendi görevleri arasındaki sıra da korunur.
+
+Kuyruk her görevden sonra havuza yeniden girer; uzun süren kuyruklar
+diğer belgelerin görevlerini bekletmez. Havuz önceliği kuyruklar
+arasındaki, görev önceliği kuyruk içindeki sırayı belirler.
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from typing import List, Optional, Tuple
+
+from PyQt6.QtCore import QRunnable, QThread, QThreadPool
+
+
+# Paylaşımlı havuzun en fazla iş parçacığı; QtPdf işleme tek kilitle
+# sıralandığından daha fazlası yalnızca PNG kodlama ve disk için yararlıdır.
+# Çekirdek sayısını aşan iş parçacıkları GIL için GUI iş parçacığıyla yarışır.
+MAX_WORKERS = 8
+
+# Kuyruk öncelikleri (havuzda yüksek olan önce başlar)
+PRIORITY_LOAD = 10
+PRIORITY_SEARCH = 5
+PRIORITY_BACKGROUND = 0
+
+
+def default_worker_pool() -> QThreadPool:
+    """
+    Tüm görüntüleyicilerin paylaştığı iş parçacığı havuzu
+
+    Qt'nin genel havuzudur. Qt uygulama nesnesiyle birlikte yok
+    edildiğinden saklanmaz, görev verilirken her seferinde alınır.
+    """
+    pool = QThreadPool.globalInstance()
+    pool.setMaxThreadCount(max(1, min(MAX_WORKERS, QThread.idealThreadCount())))
+    return pool
+
+
+class _Drain(QRunnable):
+    """Kuyruğun sıradaki tek görevini çalıştıran havuz görevi"""
+
+    def __init__(self, queue: 'SerialQueue'):
+        super().__init__()
+        self._queue = queue
+
+    def run(self) -> None:
+        self._queue._run_next()
+
+
+class SerialQueue:
+    """
+    Görevleri paylaşımlı havuzda sırayla çalıştıran kuyruk
+
+    start/clear QThreadPool'daki karşılıkları gibi davranır: yüksek
+    öncelikli görev önce, eşitlerde eklenme sırasıyla çalışır; clear
+    yalnızca bu kuyrukta bekleyenleri atar, çalışan görev sürer.
+    """
+
+    def __init__(self, priority: int = PRIORITY_BACKGROUND,
+                 thread_priority: Optional[QThread.Priority] = None,
+                 pool: Optional[QThreadPool] = None):
+        self.priority = priority
+        self.thread_priority = thread_priority
+        self._pool = pool
+        self._tasks: List[Tuple[int, int, QRunnable]] = []
+        self._order = itertools.count()
+        self._scheduled = False
+        self._idle = threading.Condition()
+
+    def __len__(self) -> int:
+        with self._idle:
+            return len(self._tasks)
+
+    def start(self, task: QRunnable, priority: int = 0) -> None:
+        """Görevi kuyruğa ekle; kuyruk boştaysa havuza ver"""
+        with self._idle:
+            heapq.heappush(self._tasks, (-priority, next(self._order), task))
+            if self._scheduled:
+                return
+            self._scheduled = True
+        self._submit()
+
+    def clear(self) -> None:
+        """Bekleyen görevleri at"""
+        with self._idle:
+            self._tasks.clear()
+
+    def wait(self, msecs: int = -1) -> bool:
+        """Kuyruk boşalıp çalışan görev bitene kadar bekle; zaman aşımında False"""
+        timeout = None if msecs < 0 else msecs / 1000
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._idle:
+            while self._scheduled:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._idle.wait(remaining)
+            return True
+
+    def _run_next(self) -> None:
+        with self._idle:
+            if not self._tasks:
+                self._scheduled = False
+                self._idle.notify_all()
+                return
+            _priority, _order, task = heapq.heappop(self._tasks)
+
+        thread = QThread.currentThread()
+        if self.thread_priority is not None:
+            thread.setPriority(self.thread_priority)
+        try:
+            task.run()
+        except Exception as e:
+            print(f"Worker error: {e}")
+        finally:
+            if self.thread_priority is not None:
+                thread.setPriority(QThread.Priority.NormalPriority)
+
+        # Sıradaki görev havuza yeniden girer; diğer kuyruklar araya girebilir
+        with self._idle:
+            if not self._tasks:
+                self._scheduled = False
+                self._idle.notify_all()
+                return
+        self._submit()
+
+    def _submit(self) -> None:
+        pool = self._pool if self._pool is not None else default_worker_pool()
+        pool.start(_Drain(self), self.priority)
@@ -0,0 +1,8 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools Core Package
+
+CLI ve görüntüleyici tarafından ortak kullanılan PDF işleme motoru.
+"""
@@ -0,0 +1,499 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools Kalıcı Önbellek
+Çıkarılan sayfa metni, metadata, görüntüleyici karoları, küçük resim
+paketleri ve arama dizini için içerik adresli disk önbelleği
+
+Kayıtlar dosya içeriğinin SHA-256 özetiyle anahtarlanır. Özeti her
+seferinde hesaplamamak için dosyanın (boyut, mtime, inode) üçlüsü de
+saklanır; üçlü değişmemişse dosya yeniden okunmaz. Toplam boyut sınırı
+aşıldığında en uzun süredir kullanılmayan belgeler silinir (LRU).
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
+
+from pypdf_tools.core.metadata import read_pdf_metadata
+from pypdf_tools.core.paths import cache_dir
+from pypdf_tools.core.reader import MappedFile, open_stream
+
+
+# Varsayılan toplam önbellek boyutu sınırı
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+# Metadata için özet hesaplanacak en büyük dosya; daha büyük dosyalarda
+# özet hesaplamak metadata'yı doğrudan okumaktan pahalıdır
+METADATA_HASH_LIMIT = 64 * 1024 * 1024
+
+_HASH_CHUNK = 1024 * 1024
+
+# Bu kadar sayfa yazıldıktan sonra işlem diske işlenir
+_COMMIT_EVERY = 64
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    digest TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS documents (
+    digest TEXT PRIMARY KEY,
+    metadata TEXT,
+    bytes INTEGER NOT NULL DEFAULT 0,
+    last_used REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS pages (
+    digest TEXT NOT NULL,
+    page INTEGER NOT NULL,
+    text TEXT NOT NULL,
+    PRIMARY KEY (digest, page)
+);
+CREATE TABLE IF NOT EXISTS tiles (
+    digest TEXT NOT NULL,
+    page INTEGER NOT NULL,
+    zoom INTEGER NOT NULL,
+    rotation INTEGER NOT NULL,
+    col INTEGER NOT NULL,
+    row INTEGER NOT NULL,
+    data BLOB NOT NULL,
+    PRIMARY KEY (digest, page, zoom, rotation, col, row)
+);
+CREATE TABLE IF NOT EXISTS search_progress (
+    digest TEXT PRIMARY KEY,
+    pages INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS documents_last_used ON documents (last_used);
+"""
+
+# Arama dizini (FTS5 ters dizini); büyük/küçük harf ve aksanlar katlanır
+_SEARCH_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS search_text USING fts5(
+    text, digest UNINDEXED, page UNINDEXED,
+    tokenize = 'unicode61 remove_diacritics 2'
+);
+"""
+
+
+def file_digest(path: Union[str, Path], backend: Optional[str] = None) -> str:
+    """Dosya içeriğinin SHA-256 özetini parça parça okuyarak hesapla"""
+    digest = hashlib.sha256()
+    with open_stream(path, backend) as stream:
+        if isinstance(stream, MappedFile):
+            # Eşlenmiş dosyada parçalar kopyalanmadan özetlenir
+            size = len(stream)
+            for offset in range(0, size, _HASH_CHUNK):
+                with stream.view(offset, offset + _HASH_CHUNK) as chunk:
+                    digest.update(chunk)
+        else:
+            for chunk in iter(lambda: stream.read(_HASH_CHUNK), b''):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cached_pdf_metadata(cache: 'DocumentCache', path: Union[str, Path]) -> Dict[str, Any]:
+    """
+    Metadata'yı önbellekten al, yoksa okuyup sakla
+
+    METADATA_HASH_LIMIT'ten büyük ve daha önce görülmemiş dosyalarda
+    özet hesaplanmaz; metadata doğrudan okunur ve saklanmaz.
+    """
+    compute = os.stat(path).st_size <= METADATA_HASH_LIMIT
+    digest = cache.fingerprint(path, compute=compute)
+
+    if digest is not None:
+        metadata = cache.get_metadata(digest)
+        if metadata is not None:
+            # Aynı içerik farklı adla saklanmış olabilir
+            metadata['filename'] = Path(path).name
+            return metadata
+    else:
+        cache.misses += 1
+
+    metadata = read_pdf_metadata(path)
+    if digest is not None:
+        cache.put_metadata(digest, metadata)
+    return metadata
+
+
+class DocumentCache:
+    """
+    Sayfa metni ve metadata önbelleği
+
+    Aynı süreçte isabet ve ıskalama sayıları hits/misses alanlarında
+    tutulur. Bağlam yöneticisi olarak kullanıldığında çıkışta bekleyen
+    yazımlar işlenir ve boyut sınırı uygulanır.
+
+    shared True ise bağlantı birden fazla iş parçacığından kullanılabilir;
+    erişimi sıraya koymak çağıranın sorumluluğundadır.
+    """
+
+    def __init__(self, directory: Optional[Union[str, Path]] = None,
+                 max_bytes: int = DEFAULT_MAX_BYTES, shared: bool = False):
+        if directory is None:
+            directory = os.environ.get('PYPDF_CACHE_DIR') or cache_dir()
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.shared = shared
+
+        self.hits = 0
+        self.misses = 0
+
+        self._connection: Optional[sqlite3.Connection] = None
+        self._uncommitted = 0
+        self._search_available = False
+
+    @property
+    def path(self) -> Path:
+        """Veritabanı dosyasının yolu"""
+        return self.directory / 'cache.db'
+
+    @property
+    def search_available(self) -> bool:
+        """SQLite FTS5 arama dizini kullanılabilir mi"""
+        self._db()
+        return self._search_available
+
+    def __enter__(self) -> 'DocumentCache':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def _db(self) -> sqlite3.Connection:
+        """Bağlantıyı ilk kullanımda aç"""
+        if self._connection is None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            connection = sqlite3.connect(str(self.path), timeout=10,
+                                         check_same_thread=not self.shared)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=NORMAL')
+            connection.executescript(_SCHEMA)
+            try:
+                connection.executescript(_SEARCH_SCHEMA)
+                self._search_available = True
+            except sqlite3.OperationalError:
+                # SQLite FTS5 olmadan derlenmiş; arama dizini kullanılamaz
+                self._search_available = False
+            self._connection = connection
+        return self._connection
+
+    # Dosya parmak izi
+
+    def fingerprint(self, path: Union[str, Path], compute: bool = True) -> Optional[str]:
+        """
+        Dosyanın içerik özetini döndür
+
+        (boyut, mtime, inode) kayıtlı değerlerle aynıysa saklı özet
+        kullanılır. compute False ise ve dosya tanınmıyorsa None döner.
+        """
+        resolved = str(Path(path).resolve())
+        stat = os.stat(resolved)
+        key = (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+
+        row = self._db().execute(
+            'SELECT size, mtime_ns, inode, digest FROM files WHERE path = ?',
+            (resolved,)
+        ).fetchone()
+        if row is not None and tuple(row[:3]) == key:
+            return row[3]
+        if not compute:
+            return None
+
+        digest = file_digest(resolved)
+        self._db().execute(
+            'INSERT OR REPLACE INTO files (path, size, mtime_ns, inode, digest) '
+            'VALUES (?, ?, ?, ?, ?)',
+            (resolved, *key, digest)
+        )
+        self._db().commit()
+        return digest
+
+    # Metadata
+
+    def get_metadata(self, digest: str) -> Optional[Dict[str, Any]]:
+        """Saklı metadata'yı döndür; yoksa None"""
+        row = self._db().execute(
+            'SELECT metadata FROM documents WHERE digest = ?', (digest,)
+        ).fetchone()
+        if row is None or row[0] is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._touch(digest)
+        return json.loads(row[0])
+
+    def put_metadata(self, digest: str, metadata: Dict[str, Any]) -> None:
+        """Metadata'yı sakla"""
+        encoded = json.dumps(metadata, ensure_ascii=False, default=str)
+        self._ensure_document(digest)
+        self._db().execute(
+            'UPDATE documents SET bytes = bytes - COALESCE(LENGTH(CAST(metadata AS BLOB)), 0) '
+            '+ ?, metadata = ? WHERE digest = ?',
+            (len(encoded.encode('utf-8')), encoded, digest)
+        )
+        self._db().commit()
+        self.evict()
+
+    # Sayfa metni
+
+    def cached_pages(self, digest: str) -> Set[int]:
+        """Metni saklı olan 0 tabanlı sayfa indeksleri"""
+        rows = self._db().execute(
+            'SELECT page FROM pages WHERE digest = ?', (digest,)
+        ).fetchall()
+        if rows:
+            self._touch(digest)
+        return {row[0] for row in rows}
+
+    def get_page_text(self, digest: str, page: int) -> Optional[str]:
+        """Sayfanın saklı metnini döndür; yoksa None"""
+        row = self._db().execute(
+            'SELECT text FROM pages WHERE digest = ? AND page = ?', (digest, page)
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return row[0]
+
+    def put_page_text(self, digest: str, page: int, text: str) -> None:
+        """Sayfa metnini sakla; yazımlar gruplar halinde işlenir"""
+        self._ensure_document(digest)
+        cursor = self._db().execute(
+            'INSERT OR IGNORE INTO pages (digest, page, text) VALUES (?, ?, ?)',
+            (digest, page, text)
+        )
+        if cursor.rowcount:
+            self._db().execute(
+                'UPDATE documents SET bytes = bytes + ? WHERE digest = ?',
+                (len(text.encode('utf-8')), digest)
+            )
+
+        self._uncommitted += 1
+        if self._uncommitted >= _COMMIT_EVERY:
+            self.flush()
+
+    # Görüntüleyici karoları
+
+    def get_tile(self, digest: str, page: int, zoom: int, rotation: int,
+                 col: int, row: int) -> Optional[bytes]:
+        """Saklı karo görüntüsünü döndür; yoksa None"""
+        result = self._db().execute(
+            'SELECT data FROM tiles WHERE digest = ? AND page = ? AND zoom = ? '
+            'AND rotation = ? AND col = ? AND row = ?',
+            (digest, page, zoom, rotation, col, row)
+        ).fetchone()
+        if result is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._touch(digest)
+        return result[0]
+
+    def put_tile(self, digest: str, page: int, zoom: int, rotation: int,
+                 col: int, row: int, data: bytes) -> None:
+        """Karo görüntüsünü sakla; yazımlar gruplar halinde işlenir"""
+        self._ensure_document(digest)
+        cursor = self._db().execute(
+            'INSERT OR IGNORE INTO tiles (digest, page, zoom, rotation, col, row, data) '
+            'VALUES (?, ?, ?, ?, ?, ?, ?)',
+            (digest, page, zoom, rotation, col, row, data)
+        )
+        if cursor.rowcount:
+            self._db().execute(
+                'UPDATE documents SET bytes = bytes + ? WHERE digest = ?',
+                (len(data), digest)
+            )
+
+        self._uncommitted += 1
+        if self._uncommitted >= _COMMIT_EVERY:
+            self.flush()
+            self.evict()
+
+    # Küçük resim paketleri
+
+    def thumbnail_path(self, digest: str) -> Path:
+        """Belgenin küçük resim paketi dosyası (thumbnails.ThumbnailPack)"""
+        return self.directory / 'thumbnails' / f"{digest}.pack"
+
+    def add_bytes(self, digest: str, size: int) -> None:
+        """Veritabanı dışında saklanan veriyi belge boyutuna ekle"""
+        self._ensure_document(digest)
+        self._db().execute(
+            'UPDATE documents SET bytes = bytes + ? WHERE digest = ?', (size, digest)
+        )
+        self._uncommitted += 1
+        if self._uncommitted >= _COMMIT_EVERY:
+            self.flush()
+            self.evict()
+
+    # Arama dizini
+
+    def search_progress(self, digest: str) -> int:
+        """Dizine eklenmiş sayfa sayısı; sayfalar 1'den itibaren sırayla eklenir"""
+        row = self._db().execute(
+            'SELECT pages FROM search_progress WHERE digest = ?', (digest,)
+        ).fetchone()
+        return row[0] if row is not None else 0
+
+    def put_search_pages(self, digest: str, first: int, texts: List[str]) -> int:
+        """
+        first numaralı sayfadan başlayan metinleri dizine ekle
+
+        Yalnızca dizinin kaldığı yerden devam eden sayfalar eklenir; aynı
+        belgeyi dizinleyen başka bir görüntüleyicinin eklediği sayfalar
+        atlanır. Güncel ilerlemeyi döndürür.
+        """
+        db = self._db()
+        progress = self.search_progress(digest)
+        texts = texts[progress + 1 - first:] if first <= progress else texts
+        if first > progress + 1 or not texts:
+            return progress
+
+        self._ensure_document(digest)
+        db.executemany(
+            'INSERT INTO search_text (text, digest, page) VALUES (?, ?, ?)',
+            [(text, digest, progress + 1 + index) for index, text in enumerate(texts)]
+        )
+        progress += len(texts)
+        db.execute(
+            'INSERT OR REPLACE INTO search_progress (digest, pages) VALUES (?, ?)',
+            (digest, progress)
+        )
+        db.execute(
+            'UPDATE documents SET bytes = bytes + ? WHERE digest = ?',
+            (sum(len(text.encode('utf-8')) for text in texts), digest)
+        )
+        db.commit()
+        return progress
+
+    def search_pages(self, digest: str, match: str) -> List[Tuple[int, str]]:
+        """FTS5 sorgusuyla eşleşen (sayfa, metin) çiftleri, sayfa sırasıyla"""
+        rows = self._db().execute(
+            'SELECT page, text FROM search_text WHERE search_text MATCH ? AND digest = ? '
+            'ORDER BY page',
+            (match, digest)
+        ).fetchall()
+        self._touch(digest)
+        return rows
+
+    # Yönetim
+
+    def flush(self) -> None:
+        """Bekleyen yazımları diske işle"""
+        if self._connection is not None:
+            self._connection.commit()
+        self._uncommitted = 0
+
+    def evict(self) -> int:
+        """Boyut sınırı aşılmışsa en eski belgeleri sil; silinen sayıyı döndür"""
+        db = self._db()
+        total = db.execute('SELECT COALESCE(SUM(bytes), 0) FROM documents').fetchone()[0]
+        removed = 0
+
+        if total > self.max_bytes:
+            rows = db.execute(
+                'SELECT digest, bytes FROM documents ORDER BY last_used'
+            ).fetchall()
+            for digest, size in rows:
+                if total <= self.max_bytes:
+                    break
+                self._delete_document(digest)
+                total -= size
+                removed += 1
+            db.commit()
+
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """Önbellek istatistikleri"""
+        db = self._db()
+        documents, total = db.execute(
+            'SELECT COUNT(*), COALESCE(SUM(bytes), 0) FROM documents'
+        ).fetchone()
+        pages = db.execute('SELECT COUNT(*) FROM pages').fetchone()[0]
+        tiles = db.execute('SELECT COUNT(*) FROM tiles').fetchone()[0]
+        packs = len(list((self.directory / 'thumbnails').glob('*.pack')))
+        search_pages = db.execute(
+            'SELECT COALESCE(SUM(pages), 0) FROM search_progress'
+        ).fetchone()[0]
+        return {
+            'path': str(self.path),
+            'documents': documents,
+            'pages': pages,
+            'tiles': tiles,
+            'thumbnail_packs': packs,
+            'search_pages': search_pages,
+            'bytes': total,
+            'max_bytes': self.max_bytes,
+            'disk_bytes': self.path.stat().st_size if self.path.exists() else 0,
+        }
+
+    def clear(self) -> None:
+        """Tüm kayıtları sil"""
+        db = self._db()
+        db.execute('DELETE FROM pages')
+        db.execute('DELETE FROM tiles')
+        db.execute('DELETE FROM documents')
+        db.execute('DELETE FROM files')
+        db.execute('DELETE FROM search_progress')
+        if self.search_available:
+            db.execute('DELETE FROM search_text')
+        db.commit()
+        db.execute('VACUUM')
+        for pack in (self.directory / 'thumbnails').glob('*.pack'):
+            _unlink(pack)
+
+    def close(self) -> None:
+        """Bekleyen yazımları işle, sınırı uygula ve bağlantıyı kapat"""
+        if self._connection is None:
+            return
+        self.flush()
+        self.evict()
+        self._connection.close()
+        self._connection = None
+
+    def _ensure_document(self, digest: str) -> None:
+        """Belge kaydını oluştur ve kullanım zamanını güncelle"""
+        self._db().execute(
+            'INSERT INTO documents (digest, last_used) VALUES (?, ?) '
+            'ON CONFLICT(digest) DO UPDATE SET last_used = excluded.last_used',
+            (digest, time.time())
+        )
+
+    def _touch(self, digest: str) -> None:
+        """LRU sırası için kullanım zamanını güncelle"""
+        self._db().execute(
+            'UPDATE documents SET last_used = ? WHERE digest = ?', (time.time(), digest)
+        )
+        self._uncommitted += 1
+
+    def _delete_document(self, digest: str) -> None:
+        """Belgenin tüm kayıtlarını sil"""
+        db = self._db()
+        db.execute('DELETE FROM pages WHERE digest = ?', (digest,))
+        db.execute('DELETE FROM tiles WHERE digest = ?', (digest,))
+        db.execute('DELETE FROM documents WHERE digest = ?', (digest,))
+        db.execute('DELETE FROM files WHERE digest = ?', (digest,))
+        db.execute('DELETE FROM search_progress WHERE digest = ?', (digest,))
+        if self.search_available:
+            db.execute('DELETE FROM search_text WHERE digest = ?', (digest,))
+        _unlink(self.thumbnail_path(digest))
+
+
+def _unlink(path: Path) -> None:
+    """Dosyayı sil; yoksa veya açıksa (Windows) sessizce geç"""
+    try:
+        path.unlink()
+    except OSError:
+        pass
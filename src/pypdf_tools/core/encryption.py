@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools Şifreleme Motoru
+AES-256 (PDF 2.0 Standard güvenlik işleyicisi, R6 / AESV3) ile akışlı
+şifreleme ve şifre çözme
+
+Nesneler StreamingPDFWriter ile kopyalanırken şifrelenir; belge hiçbir
+zaman bütünüyle belleğe alınmaz. Toplu modda belgeler işlem havuzunda
+paralel işlenir. Her belge kendi rastgele dosya anahtarını ve tuzlarını
+alır; anahtarlar ve şifreler belge yazıldıktan sonra saklanmaz.
+"""
+
+import csv
+import secrets
+import struct
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from hashlib import sha256, sha384, sha512
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+from cryptography.hazmat.primitives import padding
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from pypdf.generic import (
+    ArrayObject, BooleanObject, ByteStringObject, DictionaryObject, NameObject,
+    NumberObject, PdfObject, TextStringObject
+)
+
+from pypdf_tools.core.metadata import PERMISSION_BITS
+from pypdf_tools.core.metrics import ProgressCallback, rate
+from pypdf_tools.core.engines import WRITER_ENGINE
+from pypdf_tools.core.reader import open_document, release_cache
+from pypdf_tools.core.split import default_jobs
+from pypdf_tools.core.writer import StreamingPDFWriter, outline_entries
+
+
+# Ayrılmış bitler 1, izin bitleri 0 (ISO 32000-2, Tablo 22)
+_BASE_PERMISSIONS = 0xFFFFF0C0
+
+# Toplu modda işçi başına bekleyebilecek en fazla belge sayısı
+_PENDING_PER_WORKER = 4
+
+# Şifrelenen kopyaya aktarılan belge bilgisi anahtarları
+INFO_KEYS = ('/Title', '/Author', '/Subject', '/Keywords', '/Creator',
+             '/CreationDate', '/ModDate')
+
+
+class AES256Encryption:
+    """
+    AES-256 dosya anahtarı ve /Encrypt sözlüğü
+
+    Dosya anahtarı rastgele üretilir; kullanıcı ve sahip şifreleri ile
+    ISO 32000-2 algoritma 8, 9 ve 10'a göre sarmalanır. Her nesne rastgele
+    IV ile AES-256-CBC kullanılarak şifrelenir.
+    """
+
+    def __init__(self, user_password: str, owner_password: Optional[str] = None,
+                 permissions: Sequence[str] = ()):
+        unknown = [name for name in permissions if name not in PERMISSION_BITS]
+        if unknown:
+            raise ValueError(f"Bilinmeyen izin: {', '.join(unknown)}")
+
+        user = _prepare_password(user_password)
+        owner = _prepare_password(owner_password or user_password)
+
+        self.file_key = secrets.token_bytes(32)
+        self.permissions = tuple(permissions)
+        self.p = _permission_flags(permissions)
+
+        # Algoritma 8: kullanıcı şifresi doğrulama ve anahtar değerleri
+        validation_salt, key_salt = secrets.token_bytes(8), secrets.token_bytes(8)
+        self.u = _hash_r6(user, validation_salt) + validation_salt + key_salt
+        self.ue = _aes_cbc_no_padding(_hash_r6(user, key_salt), self.file_key)
+
+        # Algoritma 9: sahip şifresi değerleri (U değerine bağlıdır)
+        validation_salt, key_salt = secrets.token_bytes(8), secrets.token_bytes(8)
+        self.o = _hash_r6(owner, validation_salt, self.u) + validation_salt + key_salt
+        self.oe = _aes_cbc_no_padding(_hash_r6(owner, key_salt, self.u), self.file_key)
+
+        # Algoritma 10: izinlerin şifrelenmiş kopyası
+        block = (struct.pack('<I', self.p) + b'\xff\xff\xff\xff' + b'Tadb'
+                 + secrets.token_bytes(4))
+        encryptor = Cipher(algorithms.AES(self.file_key), modes.ECB()).encryptor()
+        self.perms = encryptor.update(block) + encryptor.finalize()
+
+    def encrypt(self, data: bytes) -> bytes:
+        """Veriyi rastgele IV ile şifrele; IV çıktının başına eklenir"""
+        iv = secrets.token_bytes(16)
+        padder = padding.PKCS7(128).padder()
+        padded = padder.update(data) + padder.finalize()
+        encryptor = Cipher(algorithms.AES(self.file_key), modes.CBC(iv)).encryptor()
+        return iv + encryptor.update(padded) + encryptor.finalize()
+
+    def encrypt_strings(self, obj: PdfObject) -> PdfObject:
+        """Nesnedeki tüm metin dizilerini şifrelenmiş kopyalarıyla değiştir"""
+        if isinstance(obj, TextStringObject):
+            return ByteStringObject(self.encrypt(obj.get_original_bytes()))
+        if isinstance(obj, ByteStringObject):
+            return ByteStringObject(self.encrypt(bytes(obj)))
+        if isinstance(obj, DictionaryObject):
+            copied = DictionaryObject()
+            for name, value in obj.items():
+                copied[NameObject(name)] = self.encrypt_strings(value)
+            return copied
+        if isinstance(obj, ArrayObject):
+            return ArrayObject(self.encrypt_strings(item) for item in obj)
+        return obj
+
+    def dictionary(self) -> DictionaryObject:
+        """Trailer'da gösterilecek /Encrypt sözlüğü"""
+        crypt_filter = DictionaryObject()
+        crypt_filter[NameObject('/Type')] = NameObject('/CryptFilter')
+        crypt_filter[NameObject('/CFM')] = NameObject('/AESV3')
+        crypt_filter[NameObject('/AuthEvent')] = NameObject('/DocOpen')
+        crypt_filter[NameObject('/Length')] = NumberObject(32)
+
+        filters = DictionaryObject()
+        filters[NameObject('/StdCF')] = crypt_filter
+
+        encrypt = DictionaryObject()
+        encrypt[NameObject('/Filter')] = NameObject('/Standard')
+        encrypt[NameObject('/V')] = NumberObject(5)
+        encrypt[NameObject('/R')] = NumberObject(6)
+        encrypt[NameObject('/Length')] = NumberObject(256)
+        encrypt[NameObject('/CF')] = filters
+        encrypt[NameObject('/StmF')] = NameObject('/StdCF')
+        encrypt[NameObject('/StrF')] = NameObject('/StdCF')
+        encrypt[NameObject('/P')] = NumberObject(struct.unpack('<i', struct.pack('<I', self.p))[0])
+        encrypt[NameObject('/U')] = ByteStringObject(self.u)
+        encrypt[NameObject('/UE')] = ByteStringObject(self.ue)
+        encrypt[NameObject('/O')] = ByteStringObject(self.o)
+        encrypt[NameObject('/OE')] = ByteStringObject(self.oe)
+        encrypt[NameObject('/Perms')] = ByteStringObject(self.perms)
+        encrypt[NameObject('/EncryptMetadata')] = BooleanObject(True)
+        return encrypt
+
+
+def encrypt_document(input_file: Union[str, Path], output: Union[str, Path],
+                     user_password: str, owner_password: Optional[str] = None,
+                     permissions: Sequence[str] = (),
+                     input_password: Optional[str] = None,
+                     progress: Optional[ProgressCallback] = None) -> Dict[str, Any]:
+    """
+    PDF dosyasını AES-256 ile şifreleyerek yeniden yaz
+
+    Sayfalar, yer işaretleri ve belge bilgileri korunur; nesneler
+    okundukça şifrelenip diske yazılır.
+    """
+    started = time.perf_counter()
+    encryption = AES256Encryption(user_password, owner_password, permissions)
+
+    with open_document(input_file, input_password, engine=WRITER_ENGINE) as reader:
+        pages = _copy_document(reader, output, encryption, progress)
+
+    return {
+        'pages': pages,
+        'file_size': Path(output).stat().st_size,
+        'algorithm': 'AES-256',
+        'elapsed': time.perf_counter() - started,
+    }
+
+
+def decrypt_document(input_file: Union[str, Path], output: Union[str, Path],
+                     password: str,
+                     progress: Optional[ProgressCallback] = None) -> Dict[str, Any]:
+    """
+    Şifreli PDF'in şifresini kaldırarak yeniden yaz
+
+    pypdf nesneleri okurken çözer; çözülen nesneler akışlı yazıcıyla
+    şifresiz olarak kopyalanır. Şifre yanlışsa PermissionError fırlatılır.
+    """
+    started = time.perf_counter()
+
+    with open_document(input_file, password, engine=WRITER_ENGINE) as reader:
+        if not reader.is_encrypted:
+            raise ValueError(f"PDF şifreli değil: {input_file}")
+        pages = _copy_document(reader, output, None, progress)
+
+    return {
+        'pages': pages,
+        'file_size': Path(output).stat().st_size,
+        'elapsed': time.perf_counter() - started,
+    }
+
+
+def _copy_document(reader: Any, output: Union[str, Path],
+                   encryption: Optional[AES256Encryption],
+                   progress: Optional[ProgressCallback] = None) -> int:
+    """Belgeyi sayfa sayfa kopyala; yer işaretlerini ve bilgileri taşı"""
+    with StreamingPDFWriter(output, encryption=encryption) as writer:
+        writer.begin_document(reader)
+        outline = outline_entries(reader)
+        total = len(reader.pages)
+
+        for page in reader.pages:
+            writer.add_page(page)
+            # Bir sonraki sayfaya geçmeden çözümlenmiş nesneleri bırak
+            release_cache(reader)
+            if progress:
+                progress(writer.pages_written, total)
+
+        for title, page_index, level in outline:
+            page_idnum = writer.page_id(reader.pages[page_index])
+            if page_idnum is not None:
+                writer.add_outline_item(title, page_idnum, level)
+
+        info = reader.metadata or {}
+        writer.update_info({key: str(info[key]) for key in INFO_KEYS if key in info})
+        writer.end_document()
+        return writer.pages_written
+
+
+# Toplu şifreleme
+
+def read_manifest(manifest: Union[str, Path]) -> Iterator[Dict[str, Any]]:
+    """
+    Toplu şifreleme listesini satır satır oku
+
+    Sütunlar: input, output, password, owner_password, permissions.
+    Yalnızca input zorunludur; izinler boşluk, virgül veya noktalı
+    virgülle ayrılabilir. Göreli yollar manifest dizinine göre çözülür.
+    """
+    base = Path(manifest).parent
+    with open(manifest, newline='', encoding='utf-8-sig') as stream:
+        for line_number, row in enumerate(csv.DictReader(stream), start=2):
+            row = {key.strip().lower(): (value or '').strip()
+                   for key, value in row.items() if key}
+            if not row.get('input'):
+                raise ValueError(f"Manifest satırı {line_number}: 'input' sütunu boş")
+
+            input_path = base / row['input']
+            output = row.get('output') or str(
+                input_path.with_stem(f"{input_path.stem}_encrypted")
+            )
+            permissions = row.get('permissions', '').replace(',', ' ').replace(';', ' ')
+            yield {
+                'line': line_number,
+                'input': str(input_path),
+                'output': str(base / output),
+                'password': row.get('password') or None,
+                'owner_password': row.get('owner_password') or None,
+                'permissions': tuple(permissions.split()) if permissions else None,
+            }
+
+
+def _encrypt_entry(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Tek manifest satırını şifrele; hataları kayıt olarak döndür"""
+    result = {'line': entry['line'], 'input': entry['input'], 'output': entry['output']}
+    if not entry['password']:
+        return {**result, 'success': False, 'error': 'Şifre belirtilmemiş'}
+
+    try:
+        stats = encrypt_document(entry['input'], entry['output'], entry['password'],
+                                 entry['owner_password'], entry['permissions'] or ())
+    except Exception as e:
+        return {**result, 'success': False, 'error': str(e) or type(e).__name__}
+    return {**result, 'success': True, **stats}
+
+
+def encrypt_batch(entries: Iterable[Dict[str, Any]], jobs: Optional[int] = None,
+                  password: Optional[str] = None, owner_password: Optional[str] = None,
+                  permissions: Sequence[str] = ()) -> Iterator[Dict[str, Any]]:
+    """
+    Manifest satırlarını paralel şifrele, sonuçları tamamlandıkça üret
+
+    Satırda belirtilmeyen şifre ve izinler için verilen varsayılanlar
+    kullanılır. Bekleyen iş sayısı sınırlıdır; hatalı satırlar toplu
+    işlemi durdurmaz.
+    """
+    jobs = max(1, jobs or default_jobs())
+
+    def prepared() -> Iterator[Dict[str, Any]]:
+        for entry in entries:
+            yield {
+                **entry,
+                'password': entry['password'] or password,
+                'owner_password': entry['owner_password'] or owner_password,
+                'permissions': (entry['permissions']
+                                if entry['permissions'] is not None else tuple(permissions)),
+            }
+
+    if jobs == 1:
+        for entry in prepared():
+            yield _encrypt_entry(entry)
+        return
+
+    limit = jobs * _PENDING_PER_WORKER
+    queue = prepared()
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        pending = set()
+        exhausted = False
+        while pending or not exhausted:
+            while not exhausted and len(pending) < limit:
+                entry = next(queue, None)
+                if entry is None:
+                    exhausted = True
+                else:
+                    pending.add(executor.submit(_encrypt_entry, entry))
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+
+def batch_summary(results: List[Dict[str, Any]], elapsed: float) -> Dict[str, Any]:
+    """Toplu işlem özetini hesapla"""
+    succeeded = [item for item in results if item['success']]
+    return {
+        'files': len(results),
+        'errors': len(results) - len(succeeded),
+        'pages': sum(item['pages'] for item in succeeded),
+        'elapsed': elapsed,
+        'files_per_second': rate(len(results), elapsed),
+    }
+
+
+# ISO 32000-2 yardımcı algoritmaları
+
+def _prepare_password(password: str) -> bytes:
+    """Şifreyi UTF-8 olarak kodla ve 127 byte ile sınırla"""
+    return (password or '').encode('utf-8')[:127]
+
+
+def _permission_flags(permissions: Sequence[str]) -> int:
+    """İzin isimlerinden 32 bitlik /P değerini oluştur"""
+    flags = _BASE_PERMISSIONS
+    for name in permissions:
+        flags |= 1 << (PERMISSION_BITS[name] - 1)
+    return flags
+
+
+def _hash_r6(password: bytes, salt: bytes, user_key: bytes = b'') -> bytes:
+    """Algoritma 2.B: R6 için yinelemeli parola özeti"""
+    key = sha256(password + salt + user_key).digest()
+    round_number = 0
+    while True:
+        round_number += 1
+        block = (password + key + user_key) * 64
+        encryptor = Cipher(algorithms.AES(key[:16]), modes.CBC(key[16:32])).encryptor()
+        encrypted = encryptor.update(block) + encryptor.finalize()
+        hash_function = (sha256, sha384, sha512)[sum(encrypted[:16]) % 3]
+        key = hash_function(encrypted).digest()
+        if round_number >= 64 and encrypted[-1] <= round_number - 32:
+            return key[:32]
+
+
+def _aes_cbc_no_padding(key: bytes, data: bytes) -> bytes:
+    """Sıfır IV ile dolgusuz AES-256-CBC (UE/OE değerleri için)"""
+    encryptor = Cipher(algorithms.AES(key), modes.CBC(b'\x00' * 16)).encryptor()
+    return encryptor.update(data) + encryptor.finalize()
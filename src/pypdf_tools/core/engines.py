@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools PDF Motorları
+Kurulu PDF kütüphanelerinin (pypdf, PyPDF2...) çalışma zamanında seçimi
+
+Motorlar adıyla kaydedilir ve modülleri ilk kullanımda içe aktarılır;
+böylece komut satırı yalnızca gerçekten PDF okuyan komutlarda bu
+kütüphaneleri yükler. Seçim sırası: açıkça verilen ad, PYPDF_ENGINE
+ortam değişkeni, kayıt sırasındaki ilk kurulu motor.
+
+Akışlı yazıcı (merge, split, encrypt) pypdf nesne modelini kullandığı
+için bu işlemler her zaman WRITER_ENGINE ile okur.
+"""
+
+import importlib
+import importlib.util
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Akışlı yazıcının nesnelerini anlayabildiği motor
+WRITER_ENGINE = 'pypdf'
+
+
+class PDFEngine:
+    """
+    Kayıtlı PDF motoru
+
+    Modül adları ve sınıf adları saklanır; modül ilk öznitelik
+    erişiminde içe aktarılır.
+    """
+
+    def __init__(self, name: str, module: str, reader: str = 'PdfReader',
+                 writer: str = 'PdfWriter', errors: str = 'errors'):
+        self.name = name
+        self.module_name = module
+        self._reader_name = reader
+        self._writer_name = writer
+        self._errors_name = errors
+
+    def __repr__(self) -> str:
+        return f"PDFEngine({self.name!r}, {self.module_name!r})"
+
+    def is_installed(self) -> bool:
+        """Modülü içe aktarmadan kurulu olup olmadığını kontrol et"""
+        try:
+            return importlib.util.find_spec(self.module_name) is not None
+        except (ImportError, ValueError):
+            return False
+
+    @property
+    def module(self) -> Any:
+        return importlib.import_module(self.module_name)
+
+    @property
+    def version(self) -> Optional[str]:
+        return getattr(self.module, '__version__', None)
+
+    @property
+    def PdfReader(self) -> Any:
+        return getattr(self.module, self._reader_name)
+
+    @property
+    def PdfWriter(self) -> Any:
+        return getattr(self.module, self._writer_name)
+
+    @property
+    def read_errors(self) -> Tuple[type, ...]:
+        """Bozuk belge okunurken fırlatılan istisna türleri"""
+        errors = importlib.import_module(f"{self.module_name}.{self._errors_name}")
+        return (errors.PdfReadError,)
+
+    @property
+    def not_decrypted_error(self) -> type:
+        """Şifresi çözülmemiş belgeye erişimde fırlatılan istisna"""
+        errors = importlib.import_module(f"{self.module_name}.{self._errors_name}")
+        return getattr(errors, 'FileNotDecryptedError', errors.PdfReadError)
+
+
+# Kayıt sırası öncelik sırasıdır
+_ENGINES: Dict[str, PDFEngine] = {}
+
+
+def register_engine(name: str, module: str, **names: str) -> PDFEngine:
+    """
+    Yeni bir PDF motoru kaydet
+
+    Motor pypdf ile uyumlu bir okuyucu sunmalıdır (pages, trailer,
+    metadata, is_encrypted, decrypt). Aynı adla kayıt öncekini değiştirir.
+    """
+    engine = PDFEngine(name, module, **names)
+    _ENGINES[name] = engine
+    return engine
+
+
+register_engine('pypdf', 'pypdf')
+register_engine('PyPDF2', 'PyPDF2')
+
+
+def engine_names() -> List[str]:
+    """Kayıtlı motor adları (öncelik sırasıyla)"""
+    return list(_ENGINES)
+
+
+def available_engines() -> List[str]:
+    """Kurulu motor adları (öncelik sırasıyla)"""
+    return [name for name, engine in _ENGINES.items() if engine.is_installed()]
+
+
+def get_engine(name: Optional[str] = None) -> PDFEngine:
+    """
+    PDF motorunu seç
+
+    Bilinmeyen adlarda ValueError, motor kurulu değilse ImportError
+    fırlatılır.
+    """
+    name = name or os.environ.get('PYPDF_ENGINE')
+    if name:
+        engine = _ENGINES.get(name)
+        if engine is None:
+            raise ValueError(f"Bilinmeyen PDF motoru: {name}")
+        if not engine.is_installed():
+            raise ImportError(f"PDF motoru kurulu değil: {name}")
+        return engine
+
+    for engine in _ENGINES.values():
+        if engine.is_installed():
+            return engine
+    raise ImportError(f"Kurulu PDF motoru bulunamadı ({', '.join(_ENGINES)})")
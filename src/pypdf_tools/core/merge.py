@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools Birleştirme Motoru
+Girdi belgelerini tek tek akıtarak sabit bellekle PDF birleştirme
+"""
+
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from pypdf_tools.core.engines import WRITER_ENGINE
+from pypdf_tools.core.metrics import ProgressCallback, peak_rss_bytes, rate
+from pypdf_tools.core.reader import open_document, page_count, release_cache
+from pypdf_tools.core.writer import StreamingPDFWriter, outline_entries
+
+
+def merge_documents(input_files: List[Union[str, Path]], output: Union[str, Path],
+                    keep_bookmarks: bool = False,
+                    password: Optional[str] = None,
+                    progress: Optional[ProgressCallback] = None) -> Dict[str, Any]:
+    """
+    PDF dosyalarını sırayla birleştir
+
+    Her girdi belgesi ayrı ayrı açılır, sayfaları çıktıya yazıldıktan
+    sonra okuyucusu serbest bırakılır. Yazı tipi ve görsel gibi ortak
+    kaynaklar içerik özetine göre tekilleştirilir. progress verilirse
+    toplam sayfa sayısı önce kataloglardan okunur ve her sayfadan sonra
+    bildirilir.
+    """
+    started = time.perf_counter()
+    expected = _total_pages(input_files, password) if progress else 0
+
+    with StreamingPDFWriter(output) as writer:
+        for input_file in input_files:
+            with open_document(input_file, password, engine=WRITER_ENGINE) as reader:
+                writer.begin_document(reader)
+
+                outline = outline_entries(reader) if keep_bookmarks else []
+
+                for page in reader.pages:
+                    writer.add_page(page)
+                    # Bir sonraki sayfaya geçmeden çözümlenmiş nesneleri bırak
+                    release_cache(reader)
+                    if progress:
+                        progress(writer.pages_written, expected)
+
+                for title, page_index, level in outline:
+                    page_idnum = writer.page_id(reader.pages[page_index])
+                    if page_idnum is not None:
+                        writer.add_outline_item(title, page_idnum, level)
+
+                writer.end_document()
+
+        total_pages = writer.pages_written
+        deduplicated = writer.objects_deduplicated
+
+    elapsed = time.perf_counter() - started
+    return {
+        'total_pages': total_pages,
+        'file_size': Path(output).stat().st_size,
+        'deduplicated_objects': deduplicated,
+        'elapsed': elapsed,
+        'pages_per_second': rate(total_pages, elapsed),
+        'peak_rss': peak_rss_bytes(),
+    }
+
+
+def _total_pages(input_files: List[Union[str, Path]], password: Optional[str]) -> int:
+    """Girdilerin toplam sayfa sayısını yalnızca kataloglardan oku"""
+    total = 0
+    for input_file in input_files:
+        with open_document(input_file, password, engine=WRITER_ENGINE) as reader:
+            total += page_count(reader)
+    return total
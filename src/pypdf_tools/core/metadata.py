@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools Metadata Okuyucu
+Yalnızca trailer, xref ve katalog okuyarak PDF bilgisi çıkarır
+
+Sayfa içerik stream'lerine hiç dokunulmaz; sayfa sayısı /Pages /Count
+değerinden, belge bilgileri /Info sözlüğünden ve XMP verisi katalogdaki
+/Metadata stream'inden okunur. CLI `info` komutu ve görüntüleyici aynı
+okuyucuyu kullanır.
+"""
+
+import os
+import re
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+from pypdf_tools.core.engines import PDFEngine, get_engine
+from pypdf_tools.core.reader import open_stream
+
+if TYPE_CHECKING:
+    from pypdf import PdfReader
+
+
+# PDF izin bitleri (ISO 32000-1, Tablo 22) - 1 tabanlı bit numarası
+PERMISSION_BITS = {
+    'print': 3,
+    'modify': 4,
+    'copy': 5,
+    'annotate': 6,
+    'fill-forms': 9,
+    'accessibility': 10,
+    'assemble': 11,
+    'print-high-quality': 12,
+}
+
+_INFO_FIELDS = {
+    '/Title': 'title',
+    '/Author': 'author',
+    '/Subject': 'subject',
+    '/Keywords': 'keywords',
+    '/Creator': 'creator',
+    '/Producer': 'producer',
+    '/CreationDate': 'creation_date',
+    '/ModDate': 'modification_date',
+}
+
+_DATE_PATTERN = re.compile(
+    r"^D?:?(\d{4})(\d{2})?(\d{2})?(\d{2})?(\d{2})?(\d{2})?"
+    r"(?:([Zz+\-])(\d{2})?'?(\d{2})?'?)?"
+)
+
+
+def read_pdf_metadata(path: Union[str, Path], password: Optional[str] = None,
+                      engine: Optional[str] = None) -> Dict[str, Any]:
+    """
+    PDF dosyasının metadata'sını içerik stream'lerini okumadan çıkar
+
+    Şifreli dosyalar önce verilen şifre, yoksa boş şifre ile açılmaya
+    çalışılır. Şifre çözülemezse sayfa sayısı ve belge bilgileri None
+    olarak döner, şifreleme bilgileri yine de raporlanır.
+    """
+    pdf_engine = get_engine(engine)
+    file_path = Path(path)
+    stat = file_path.stat()
+
+    # Dosya yolu yerine eşlenmiş dosya verilir; böylece pypdf dosyanın
+    # tamamını belleğe okumaz, yalnızca trailer ve xref'e erişir
+    with open_stream(file_path) as stream:
+        return _read_metadata(pdf_engine.PdfReader(stream), file_path, stat,
+                              password, pdf_engine)
+
+
+def _read_metadata(reader: 'PdfReader', file_path: Path, stat: os.stat_result,
+                   password: Optional[str], pdf_engine: PDFEngine) -> Dict[str, Any]:
+    """Açılmış okuyucudan metadata sözlüğünü oluştur"""
+    encryption = _encryption_info(reader)
+
+    decrypted = True
+    if reader.is_encrypted:
+        decrypted = bool(reader.decrypt(password or ''))
+
+    info: Dict[str, Any] = {
+        'filename': file_path.name,
+        'file_size': stat.st_size,
+        'pdf_version': _header_version(reader),
+        'pages': None,
+        **{field: None for field in _INFO_FIELDS.values()},
+        'encrypted': reader.is_encrypted,
+        'decrypted': decrypted,
+        'encryption': encryption,
+        'permissions': _permissions(encryption),
+        'xmp': None,
+    }
+
+    if not decrypted:
+        return info
+
+    try:
+        catalog = reader.trailer['/Root']
+        info['pages'] = int(catalog['/Pages']['/Count'])
+        info.update(_document_info(reader))
+        info['xmp'] = _xmp_metadata(catalog, pdf_engine)
+    except pdf_engine.not_decrypted_error:
+        info['decrypted'] = False
+    except (KeyError, TypeError, ValueError, *pdf_engine.read_errors):
+        # Bozuk katalog: sayfa ağacından saymayı dene; o da bozuksa None kalır.
+        # pypdf, tanımsız /Pages nesnesinde AttributeError fırlatır.
+        try:
+            info['pages'] = len(reader.pages)
+        except (AttributeError, KeyError, TypeError, ValueError, *pdf_engine.read_errors):
+            info['pages'] = None
+
+    return info
+
+
+def _header_version(reader: 'PdfReader') -> Optional[str]:
+    """%PDF-x.y başlığından sürümü al"""
+    header = getattr(reader, 'pdf_header', '') or ''
+    return header[5:] if header.startswith('%PDF-') else None
+
+
+def _document_info(reader: 'PdfReader') -> Dict[str, Any]:
+    """/Info sözlüğündeki alanları oku"""
+    result: Dict[str, Any] = {}
+    document_info = reader.trailer.get('/Info')
+    if document_info is None:
+        return result
+
+    document_info = document_info.get_object()
+    for key, field in _INFO_FIELDS.items():
+        value = document_info.get(key)
+        if value is None:
+            continue
+        value = str(value)
+        if key in ('/CreationDate', '/ModDate'):
+            value = parse_pdf_date(value) or value
+        result[field] = value
+    return result
+
+
+def _xmp_metadata(catalog: Any, pdf_engine: PDFEngine) -> Optional[str]:
+    """Katalogdaki XMP stream'ini metin olarak döndür"""
+    metadata = catalog.get('/Metadata')
+    if metadata is None:
+        return None
+    try:
+        return metadata.get_object().get_data().decode('utf-8', errors='replace')
+    except (AttributeError, *pdf_engine.read_errors):
+        return None
+
+
+def _encryption_info(reader: 'PdfReader') -> Optional[Dict[str, Any]]:
+    """/Encrypt sözlüğünden şifreleme yöntemini çıkar"""
+    encrypt = reader.trailer.get('/Encrypt')
+    if encrypt is None:
+        return None
+
+    encrypt = encrypt.get_object()
+    version = int(encrypt.get('/V', 0))
+    revision = int(encrypt.get('/R', 0))
+    length = int(encrypt.get('/Length', 40))
+
+    if version >= 5:
+        algorithm = 'AES-256'
+    elif version == 4:
+        crypt_filter = encrypt.get('/CF', {}).get('/StdCF', {})
+        method = crypt_filter.get('/CFM')
+        algorithm = 'AES-128' if method == '/AESV2' else f'RC4-{length}'
+    else:
+        algorithm = f'RC4-{length if version > 1 else 40}'
+
+    return {
+        'filter': str(encrypt.get('/Filter', '')).lstrip('/'),
+        'version': version,
+        'revision': revision,
+        'algorithm': algorithm,
+        'p': int(encrypt.get('/P', -1)),
+    }
+
+
+def _permissions(encryption: Optional[Dict[str, Any]]) -> List[str]:
+    """İzin bitlerini isim listesine çevir"""
+    if encryption is None:
+        return list(PERMISSION_BITS)
+
+    flags = encryption['p']
+    return [name for name, bit in PERMISSION_BITS.items() if flags & (1 << (bit - 1))]
+
+
+def parse_pdf_date(value: str) -> Optional[str]:
+    """PDF tarih metnini (D:YYYYMMDDHHmmSS+HH'mm') ISO 8601'e çevir"""
+    match = _DATE_PATTERN.match(value.strip())
+    if not match:
+        return None
+
+    (year, month, day, hour, minute, second,
+     sign, tz_hour, tz_minute) = match.groups()
+    try:
+        tz = None
+        if sign in ('Z', 'z'):
+            tz = timezone.utc
+        elif sign in ('+', '-'):
+            offset = timedelta(hours=int(tz_hour or 0), minutes=int(tz_minute or 0))
+            tz = timezone(offset if sign == '+' else -offset)
+
+        parsed = datetime(
+            int(year), int(month or 1), int(day or 1),
+            int(hour or 0), int(minute or 0), int(second or 0), tzinfo=tz
+        )
+    except ValueError:
+        return None
+    return parsed.isoformat()
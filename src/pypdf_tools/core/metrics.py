@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools Performans Ölçümleri
+Bellek ve hız istatistikleri için yardımcı fonksiyonlar
+"""
+
+import sys
+from typing import Callable, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+# (tamamlanan, toplam) ile çağrılan ilerleme bildirimi; istisna fırlatırsa
+# işlem yarıda kesilir
+ProgressCallback = Callable[[int, int], None]
+
+
+def peak_rss_bytes() -> Optional[int]:
+    """Sürecin tepe bellek kullanımını (RSS) byte cinsinden döndür"""
+    if resource is None:
+        return None
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux kilobyte, macOS byte cinsinden raporlar
+    if sys.platform == 'darwin':
+        return int(peak)
+    return int(peak) * 1024
+
+
+def format_size(size: Optional[float]) -> str:
+    """Byte değerini okunabilir metne çevir (örn: 1.2 MB)"""
+    if size is None:
+        return 'bilinmiyor'
+
+    for unit in ('B', 'KB', 'MB', 'GB'):
+        if abs(size) < 1024 or unit == 'GB':
+            break
+        size /= 1024
+
+    if unit == 'B':
+        return f"{int(size)} B"
+    return f"{size:.1f} {unit}"
+
+
+def rate(count: float, elapsed: float) -> float:
+    """Saniye başına işlem oranını hesapla"""
+    if elapsed <= 0:
+        return 0.0
+    return count / elapsed
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools Sayfa Aralığı İfadeleri
+`--range` ve `--pages` seçenekleri için ortak ayrıştırıcı ve planlayıcı
+
+Desteklenen söz dizimi (sayfalar 1 tabanlıdır):
+    5           tek sayfa
+    1-5         kapalı aralık
+    10-         10. sayfadan sona kadar
+    -1, -3--1   sondan sayma (-1 son sayfa)
+    1-20:2      adımlı aralık (1, 3, 5, ...)
+    odd, even   tek / çift sayfalar
+    all, *      tüm sayfalar
+
+Öğeler virgülle ayrılır; sonuç sıralı, tekilleştirilmiş ve birleştirilmiş
+aralık kümesidir.
+"""
+
+import bisect
+import re
+from functools import lru_cache
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+
+_ITEM_PATTERN = re.compile(
+    r'^(?P<start>-?\d+)(?:(?P<dash>-)(?P<end>-?\d+)?)?(?::(?P<step>\d+))?$'
+)
+_KEYWORDS = {
+    'all': (1, None, 1, True),
+    '*': (1, None, 1, True),
+    'odd': (1, None, 2, True),
+    'even': (2, None, 2, True),
+}
+
+# (başlangıç, bitiş, adım, kırpılır); bitiş None ise belge sonuna kadar.
+# Anahtar sözcükler belgeye kırpılır: kısa belgede boş veya eksik seçim
+# üretir, hata vermez.
+_Term = Tuple[int, Optional[int], int, bool]
+
+
+class PageRangeSet:
+    """
+    Sıralı ve birleştirilmiş sayfa aralıkları kümesi
+    Aralıklar 0 tabanlı ve yarı açıktır: (başlangıç, bitiş)
+    """
+
+    __slots__ = ('_intervals', '_starts', '_length')
+
+    def __init__(self, intervals: Sequence[Tuple[int, int]] = ()):
+        self._intervals = tuple(_merge_intervals(intervals))
+        self._starts = [start for start, _stop in self._intervals]
+        self._length = sum(stop - start for start, stop in self._intervals)
+
+    @classmethod
+    def full(cls, total_pages: int) -> 'PageRangeSet':
+        """Tüm sayfaları kapsayan küme"""
+        return cls([(0, total_pages)] if total_pages > 0 else [])
+
+    @property
+    def intervals(self) -> Tuple[Tuple[int, int], ...]:
+        """Birleştirilmiş (başlangıç, bitiş) aralıkları"""
+        return self._intervals
+
+    def __iter__(self) -> Iterator[int]:
+        """Sayfa indekslerini artan sırada, tek geçişte üret"""
+        for start, stop in self._intervals:
+            yield from range(start, stop)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __bool__(self) -> bool:
+        return self._length > 0
+
+    def __contains__(self, index: object) -> bool:
+        if not isinstance(index, int):
+            return False
+        position = bisect.bisect_right(self._starts, index) - 1
+        return position >= 0 and index < self._intervals[position][1]
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PageRangeSet):
+            return NotImplemented
+        return self._intervals == other._intervals
+
+    def __repr__(self) -> str:
+        return f"PageRangeSet({self.to_expression()!r})"
+
+    def to_expression(self) -> str:
+        """Kümeyi 1 tabanlı ifade olarak yaz (örn: 1-5,7,9-12)"""
+        parts = []
+        for start, stop in self._intervals:
+            if stop - start == 1:
+                parts.append(str(start + 1))
+            else:
+                parts.append(f"{start + 1}-{stop}")
+        return ','.join(parts)
+
+
+class PageRangeExpression:
+    """
+    Derlenmiş sayfa aralığı ifadesi
+    Sayfa sayısından bağımsızdır; resolve() ile gerçek belgeye uygulanır
+    """
+
+    __slots__ = ('source', '_terms')
+
+    def __init__(self, source: str, terms: Sequence[_Term]):
+        self.source = source
+        self._terms = tuple(terms)
+
+    def resolve(self, total_pages: int) -> PageRangeSet:
+        """İfadeyi belgenin sayfa sayısına göre doğrula ve kümeye çevir"""
+        intervals: List[Tuple[int, int]] = []
+
+        for start, end, step, clamped in self._terms:
+            if clamped:
+                if start > total_pages:
+                    continue
+                first = start
+            else:
+                first = _absolute(start, total_pages, self.source)
+            last = total_pages if end is None else _absolute(end, total_pages, self.source)
+
+            if first > last:
+                raise ValueError(
+                    f"Geçersiz sayfa aralığı '{self.source}': {first} > {last}"
+                )
+
+            if step == 1:
+                intervals.append((first - 1, last))
+            else:
+                intervals.extend(
+                    (page - 1, page) for page in range(first, last + 1, step)
+                )
+
+        return PageRangeSet(intervals)
+
+    def __repr__(self) -> str:
+        return f"PageRangeExpression({self.source!r})"
+
+
+@lru_cache(maxsize=128)
+def compile_page_ranges(expression: str) -> PageRangeExpression:
+    """Aralık ifadesini derle; söz dizimi hatalarında ValueError fırlat"""
+    terms: List[_Term] = []
+
+    for raw_item in expression.split(','):
+        item = ''.join(raw_item.split()).lower()
+        if not item:
+            continue
+
+        if item in _KEYWORDS:
+            terms.append(_KEYWORDS[item])
+            continue
+
+        match = _ITEM_PATTERN.match(item)
+        if not match:
+            raise ValueError(f"Geçersiz sayfa ifadesi: '{raw_item.strip()}'")
+
+        start = int(match.group('start'))
+        step = int(match.group('step') or 1)
+        if step < 1:
+            raise ValueError(f"Adım 1'den küçük olamaz: '{raw_item.strip()}'")
+
+        if match.group('dash') is None:
+            end: Optional[int] = start
+        elif match.group('end') is None:
+            end = None
+        else:
+            end = int(match.group('end'))
+
+        terms.append((start, end, step, False))
+
+    if not terms:
+        raise ValueError("Sayfa aralığı boş olamaz")
+
+    return PageRangeExpression(expression, terms)
+
+
+def parse_page_ranges(expression: Optional[str], total_pages: int) -> PageRangeSet:
+    """
+    İfadeyi derleyip belgeye uygula
+
+    İfade verilmezse tüm sayfalar seçilir.
+    """
+    if expression is None or not expression.strip():
+        return PageRangeSet.full(total_pages)
+    return compile_page_ranges(expression).resolve(total_pages)
+
+
+def _absolute(page: int, total_pages: int, source: str) -> int:
+    """Negatif sayfa numarasını sondan sayarak 1 tabanlı numaraya çevir"""
+    if page < 0:
+        page = total_pages + page + 1
+    if page < 1 or page > total_pages:
+        raise ValueError(
+            f"Sayfa aralık dışında '{source}': belge {total_pages} sayfa"
+        )
+    return page
+
+
+def _merge_intervals(intervals: Sequence[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """Çakışan ve bitişik aralıkları birleştir"""
+    merged: List[Tuple[int, int]] = []
+    for start, stop in sorted(interval for interval in intervals
+                              if interval[1] > interval[0]):
+        if merged and start <= merged[-1][1]:
+            if stop > merged[-1][1]:
+                merged[-1] = (merged[-1][0], stop)
+        else:
+            merged.append((start, stop))
+    return merged
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools Uygulama Dizinleri
+Önbellek ve kalıcı veriler için platforma uygun dizinler
+"""
+
+import os
+import sys
+from pathlib import Path
+
+from pypdf_tools._version import APP_NAME
+
+
+def app_data_dir() -> Path:
+    """
+    Uygulama veri dizini
+
+    PYPDF_DATA_DIR ortam değişkeni verilmişse o kullanılır; aksi halde
+    Windows'ta %LOCALAPPDATA%, macOS'ta ~/Library/Application Support,
+    diğer sistemlerde $XDG_DATA_HOME (~/.local/share) altı seçilir.
+    """
+    override = os.environ.get('PYPDF_DATA_DIR')
+    if override:
+        return Path(override)
+
+    if sys.platform == 'win32':
+        base = Path(os.environ.get('LOCALAPPDATA') or Path.home() / 'AppData' / 'Local')
+    elif sys.platform == 'darwin':
+        base = Path.home() / 'Library' / 'Application Support'
+    else:
+        base = Path(os.environ.get('XDG_DATA_HOME') or Path.home() / '.local' / 'share')
+
+    return base / APP_NAME
+
+
+def cache_dir() -> Path:
+    """Kalıcı önbellek dizini"""
+    return app_data_dir() / 'cache'
@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools İşlem Hattı
+Belge başına aşamalardan oluşan DAG'ı ara dosya yazmadan çalıştırma
+
+Her belge bir kez açılır; aşamalar açık okuyucular üzerindeki sayfa
+listesini (PipelineDocument) birbirine aktarır. Yalnızca çıktı üreten
+aşamalar (save, encrypt, extract-text) diske yazar. Bağımsız belgeler
+ayrı işçi süreçlerinde aynı anda işlenir.
+
+Örnek işlem hattı (YAML veya JSON):
+
+    jobs: 4
+    stages:                     # belgelerde stages yoksa kullanılır
+      - op: merge
+        files: [cover.pdf]
+      - id: summary
+        op: select
+        pages: 1-3
+      - op: encrypt
+        from: merge
+        output: out/{name}.pdf
+        password: secret
+        permissions: [print]
+      - op: extract-text
+        from: summary
+        format: ndjson
+        output: out/{name}.ndjson
+    documents:
+      - input: statements/march.pdf
+      - name: april
+        input: [statements/april-1.pdf, statements/april-2.pdf]
+
+Aşamanın girdisi `from` ile verilir (bir veya birden fazla önceki
+aşama, ya da `source`); verilmezse bir önceki aşamadır. Bir aşama
+yalnızca kendisinden önce tanımlanmış aşamalara bağlanabilir. Göreli
+yollar işlem hattı dosyasının dizinine göre çözülür; çıktı yollarında
+{name} ve {stem} kullanılabilir.
+"""
+
+import json
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from pypdf_tools.core.encryption import INFO_KEYS, AES256Encryption
+from pypdf_tools.core.engines import WRITER_ENGINE
+from pypdf_tools.core.metrics import rate
+from pypdf_tools.core.page_ranges import PageRangeSet, parse_page_ranges
+from pypdf_tools.core.reader import close_reader, open_reader
+from pypdf_tools.core.split import default_jobs
+from pypdf_tools.core.text import TEXT_FORMATS, write_page_text
+from pypdf_tools.core.writer import StreamingPDFWriter, outline_entries
+
+
+# Kaynak belgeyi gösteren aşama adı
+SOURCE_STAGE = 'source'
+
+# İşçi başına bekleyebilecek en fazla belge sayısı
+_PENDING_PER_WORKER = 4
+
+
+class PipelineDocument:
+    """
+    Aşamalar arasında bellekte tutulan belge
+
+    Sayfalar (okuyucu, sayfa indeksi) çiftleri olarak tutulur; aşamalar
+    yeni liste oluşturur, okuyucuları ve ayrıştırılmış nesneleri paylaşır.
+    """
+
+    def __init__(self, pages: List[Tuple[Any, int]],
+                 outline: Optional[List[Tuple[str, Any, int, int]]] = None,
+                 info: Optional[Dict[str, str]] = None):
+        self.pages = pages
+        self.outline = outline or []
+        self.info = info or {}
+
+    def __len__(self) -> int:
+        return len(self.pages)
+
+    @classmethod
+    def from_reader(cls, reader: Any) -> 'PipelineDocument':
+        """Açık okuyucunun tüm sayfalarından belge oluştur"""
+        outline = [(title, reader, index, level)
+                   for title, index, level in outline_entries(reader)]
+        metadata = reader.metadata or {}
+        info = {key: str(metadata[key]) for key in INFO_KEYS if key in metadata}
+        return cls([(reader, index) for index in range(len(reader.pages))], outline, info)
+
+    @classmethod
+    def concat(cls, documents: List['PipelineDocument']) -> 'PipelineDocument':
+        """Belgeleri sırayla birleştir; bilgiler ilk belgeden alınır"""
+        return cls(
+            [page for document in documents for page in document.pages],
+            [entry for document in documents for entry in document.outline],
+            dict(documents[0].info) if documents else {},
+        )
+
+    def select(self, expression: str) -> 'PipelineDocument':
+        """Sayfa aralığı ifadesine uyan sayfaları seç"""
+        selected = parse_page_ranges(expression, len(self.pages))
+        pages = [self.pages[index] for index in selected]
+        kept = {(id(reader), index) for reader, index in pages}
+        outline = [entry for entry in self.outline if (id(entry[1]), entry[2]) in kept]
+        return PipelineDocument(pages, outline, dict(self.info))
+
+    def iter_text(self) -> Iterator[Tuple[int, str]]:
+        """(1 tabanlı sayfa numarası, metin) çiftlerini üret"""
+        for number, (reader, index) in enumerate(self.pages, start=1):
+            yield number, reader.pages[index].extract_text() or ''
+
+    def write(self, output: Union[str, Path], encryption: Any = None) -> int:
+        """Belgeyi akışlı yazıcıyla diske yaz; yazılan sayfa sayısını döndür"""
+        with StreamingPDFWriter(output, encryption=encryption) as writer:
+            for reader, indices in _runs(self.pages):
+                writer.begin_document(reader, indices)
+                for index in indices:
+                    writer.add_page(reader.pages[index])
+                included = set(indices)
+                for title, entry_reader, index, level in self.outline:
+                    if entry_reader is reader and index in included:
+                        page_idnum = writer.page_id(reader.pages[index])
+                        if page_idnum is not None:
+                            writer.add_outline_item(title, page_idnum, level)
+                writer.end_document()
+            writer.update_info(self.info)
+            return writer.pages_written
+
+
+def _runs(pages: List[Tuple[Any, int]]) -> Iterator[Tuple[Any, List[int]]]:
+    """
+    Aynı okuyucudan gelen ardışık sayfaları grupla
+
+    Tekrarlanan sayfa yeni grup başlatır; yazıcı her grupta sayfaya ayrı
+    nesne numarası verir.
+    """
+    reader, indices, seen = None, [], set()
+    for page_reader, index in pages:
+        if indices and (page_reader is not reader or index in seen):
+            yield reader, indices
+            indices, seen = [], set()
+        reader = page_reader
+        indices.append(index)
+        seen.add(index)
+    if indices:
+        yield reader, indices
+
+
+# İşlem hattı dosyası
+
+def load_pipeline(path: Union[str, Path]) -> Dict[str, Any]:
+    """
+    İşlem hattı dosyasını oku ve doğrula
+
+    .json dosyaları veya pyyaml kurulu değilse JSON olarak okunur.
+    Belgeler için ortak aşamalar tamamlanır, yollar mutlak hale getirilir.
+    Geçersiz tanımlarda ValueError fırlatılır.
+    """
+    path = Path(path)
+    text = path.read_text(encoding='utf-8')
+    if path.suffix.lower() == '.json':
+        spec = json.loads(text)
+    else:
+        try:
+            import yaml
+        except ImportError:
+            spec = json.loads(text)
+        else:
+            spec = yaml.safe_load(text)
+
+    if not isinstance(spec, dict) or not isinstance(spec.get('documents'), list):
+        raise ValueError("İşlem hattında 'documents' listesi gerekli")
+
+    base = path.parent
+    shared_stages = spec.get('stages') or []
+    documents = []
+    for position, document in enumerate(spec['documents'], start=1):
+        if isinstance(document, str):
+            document = {'input': document}
+        documents.append(_prepare_document(document, shared_stages, base, position))
+
+    names = [document['name'] for document in documents]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"Aynı adlı belgeler: {', '.join(duplicates)}")
+
+    return {'jobs': spec.get('jobs'), 'documents': documents}
+
+
+def _prepare_document(document: Dict[str, Any], shared_stages: List[Dict[str, Any]],
+                      base: Path, position: int) -> Dict[str, Any]:
+    """Belge tanımını doğrula, aşama bağlantılarını çöz"""
+    inputs = document.get('input')
+    if not inputs:
+        raise ValueError(f"Belge {position}: 'input' gerekli")
+    if isinstance(inputs, str):
+        inputs = [inputs]
+
+    inputs = [str(base / item) for item in inputs]
+    stem = Path(inputs[0]).stem
+    name = str(document.get('name') or stem)
+    stages = document.get('stages', shared_stages)
+    if not stages:
+        raise ValueError(f"Belge '{name}': aşama tanımlanmamış")
+
+    prepared = []
+    known = [SOURCE_STAGE]
+    for index, stage in enumerate(stages):
+        op = stage.get('op')
+        if op not in STAGE_OPERATIONS:
+            raise ValueError(f"Belge '{name}': bilinmeyen işlem '{op}'")
+
+        stage_id = str(stage.get('id') or (op if op not in known else f"{op}-{index + 1}"))
+        if stage_id in known:
+            raise ValueError(f"Belge '{name}': aşama adı tekrarlanmış '{stage_id}'")
+
+        sources = stage.get('from', known[-1])
+        sources = [sources] if isinstance(sources, str) else list(sources)
+        for source in sources:
+            if source not in known:
+                raise ValueError(f"Belge '{name}': '{stage_id}' aşaması önceki bir "
+                                 f"aşamaya bağlanmalı, '{source}' bulunamadı")
+
+        options = {key: value for key, value in stage.items()
+                   if key not in ('id', 'op', 'from')}
+        for key in ('output', 'files'):
+            if key in options:
+                options[key] = _resolve_paths(options[key], base, name, stem)
+
+        prepared.append({'id': stage_id, 'op': op, 'from': sources, 'options': options})
+        known.append(stage_id)
+
+    return {'name': name, 'inputs': inputs, 'password': document.get('password'),
+            'stages': prepared}
+
+
+def _resolve_paths(value: Union[str, List[str]], base: Path, name: str,
+                   stem: str) -> Union[str, List[str]]:
+    """Yol şablonlarını doldurup işlem hattı dizinine göre çöz"""
+    if isinstance(value, list):
+        return [_resolve_paths(item, base, name, stem) for item in value]
+    return str(base / str(value).format(name=name, stem=stem))
+
+
+# Aşama işlemleri; her biri (çıktı belgesi, rapor alanları) döndürür
+
+def _stage_merge(document: PipelineDocument, options: Dict[str, Any],
+                 context: Dict[str, Any]) -> Tuple[PipelineDocument, Dict[str, Any]]:
+    files = options.get('files') or []
+    if isinstance(files, str):
+        files = [files]
+    extra = [context['open'](path, options.get('password')) for path in files]
+    return PipelineDocument.concat([document, *extra]), {}
+
+
+def _stage_select(document: PipelineDocument, options: Dict[str, Any],
+                  context: Dict[str, Any]) -> Tuple[PipelineDocument, Dict[str, Any]]:
+    if not options.get('pages'):
+        raise ValueError("select aşaması için 'pages' gerekli")
+    return document.select(str(options['pages'])), {}
+
+
+def _stage_save(document: PipelineDocument, options: Dict[str, Any],
+                context: Dict[str, Any]) -> Tuple[PipelineDocument, Dict[str, Any]]:
+    output = _require_output(options)
+    document.write(output)
+    return document, {'output': output, 'bytes': Path(output).stat().st_size}
+
+
+def _stage_encrypt(document: PipelineDocument, options: Dict[str, Any],
+                   context: Dict[str, Any]) -> Tuple[PipelineDocument, Dict[str, Any]]:
+    output = _require_output(options)
+    if not options.get('password'):
+        raise ValueError("encrypt aşaması için 'password' gerekli")
+    permissions = options.get('permissions') or ()
+    if isinstance(permissions, str):
+        permissions = permissions.replace(',', ' ').replace(';', ' ').split()
+
+    encryption = AES256Encryption(str(options['password']), options.get('owner_password'),
+                                  permissions)
+    document.write(output, encryption)
+    return document, {'output': output, 'bytes': Path(output).stat().st_size}
+
+
+def _stage_extract_text(document: PipelineDocument, options: Dict[str, Any],
+                        context: Dict[str, Any]) -> Tuple[PipelineDocument, Dict[str, Any]]:
+    output = _require_output(options)
+    format = options.get('format', 'txt')
+    if format not in TEXT_FORMATS:
+        raise ValueError(f"Desteklenmeyen metin formatı: {format}")
+
+    newline = '' if format == 'csv' else None
+    with open(output, 'w', encoding='utf-8', newline=newline) as stream:
+        result = write_page_text(document.iter_text(), stream, format,
+                                 source=context.get('name'),
+                                 selected=PageRangeSet.full(len(document)))
+    return document, {'output': output, 'characters': result['characters']}
+
+
+def _stage_info(document: PipelineDocument, options: Dict[str, Any],
+                context: Dict[str, Any]) -> Tuple[PipelineDocument, Dict[str, Any]]:
+    return document, {'info': {'pages': len(document), 'title': document.info.get('/Title'),
+                               'bookmarks': len(document.outline)}}
+
+
+def _require_output(options: Dict[str, Any]) -> str:
+    if not options.get('output'):
+        raise ValueError("Bu aşama için 'output' gerekli")
+    Path(options['output']).parent.mkdir(parents=True, exist_ok=True)
+    return options['output']
+
+
+STAGE_OPERATIONS: Dict[str, Callable[..., Tuple[PipelineDocument, Dict[str, Any]]]] = {
+    'merge': _stage_merge,
+    'select': _stage_select,
+    'save': _stage_save,
+    'encrypt': _stage_encrypt,
+    'extract-text': _stage_extract_text,
+    'info': _stage_info,
+}
+
+
+# Çalıştırma
+
+def run_document(document: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Tek belgenin aşamalarını sırayla çalıştır
+
+    Hatalar kayıt olarak döner; hata veren aşamadan sonraki aşamalar
+    çalıştırılmaz. Açılan tüm okuyucular sonunda kapatılır.
+    """
+    started = time.perf_counter()
+    readers: List[Any] = []
+    stages: List[Dict[str, Any]] = []
+    result = {'name': document['name'], 'inputs': document['inputs'], 'stages': stages}
+
+    def open_source(path: str, password: Optional[str] = None) -> PipelineDocument:
+        reader = open_reader(path, password, engine=WRITER_ENGINE)
+        readers.append(reader)
+        return PipelineDocument.from_reader(reader)
+
+    context = {'open': open_source, 'name': document['name']}
+    try:
+        load_started = time.perf_counter()
+        outputs = {SOURCE_STAGE: PipelineDocument.concat(
+            [open_source(path, document.get('password')) for path in document['inputs']]
+        )}
+        stages.append({'id': SOURCE_STAGE, 'op': 'load', 'pages': len(outputs[SOURCE_STAGE]),
+                       'seconds': time.perf_counter() - load_started})
+
+        for stage in document['stages']:
+            stage_started = time.perf_counter()
+            sources = [outputs[source] for source in stage['from']]
+            source = sources[0] if len(sources) == 1 else PipelineDocument.concat(sources)
+            try:
+                output, details = STAGE_OPERATIONS[stage['op']](source, stage['options'],
+                                                                context)
+            except Exception as e:
+                raise RuntimeError(f"'{stage['id']}' aşaması: {str(e) or type(e).__name__}") \
+                    from e
+            outputs[stage['id']] = output
+            stages.append({'id': stage['id'], 'op': stage['op'], 'pages': len(output),
+                           'seconds': time.perf_counter() - stage_started, **details})
+    except Exception as e:
+        result.update(success=False, error=str(e) or type(e).__name__)
+    else:
+        result['success'] = True
+    finally:
+        for reader in readers:
+            close_reader(reader)
+
+    result['elapsed'] = time.perf_counter() - started
+    return result
+
+
+def run_pipeline(pipeline: Dict[str, Any], jobs: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Belgeleri paralel işle, sonuçları tamamlandıkça üret
+
+    İşçi sayısı verilmezse işlem hattındaki 'jobs', o da yoksa çekirdek
+    sayısı kullanılır. Bekleyen iş sayısı sınırlıdır.
+    """
+    documents = pipeline['documents']
+    jobs = max(1, min(jobs or pipeline.get('jobs') or default_jobs(), len(documents) or 1))
+
+    if jobs == 1:
+        for document in documents:
+            yield run_document(document)
+        return
+
+    limit = jobs * _PENDING_PER_WORKER
+    queue = iter(documents)
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        pending = set()
+        exhausted = False
+        while pending or not exhausted:
+            while not exhausted and len(pending) < limit:
+                document = next(queue, None)
+                if document is None:
+                    exhausted = True
+                else:
+                    pending.add(executor.submit(run_document, document))
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+
+
+def pipeline_report(results: List[Dict[str, Any]], elapsed: float) -> Dict[str, Any]:
+    """Belge sonuçlarından aşama türü başına süre özetini hesapla"""
+    operations: Dict[str, Dict[str, Any]] = {}
+    for result in results:
+        for stage in result['stages']:
+            totals = operations.setdefault(stage['op'], {'count': 0, 'seconds': 0.0})
+            totals['count'] += 1
+            totals['seconds'] += stage['seconds']
+
+    errors = sum(1 for result in results if not result['success'])
+    return {
+        'documents': len(results),
+        'errors': errors,
+        'elapsed': elapsed,
+        'documents_per_second': rate(len(results), elapsed),
+        'operations': operations,
+        'results': results,
+    }
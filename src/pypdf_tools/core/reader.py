@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools PDF Okuyucu Yardımcıları
+PDF dosyalarını açma, şifre çözme ve önbellek yönetimi
+
+Dosyalar varsayılan olarak bellek eşlemesi (mmap) ile açılır: okuyucu
+işletim sisteminin sayfa önbelleğinden doğrudan okur ve aynı dosyayı
+açan işçi süreçleri bu sayfaları paylaşır. mmap kullanılamayan
+durumlarda (boş dosya, desteklemeyen dosya sistemi) tamponlu okumaya
+geri dönülür. PYPDF_READER_BACKEND=buffered ile mmap kapatılabilir.
+"""
+
+import mmap
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import TYPE_CHECKING, BinaryIO, Iterator, Optional, Union
+
+from pypdf_tools.core.engines import get_engine
+
+if TYPE_CHECKING:
+    from pypdf import PdfReader
+
+
+READER_BACKENDS = ('mmap', 'buffered')
+
+
+class MappedFile(mmap.mmap):
+    """
+    Salt okunur bellek eşlemeli dosya
+
+    pypdf için dosya nesnesi gibi davranır (read/seek/tell). view() ile
+    kopyalamadan memoryview dilimleri alınabilir; dilimler serbest
+    bırakılmadan dosya kapatılamaz.
+    """
+
+    def view(self, start: int = 0, stop: Optional[int] = None) -> memoryview:
+        """Dosyanın [start:stop) bölümünü kopyasız döndür"""
+        return memoryview(self)[start:stop]
+
+
+def default_backend() -> str:
+    """Ortam değişkeninden veya varsayılandan okuyucu arka ucunu seç"""
+    backend = os.environ.get('PYPDF_READER_BACKEND', 'mmap')
+    return backend if backend in READER_BACKENDS else 'mmap'
+
+
+def open_stream(path: Union[str, Path], backend: Optional[str] = None) -> BinaryIO:
+    """
+    PDF dosyasını okuyucu için aç
+
+    mmap arka ucu seçiliyse MappedFile, aksi halde tamponlu dosya döner.
+    """
+    backend = backend or default_backend()
+    if backend not in READER_BACKENDS:
+        raise ValueError(f"Bilinmeyen okuyucu arka ucu: {backend}")
+
+    handle = open(path, 'rb')
+    if backend == 'buffered':
+        return handle
+
+    try:
+        mapped = MappedFile(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    except (ValueError, OSError):
+        # Boş dosya veya eşlenemeyen dosya sistemi: tamponlu okumaya dön
+        return handle
+    handle.close()
+    return mapped
+
+
+def open_reader(path: Union[str, Path], password: Optional[str] = None,
+                backend: Optional[str] = None, engine: Optional[str] = None) -> 'PdfReader':
+    """
+    PDF dosyasını aç ve gerekiyorsa şifresini çöz
+
+    Dosya belleğe okunmaz; okuyucu eşlenmiş dosya veya dosya tanıtıcısı
+    üzerinden yalnızca ihtiyaç duyduğu nesnelere erişir. İş bitince
+    close_reader() çağrılmalıdır.
+
+    Şifreli dosyalar önce verilen şifre, yoksa boş şifre ile açılmaya
+    çalışılır. Şifre yanlışsa PermissionError fırlatılır. engine ile
+    PDF motoru seçilebilir (bkz. core.engines).
+    """
+    reader_class = get_engine(engine).PdfReader
+    stream = open_stream(path, backend)
+    try:
+        reader = reader_class(stream)
+        if reader.is_encrypted and not reader.decrypt(password or ''):
+            raise PermissionError(f"PDF şifreli, doğru şifre gerekli: {path}")
+    except BaseException:
+        stream.close()
+        raise
+
+    return reader
+
+
+def close_reader(reader: 'PdfReader') -> None:
+    """Okuyucunun dosya tanıtıcısını kapat"""
+    stream = getattr(reader, 'stream', None)
+    if stream is not None and not stream.closed:
+        stream.close()
+
+
+@contextmanager
+def open_document(path: Union[str, Path], password: Optional[str] = None,
+                  backend: Optional[str] = None,
+                  engine: Optional[str] = None) -> Iterator['PdfReader']:
+    """open_reader için bağlam yöneticisi; çıkışta dosyayı kapatır"""
+    reader = open_reader(path, password, backend, engine)
+    try:
+        yield reader
+    finally:
+        close_reader(reader)
+
+
+def page_count(reader: 'PdfReader') -> int:
+    """
+    Sayfa sayısını sayfa ağacını gezmeden al
+
+    Katalogdaki /Pages düğümünün /Count değeri okunur; değer bozuksa
+    sayfa ağacı düzleştirilerek sayılır.
+    """
+    try:
+        count = reader.trailer['/Root']['/Pages']['/Count']
+        return int(count)
+    except (KeyError, TypeError, ValueError):
+        return len(reader.pages)
+
+
+def release_cache(reader: 'PdfReader') -> None:
+    """
+    Okuyucunun çözümlenmiş nesne önbelleğini boşalt
+
+    Uzun belgeler sayfa sayfa işlenirken bellek kullanımını tek sayfa
+    ile sınırlı tutmak için kullanılır.
+    """
+    cache = getattr(reader, 'resolved_objects', None)
+    if isinstance(cache, dict):
+        cache.clear()
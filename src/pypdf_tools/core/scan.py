@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools Dizin Tarayıcı
+Dizin ağacındaki PDF dosyalarının metadata'sını paralel olarak okur
+
+Dosya listesi bellekte tutulmaz; dizinler gezildikçe dosyalar küçük
+gruplar halinde işçilere verilir ve bekleyen iş sayısı sınırlıdır.
+Sonuçlar tamamlandıkça üretilir, böylece milyonlarca dosyada da bellek
+kullanımı sabit kalır.
+
+Bir dosya işçi sürecini çökertirse (kütüphane segfault'u, bellek
+yetersizliği) havuz yeniden başlatılır. Yarım kalan gruplar tek
+başlarına yeniden çalıştırılır, yine çöken grup ikiye bölünerek
+çökerten dosya bulunur; bu dosya 'crash' hatasıyla raporlanır ve
+tarama sürer.
+"""
+
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from pypdf_tools.core.engines import get_engine
+from pypdf_tools.core.metadata import read_pdf_metadata
+from pypdf_tools.core.metrics import rate
+from pypdf_tools.core.split import default_jobs
+
+
+# İşçiye tek seferde gönderilen dosya sayısı
+_BATCH_SIZE = 32
+
+# İşçi başına bekleyebilecek en fazla grup sayısı
+_PENDING_PER_WORKER = 4
+
+
+def iter_pdf_files(root: Union[str, Path], recursive: bool = True) -> Iterator[str]:
+    """
+    Dizindeki PDF dosyalarını gezinti sırasında üret
+
+    Sembolik bağlantılı dizinler döngüye girmemek için izlenmez.
+    """
+    stack = [str(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if recursive:
+                                stack.append(entry.path)
+                        elif entry.name.lower().endswith('.pdf') and entry.is_file():
+                            yield entry.path
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+
+def probe_file(path: str, password: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Tek dosyanın metadata'sını oku; hataları kayıt olarak döndür
+
+    Bozuk, okunamayan veya şifresi çözülemeyen dosyalar istisna
+    fırlatmaz, 'error' alanı dolu bir kayıt döner.
+    """
+    try:
+        metadata = read_pdf_metadata(path, password)
+    except (*get_engine().read_errors, ValueError, KeyError, TypeError) as e:
+        return {'path': path, 'success': False, 'error_type': 'corrupt',
+                'error': str(e) or type(e).__name__}
+    except OSError as e:
+        return {'path': path, 'success': False, 'error_type': 'io', 'error': str(e)}
+    except Exception as e:
+        return {'path': path, 'success': False, 'error_type': 'corrupt',
+                'error': f"{type(e).__name__}: {e}"}
+
+    if not metadata['decrypted']:
+        return {'path': path, 'success': False, 'error_type': 'encrypted',
+                'error': 'PDF şifreli, doğru şifre gerekli', 'info': metadata}
+
+    return {'path': path, 'success': True, 'info': metadata}
+
+
+def _probe_batch(paths: List[str], password: Optional[str]) -> List[Dict[str, Any]]:
+    """İşçi sürecinde bir dosya grubunu oku"""
+    return [probe_file(path, password) for path in paths]
+
+
+def _crash_record(path: str, error: BaseException) -> Dict[str, Any]:
+    """İşçi sürecini çökerten dosyanın hata kaydı"""
+    return {'path': path, 'success': False, 'error_type': 'crash',
+            'error': f"İşçi süreci dosyayı okurken sonlandı: {error}"}
+
+
+class DirectoryScanner:
+    """
+    Dizin ağacını tarayıp her PDF için bir kayıt üreten yineleyici
+
+    Tarama bittikten sonra summary() toplam dosya, hata ve hız
+    istatistiklerini döndürür.
+    """
+
+    def __init__(self, root: Union[str, Path], recursive: bool = True,
+                 jobs: Optional[int] = None, password: Optional[str] = None):
+        self.root = str(root)
+        self.recursive = recursive
+        self.jobs = max(1, jobs or default_jobs())
+        self.password = password
+
+        self.files = 0
+        self.errors = 0
+        self.bytes = 0
+        self.elapsed = 0.0
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        started = time.perf_counter()
+        try:
+            for record in self._records():
+                self.files += 1
+                if record['success']:
+                    self.bytes += record['info']['file_size']
+                else:
+                    self.errors += 1
+                    if record.get('info'):
+                        self.bytes += record['info']['file_size']
+                yield record
+        finally:
+            self.elapsed = time.perf_counter() - started
+
+    def summary(self) -> Dict[str, Any]:
+        """Tarama istatistikleri"""
+        return {
+            'files': self.files,
+            'errors': self.errors,
+            'bytes': self.bytes,
+            'elapsed': self.elapsed,
+            'files_per_second': rate(self.files, self.elapsed),
+            'mb_per_second': rate(self.bytes / (1024 * 1024), self.elapsed),
+        }
+
+    def _batches(self) -> Iterator[List[str]]:
+        """Dosya yollarını sabit boyutlu gruplara ayır"""
+        paths = iter_pdf_files(self.root, self.recursive)
+        while True:
+            batch = list(islice(paths, _BATCH_SIZE))
+            if not batch:
+                return
+            yield batch
+
+    def _records(self) -> Iterator[Dict[str, Any]]:
+        """Kayıtları tamamlanma sırasıyla üret"""
+        if self.jobs == 1:
+            for path in iter_pdf_files(self.root, self.recursive):
+                yield probe_file(path, self.password)
+            return
+
+        limit = self.jobs * _PENDING_PER_WORKER
+        batches = self._batches()
+        # Çöken havuzda yarım kalan gruplar; tek başına çalıştırılır
+        suspects: List[List[str]] = []
+        executor = ProcessPoolExecutor(max_workers=self.jobs)
+
+        try:
+            pending: Dict[Future, Tuple[ProcessPoolExecutor, List[str], bool]] = {}
+            exhausted = False
+
+            while pending or suspects or not exhausted:
+                if suspects:
+                    # Şüpheli grup, çökmenin sebebi belli olsun diye yalnız çalışır
+                    if not pending:
+                        future = executor.submit(_probe_batch, suspects[-1], self.password)
+                        pending[future] = (executor, suspects.pop(), True)
+                else:
+                    # Bekleyen iş sınırına kadar yeni grup gönder
+                    while not exhausted and len(pending) < limit:
+                        batch = next(batches, None)
+                        if batch is None:
+                            exhausted = True
+                        else:
+                            future = executor.submit(_probe_batch, batch, self.password)
+                            pending[future] = (executor, batch, False)
+
+                if not pending:
+                    continue
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    owner, batch, isolated = pending.pop(future)
+                    try:
+                        records = future.result()
+                    except BrokenProcessPool as e:
+                        # Çöken havuzu bir kez yenisiyle değiştir
+                        if owner is executor:
+                            executor.shutdown(wait=False)
+                            executor = ProcessPoolExecutor(max_workers=self.jobs)
+                        if not isolated:
+                            suspects.append(batch)
+                        elif len(batch) == 1:
+                            yield _crash_record(batch[0], e)
+                        else:
+                            # Yalnız çalışırken çöken grubu ikiye bölerek dosyayı bul
+                            middle = len(batch) // 2
+                            suspects.extend([batch[middle:], batch[:middle]])
+                        continue
+                    yield from records
+        finally:
+            executor.shutdown()
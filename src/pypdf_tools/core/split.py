@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools Bölme Motoru
+Sayfa gruplarını işlem havuzunda paralel olarak ayrı dosyalara yazar
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from pypdf_tools.core.engines import WRITER_ENGINE
+from pypdf_tools.core.metrics import ProgressCallback, rate
+from pypdf_tools.core.page_ranges import parse_page_ranges
+from pypdf_tools.core.reader import (
+    close_reader, open_document, open_reader, page_count, release_cache
+)
+from pypdf_tools.core.writer import StreamingPDFWriter
+
+
+# (çıktı dosya adı, 0 tabanlı sayfa indeksleri)
+Part = Tuple[str, List[int]]
+
+# İş dengesini korumak için işçi başına düşen parça sayısı
+_SHARDS_PER_WORKER = 4
+
+# İşçi sürecinde bir kez açılan kaynak belge; yalnızca havuz işçilerinde
+# kullanılır, aynı süreçte eşzamanlı bölmeler kendi okuyucularını açar
+_worker_state: Dict[str, Any] = {}
+
+
+def default_jobs() -> int:
+    """Varsayılan işçi sayısı: çekirdek sayısı"""
+    return os.cpu_count() or 1
+
+
+def split_pages(input_file: Union[str, Path], output_dir: Union[str, Path],
+                prefix: str = 'page_', jobs: Optional[int] = None,
+                password: Optional[str] = None,
+                progress: Optional[ProgressCallback] = None) -> Dict[str, Any]:
+    """
+    Her sayfayı ayrı bir PDF dosyasına yaz
+
+    Sayfa sayısı yalnızca katalogdan okunur; sayfalar işçilere bitişik
+    aralıklar halinde dağıtılır.
+    """
+    with open_document(input_file, password, engine=WRITER_ENGINE) as reader:
+        total = page_count(reader)
+
+    width = max(3, len(str(total)))
+    parts = [(f"{prefix}{index + 1:0{width}d}.pdf", [index]) for index in range(total)]
+    return write_parts(input_file, output_dir, parts, jobs=jobs, password=password,
+                       progress=progress)
+
+
+def split_ranges(input_file: Union[str, Path], output_dir: Union[str, Path],
+                 expression: str, prefix: str = 'page_', jobs: Optional[int] = None,
+                 password: Optional[str] = None,
+                 progress: Optional[ProgressCallback] = None) -> Dict[str, Any]:
+    """
+    Aralık ifadesindeki her bitişik sayfa bloğunu ayrı dosyaya yaz
+
+    İfade birleştirilmiş aralık kümesine derlenir; örneğin "1-5, 3, 7"
+    için prefix1-5.pdf ve prefix7.pdf oluşturulur.
+    """
+    with open_document(input_file, password, engine=WRITER_ENGINE) as reader:
+        ranges = parse_page_ranges(expression, page_count(reader))
+
+    parts = []
+    for start, stop in ranges.intervals:
+        label = str(start + 1) if stop - start == 1 else f"{start + 1}-{stop}"
+        parts.append((f"{prefix}{label}.pdf", list(range(start, stop))))
+    return write_parts(input_file, output_dir, parts, jobs=jobs, password=password,
+                       progress=progress)
+
+
+def write_parts(input_file: Union[str, Path], output_dir: Union[str, Path],
+                parts: Sequence[Part], jobs: Optional[int] = None,
+                password: Optional[str] = None,
+                progress: Optional[ProgressCallback] = None) -> Dict[str, Any]:
+    """
+    Sayfa gruplarını paralel olarak ayrı dosyalara yaz
+
+    Parçalar sırayı koruyan bitişik dilimlere ayrılır. Her işçi kaynak
+    dosyayı başlangıçta bir kez açar ve çıktı dosyalarını kendisi yazar;
+    ana süreç yalnızca dosya listesini toplar. progress her dilim
+    tamamlandığında yazılan dosya sayısıyla çağrılır.
+    """
+    started = time.perf_counter()
+    jobs = max(1, jobs or default_jobs())
+    output_dir = str(output_dir)
+    input_file = str(input_file)
+
+    parts = list(parts)
+    shards = _make_shards(parts, jobs * _SHARDS_PER_WORKER)
+    files: List[Dict[str, Any]] = []
+
+    if jobs == 1 or len(shards) <= 1:
+        reader = open_reader(input_file, password, engine=WRITER_ENGINE)
+        try:
+            for shard in shards:
+                files.extend(_write_parts(reader, output_dir, shard))
+                if progress:
+                    progress(len(files), len(parts))
+        finally:
+            close_reader(reader)
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(shards)),
+                                 initializer=_init_worker,
+                                 initargs=(input_file, password)) as executor:
+            futures = [
+                executor.submit(_write_shard, output_dir, shard)
+                for shard in shards
+            ]
+            try:
+                for future in futures:
+                    files.extend(future.result())
+                    if progress:
+                        progress(len(files), len(parts))
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+    elapsed = time.perf_counter() - started
+    pages_written = sum(item['pages'] for item in files)
+    return {
+        'files_created': len(files),
+        'files': files,
+        'elapsed': elapsed,
+        'pages_per_second': rate(pages_written, elapsed),
+        'jobs': jobs,
+    }
+
+
+def _make_shards(parts: List[Part], count: int) -> List[List[Part]]:
+    """Parçaları sırayı bozmadan en fazla count dilime böl"""
+    if not parts:
+        return []
+    count = max(1, min(count, len(parts)))
+    size, remainder = divmod(len(parts), count)
+
+    shards = []
+    start = 0
+    for index in range(count):
+        stop = start + size + (1 if index < remainder else 0)
+        shards.append(parts[start:stop])
+        start = stop
+    return shards
+
+
+def _init_worker(input_file: str, password: Optional[str]) -> None:
+    """İşçi süreci başlangıcında kaynak belgeyi aç"""
+    _worker_state['reader'] = open_reader(input_file, password, engine=WRITER_ENGINE)
+
+
+def _write_shard(output_dir: str, shard: List[Part]) -> List[Dict[str, Any]]:
+    """İşçi sürecinde bir dilimin tüm çıktı dosyalarını yaz"""
+    return _write_parts(_worker_state['reader'], output_dir, shard)
+
+
+def _write_parts(reader: Any, output_dir: str, shard: List[Part]) -> List[Dict[str, Any]]:
+    """Dilimin çıktı dosyalarını verilen okuyucudan yaz"""
+    written = []
+
+    for name, indices in shard:
+        with StreamingPDFWriter(Path(output_dir) / name) as writer:
+            writer.begin_document(reader, indices)
+            for index in indices:
+                writer.add_page(reader.pages[index])
+            writer.end_document()
+        release_cache(reader)
+        written.append({'name': name, 'pages': len(indices)})
+
+    return written
@@ -0,0 +1,243 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools Metin Çıkarma Motoru
+Sayfa metnini tek tek üreten akış ve artımlı çıktı yazıcısı
+
+Sayfalar sırayla işlenir ve her sayfanın metni yazıldıktan sonra
+bırakılır; bellek kullanımı belge boyutundan bağımsız olarak tek
+sayfa ile sınırlıdır. Önbellek verilirse daha önce çıkarılmış sayfalar
+yeniden ayrıştırılmaz.
+
+Birden fazla işçi ile çalışırken sayfa blokları işlem havuzuna dağıtılır.
+Her işçi dosyayı kendisi açar; sonuçlar gönderim sırasını koruyan sınırlı
+bir kuyrukta bekletilerek sayfa sırasıyla üretilir.
+"""
+
+import csv
+import json
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, TextIO, Tuple, Union
+
+from pypdf_tools.core.cache import DocumentCache
+from pypdf_tools.core.metrics import ProgressCallback
+from pypdf_tools.core.page_ranges import PageRangeSet, parse_page_ranges
+from pypdf_tools.core.reader import close_reader, open_reader, page_count, release_cache
+
+
+TEXT_FORMATS = ('txt', 'json', 'ndjson', 'csv')
+
+# İşçiye tek seferde gönderilen sayfa sayısı
+_CHUNK_PAGES = 8
+
+# Sıralama kuyruğunda işçi başına bekleyebilecek en fazla blok sayısı
+_PENDING_PER_WORKER = 2
+
+# İşçi sürecinde bir kez açılan kaynak belge
+_worker_state: Dict[str, Any] = {}
+
+
+class PageTextStream:
+    """
+    Seçilen sayfaların metnini (sayfa numarası, metin) olarak üreten akış
+
+    Bağlam yöneticisi olarak kullanılır; girişte belge açılır ve sayfa
+    aralığı doğrulanır, çıkışta dosya kapatılır. jobs 1'den büyükse
+    sayfalar işçi süreçlerinde çıkarılır, sıra yine korunur.
+    """
+
+    def __init__(self, input_file: Union[str, Path], pages: Optional[str] = None,
+                 password: Optional[str] = None, jobs: int = 1,
+                 cache: Optional[DocumentCache] = None):
+        self.input_file = str(input_file)
+        self.pages = pages
+        self.password = password
+        self.jobs = max(1, jobs)
+        # Şifreli belgelerin metni şifre olmadan erişilebilir hale gelmesin
+        self.cache = cache if password is None else None
+        self.selected = PageRangeSet()
+        self._reader = None
+        self._digest: Optional[str] = None
+
+    def __enter__(self) -> 'PageTextStream':
+        self._reader = open_reader(self.input_file, self.password)
+        try:
+            self.selected = parse_page_ranges(self.pages, page_count(self._reader))
+            if self.cache is not None and not self._reader.is_encrypted:
+                self._digest = self.cache.fingerprint(self.input_file)
+        except BaseException:
+            self.close()
+            raise
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[Tuple[int, str]]:
+        if self._reader is None:
+            raise RuntimeError("PageTextStream açılmadan okunamaz")
+
+        if self._digest is None:
+            yield from self._extract(self.selected)
+            return
+
+        # Yalnızca önbellekte olmayan sayfalar çıkarılır
+        cache, digest = self.cache, self._digest
+        cached = cache.cached_pages(digest)
+        missing = PageRangeSet([(index, index + 1) for index in self.selected
+                                if index not in cached])
+        cache.misses += len(missing)
+        extracted = self._extract(missing)
+
+        for index in self.selected:
+            text = cache.get_page_text(digest, index) if index in cached else None
+            if text is None:
+                if index in missing:
+                    _number, text = next(extracted)
+                else:
+                    # Okuma sırasında başka bir süreç kaydı silmiş
+                    text = self._reader.pages[index].extract_text()
+                cache.put_page_text(digest, index, text)
+            yield index + 1, text
+
+    def _extract(self, selection: PageRangeSet) -> Iterator[Tuple[int, str]]:
+        """Verilen sayfaları sırayla, gerekiyorsa işçilerde çıkar"""
+        if self.jobs > 1 and len(selection) > _CHUNK_PAGES:
+            yield from self._parallel_pages(selection)
+            return
+
+        reader = self._reader
+        for index in selection:
+            text = reader.pages[index].extract_text()
+            # Sayfanın çözümlenmiş nesnelerini bir sonraki sayfadan önce bırak
+            release_cache(reader)
+            yield index + 1, text
+
+    def _parallel_pages(self, selection: PageRangeSet) -> Iterator[Tuple[int, str]]:
+        """Blokları işçilere dağıt, sonuçları sayfa sırasıyla üret"""
+        limit = self.jobs * _PENDING_PER_WORKER
+        chunks = _chunks(selection)
+
+        with ProcessPoolExecutor(max_workers=self.jobs,
+                                 initializer=_init_worker,
+                                 initargs=(self.input_file, self.password)) as executor:
+            # Gönderim sırasındaki bloklar; en eskisi bitmeden yenisi eklenmez
+            pending = deque(
+                executor.submit(_extract_chunk, chunk)
+                for chunk in islice(chunks, limit)
+            )
+            try:
+                while pending:
+                    results = pending.popleft().result()
+                    chunk = next(chunks, None)
+                    if chunk is not None:
+                        pending.append(executor.submit(_extract_chunk, chunk))
+                    yield from results
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def close(self) -> None:
+        """Kaynak belgeyi kapat"""
+        if self._reader is not None:
+            close_reader(self._reader)
+            self._reader = None
+
+
+def _chunks(selection: PageRangeSet) -> Iterator[List[int]]:
+    """Sayfaları sıralı, sabit boyutlu bloklara ayır"""
+    indices = iter(selection)
+    while True:
+        chunk = list(islice(indices, _CHUNK_PAGES))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _init_worker(input_file: str, password: Optional[str]) -> None:
+    """İşçi süreci başlangıcında kaynak belgeyi aç"""
+    _worker_state['reader'] = open_reader(input_file, password)
+
+
+def _extract_chunk(indices: List[int]) -> List[Tuple[int, str]]:
+    """İşçi sürecinde bir sayfa bloğunun metnini çıkar"""
+    reader = _worker_state['reader']
+    results = []
+    for index in indices:
+        results.append((index + 1, reader.pages[index].extract_text()))
+        release_cache(reader)
+    return results
+
+
+def write_page_text(pages: Iterable[Tuple[int, str]], stream: TextIO,
+                    format: str = 'txt',
+                    progress: Optional[ProgressCallback] = None,
+                    source: Optional[str] = None,
+                    selected: Optional[PageRangeSet] = None) -> Dict[str, Any]:
+    """
+    (sayfa numarası, metin) çiftlerini geldikçe akışa yaz
+
+    source ve selected json başlığına ve progress toplamına yazılır;
+    PageTextStream verilirse verilmeyenler akıştan alınır.
+
+    txt    sayfalar boş satırla ayrılır
+    json   {'file', 'pages', 'content': [{'page', 'text'}, ...]} belgesi
+    ndjson her sayfa için bir {'page', 'text'} satırı
+    csv    page,text sütunları
+
+    Her sayfadan sonra akış boşaltılır ve varsa progress çağrılır;
+    yarıda kesilen çıkarmada o ana kadarki sayfalar diske yazılmış olur.
+    """
+    if format not in TEXT_FORMATS:
+        raise ValueError(f"Desteklenmeyen metin formatı: {format}")
+
+    if isinstance(pages, PageTextStream):
+        source = pages.input_file if source is None else source
+        selected = pages.selected if selected is None else selected
+    total = len(selected) if selected is not None else 0
+
+    processed = 0
+    characters = 0
+
+    if format == 'csv':
+        rows = csv.writer(stream)
+        rows.writerow(['page', 'text'])
+    elif format == 'json':
+        stream.write('{\n')
+        expression = selected.to_expression() if selected is not None else ''
+        stream.write(f'  "file": {json.dumps(source, ensure_ascii=False)},\n')
+        stream.write(f'  "pages": {json.dumps(expression or "all")},\n')
+        stream.write('  "content": [')
+
+    for number, text in pages:
+        item = {'page': number, 'text': text}
+
+        if format == 'txt':
+            if processed:
+                stream.write('\n\n')
+            stream.write(text)
+        elif format == 'ndjson':
+            stream.write(json.dumps(item, ensure_ascii=False) + '\n')
+        elif format == 'json':
+            stream.write(',' if processed else '')
+            stream.write('\n    ' + json.dumps(item, ensure_ascii=False))
+        else:
+            rows.writerow([number, text])
+
+        stream.flush()
+        processed += 1
+        characters += len(text)
+        if progress:
+            progress(processed, total)
+
+    if format == 'json':
+        stream.write('\n  ]\n}\n' if processed else ']\n}\n')
+    elif format == 'txt':
+        stream.write('\n')
+    stream.flush()
+
+    return {'pages_processed': processed, 'characters': characters}
@@ -0,0 +1,475 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools Akışlı PDF Yazıcı
+Sayfa nesnelerini okundukça diske yazan, sabit bellekli PDF yazıcısı
+
+Şifreleme verilirse metin dizileri ve stream verileri diske yazılmadan
+hemen önce şifrelenir; kaynak tekilleştirmesi şifresiz içerik üzerinden
+yapılır.
+"""
+
+import hashlib
+import io
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple, Union
+
+from pypdf import PdfReader
+from pypdf.generic import (
+    ArrayObject, ByteStringObject, DictionaryObject, IndirectObject,
+    NameObject, NullObject, NumberObject, PdfObject, StreamObject,
+    TextStringObject
+)
+
+from pypdf_tools._version import APP_NAME, __version__
+
+if TYPE_CHECKING:
+    from pypdf_tools.core.encryption import AES256Encryption
+
+
+# Kataloğa ve sayfa ağacına geri dönen anahtarlar kopyalanmaz
+_SKIPPED_PAGE_KEYS = {'/Parent', '/B'}
+_PAGE_TREE_TYPES = {'/Page', '/Pages'}
+
+_PAGES_ID = 2
+_CATALOG_ID = 1
+
+
+class StreamingPDFWriter:
+    """
+    Nesneleri kopyalandıkları anda çıktı dosyasına yazan PDF yazıcısı
+    Kaynak belgeler tek tek işlenir; xref tablosu dosya kapatılırken eklenir
+    """
+
+    def __init__(self, output_path: Union[str, Path], dedupe_resources: bool = True,
+                 buffer_size: int = 1024 * 1024,
+                 encryption: Optional['AES256Encryption'] = None):
+        self.output_path = Path(output_path)
+        self.dedupe_resources = dedupe_resources
+        self.encryption = encryption
+
+        self._stream = open(self.output_path, 'wb', buffering=buffer_size)
+        self._position = 0
+        self._offsets: List[Optional[int]] = []
+
+        # Katalog ve sayfa ağacı kökü için numaraları ayır
+        self._reserve()
+        self._reserve()
+
+        # Belgeler arası paylaşılan kaynakların içerik özetleri
+        self._digests: Dict[bytes, int] = {}
+
+        # Aktif kaynak belgeye ait durum
+        self._reader: Optional[PdfReader] = None
+        self._local: Dict[Tuple[int, int], int] = {}
+        self._pending: Dict[Tuple[int, int], Optional[int]] = {}
+        self._page_ids: Dict[Tuple[int, int], int] = {}
+
+        self._kids: List[int] = []
+        self._outline: List[Tuple[str, int, int]] = []
+        self._info: Dict[str, str] = {}
+        self._closed = False
+
+        # İstatistikler
+        self.pages_written = 0
+        self.objects_written = 0
+        self.objects_deduplicated = 0
+
+        self._write(b"%PDF-1.7\n%\xe2\xe3\xcf\xd3\n")
+
+    def __enter__(self) -> 'StreamingPDFWriter':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    @property
+    def bytes_written(self) -> int:
+        """Şu ana kadar yazılan byte sayısı"""
+        return self._position
+
+    # Belge yönetimi
+    def begin_document(self, reader: PdfReader,
+                       page_indices: Optional[List[int]] = None) -> None:
+        """
+        Yeni bir kaynak belge üzerinde çalışmaya başla
+
+        Kopyalanacak sayfaların numaraları önceden ayrılır; böylece
+        bağlantı ve notlar gibi sayfalara dönen referanslar doğru
+        nesneyi gösterir, seçilmeyen sayfalara giden referanslar null olur.
+        """
+        self.end_document()
+        self._reader = reader
+
+        if page_indices is None:
+            page_indices = range(len(reader.pages))
+
+        for index in page_indices:
+            ref = reader.pages[index].indirect_reference
+            if ref is not None:
+                self._page_ids[(ref.idnum, ref.generation)] = self._reserve()
+
+    def end_document(self) -> None:
+        """Aktif kaynak belgeye ait eşleme tablolarını serbest bırak"""
+        self._reader = None
+        self._local = {}
+        self._pending = {}
+        self._page_ids = {}
+
+    def add_page(self, page: DictionaryObject) -> int:
+        """Sayfayı ve bağımlı nesnelerini çıktıya yaz, yeni nesne numarasını döndür"""
+        if self._closed:
+            raise ValueError("Yazıcı kapatılmış")
+
+        ref = page.indirect_reference
+        key = (ref.idnum, ref.generation) if ref is not None else None
+        idnum = self._page_ids.get(key) if key else None
+        if idnum is None:
+            idnum = self._reserve()
+            if key:
+                self._page_ids[key] = idnum
+
+        copied = DictionaryObject()
+        for name, value in page.items():
+            if name in _SKIPPED_PAGE_KEYS:
+                continue
+            copied[NameObject(name)] = self._convert(value, name == '/Resources')
+        copied[NameObject('/Parent')] = IndirectObject(_PAGES_ID, 0, None)
+
+        self._write_object(idnum, self._encode(copied))
+        self._kids.append(idnum)
+        self.pages_written += 1
+        return idnum
+
+    def page_id(self, page: DictionaryObject) -> Optional[int]:
+        """Kaynak sayfanın çıktıdaki nesne numarasını döndür"""
+        ref = page.indirect_reference
+        if ref is None:
+            return None
+        return self._page_ids.get((ref.idnum, ref.generation))
+
+    def add_outline_item(self, title: str, page_idnum: int, level: int = 0) -> None:
+        """Yer işareti ekle; seviye 0 en üst düzeydir"""
+        self._outline.append((title, page_idnum, level))
+
+    def update_info(self, entries: Dict[str, str]) -> None:
+        """Belge bilgi sözlüğüne (/Info) alan ekle; /Producer her zaman yazıcıdır"""
+        self._info.update(entries)
+
+    # Nesne kopyalama
+    def _convert(self, value: Any, shared: bool) -> PdfObject:
+        """Nesneyi referanslarını yeni numaralara çevirerek kopyala"""
+        if isinstance(value, IndirectObject):
+            return self._copy_reference(value, shared)
+        if isinstance(value, StreamObject):
+            # Doğrudan gömülü stream olamaz, yine de güvenli tarafta kal
+            return value
+        if isinstance(value, DictionaryObject):
+            copied = DictionaryObject()
+            for name, item in value.items():
+                copied[NameObject(name)] = self._convert(
+                    item, shared or name == '/Resources'
+                )
+            return copied
+        if isinstance(value, ArrayObject):
+            return ArrayObject(self._convert(item, shared) for item in value)
+        return value
+
+    def _copy_reference(self, ref: IndirectObject, shared: bool) -> PdfObject:
+        """Dolaylı nesneyi bir kez kopyala ve yeni referansını döndür"""
+        key = (ref.idnum, ref.generation)
+
+        if key in self._page_ids:
+            return IndirectObject(self._page_ids[key], 0, None)
+
+        mapped = self._local.get(key)
+        if mapped is not None:
+            return IndirectObject(mapped, 0, None)
+
+        if key in self._pending:
+            # Döngüsel referans: numarayı şimdiden ayır
+            if self._pending[key] is None:
+                self._pending[key] = self._reserve()
+            return IndirectObject(self._pending[key], 0, None)
+
+        obj = ref.get_object()
+        if obj is None:
+            return NullObject()
+        if isinstance(obj, DictionaryObject) and obj.get('/Type') in _PAGE_TREE_TYPES:
+            # Seçilmemiş sayfa veya sayfa ağacı düğümü
+            return NullObject()
+
+        self._pending[key] = None
+        try:
+            copied, data = self._copy_object(obj, shared)
+        finally:
+            reserved = self._pending.pop(key)
+
+        body = self._encode(copied, data, encrypt=False)
+
+        digest = None
+        if shared and self.dedupe_resources and reserved is None:
+            digest = hashlib.sha1(body).digest()
+            existing = self._digests.get(digest)
+            if existing is not None:
+                self._local[key] = existing
+                self.objects_deduplicated += 1
+                return IndirectObject(existing, 0, None)
+
+        if self.encryption is not None:
+            body = self._encode(copied, data)
+
+        idnum = reserved if reserved is not None else self._reserve()
+        self._write_object(idnum, body)
+        self._local[key] = idnum
+        if digest is not None:
+            self._digests[digest] = idnum
+        return IndirectObject(idnum, 0, None)
+
+    def _copy_object(self, obj: PdfObject,
+                     shared: bool = False) -> Tuple[PdfObject, Optional[bytes]]:
+        """
+        Kaynak nesnenin referansları çevrilmiş kopyasını oluştur
+
+        Stream'ler için (başlık sözlüğü, ham veri), diğerleri için
+        (nesne, None) döner.
+        """
+        if isinstance(obj, StreamObject):
+            header = DictionaryObject()
+            for name, item in obj.items():
+                if name == '/Length':
+                    continue
+                header[NameObject(name)] = self._convert(
+                    item, shared or name == '/Resources'
+                )
+            return header, self._stream_data(obj)
+        if isinstance(obj, (DictionaryObject, ArrayObject)):
+            return self._convert(obj, shared), None
+        return obj, None
+
+    def _encode(self, obj: PdfObject, data: Optional[bytes] = None,
+                encrypt: bool = True) -> bytes:
+        """
+        Nesneyi PDF söz dizimiyle byte dizisine çevir
+
+        data verilirse obj stream başlığıdır. encrypt True ve yazıcıda
+        şifreleme varsa metin dizileri ve stream verisi şifrelenir.
+        """
+        if encrypt and self.encryption is not None:
+            obj = self.encryption.encrypt_strings(obj)
+            if data is not None:
+                data = self.encryption.encrypt(data)
+
+        buffer = io.BytesIO()
+        if data is not None:
+            header = DictionaryObject(obj)
+            header[NameObject('/Length')] = NumberObject(len(data))
+            header.write_to_stream(buffer)
+            buffer.write(b"\nstream\n")
+            buffer.write(data)
+            buffer.write(b"\nendstream")
+        else:
+            obj.write_to_stream(buffer)
+        return buffer.getvalue()
+
+    @staticmethod
+    def _stream_data(obj: StreamObject) -> bytes:
+        """Stream'in kodlanmış (sıkıştırılmış) ham verisini döndür"""
+        # pypdf ham veriyi _data içinde tutar; yeniden sıkıştırma yapılmaz
+        return obj._data
+
+    # Düşük seviye yazma
+    def _reserve(self) -> int:
+        """Yeni nesne numarası ayır"""
+        self._offsets.append(None)
+        return len(self._offsets)
+
+    def _write(self, data: bytes) -> None:
+        self._stream.write(data)
+        self._position += len(data)
+
+    def _write_object(self, idnum: int, body: bytes) -> None:
+        """Nesneyi dosyaya yaz ve konumunu kaydet"""
+        self._offsets[idnum - 1] = self._position
+        self._write(f"{idnum} 0 obj\n".encode('ascii'))
+        self._write(body)
+        self._write(b"\nendobj\n")
+        self.objects_written += 1
+
+    def _write_outlines(self) -> Optional[int]:
+        """Toplanan yer işaretlerinden outline ağacını oluştur"""
+        if not self._outline:
+            return None
+
+        root_id = self._reserve()
+        item_ids = [self._reserve() for _ in self._outline]
+
+        # Her öğenin ebeveynini ve çocuklarını seviyelerden çıkar
+        parents: List[int] = []
+        children: Dict[int, List[int]] = {root_id: []}
+        stack: List[Tuple[int, int]] = [(-1, root_id)]
+        for (title, page_idnum, level), idnum in zip(self._outline, item_ids):
+            while len(stack) > 1 and stack[-1][0] >= level:
+                stack.pop()
+            parent = stack[-1][1]
+            parents.append(parent)
+            children.setdefault(parent, []).append(idnum)
+            children[idnum] = []
+            stack.append((level, idnum))
+
+        def descendants(idnum: int) -> int:
+            return sum(1 + descendants(child) for child in children[idnum])
+
+        for (title, page_idnum, _level), idnum, parent in zip(
+                self._outline, item_ids, parents):
+            siblings = children[parent]
+            position = siblings.index(idnum)
+
+            item = DictionaryObject()
+            item[NameObject('/Title')] = TextStringObject(title)
+            item[NameObject('/Parent')] = IndirectObject(parent, 0, None)
+            item[NameObject('/Dest')] = ArrayObject([
+                IndirectObject(page_idnum, 0, None), NameObject('/Fit')
+            ])
+            if position > 0:
+                item[NameObject('/Prev')] = IndirectObject(siblings[position - 1], 0, None)
+            if position < len(siblings) - 1:
+                item[NameObject('/Next')] = IndirectObject(siblings[position + 1], 0, None)
+            if children[idnum]:
+                item[NameObject('/First')] = IndirectObject(children[idnum][0], 0, None)
+                item[NameObject('/Last')] = IndirectObject(children[idnum][-1], 0, None)
+                item[NameObject('/Count')] = NumberObject(-descendants(idnum))
+            self._write_object(idnum, self._encode(item))
+
+        root = DictionaryObject()
+        root[NameObject('/Type')] = NameObject('/Outlines')
+        root[NameObject('/First')] = IndirectObject(children[root_id][0], 0, None)
+        root[NameObject('/Last')] = IndirectObject(children[root_id][-1], 0, None)
+        root[NameObject('/Count')] = NumberObject(len(self._outline))
+        self._write_object(root_id, self._encode(root))
+        return root_id
+
+    def _write_trailer(self, extra_trailer: Optional[Dict[str, PdfObject]] = None) -> None:
+        """Sayfa ağacı, katalog, xref tablosu ve trailer'ı yaz"""
+        pages = DictionaryObject()
+        pages[NameObject('/Type')] = NameObject('/Pages')
+        pages[NameObject('/Kids')] = ArrayObject(
+            IndirectObject(idnum, 0, None) for idnum in self._kids
+        )
+        pages[NameObject('/Count')] = NumberObject(len(self._kids))
+        self._write_object(_PAGES_ID, self._encode(pages))
+
+        outline_id = self._write_outlines()
+
+        catalog = DictionaryObject()
+        catalog[NameObject('/Type')] = NameObject('/Catalog')
+        catalog[NameObject('/Pages')] = IndirectObject(_PAGES_ID, 0, None)
+        if outline_id is not None:
+            catalog[NameObject('/Outlines')] = IndirectObject(outline_id, 0, None)
+            catalog[NameObject('/PageMode')] = NameObject('/UseOutlines')
+        if self.encryption is not None:
+            # AES-256 (R6) için Adobe uzantı seviyesi 3
+            extension = DictionaryObject()
+            extension[NameObject('/BaseVersion')] = NameObject('/1.7')
+            extension[NameObject('/ExtensionLevel')] = NumberObject(3)
+            extensions = DictionaryObject()
+            extensions[NameObject('/ADBE')] = extension
+            catalog[NameObject('/Extensions')] = extensions
+        self._write_object(_CATALOG_ID, self._encode(catalog))
+
+        info_id = self._reserve()
+        info = DictionaryObject()
+        for name, value in self._info.items():
+            info[NameObject(name)] = TextStringObject(value)
+        info[NameObject('/Producer')] = TextStringObject(f"{APP_NAME} {__version__}")
+        self._write_object(info_id, self._encode(info))
+
+        extra_trailer = dict(extra_trailer or {})
+        if self.encryption is not None:
+            # /Encrypt sözlüğü şifrelenmeden yazılır
+            encrypt_id = self._reserve()
+            self._write_object(encrypt_id,
+                               self._encode(self.encryption.dictionary(), encrypt=False))
+            extra_trailer['/Encrypt'] = IndirectObject(encrypt_id, 0, None)
+
+        xref_offset = self._position
+        lines = [f"xref\n0 {len(self._offsets) + 1}\n", "0000000000 65535 f \n"]
+        for offset in self._offsets:
+            if offset is None:
+                lines.append("0000000000 65535 f \n")
+            else:
+                lines.append(f"{offset:010d} 00000 n \n")
+        self._write(''.join(lines).encode('ascii'))
+
+        file_id = ByteStringObject(
+            hashlib.md5(f"{self.output_path}:{xref_offset}".encode('utf-8')).digest()
+        )
+        trailer = DictionaryObject()
+        trailer[NameObject('/Size')] = NumberObject(len(self._offsets) + 1)
+        trailer[NameObject('/Root')] = IndirectObject(_CATALOG_ID, 0, None)
+        trailer[NameObject('/Info')] = IndirectObject(info_id, 0, None)
+        trailer[NameObject('/ID')] = ArrayObject([file_id, file_id])
+        for name, value in extra_trailer.items():
+            trailer[NameObject(name)] = value
+
+        self._write(b"trailer\n")
+        self._write(self._encode(trailer, encrypt=False))
+        self._write(f"\nstartxref\n{xref_offset}\n%%EOF\n".encode('ascii'))
+
+    def close(self) -> None:
+        """Belgeyi tamamla ve dosyayı kapat"""
+        if self._closed:
+            return
+        self.end_document()
+        self._digests.clear()
+        self._write_trailer()
+        self._stream.close()
+        self._closed = True
+
+    def abort(self) -> None:
+        """Yarım kalan çıktıyı kapat ve sil"""
+        if self._closed:
+            return
+        self._closed = True
+        self._stream.close()
+        try:
+            self.output_path.unlink()
+        except OSError:
+            pass
+
+
+def outline_entries(reader: PdfReader) -> List[Tuple[str, int, int]]:
+    """
+    Belgenin yer işaretlerini (başlık, sayfa indeksi, seviye) listesi olarak döndür
+
+    Hedef sayfası çözülemeyen öğeler atlanır.
+    """
+    entries: List[Tuple[str, int, int]] = []
+    seen: Set[int] = set()
+
+    def walk(items: List[Any], level: int) -> None:
+        for item in items:
+            if isinstance(item, list):
+                walk(item, level + 1)
+                continue
+            if id(item) in seen:
+                continue
+            seen.add(id(item))
+            try:
+                page_index = reader.get_destination_page_number(item)
+            except Exception:
+                continue
+            if page_index is None or page_index < 0:
+                continue
+            entries.append((str(item.title or ''), page_index, level))
+
+    try:
+        walk(reader.outline, 0)
+    except Exception:
+        # Bozuk outline ağacı birleştirmeyi engellemesin
+        pass
+    return entries
@@ -11,18 +11,27 @@ import os
 import json
 import argparse
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QVBoxLayout, QHBoxLayout,
     QWidget, QMenuBar, QStatusBar, QToolBar, QFileDialog,
-    QMessageBox, QSplashScreen, QProgressBar, QLabel
+    QMessageBox, QSplashScreen, QProgressBar, QLabel, QTabWidget
 )
 from PyQt6.QtCore import QTimer, QSettings, Qt, pyqtSignal, QThread
 from PyQt6.QtGui import QAction, QIcon, QPixmap, QKeySequence
 
 from pypdf_tools._version import __version__, APP_NAME, APP_DISPLAY_NAME
 from pypdf_tools.features.pdf_viewer import PDFViewerContainer
+from pypdf_tools.features.recent import PathProbe, default_recent_documents
+from pypdf_tools.features.startup import (
+    IMPORTS_DONE, PROFILE_READY, QT_INIT, WINDOW_BUILT, WINDOW_SHOWN, startup_metrics
+)
+from pypdf_tools.features.web_profile import default_web_profile, prewarm_page
+
+
+# Köprü bu sürede hazır olmazsa splash yine de kapatılır (ms)
+SPLASH_TIMEOUT_MS = 10000
 
 
 class MainWindow(QMainWindow):
@@ -41,8 +50,8 @@ class MainWindow(QMainWindow):
         # Uygulama ayarları
         self.settings = QSettings('PyPDF-Tools', APP_NAME)
         
-        # Ana widget'lar
-        self.pdf_viewer_container: Optional[PDFViewerContainer] = None
+        # Ana widget'lar; her sekme bir PDFViewerContainer
+        self.tabs: Optional[QTabWidget] = None
         self.status_bar: Optional[QStatusBar] = None
         
         # Durum değişkenleri
@@ -50,6 +59,14 @@ class MainWindow(QMainWindow):
         self.current_theme = 'light'
         self.is_fullscreen = False
         
+        # Son dosyalar SQLite deposunda; varlıkları arka planda denetlenir
+        # (yol -> True/False, zaman aşımında None)
+        self.recent_documents = default_recent_documents()
+        self._recent_status: Dict[str, Optional[bool]] = {}
+        self._recent_probe = PathProbe(parent=self)
+        self._recent_probe.checked.connect(self._on_recent_checked)
+        self._migrate_recent_files()
+        
         # UI kurulumu
         self._setup_ui()
         self._setup_menus()
@@ -73,10 +90,50 @@ class MainWindow(QMainWindow):
         main_layout = QVBoxLayout(central_widget)
         main_layout.setContentsMargins(0, 0, 0, 0)
         
-        # PDF Viewer Container
-        self.pdf_viewer_container = PDFViewerContainer(self)
-        main_layout.addWidget(self.pdf_viewer_container)
-        
+        # Belge sekmeleri; görüntüleyiciler karo önbelleğini ve iş
+        # parçacığı havuzunu paylaşır, arka plandaki sekmeler bütçeyle sınırlı
+        self.tabs = QTabWidget()
+        self.tabs.setDocumentMode(True)
+        self.tabs.setTabsClosable(True)
+        self.tabs.setMovable(True)
+        self.tabs.tabCloseRequested.connect(self.close_tab)
+        main_layout.addWidget(self.tabs)
+        self._add_tab()
+        self.tabs.currentChanged.connect(self._on_tab_changed)
+    
+    @property
+    def pdf_viewer_container(self) -> Optional[PDFViewerContainer]:
+        """Görünür sekmenin görüntüleyicisi"""
+        return self.tabs.currentWidget() if self.tabs else None
+    
+    def _containers(self) -> List[PDFViewerContainer]:
+        return [self.tabs.widget(index) for index in range(self.tabs.count())]
+    
+    def _add_tab(self) -> PDFViewerContainer:
+        """Boş görüntüleyici sekmesi ekle"""
+        container = PDFViewerContainer(self)
+        container.set_theme(self.current_theme)
+        container.pdf_viewer.pdfLoaded.connect(self._on_pdf_loaded)
+        container.pdf_viewer.toolActionPerformed.connect(self._on_tool_action)
+        self.tabs.addTab(container, 'Yeni Sekme')
+        return container
+    
+    def close_tab(self, index: int) -> None:
+        """Sekmeyi kapat ve belgesinin kaynaklarını bırak; son sekme boş kalır"""
+        container = self.tabs.widget(index)
+        if container is None:
+            return
+        if self.tabs.count() == 1 and container.file_path is None:
+            return
+        container.pdf_viewer.close()
+        self.tabs.removeTab(index)
+        container.deleteLater()
+        if not self.tabs.count():
+            self._add_tab()
+    
+    def close_current_tab(self) -> None:
+        self.close_tab(self.tabs.currentIndex())
+    
     def _setup_menus(self) -> None:
         """Menü çubuğunu kur"""
         menubar = self.menuBar()
@@ -93,7 +150,16 @@ class MainWindow(QMainWindow):
         
         # Son dosyalar
         self.recent_files_menu = file_menu.addMenu('Son &Dosyalar')
+        self.recent_files_menu.aboutToShow.connect(self._check_recent_files)
         self._update_recent_files_menu()
+        self._check_recent_files()
+        
+        # Sekmeyi kapat
+        close_tab_action = QAction('Sekmeyi &Kapat', self)
+        close_tab_action.setShortcut(QKeySequence.StandardKey.Close)
+        close_tab_action.setStatusTip('Görünür belge sekmesini kapat')
+        close_tab_action.triggered.connect(self.close_current_tab)
+        file_menu.addAction(close_tab_action)
         
         file_menu.addSeparator()
         
@@ -286,50 +352,68 @@ class MainWindow(QMainWindow):
     
     def _connect_signals(self) -> None:
         """Sinyal bağlantılarını kur"""
-        if self.pdf_viewer_container:
-            # PDF yüklendiğinde
-            self.pdf_viewer_container.pdf_viewer.pdfLoaded.connect(self._on_pdf_loaded)
-            # Tool action'lar
-            self.pdf_viewer_container.pdf_viewer.toolActionPerformed.connect(self._on_tool_action)
+        # Görüntüleyici sinyalleri her sekme eklenirken bağlanır (_add_tab)
     
-    def _update_recent_files_menu(self) -> None:
-        """Son dosyalar menüsünü güncelle"""
-        self.recent_files_menu.clear()
-        
-        recent_files = self.settings.value('recent_files', [])
+    def _migrate_recent_files(self) -> None:
+        """Eski QSettings listesini son belgeler deposuna bir kez aktar"""
+        recent_files = self.settings.value('recent_files')
+        if recent_files is None:
+            return
         if not isinstance(recent_files, list):
-            recent_files = []
+            recent_files = [recent_files]
+        self.recent_documents.import_paths(str(Path(path)) for path in recent_files if path)
+        self.settings.remove('recent_files')
+    
+    def _update_recent_files_menu(self) -> None:
+        """
+        Son dosyalar menüsünü depodan ve bilinen varlık durumlarından kur
         
-        for i, file_path in enumerate(recent_files[:10]):  # Son 10 dosya
-            if Path(file_path).exists():
-                action = QAction(f"{i+1}. {Path(file_path).name}", self)
-                action.setStatusTip(file_path)
-                action.triggered.connect(lambda checked, path=file_path: self.load_pdf(path))
-                self.recent_files_menu.addAction(action)
+        Diske erişilmez: bulunamayan dosyalar gizlenir, yanıt vermeyen
+        konumdakiler devre dışı gösterilir, henüz denetlenmeyenler açılabilir.
+        """
+        self.recent_files_menu.clear()
         
-        if not recent_files:
+        number = 0
+        for entry in self.recent_documents.entries():
+            file_path = entry['path']
+            status = self._recent_status.get(file_path, True)
+            if status is False:
+                continue
+            
+            number += 1
+            name = Path(file_path).name
+            action = QAction(f"{number}. {name}", self)
+            action.setStatusTip(file_path)
+            if entry['thumbnail']:
+                pixmap = QPixmap()
+                if pixmap.loadFromData(entry['thumbnail']):
+                    action.setIcon(QIcon(pixmap))
+            if status is None:
+                action.setText(f"{number}. {name} (erişilemiyor)")
+                action.setEnabled(False)
+            action.triggered.connect(lambda checked, path=file_path: self.load_pdf(path))
+            self.recent_files_menu.addAction(action)
+        
+        if not number:
             no_recent_action = QAction('Son dosya yok', self)
             no_recent_action.setEnabled(False)
             self.recent_files_menu.addAction(no_recent_action)
     
+    def _check_recent_files(self) -> None:
+        """Son dosyaların varlığını arka planda denetle; menü sonuçlar geldikçe güncellenir"""
+        self._recent_probe.check(self.recent_documents.paths())
+    
+    def _on_recent_checked(self, file_path: str, status: Optional[bool]) -> None:
+        previous = self._recent_status.get(file_path, True)
+        self._recent_status[file_path] = status
+        if status is not previous:
+            self._update_recent_files_menu()
+    
     def _add_to_recent_files(self, file_path: str) -> None:
-        """Dosyayı son dosyalar listesine ekle"""
-        recent_files = self.settings.value('recent_files', [])
-        if not isinstance(recent_files, list):
-            recent_files = []
-        
-        # Varsa listeden kaldır
-        if file_path in recent_files:
-            recent_files.remove(file_path)
-        
-        # Başa ekle
-        recent_files.insert(0, file_path)
-        
-        # Maksimum 10 dosya tut
-        recent_files = recent_files[:10]
-        
-        # Kaydet
-        self.settings.setValue('recent_files', recent_files)
+        """Dosyayı son dosyalar listesinin başına al"""
+        file_path = str(Path(file_path))
+        self.recent_documents.touch(file_path)
+        self._recent_status[file_path] = True
         self._update_recent_files_menu()
     
     # Slot fonksiyonları
@@ -352,24 +436,39 @@ class MainWindow(QMainWindow):
                 QMessageBox.warning(self, 'Hata', f'Dosya bulunamadı: {file_path}')
                 return False
             
+            # Açık dosya kendi sekmesinde gösterilir; yeni dosya boş sekmede
+            # veya yeni sekmede açılır
+            for container in self._containers():
+                if container.file_path and Path(container.file_path).resolve() == Path(file_path).resolve():
+                    self.tabs.setCurrentWidget(container)
+                    return True
+            
+            container = self.pdf_viewer_container
+            added = container.file_path is not None
+            if added:
+                container = self._add_tab()
+            
             # PDF'i viewer'da yükle
-            success = self.pdf_viewer_container.load_pdf(file_path)
+            success = container.load_pdf(file_path)
             
             if success:
-                self.current_pdf_path = file_path
+                index = self.tabs.indexOf(container)
+                self.tabs.setTabText(index, Path(file_path).name)
+                self.tabs.setTabToolTip(index, file_path)
+                self.tabs.setCurrentWidget(container)
+                self._on_tab_changed(index)
+                
                 self.settings.setValue('last_file', file_path)
                 self.settings.setValue('last_directory', str(Path(file_path).parent))
                 self._add_to_recent_files(file_path)
                 
-                # Başlığı güncelle
-                self.setWindowTitle(f"{APP_DISPLAY_NAME} - {Path(file_path).name}")
-                
                 # Durum çubuğunu güncelle
                 self.status_bar.showMessage(f'PDF yüklendi: {Path(file_path).name}')
-                self.status_label.setText(f'{Path(file_path).name}')
                 
                 return True
             else:
+                if added:
+                    self.close_tab(self.tabs.indexOf(container))
                 QMessageBox.critical(self, 'Hata', 'PDF dosyası yüklenemedi!')
                 return False
                 
@@ -416,9 +515,10 @@ class MainWindow(QMainWindow):
         self.current_theme = theme
         self.settings.setValue('theme', theme)
         
-        # PDF viewer'a tema bilgisini gönder
-        if self.pdf_viewer_container:
-            self.pdf_viewer_container.set_theme(theme)
+        # Tüm sekmelere tema bilgisini gönder
+        if self.tabs:
+            for container in self._containers():
+                container.set_theme(theme)
         
         # Ana pencere temasını da değiştir (opsiyonel)
         self._apply_window_theme(theme)
@@ -469,7 +569,7 @@ class MainWindow(QMainWindow):
     
     def show_settings(self) -> None:
         """Ayarlar dialog'u aç"""
-        QMessageBox.information(self, 'Bilgi', 'Ayarlar dialog'u geliştirilecek')
+        QMessageBox.information(self, 'Bilgi', "Ayarlar dialog'u geliştirilecek")
     
     def show_about(self) -> None:
         """Hakkında dialog'u göster"""
@@ -488,6 +588,23 @@ class MainWindow(QMainWindow):
         )
     
     # Event handlers
+    def _on_tab_changed(self, index: int) -> None:
+        """Görünür sekme değişti: yalnızca o sekmenin belgesi etkin kalır"""
+        current = self.tabs.widget(index)
+        for container in self._containers():
+            container.set_active(container is current)
+        if current is None:
+            return
+        
+        self.current_pdf_path = current.file_path
+        if current.file_path:
+            name = Path(current.file_path).name
+            self.setWindowTitle(f"{APP_DISPLAY_NAME} - {name}")
+            self.status_label.setText(name)
+        else:
+            self.setWindowTitle(APP_DISPLAY_NAME)
+            self.status_label.setText('PDF yüklü değil')
+    
     def _on_pdf_loaded(self, pdf_data: Dict[str, Any]) -> None:
         """PDF yüklendiğinde çağrılır"""
         self.status_bar.showMessage(f"PDF yüklendi: {pdf_data.get('fileName', 'Bilinmiyor')}")
@@ -498,8 +615,10 @@ class MainWindow(QMainWindow):
     
     # Pencere kapatma
     def closeEvent(self, event) -> None:
-        """Pencere kapatılırken ayarları kaydet"""
+        """Pencere kapatılırken ayarları ve bekleyen son sayfaları kaydet"""
         self.settings.setValue('geometry', self.saveGeometry())
+        for container in self._containers():
+            container.pdf_viewer.save_last_page()
         super().closeEvent(event)
 
 
@@ -522,6 +641,10 @@ class SplashScreen(QSplashScreen):
 
 def create_app() -> QApplication:
     """PyQt uygulamasını oluştur"""
+    # Özel URL şemaları QApplication'dan önce kaydedilmeli
+    from pypdf_tools.features.tile_scheme import register_tile_scheme
+    register_tile_scheme()
+    
     app = QApplication(sys.argv)
     
     # Uygulama meta bilgileri
@@ -535,15 +658,20 @@ def create_app() -> QApplication:
 
 def main() -> int:
     """Ana CLI entry point"""
+    startup_metrics().mark(IMPORTS_DONE)
+    
     parser = argparse.ArgumentParser(description=f'{APP_DISPLAY_NAME} - Hibrit PDF Uygulaması')
     parser.add_argument('--version', action='version', version=f'{APP_NAME} {__version__}')
     parser.add_argument('--no-splash', action='store_true', help='Splash ekranını gösterme')
+    parser.add_argument('--profile-startup', action='store_true',
+                        help='Başlangıç aşamalarının zaman çizelgesini yazdır')
     parser.add_argument('file', nargs='?', help='Açılacak PDF dosyası')
     
     args = parser.parse_args()
     
     # Qt uygulamasını oluştur
     app = create_app()
+    startup_metrics().mark(QT_INIT)
     
     # Splash screen göster
     splash = None
@@ -553,18 +681,48 @@ def main() -> int:
         app.processEvents()
     
     try:
+        # React uygulaması ana pencere kurulurken yüklenmeye başlar;
+        # bundan sonra görüntüleyici sayfayı devralana kadar olay döngüsü çalışmamalı
+        default_web_profile()
+        startup_metrics().mark(PROFILE_READY)
+        prewarm_page()
+        
         # Ana pencereyi oluştur
         main_window = MainWindow()
-        
-        # Dosya belirtilmişse yükle
-        if args.file:
-            QTimer.singleShot(500, lambda: main_window.load_pdf(args.file))
-        
-        # Splash'i kapat ve ana pencereyi göster
+        startup_metrics().mark(WINDOW_BUILT)
+        viewer = main_window.pdf_viewer_container.pdf_viewer
+        
+        def show_window() -> None:
+            """Splash'i kapat ve ana pencereyi göster"""
+            if main_window.isVisible():
+                return
+            if splash:
+                splash.finish(main_window)
+            main_window.show()
+            startup_metrics().mark(WINDOW_SHOWN)
+        
+        # Splash köprü hazır olana kadar kalır; hata veya zaman aşımında pencere yine açılır
         if splash:
-            splash.finish(main_window)
+            viewer.ready.connect(show_window)
+            viewer.errorOccurred.connect(show_window)
+            QTimer.singleShot(SPLASH_TIMEOUT_MS, show_window)
+        else:
+            show_window()
+        
+        # Zaman çizelgesi dosya açılıyorsa ilk sayfa, yoksa köprü hazır olunca yazdırılır
+        if args.profile_startup:
+            done = viewer.firstPagePainted if args.file else viewer.ready
+            
+            def print_timeline() -> None:
+                done.disconnect(print_timeline)
+                print(startup_metrics().report())
+            
+            done.connect(print_timeline)
         
-        main_window.show()
+        # Dosya belirtilmişse hemen açmaya başla; görüntüleyici React hazır
+        # olduğunda (bridgeReady) bekleyen belge verisini gönderir
+        if args.file:
+            main_window.load_pdf(args.file)
         
         # Uygulamayı çalıştır
         return app.exec()
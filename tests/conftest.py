@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools Ortak Test Fixture'ları
+Testler için örnek PDF dosyaları üretir
+"""
+
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import pytest
+
+
+def build_pdf(path: Path, pages: int = 3, title: str = 'Sample',
+              with_image: bool = False, with_outline: bool = False,
+              text: Optional[str] = None, lines: int = 1) -> Path:
+    """
+    reportlab ile örnek PDF üret
+
+    Her sayfaya sayfa numaralı metin yazılır; istenirse tüm belgelerde
+    aynı olan bir görsel, yer işaretleri ve ek metin satırları eklenir.
+    """
+    from reportlab.pdfgen import canvas
+
+    pdf = canvas.Canvas(str(path))
+    pdf.setTitle(title)
+    pdf.setAuthor('PyPDF-Tools Test')
+
+    image = _shared_image() if with_image else None
+
+    for index in range(pages):
+        pdf.drawString(72, 720, f"{title} page {index + 1}")
+        if text:
+            for line in range(lines):
+                pdf.drawString(72, 700 - line * 12, text)
+        if image is not None:
+            pdf.drawImage(image, 72, 400, 100, 100)
+        if with_outline:
+            key = f"page-{index}"
+            pdf.bookmarkPage(key)
+            pdf.addOutlineEntry(f"{title} {index + 1}", key, level=0)
+        pdf.showPage()
+
+    pdf.save()
+    return path
+
+
+@pytest.fixture(autouse=True)
+def isolated_data_dir(tmp_path_factory, monkeypatch):
+    """Önbellek ve uygulama verilerini kullanıcı dizini yerine geçici dizine yaz"""
+    data_dir = tmp_path_factory.mktemp('app-data')
+    monkeypatch.setenv('PYPDF_DATA_DIR', str(data_dir))
+    monkeypatch.delenv('PYPDF_CACHE_DIR', raising=False)
+    return data_dir
+
+
+@pytest.fixture
+def pdf_factory(tmp_path):
+    """Test başına geçici dizinde örnek PDF üreten fabrika"""
+
+    def _create(name: str = 'sample.pdf', **options) -> Path:
+        return build_pdf(tmp_path / name, **options)
+
+    return _create
+
+
+@pytest.fixture(scope='session')
+def large_pdf_factory(tmp_path_factory):
+    """
+    Benchmark'lar için büyük PDF üreten, oturum boyunca önbellekleyen fabrika
+    """
+    created: Dict[Tuple, Path] = {}
+    directory = tmp_path_factory.mktemp('large-pdfs')
+
+    def _create(pages: int, text: Optional[str] = None, lines: int = 1) -> Path:
+        key = (pages, text, lines)
+        if key not in created:
+            name = f"large-{pages}-{len(created)}.pdf"
+            created[key] = build_pdf(directory / name, pages=pages, title='Large',
+                                     text=text, lines=lines)
+        return created[key]
+
+    return _create
+
+
+@pytest.fixture(scope='session')
+def padded_pdf_factory(tmp_path_factory):
+    """
+    Belirtilen boyutta tek sayfalık PDF üreten, oturum boyunca önbellekleyen fabrika
+    """
+    created: Dict[int, Path] = {}
+    directory = tmp_path_factory.mktemp('padded-pdfs')
+
+    def _create(size: int) -> Path:
+        if size not in created:
+            created[size] = write_padded_pdf(directory / f'padded-{size}.pdf', size)
+        return created[size]
+
+    return _create
+
+
+def write_padded_pdf(path: Path, size: int) -> Path:
+    """
+    Belirtilen boyuta ulaşan tek sayfalık PDF yaz
+
+    Dosya boyutunu sayfa içeriğindeki büyük bir stream sağlar; veri
+    parça parça yazıldığı için GB boyutlu dosyalar da belleğe sığar.
+    """
+    chunk = b'% padding ' * 6553 + b'\n'
+    payload = max(0, size - 600)
+
+    with open(path, 'wb') as stream:
+        offsets = []
+
+        def write_object(body: bytes) -> None:
+            offsets.append(stream.tell())
+            stream.write(f"{len(offsets)} 0 obj\n".encode() + body + b"\nendobj\n")
+
+        stream.write(b"%PDF-1.7\n")
+        write_object(b"<< /Type /Catalog /Pages 2 0 R >>")
+        write_object(b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>")
+        write_object(b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                     b"/Contents 4 0 R >>")
+
+        offsets.append(stream.tell())
+        stream.write(f"4 0 obj\n<< /Length {payload} >>\nstream\n".encode())
+        remaining = payload
+        while remaining > 0:
+            part = chunk[:remaining]
+            stream.write(part)
+            remaining -= len(part)
+        stream.write(b"\nendstream\nendobj\n")
+
+        write_object(b"<< /Title (Padded) /Producer (PyPDF-Tools Test) >>")
+
+        xref = stream.tell()
+        stream.write(f"xref\n0 {len(offsets) + 1}\n0000000000 65535 f \n".encode())
+        for offset in offsets:
+            stream.write(f"{offset:010d} 00000 n \n".encode())
+        stream.write(f"trailer\n<< /Size {len(offsets) + 1} /Root 1 0 R /Info 5 0 R >>\n"
+                     f"startxref\n{xref}\n%%EOF\n".encode())
+    return path
+
+
+def _shared_image():
+    """Belgeler arası paylaşılan örnek görsel"""
+    from PIL import Image
+    from reportlab.lib.utils import ImageReader
+
+    return ImageReader(Image.new('RGB', (64, 64), (200, 30, 30)))
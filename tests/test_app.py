@@ -133,6 +133,34 @@ class TestMainWindow:
             else:
                 mock_normal.assert_called_once()
                 assert not main_window.is_fullscreen
+    
+    def test_documents_open_in_tabs(self, main_window, pdf_factory):
+        """Her yeni belge kendi sekmesinde açılmalı; açık belge yeniden açılmamalı"""
+        first, second = str(pdf_factory('a.pdf')), str(pdf_factory('b.pdf'))
+        
+        with patch.object(main_window, 'settings'), \
+             patch.object(main_window, '_add_to_recent_files'):
+            assert main_window.load_pdf(first)
+            assert main_window.tabs.count() == 1
+            assert main_window.load_pdf(second)
+            assert main_window.tabs.count() == 2
+            assert main_window.current_pdf_path == second
+            
+            assert main_window.load_pdf(first)
+            assert main_window.tabs.count() == 2
+            assert main_window.current_pdf_path == first
+            assert [main_window.tabs.tabText(index) for index in range(2)] == ['a.pdf', 'b.pdf']
+    
+    def test_close_last_tab_leaves_empty_tab(self, main_window, pdf_factory):
+        """Son sekme kapatılınca boş bir sekme kalmalı"""
+        with patch.object(main_window, 'settings'), \
+             patch.object(main_window, '_add_to_recent_files'):
+            main_window.load_pdf(str(pdf_factory('a.pdf')))
+        
+        main_window.close_tab(0)
+        assert main_window.tabs.count() == 1
+        assert main_window.pdf_viewer_container.file_path is None
+        assert main_window.current_pdf_path is None
 
 
 class TestPDFViewerWidget:
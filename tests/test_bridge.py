@@ -174,6 +174,28 @@ class TestToolActionHandling:
         result = bridge._handle_rotate(data)
         assert result['rotation'] == 0  # 360 % 360 = 0
 
+    def test_heavy_tool_returns_job_id(self, bridge):
+        """Ağır araçlar hemen iş kimliği döndürmeli, sonuç sinyalle gelmeli"""
+        finished = []
+        bridge.jobFinished.connect(lambda message: finished.append(json.loads(message)))
+
+        result = json.loads(bridge.onToolAction(json.dumps({
+            'toolId': 'merge', 'data': {'files': ['a.pdf', 'b.pdf']}
+        })))
+
+        assert result['success'] is True
+        job_id = result['result']['jobId']
+
+        assert bridge.cancel_all_jobs(5000)
+        QApplication.processEvents()
+        assert finished[0]['jobId'] == job_id
+        assert finished[0]['success'] is False
+
+    def test_cancel_unknown_job(self, bridge):
+        """Bilinmeyen iş iptali hata döndürmeli"""
+        result = json.loads(bridge.cancelJob('job-missing'))
+        assert result['success'] is False
+
 
 class TestPageAndAnnotationHandling:
     """Sayfa ve annotation işleme testleri"""
@@ -199,14 +221,50 @@ class TestPageAndAnnotationHandling:
         
         bridge.onPageChange(page_data)
         signal_spy.assert_called_once_with(5)
-    
+
+    def test_on_page_change_view(self, bridge):
+        """Sayfa değişimi zoom ve döndürmeyle birlikte bildirilmeli"""
+        signal_spy = Mock()
+        bridge.viewChanged.connect(signal_spy)
+
+        bridge.onPageChange(json.dumps({'page': 3, 'zoom': 150, 'rotation': 90}))
+        bridge.onPageChange(json.dumps({'page': 4}))
+        assert signal_spy.call_args_list == [((3, 150, 90),), ((4, 100, 0),)]
+
     def test_on_page_change_invalid_json(self, bridge):
         """Geçersiz JSON ile sayfa değişimi"""
         # Hata çıktısını bastır (test için)
         with patch('builtins.print'):
             bridge.onPageChange("invalid json")
         # Hata durumunda exception raise edilmemeli
-    
+
+    def test_ready_handshake_slots(self, bridge):
+        """React'in hazır ve ilk çizim bildirimleri sinyale dönüşmeli"""
+        ready_spy = Mock()
+        painted_spy = Mock()
+        bridge.ready.connect(ready_spy)
+        bridge.firstPagePainted.connect(painted_spy)
+
+        bridge.bridgeReady()
+        bridge.onFirstPagePainted()
+        ready_spy.assert_called_once_with()
+        painted_spy.assert_called_once_with()
+
+    def test_search_slots(self, bridge):
+        """Arama isteği servise iletilmeli, sorgu kimliği dönmeli"""
+        result = json.loads(bridge.search(json.dumps({'query': 'rapor'})))
+        assert result['success'] is False
+
+        service = Mock()
+        service.search.return_value = 'q-1'
+        bridge.set_search_service(service)
+        result = json.loads(bridge.search(json.dumps({'query': 'rapor'})))
+        assert result == {'success': True, 'queryId': 'q-1'}
+        service.search.assert_called_once_with('rapor')
+
+        bridge.cancelSearch()
+        service.cancel_search.assert_called_once()
+
     def test_on_annotation_add_valid(self, bridge):
         """Geçerli annotation ekleme"""
         annotation_data = json.dumps({
@@ -259,11 +317,32 @@ class TestDataUpdates:
         # Internal state'in güncellendiğini kontrol et
         assert bridge._pdf_data == pdf_data
         
-        # Signal'ın emit edildiğini kontrol et
+        # İlk güncelleme tam anlık görüntü olarak gönderilmeli
         signal_spy.assert_called_once()
         call_args = signal_spy.call_args[0][0]
         emitted_data = json.loads(call_args)
-        assert emitted_data == pdf_data
+        assert emitted_data == {'version': 1, 'data': pdf_data}
+    
+    def test_update_pdf_data_sends_patch(self, bridge):
+        """Aynı belgede yalnızca fark gönderilmeli"""
+        pdf_data = create_test_pdf_data()
+        bridge.update_pdf_data(pdf_data)
+        
+        snapshot_spy = Mock()
+        patch_spy = Mock()
+        bridge.pdfDataChanged.connect(snapshot_spy)
+        bridge.pdfDataPatched.connect(patch_spy)
+        
+        pdf_data['metadata']['title'] = 'Yeni Başlık'
+        bridge.update_pdf_data(pdf_data)
+        
+        snapshot_spy.assert_not_called()
+        message = json.loads(patch_spy.call_args[0][0])
+        assert message == {
+            'baseVersion': 1, 'version': 2,
+            'patch': [{'op': 'replace', 'path': '/metadata/title', 'value': 'Yeni Başlık'}]
+        }
+        assert json.loads(bridge.requestPdfSnapshot())['data'] == pdf_data
     
     def test_update_theme(self, bridge):
         """Tema güncelleme"""
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools Kalıcı Önbellek Test Modülü
+İçerik adresli metin/metadata önbelleği ve `cache` komutu testleri
+"""
+
+import os
+import shutil
+from unittest.mock import patch
+
+from click.testing import CliRunner
+
+from pypdf_tools.core.cache import DocumentCache, cached_pdf_metadata
+from pypdf_tools.core.text import PageTextStream
+from pypdf_tools.cli.cli_handler import cli
+
+
+class TestDocumentCache:
+    """DocumentCache testleri"""
+
+    def test_fingerprint_precheck_skips_hashing(self, pdf_factory, tmp_path):
+        """Dosya değişmediyse içerik yeniden özetlenmemeli"""
+        source = pdf_factory('doc.pdf', pages=2)
+
+        with DocumentCache(tmp_path / 'cache') as cache:
+            digest = cache.fingerprint(source)
+            with patch('pypdf_tools.core.cache.file_digest') as file_digest:
+                assert cache.fingerprint(source) == digest
+            file_digest.assert_not_called()
+
+            # İçerik değişince yeni özet hesaplanmalı
+            source.write_bytes(source.read_bytes() + b'\n')
+            assert cache.fingerprint(source) != digest
+
+    def test_content_addressed_across_paths(self, pdf_factory, tmp_path):
+        """Aynı içerikli kopya önbellekten okunmalı"""
+        source = pdf_factory('doc.pdf', pages=3, title='Doc')
+        copy = tmp_path / 'copy.pdf'
+        shutil.copy(source, copy)
+
+        with DocumentCache(tmp_path / 'cache') as cache:
+            first = cached_pdf_metadata(cache, source)
+            second = cached_pdf_metadata(cache, copy)
+
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert second['filename'] == 'copy.pdf'
+        assert second['pages'] == first['pages'] == 3
+
+    def test_only_uncached_pages_extracted(self, pdf_factory, tmp_path):
+        """Yeniden çalıştırmada yalnızca eksik sayfalar ayrıştırılmalı"""
+        source = pdf_factory('doc.pdf', pages=6, title='Doc')
+
+        with DocumentCache(tmp_path / 'cache') as cache:
+            with PageTextStream(source, '1-3', cache=cache) as page_stream:
+                first = list(page_stream)
+            assert (cache.hits, cache.misses) == (0, 3)
+
+            with patch('pypdf._page.PageObject.extract_text',
+                       return_value='yeni') as extract:
+                with PageTextStream(source, cache=cache) as page_stream:
+                    pages = list(page_stream)
+
+        assert extract.call_count == 3
+        assert pages[:3] == first
+        assert [text for _number, text in pages[3:]] == ['yeni'] * 3
+        assert (cache.hits, cache.misses) == (3, 6)
+
+    def test_lru_eviction(self, pdf_factory, tmp_path):
+        """Boyut sınırı aşılınca en eski belge silinmeli"""
+        sources = [pdf_factory(f'doc{index}.pdf', pages=4, title=f'Doc{index}')
+                   for index in range(3)]
+
+        with DocumentCache(tmp_path / 'cache', max_bytes=10 ** 9) as cache:
+            for source in sources:
+                with PageTextStream(source, cache=cache) as page_stream:
+                    list(page_stream)
+            per_document = cache.stats()['bytes'] // 3
+
+            # İlk belgeyi yeniden kullanarak en yeni hale getir
+            with PageTextStream(sources[0], cache=cache) as page_stream:
+                list(page_stream)
+
+            cache.max_bytes = per_document * 2 + per_document // 2
+            assert cache.evict() == 1
+            remaining = {cache.fingerprint(source, compute=False) for source in sources}
+
+        assert cache.stats()['documents'] == 2
+        assert None in remaining
+        assert len(remaining) == 3
+
+
+class TestCacheCommand:
+    """`cache` komutu ve önbellekli CLI testleri"""
+
+    def test_verbose_counters_and_stats(self, pdf_factory, isolated_data_dir):
+        """--verbose isabet sayılarını, stats kayıtları göstermeli"""
+        source = pdf_factory('doc.pdf', pages=3, title='Doc')
+        runner = CliRunner()
+
+        first = runner.invoke(cli, ['-v', 'extract-text', str(source)])
+        second = runner.invoke(cli, ['-v', 'extract-text', str(source)])
+
+        assert first.exit_code == 0 and second.exit_code == 0
+        assert '0 isabet, 3 ıskalama' in first.stderr
+        assert '3 isabet, 0 ıskalama' in second.stderr
+        assert first.stdout.split('\n', 1)[1] == second.stdout.split('\n', 1)[1]
+
+        stats = runner.invoke(cli, ['cache', 'stats'])
+        assert stats.exit_code == 0
+        assert 'Sayfa sayısı: 3' in stats.output
+        assert str(isolated_data_dir) in stats.output
+
+        cleared = runner.invoke(cli, ['cache', 'clear'])
+        assert cleared.exit_code == 0
+        assert 'Sayfa sayısı: 0' in runner.invoke(cli, ['cache', 'stats']).output
+
+    def test_no_cache_option(self, pdf_factory, isolated_data_dir):
+        """--no-cache verilince önbellek oluşturulmamalı"""
+        source = pdf_factory('doc.pdf', pages=2)
+
+        result = CliRunner().invoke(cli, ['--no-cache', '-v', 'info', str(source)])
+
+        assert result.exit_code == 0
+        assert 'Önbellek: kapalı' in result.stderr
+        assert not os.path.exists(isolated_data_dir / 'cache' / 'cache.db')
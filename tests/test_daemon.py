@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools Daemon Modu Test Modülü
+`pypdf serve` sunucusu ve --connect istemcisi testleri
+"""
+
+import json
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+import pytest
+from click.testing import CliRunner
+
+from pypdf_tools.cli.cli_handler import cli
+from pypdf_tools.cli.daemon import (
+    MESSAGE, STDOUT, PDFDaemon, forward_command, read_stdin, recv_frame, send_message
+)
+
+
+# `pypdf` konsol betiğinin yaptığı çağrı
+CLI_ENTRY = 'from pypdf_tools.cli.cli_handler import cli_main; cli_main()'
+
+
+@pytest.fixture
+def daemon_socket():
+    """Arka planda tek işçili daemon çalıştır, soket yolunu döndür"""
+    # Unix soket yolları ~100 karakterle sınırlı; tmp_path çok uzun olabilir
+    directory = tempfile.mkdtemp(prefix='pypdf-')
+    socket_path = os.path.join(directory, 'daemon.sock')
+    daemon = PDFDaemon(socket_path, workers=1)
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+
+    yield socket_path
+
+    daemon.shutdown()
+    daemon.server_close()
+    thread.join()
+    shutil.rmtree(directory)
+
+
+def invoke_both(socket_path, args, **options):
+    """Komutu tek seferlik ve daemon üzerinden çalıştır"""
+    runner = CliRunner()
+    local = runner.invoke(cli, args, **options)
+    remote = runner.invoke(cli, ['--connect', socket_path, *args], **options)
+    return local, remote
+
+
+class TestDaemonParity:
+    """Daemon çıktısının tek seferlik CLI ile aynı olması testleri"""
+
+    @pytest.mark.parametrize('args', [
+        ['--no-cache', 'info', '{pdf}'],
+        ['extract-text', '{pdf}', '-f', 'ndjson', '-p', '2-3'],
+        ['extract-text', '{pdf}', '-p', '9'],
+        ['info'],
+        ['merge', '--help'],
+        ['missing-command'],
+    ])
+    def test_output_and_exit_code(self, daemon_socket, pdf_factory, args):
+        """stdout, stderr ve çıkış kodu aynı olmalı"""
+        source = pdf_factory('doc.pdf', pages=3, title='Doc')
+        args = [arg.format(pdf=source) for arg in args]
+
+        local, remote = invoke_both(daemon_socket, args)
+
+        assert remote.exit_code == local.exit_code
+        assert remote.stdout == local.stdout
+        assert remote.stderr == local.stderr
+
+    def test_relative_paths_and_files(self, daemon_socket, pdf_factory, tmp_path,
+                                      monkeypatch):
+        """Göreli yollar istemcinin çalışma dizinine göre çözülmeli"""
+        pdf_factory('a.pdf', pages=2)
+        pdf_factory('b.pdf', pages=3)
+        monkeypatch.chdir(tmp_path)
+
+        result = CliRunner().invoke(cli, ['--connect', daemon_socket, 'merge',
+                                          'a.pdf', 'b.pdf', '-o', 'merged.pdf'])
+
+        assert result.exit_code == 0
+        assert (tmp_path / 'merged.pdf').exists()
+
+    def test_prompt_reads_forwarded_stdin(self, daemon_socket, pdf_factory, tmp_path):
+        """Şifre sorusu istemcinin stdin'inden yanıtlanmalı"""
+        source = pdf_factory('doc.pdf')
+        encrypted = tmp_path / 'secure.pdf'
+        runner = CliRunner()
+        runner.invoke(cli, ['encrypt', str(source), '-o', str(encrypted), '-p', 'pw',
+                            '--owner-password', 'owner'])
+
+        local, remote = invoke_both(daemon_socket, [
+            'decrypt', str(encrypted), '-o', str(tmp_path / 'plain.pdf')
+        ], input='pw\n')
+
+        assert local.exit_code == remote.exit_code == 0
+        # CliRunner yerel soruyu stdout'a yazar; daemon getpass gibi stderr'e yazar
+        assert 'Password: ' in remote.stderr
+        assert remote.stdout.splitlines()[-1] == local.stdout.splitlines()[-1]
+
+    def test_environment_restored_between_requests(self, daemon_socket, pdf_factory):
+        """--engine gibi ortam değişiklikleri sonraki isteğe taşınmamalı"""
+        pytest.importorskip('PyPDF2')
+        source = pdf_factory('doc.pdf')
+        runner = CliRunner()
+
+        first = runner.invoke(cli, ['--connect', daemon_socket, '--engine', 'PyPDF2',
+                                    '--no-cache', 'info', str(source)])
+        second = runner.invoke(cli, ['--connect', daemon_socket, '--no-cache',
+                                     'info', str(source)])
+
+        assert first.exit_code == second.exit_code == 0
+        assert 'PYPDF_ENGINE' not in os.environ
+
+    def test_missing_daemon_runs_locally(self, pdf_factory, tmp_path):
+        """Daemon yoksa komut yerelde çalışmalı"""
+        source = pdf_factory('doc.pdf')
+        socket_path = str(tmp_path / 'none.sock')
+
+        assert forward_command(socket_path, ['info', str(source)], stdin='') is None
+        result = CliRunner().invoke(cli, ['--connect', socket_path, '--no-cache',
+                                          'info', str(source)])
+        assert result.exit_code == 0
+
+    def test_output_streamed_in_chunks(self, daemon_socket, pdf_factory, tmp_path):
+        """Sayfa sayfa boşaltılan çıktı tek yanıt yerine parçalar halinde gelmeli"""
+        source = pdf_factory('doc.pdf', pages=5, title='Doc')
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(daemon_socket)
+            send_message(sock, {'argv': ['extract-text', str(source), '-f', 'ndjson'],
+                                'cwd': str(tmp_path), 'stdin': '', 'env': {}})
+            frames = []
+            while not frames or frames[-1][0] != MESSAGE:
+                frames.append(recv_frame(sock))
+
+        chunks = [data for kind, data in frames if kind == STDOUT]
+        assert len(chunks) >= 5
+        lines = b''.join(chunks).decode('utf-8').splitlines()
+        assert [json.loads(line)['page'] for line in lines] == [1, 2, 3, 4, 5]
+        assert json.loads(frames[-1][1]) == {'exit_code': 0}
+
+    def test_slow_piped_stdin_read_to_eof(self, monkeypatch):
+        """Borudan geç gelen stdin verisi kesilmeden okunmalı"""
+        read_fd, write_fd = os.pipe()
+
+        def writer():
+            with os.fdopen(write_fd, 'w') as stream:
+                stream.write('ilk\n')
+                stream.flush()
+                time.sleep(0.2)
+                stream.write('son\n')
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        with os.fdopen(read_fd, 'r') as stream:
+            monkeypatch.setattr(sys, 'stdin', stream)
+            assert read_stdin() == 'ilk\nson\n'
+        thread.join()
+
+    def test_socket_in_use(self, daemon_socket):
+        """Çalışan daemon'un soketi devralınmamalı"""
+        with pytest.raises(OSError):
+            PDFDaemon(daemon_socket, workers=1)
+
+
+@pytest.mark.slow
+class TestDaemonBenchmark:
+    """Tek seferlik CLI ile daemon modu gecikme karşılaştırması"""
+
+    @pytest.mark.parametrize('mode', ['one-shot', 'daemon', 'daemon-in-process'])
+    def test_info_latency(self, benchmark, daemon_socket, pdf_factory, mode):
+        """`pypdf info` çağrısı başına gecikme"""
+        source = str(pdf_factory('doc.pdf', pages=20, title='Doc'))
+        args = ['--no-cache', 'info', source]
+        env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+        benchmark.group = 'cli-latency-info'
+
+        if mode == 'daemon-in-process':
+            # Yorumlayıcı başlatma hariç istemci-daemon gidiş dönüşü
+            def run():
+                return forward_command(daemon_socket, args, stdin='')
+        else:
+            prefix = ['--connect', daemon_socket] if mode == 'daemon' else []
+
+            def run():
+                return subprocess.run(
+                    [sys.executable, '-c', CLI_ENTRY, *prefix, *args],
+                    stdin=subprocess.DEVNULL, capture_output=True, env=env
+                ).returncode
+
+        assert benchmark.pedantic(run, rounds=20, iterations=1) == 0
@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools Şifreleme Test Modülü
+AES-256 şifreleme, şifre çözme ve toplu şifreleme testleri
+"""
+
+import csv
+import shutil
+from contextlib import contextmanager
+
+import pytest
+from click.testing import CliRunner
+from pypdf import PdfReader
+from pypdf._encryption import AlgV5, PasswordType
+
+from pypdf_tools.core import encryption as encryption_module
+from pypdf_tools.core.encryption import (
+    AES256Encryption, _hash_r6, decrypt_document, encrypt_batch,
+    encrypt_document, read_manifest
+)
+from pypdf_tools.core.metadata import read_pdf_metadata
+from pypdf_tools.cli.cli_handler import cli
+
+
+def write_manifest(path, rows):
+    """Toplu şifreleme için CSV listesi yaz"""
+    with open(path, 'w', newline='', encoding='utf-8') as stream:
+        writer = csv.writer(stream)
+        writer.writerow(['input', 'output', 'password', 'permissions'])
+        writer.writerows(rows)
+    return path
+
+
+class TestEncryptDocument:
+    """encrypt_document / decrypt_document testleri"""
+
+    def test_round_trip(self, pdf_factory, tmp_path):
+        """Şifrelenen belge doğru şifreyle okunabilmeli ve çözülebilmeli"""
+        source = pdf_factory('doc.pdf', pages=4, title='Statement', with_outline=True)
+        encrypted = tmp_path / 'encrypted.pdf'
+        decrypted = tmp_path / 'decrypted.pdf'
+
+        stats = encrypt_document(source, encrypted, 'user-pw', 'owner-pw', ['print'])
+        assert stats['pages'] == 4
+
+        raw = encrypted.read_bytes()
+        assert b'Statement page' not in raw
+        assert b'/AESV3' in raw
+
+        reader = PdfReader(str(encrypted))
+        assert reader.is_encrypted
+        assert reader.decrypt('user-pw') == PasswordType.USER_PASSWORD
+        assert 'Statement page 3' in reader.pages[2].extract_text()
+        assert reader.metadata.title == 'Statement'
+        assert len(reader.outline) == 4
+
+        owner_reader = PdfReader(str(encrypted))
+        assert owner_reader.decrypt('owner-pw') == PasswordType.OWNER_PASSWORD
+
+        decrypt_document(encrypted, decrypted, 'user-pw')
+        plain = PdfReader(str(decrypted))
+        assert not plain.is_encrypted
+        assert 'Statement page 1' in plain.pages[0].extract_text()
+
+    def test_reader_cache_bounded(self, pdf_factory, tmp_path, monkeypatch):
+        """Kopyalanan sayfaların çözümlenmiş nesneleri bellekte birikmemeli"""
+        source = pdf_factory('doc.pdf', pages=60)
+        encrypted = tmp_path / 'encrypted.pdf'
+        readers, sizes = [], []
+        open_document = encryption_module.open_document
+
+        @contextmanager
+        def tracking_open(*args, **kwargs):
+            with open_document(*args, **kwargs) as reader:
+                readers.append(reader)
+                yield reader
+
+        def progress(done, total):
+            sizes.append(len(readers[-1].resolved_objects))
+
+        monkeypatch.setattr(encryption_module, 'open_document', tracking_open)
+        encrypt_document(source, encrypted, 'user-pw', progress=progress)
+        decrypt_document(encrypted, tmp_path / 'decrypted.pdf', 'user-pw', progress=progress)
+
+        assert len(sizes) == 120
+        assert max(sizes) < 10
+
+    def test_permissions_reported(self, pdf_factory, tmp_path):
+        """İzinler ve algoritma metadata okuyucusunda görünmeli"""
+        encrypted = tmp_path / 'encrypted.pdf'
+        encrypt_document(pdf_factory('doc.pdf'), encrypted, '', 'owner',
+                         ['print', 'copy'])
+
+        info = read_pdf_metadata(encrypted)
+
+        assert info['encryption']['algorithm'] == 'AES-256'
+        assert info['encryption']['revision'] == 6
+        assert info['decrypted'] is True
+        assert set(info['permissions']) == {'print', 'copy'}
+
+    def test_wrong_password(self, pdf_factory, tmp_path):
+        """Yanlış şifre PermissionError, şifresiz belge ValueError vermeli"""
+        source = pdf_factory('doc.pdf')
+        encrypted = tmp_path / 'encrypted.pdf'
+        encrypt_document(source, encrypted, 'secret')
+
+        with pytest.raises(PermissionError):
+            decrypt_document(encrypted, tmp_path / 'out.pdf', 'wrong')
+        with pytest.raises(ValueError):
+            decrypt_document(source, tmp_path / 'out.pdf', '')
+
+    def test_key_derivation(self):
+        """Parola özeti ISO 32000-2 algoritma 2.B ile aynı olmalı, her belge yeni anahtar almalı"""
+        salt, user_key = b'12345678', b'u' * 48
+        assert _hash_r6(b'parola', salt, user_key) == \
+            AlgV5.calculate_hash(6, b'parola', salt, user_key)
+
+        first = AES256Encryption('pw', 'owner', ('print',))
+        second = AES256Encryption('pw', 'owner', ('print',))
+        assert first.file_key != second.file_key
+        assert first.u[32:] != second.u[32:] and first.o[32:] != second.o[32:]
+
+
+class TestEncryptBatch:
+    """Toplu şifreleme testleri"""
+
+    def test_batch_reports_errors_inline(self, pdf_factory, tmp_path):
+        """Hatalı satırlar diğerlerini durdurmamalı"""
+        source = pdf_factory('doc.pdf', pages=2)
+        for index in range(3):
+            shutil.copy(source, tmp_path / f'statement{index}.pdf')
+        manifest = write_manifest(tmp_path / 'manifest.csv', [
+            ['statement0.pdf', 'out/s0.pdf', 'pw0', 'print'],
+            ['statement1.pdf', '', '', ''],
+            ['missing.pdf', 'out/missing.pdf', 'pw', ''],
+            ['statement2.pdf', 'out/s2.pdf', '', 'copy;print'],
+        ])
+        (tmp_path / 'out').mkdir()
+
+        results = list(encrypt_batch(read_manifest(manifest), jobs=2, password='default'))
+
+        by_line = {item['line']: item for item in results}
+        assert len(results) == 4
+        assert by_line[4]['success'] is False
+        assert all(by_line[line]['success'] for line in (2, 3, 5))
+
+        reader = PdfReader(str(tmp_path / 'out' / 's2.pdf'))
+        assert reader.decrypt('default')
+        assert PdfReader(str(tmp_path / 'statement1_encrypted.pdf')).decrypt('default')
+
+    def test_batch_command(self, pdf_factory, tmp_path):
+        """--batch seçeneği özet yazmalı, hata varsa 1 ile çıkmalı"""
+        source = pdf_factory('doc.pdf')
+        shutil.copy(source, tmp_path / 'a.pdf')
+        manifest = write_manifest(tmp_path / 'manifest.csv', [
+            ['a.pdf', 'a_secure.pdf', 'pw', ''],
+            ['missing.pdf', '', 'pw', ''],
+        ])
+
+        result = CliRunner().invoke(cli, ['encrypt', '--batch', str(manifest),
+                                          '--jobs', '1'])
+
+        assert result.exit_code == 1
+        assert '1 dosya şifrelendi, 1 hata' in result.stdout
+        assert 'missing.pdf' in result.stderr
+        assert (tmp_path / 'a_secure.pdf').exists()
+
+
+class TestEncryptCommands:
+    """encrypt / decrypt komut testleri"""
+
+    def test_encrypt_then_decrypt(self, pdf_factory, tmp_path):
+        """Komut satırından şifreleme ve şifre kaldırma"""
+        source = pdf_factory('doc.pdf', pages=2)
+        encrypted = tmp_path / 'secure.pdf'
+        decrypted = tmp_path / 'plain.pdf'
+        runner = CliRunner()
+
+        result = runner.invoke(cli, ['encrypt', str(source), '-o', str(encrypted),
+                                     '-p', 'pw', '--owner-password', 'owner',
+                                     '--permissions', 'print'])
+        assert result.exit_code == 0
+
+        wrong = runner.invoke(cli, ['decrypt', str(encrypted), '-o', str(decrypted),
+                                    '-p', 'nope'])
+        assert wrong.exit_code == 1
+
+        result = runner.invoke(cli, ['decrypt', str(encrypted), '-o', str(decrypted),
+                                     '-p', 'pw'])
+        assert result.exit_code == 0
+        assert not PdfReader(str(decrypted)).is_encrypted
+
+    def test_prompts_for_password(self, pdf_factory, tmp_path):
+        """Şifre verilmezse sorulmalı"""
+        source = pdf_factory('doc.pdf')
+        encrypted = tmp_path / 'secure.pdf'
+
+        result = CliRunner().invoke(cli, ['encrypt', str(source), '-o', str(encrypted)],
+                                    input='pw\nowner\n')
+
+        assert result.exit_code == 0
+        assert PdfReader(str(encrypted)).decrypt('pw') == PasswordType.USER_PASSWORD
+
+
+@pytest.mark.slow
+class TestEncryptBatchBenchmark:
+    """500 belgelik toplu şifrelemede işçi sayısı karşılaştırması"""
+
+    @pytest.mark.parametrize('jobs', [1, 2, 4, 8])
+    def test_batch_workers(self, benchmark, pdf_factory, tmp_path, jobs):
+        """1/2/4/8 işçi ile 500 ekstrenin şifrelenme süresi"""
+        source = pdf_factory('statement.pdf', pages=3, title='Statement')
+        rows = []
+        for index in range(500):
+            shutil.copy(source, tmp_path / f'statement{index}.pdf')
+            rows.append([f'statement{index}.pdf', f'out/s{index}.pdf', 'pw', 'print'])
+        manifest = write_manifest(tmp_path / 'manifest.csv', rows)
+        (tmp_path / 'out').mkdir()
+        benchmark.group = 'encrypt-batch-500'
+
+        def run():
+            return list(encrypt_batch(read_manifest(manifest), jobs=jobs))
+
+        results = benchmark.pedantic(run, rounds=2, iterations=1)
+        assert all(item['success'] for item in results)
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools PDF Motoru Test Modülü
+Motor kaydı, çalışma zamanında seçim ve --engine seçeneği testleri
+"""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from pypdf_tools.core import engines
+from pypdf_tools.core.engines import available_engines, get_engine, register_engine
+from pypdf_tools.core.metadata import read_pdf_metadata
+from pypdf_tools.core.reader import open_document
+from pypdf_tools.core.text import TEXT_FORMATS
+from pypdf_tools.cli import cli_handler
+from pypdf_tools.cli.cli_handler import cli
+
+
+@pytest.fixture
+def engine_registry(monkeypatch):
+    """Testte yapılan kayıtları geri al"""
+    monkeypatch.setattr(engines, '_ENGINES', dict(engines._ENGINES))
+    # --engine seçeneği ortam değişkenini ayarlar; testten sonra kaldırılır
+    monkeypatch.setenv('PYPDF_ENGINE', '')
+    monkeypatch.delenv('PYPDF_ENGINE')
+
+
+class TestEngineRegistry:
+    """Motor kaydı ve seçimi testleri"""
+
+    def test_default_is_first_installed(self, engine_registry):
+        """Varsayılan motor kayıt sırasındaki ilk kurulu motor olmalı"""
+        assert available_engines()[0] == 'pypdf'
+        assert get_engine().name == 'pypdf'
+
+    def test_environment_selects_engine(self, engine_registry, monkeypatch):
+        """PYPDF_ENGINE ortam değişkeni motoru seçmeli"""
+        pytest.importorskip('PyPDF2')
+        monkeypatch.setenv('PYPDF_ENGINE', 'PyPDF2')
+
+        assert get_engine().name == 'PyPDF2'
+        assert get_engine('pypdf').name == 'pypdf'
+
+    def test_unknown_and_missing_engines(self, engine_registry):
+        """Bilinmeyen motor ValueError, kurulu olmayan ImportError vermeli"""
+        register_engine('ghost', 'pypdf_tools_missing_engine')
+
+        with pytest.raises(ValueError):
+            get_engine('nope')
+        with pytest.raises(ImportError):
+            get_engine('ghost')
+        assert 'ghost' not in available_engines()
+
+    def test_registered_engine_used_by_reader(self, engine_registry, pdf_factory):
+        """Kaydedilen motor okuyucu ve metadata tarafından kullanılmalı"""
+        engine = register_engine('alias', 'pypdf')
+        source = pdf_factory('doc.pdf', pages=3, title='Doc')
+
+        with open_document(source, engine='alias') as reader:
+            assert isinstance(reader, engine.PdfReader)
+        assert read_pdf_metadata(source, engine='alias')['pages'] == 3
+
+
+class TestEngineOption:
+    """--engine seçeneği testleri"""
+
+    def test_info_with_pypdf2(self, engine_registry, pdf_factory):
+        """PyPDF2 motoruyla okunan bilgi pypdf ile aynı olmalı"""
+        pytest.importorskip('PyPDF2')
+        source = pdf_factory('doc.pdf', pages=4, title='Doc')
+        runner = CliRunner()
+
+        default = runner.invoke(cli, ['--no-cache', 'info', str(source)])
+        legacy = runner.invoke(cli, ['--no-cache', '--engine', 'PyPDF2',
+                                     'info', str(source)])
+
+        assert legacy.exit_code == 0
+        assert json.loads(legacy.stdout) == json.loads(default.stdout)
+
+    def test_text_formats_in_sync(self):
+        """CLI format seçenekleri core.text ile aynı olmalı"""
+        assert cli_handler.TEXT_FORMATS == TEXT_FORMATS
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools İçe Aktarma Süresi Test Modülü
+Paketin ve CLI'nin Qt yüklemeden, bütçe içinde içe aktarılması testleri
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+
+# Soğuk başlangıçta `import pypdf_tools` için kümülatif süre bütçesi
+IMPORT_BUDGET_US = 150_000
+
+# `pypdf --version` için süreç başlatma dahil duvar saati bütçesi
+CLI_START_BUDGET_S = 0.5
+
+# `pypdf` konsol betiğinin yaptığı çağrı
+CLI_ENTRY = 'from pypdf_tools.cli.cli_handler import cli_main; cli_main()'
+
+PDF_LIBRARIES = ('pypdf', 'PyPDF2', 'reportlab')
+
+
+def run_python(*args):
+    """Test ortamının modül yoluyla yeni bir Python süreci çalıştır"""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    return subprocess.run([sys.executable, *args], capture_output=True, text=True,
+                          env=env, check=True)
+
+
+def import_times(statement, *args):
+    """
+    `python -X importtime` ile ifadeyi yeni bir süreçte çalıştır
+
+    Modül adından kümülatif süreye (mikrosaniye) sözlük döndürür.
+    """
+    result = run_python('-X', 'importtime', '-c', statement, *args)
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _self, cumulative, name = line[len('import time:'):].split('|')
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+class TestLazyPackage:
+    """Paket düzeyinde tembel yükleme testleri"""
+
+    def test_package_import_skips_qt(self):
+        """`import pypdf_tools` Qt ve CLI modüllerini yüklememeli"""
+        times = import_times('import pypdf_tools')
+
+        assert 'pypdf_tools' in times
+        assert not [name for name in times if name.startswith('PyQt6')]
+        assert 'pypdf_tools.main' not in times
+        assert 'pypdf_tools.cli.cli_handler' not in times
+
+    def test_cli_import_skips_qt(self):
+        """CLI yalnızca kullandığı modülleri yüklemeli"""
+        times = import_times('import pypdf_tools.cli.cli_handler')
+
+        assert 'pypdf_tools.cli.cli_handler' in times
+        assert not [name for name in times if name.startswith('PyQt6')]
+
+    @pytest.mark.parametrize('args', [['--version'], ['--help'], ['merge', '--help']])
+    def test_cli_skips_pdf_libraries(self, args):
+        """Yardım ve sürüm çıktısı PDF kütüphanelerini yüklememeli"""
+        times = import_times(CLI_ENTRY, *args)
+
+        assert not [name for name in times if name.split('.')[0] in PDF_LIBRARIES]
+
+    def test_command_loads_engine(self, pdf_factory):
+        """PDF okuyan komut seçilen motoru yüklemeli"""
+        source = pdf_factory('doc.pdf')
+
+        times = import_times(CLI_ENTRY, '--no-cache', 'info', str(source))
+
+        loaded = {name.split('.')[0] for name in times}
+        assert 'pypdf' in loaded
+        assert 'PyPDF2' not in loaded and 'reportlab' not in loaded
+
+    def test_lazy_attribute_resolved(self):
+        """Tembel öznitelik ilk erişimde yüklenip önbelleklenmeli"""
+        import pypdf_tools
+
+        assert 'MainWindow' in dir(pypdf_tools)
+        assert 'PDFJSBridge' in pypdf_tools.__all__
+        with pytest.raises(AttributeError):
+            pypdf_tools.missing_attribute
+
+
+class TestImportTimeBudget:
+    """Soğuk içe aktarma süresi regresyon testi"""
+
+    def test_package_import_budget(self):
+        """`import pypdf_tools` bütçeyi aşmamalı (en iyi 5 ölçüm)"""
+        best = min(import_times('import pypdf_tools')['pypdf_tools'] for _ in range(5))
+
+        assert best < IMPORT_BUDGET_US, f'{best / 1000:.1f} ms'
+
+    def test_cli_version_budget(self):
+        """`pypdf --version` soğuk başlangıcı bütçeyi aşmamalı (en iyi 5 ölçüm)"""
+        durations = []
+        for _ in range(5):
+            started = time.perf_counter()
+            result = run_python('-c', CLI_ENTRY, '--version')
+            durations.append(time.perf_counter() - started)
+            assert 'version' in result.stdout
+
+        assert min(durations) < CLI_START_BUDGET_S, f'{min(durations) * 1000:.0f} ms'
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools Arka Plan İşleri Test Modülü
+QThreadPool iş kuyruğu, ilerleme/sonuç sinyalleri ve iptal testleri
+"""
+
+import json
+import threading
+import time
+
+import pytest
+from pypdf import PdfReader
+from PyQt6.QtCore import QCoreApplication
+
+from pypdf_tools.core.merge import merge_documents
+from pypdf_tools.features.jobs import (
+    JOB_CANCELLED, JOB_DONE, JOB_FAILED, JobManager, extract_text_job, merge_job
+)
+
+
+@pytest.fixture(scope='module')
+def app():
+    """Kuyruklu sinyaller için Qt olay döngüsü"""
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+class JobSpy:
+    """Yöneticinin sinyallerini toplayan yardımcı"""
+
+    def __init__(self, manager: JobManager):
+        self.progress = []
+        self.finished = {}
+        manager.jobProgress.connect(lambda message: self.progress.append(json.loads(message)))
+        manager.jobFinished.connect(self._on_finished)
+
+    def _on_finished(self, message: str) -> None:
+        data = json.loads(message)
+        self.finished[data['jobId']] = data
+
+    def wait(self, *job_ids: str, timeout: float = 10.0) -> None:
+        """İşlerin sonuç sinyali gelene kadar olay döngüsünü çalıştır"""
+        deadline = time.monotonic() + timeout
+        while not all(job_id in self.finished for job_id in job_ids):
+            assert time.monotonic() < deadline, "İş zamanında bitmedi"
+            QCoreApplication.processEvents()
+            time.sleep(0.005)
+
+
+@pytest.fixture
+def manager(app):
+    """İki eşzamanlı işe izin veren yönetici"""
+    manager = JobManager(max_jobs=2)
+    yield manager
+    manager.cancel_all()
+    manager.wait()
+
+
+class TestJobQueue:
+    """İş kuyruğu davranış testleri"""
+
+    def test_job_runs_off_gui_thread(self, manager):
+        """submit hemen dönmeli, iş başka iş parçacığında çalışmalı"""
+        spy = JobSpy(manager)
+        release = threading.Event()
+        threads = []
+
+        def work(context, data):
+            threads.append(threading.get_ident())
+            release.wait(5)
+            for done in range(1, 4):
+                context.progress(done, 3)
+            return {'value': data['value'] * 2}
+
+        job_id = manager.submit('double', work, {'value': 21})
+        # İş GUI iş parçacığını bloklamadı; hâlâ çalışıyor
+        assert job_id not in spy.finished
+        release.set()
+        spy.wait(job_id)
+
+        assert threads and threads[0] != threading.get_ident()
+        assert spy.finished[job_id] == {'jobId': job_id, 'toolId': 'double',
+                                        'status': JOB_DONE, 'success': True,
+                                        'result': {'value': 42}}
+        # Son ilerleme her zaman bildirilir
+        assert spy.progress[-1]['done'] == 3 and spy.progress[-1]['percent'] == 100.0
+        assert manager.active_jobs() == []
+
+    def test_concurrency_is_bounded(self, manager):
+        """Aynı anda en fazla max_jobs iş çalışmalı"""
+        spy = JobSpy(manager)
+        lock = threading.Lock()
+        running = [0]
+        peak = [0]
+
+        def work(context, data):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.05)
+            with lock:
+                running[0] -= 1
+
+        job_ids = [manager.submit('sleep', work, {}) for _ in range(6)]
+        spy.wait(*job_ids)
+
+        assert manager.max_jobs == 2
+        assert peak[0] == 2
+        assert all(spy.finished[job_id]['success'] for job_id in job_ids)
+
+    def test_cancel_queued_job(self, app):
+        """Sıradaki iş hiç çalışmadan iptal edilmeli"""
+        manager = JobManager(max_jobs=1)
+        spy = JobSpy(manager)
+        release = threading.Event()
+        called = []
+
+        first = manager.submit('block', lambda context, data: release.wait(5), {})
+        second = manager.submit('never', lambda context, data: called.append(True), {})
+
+        assert manager.cancel(second) is True
+        release.set()
+        spy.wait(first, second)
+
+        assert spy.finished[second]['status'] == JOB_CANCELLED
+        assert spy.finished[first]['status'] == JOB_DONE
+        assert called == []
+        assert manager.cancel(second) is False
+
+    def test_cancel_running_job(self, manager):
+        """Çalışan iş bir sonraki ilerleme bildiriminde durmalı"""
+        spy = JobSpy(manager)
+        started = threading.Event()
+
+        def work(context, data):
+            started.set()
+            for done in range(10_000):
+                context.progress(done, 10_000)
+                time.sleep(0.001)
+
+        job_id = manager.submit('long', work, {})
+        assert started.wait(5)
+        manager.cancel(job_id)
+        spy.wait(job_id)
+
+        assert spy.finished[job_id]['status'] == JOB_CANCELLED
+        assert spy.finished[job_id]['success'] is False
+
+    def test_failed_job(self, manager):
+        """Hata veren iş 'failed' durumuyla bildirilmeli"""
+        spy = JobSpy(manager)
+
+        def work(context, data):
+            raise ValueError('bozuk belge')
+
+        job_id = manager.submit('broken', work, {})
+        spy.wait(job_id)
+
+        assert spy.finished[job_id]['status'] == JOB_FAILED
+        assert spy.finished[job_id]['error'] == 'bozuk belge'
+
+
+class TestToolJobs:
+    """Araç iş fonksiyonları testleri"""
+
+    def test_merge_job_progress(self, manager, pdf_factory, tmp_path):
+        """Birleştirme sayfa bazında ilerleme bildirmeli"""
+        spy = JobSpy(manager)
+        first = pdf_factory('a.pdf', pages=3)
+        second = pdf_factory('b.pdf', pages=2)
+        output = tmp_path / 'merged.pdf'
+
+        job_id = manager.submit('merge', merge_job, {
+            'file': str(first), 'files': [str(second)], 'output': str(output)
+        })
+        spy.wait(job_id)
+
+        assert spy.finished[job_id]['success'], spy.finished[job_id].get('error')
+        assert spy.finished[job_id]['result']['total_pages'] == 5
+        assert spy.progress[-1]['done'] == spy.progress[-1]['total'] == 5
+        assert len(PdfReader(str(output)).pages) == 5
+
+    def test_cancelled_merge_removes_output(self, pdf_factory, tmp_path):
+        """İptal edilen birleştirme yarım dosya bırakmamalı"""
+        first = pdf_factory('a.pdf', pages=4)
+        second = pdf_factory('b.pdf', pages=4)
+        output = tmp_path / 'merged.pdf'
+        calls = []
+
+        def progress(done, total):
+            calls.append((done, total))
+            if done == 2:
+                raise RuntimeError('iptal')
+
+        with pytest.raises(RuntimeError):
+            merge_documents([first, second], output, progress=progress)
+
+        assert calls == [(1, 8), (2, 8)]
+        assert not output.exists()
+
+    def test_extract_job_returns_text(self, manager, pdf_factory):
+        """Çıktı verilmezse metin sonuçta dönmeli"""
+        spy = JobSpy(manager)
+        source = pdf_factory('doc.pdf', pages=3, title='Doc')
+
+        job_id = manager.submit('extract', extract_text_job,
+                                {'file': str(source), 'pages': '2-3', 'format': 'ndjson'})
+        spy.wait(job_id)
+
+        result = spy.finished[job_id]['result']
+        assert result['pages_processed'] == 2
+        assert [json.loads(line)['page'] for line in result['text'].splitlines()] == [2, 3]
+
+    def test_missing_parameter(self, manager):
+        """Eksik parametre anlaşılır hata vermeli"""
+        spy = JobSpy(manager)
+
+        job_id = manager.submit('merge', merge_job, {'files': ['a.pdf', 'b.pdf']})
+        spy.wait(job_id)
+
+        assert spy.finished[job_id]['error'] == 'Eksik parametre: output'
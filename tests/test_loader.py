@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools Belge Açıcı Test Modülü
+Arka planda açılış aşamaları, eski isteklerin iptali ve belge bırakma testleri
+"""
+
+import time
+
+import pytest
+from PyQt6.QtCore import QCoreApplication
+from PyQt6.QtGui import QGuiApplication
+
+from pypdf_tools.core.cache import DocumentCache
+from pypdf_tools.core.metadata import read_pdf_metadata
+from pypdf_tools.features.loader import FIRST_PAGE_TILES, DocumentLoader, read_outline
+from pypdf_tools.features.render import TileRenderer
+
+
+@pytest.fixture(scope='module')
+def app():
+    """QtPdf ve kuyruklu sinyaller için Qt uygulaması"""
+    return QCoreApplication.instance() or QGuiApplication([])
+
+
+@pytest.fixture
+def loader(app, tmp_path):
+    renderer = TileRenderer(DocumentCache(tmp_path / 'cache', shared=True))
+    loader = DocumentLoader(renderer)
+    yield loader
+    loader.cancel()
+    loader.wait()
+    renderer.close()
+
+
+class LoadSpy:
+    """Yükleyicinin aşama sinyallerini (aşama, istek, veri) olarak toplayan yardımcı"""
+
+    STAGES = ('headerParsed', 'pageCountKnown', 'firstPageReady',
+              'outlineReady', 'loadFinished', 'loadFailed')
+
+    def __init__(self, loader: DocumentLoader):
+        self.events = []
+        for stage in self.STAGES:
+            getattr(loader, stage).connect(
+                lambda request, *payload, stage=stage:
+                    self.events.append((stage, request, *payload)))
+
+    def wait(self, request: int, timeout: float = 10.0) -> dict:
+        """İstek bitene kadar olay döngüsünü çalıştır; aşama -> veri döndür"""
+        deadline = time.monotonic() + timeout
+        while not self.stages(request).keys() & {'loadFinished', 'loadFailed'}:
+            assert time.monotonic() < deadline, "Belge zamanında açılmadı"
+            QCoreApplication.processEvents()
+            time.sleep(0.005)
+        return self.stages(request)
+
+    def stages(self, request: int) -> dict:
+        return {event[0]: event[2:] for event in self.events if event[1] == request}
+
+    def order(self, request: int) -> list:
+        return [event[0] for event in self.events if event[1] == request]
+
+
+class TestDocumentLoader:
+    """Aşamalı açılış testleri"""
+
+    def test_stages_in_order(self, loader, pdf_factory):
+        """Aşamalar sırayla ve beklenen verilerle gelmeli"""
+        spy = LoadSpy(loader)
+        source = pdf_factory('doc.pdf', pages=3, title='Rapor', with_outline=True)
+
+        stages = spy.wait(loader.load(source))
+        assert spy.order(1) == ['headerParsed', 'pageCountKnown', 'firstPageReady',
+                                'outlineReady', 'loadFinished']
+
+        [info] = stages['headerParsed']
+        assert (info['fileName'], info['totalPages'], info['encrypted']) == ('doc.pdf', 3, False)
+        assert info['metadata']['title'] == 'Rapor'
+
+        [document] = stages['pageCountKnown']
+        assert len(document['pages']) == 3
+        assert stages['firstPageReady'] == (document['digest'],)
+        assert stages['outlineReady'] == ([
+            {'title': f'Rapor {page}', 'page': page, 'level': 0} for page in (1, 2, 3)
+        ],)
+
+    def test_first_page_tiles_cached(self, loader, pdf_factory):
+        """İlk sayfanın üst karoları açılışta işlenmiş olmalı"""
+        spy = LoadSpy(loader)
+        stages = spy.wait(loader.load(pdf_factory('doc.pdf', pages=2), zoom=200))
+        [digest] = stages['firstPageReady']
+
+        # %200: 1587x2245 piksel, 4x5 karonun ilk üç satırı
+        assert loader.renderer.renders == FIRST_PAGE_TILES == 12
+        loader.renderer.tile(digest, 1, 200, 0, 3, 2)
+        assert loader.renderer.stats()['memory_hits'] == 1
+        loader.renderer.tile(digest, 1, 200, 0, 0, 3)
+        assert loader.renderer.renders == 13
+
+    def test_failed_load(self, loader, tmp_path):
+        spy = LoadSpy(loader)
+        broken = tmp_path / 'broken.pdf'
+        broken.write_bytes(b'not a pdf')
+
+        stages = spy.wait(loader.load(broken))
+        assert list(stages) == ['loadFailed']
+        assert 'PDF yükleme hatası' in stages['loadFailed'][0]
+
+    def test_read_outline_without_bookmarks(self, pdf_factory):
+        assert read_outline(pdf_factory('doc.pdf', pages=2)) == []
+
+
+class TestStaleRequests:
+    """Yeni isteğin eskisini iptal etmesi"""
+
+    def test_new_request_cancels_previous(self, loader, pdf_factory, large_pdf_factory):
+        """Eski istek bitmemeli; açtığı belge kapatılmalı"""
+        spy = LoadSpy(loader)
+        stale = loader.load(large_pdf_factory(200, text='Lorem ipsum', lines=40))
+        current = loader.load(pdf_factory('doc.pdf', pages=2))
+
+        stages = spy.wait(current)
+        assert loader.wait(10000)
+        QCoreApplication.processEvents()
+
+        assert 'loadFinished' in stages
+        assert not {'firstPageReady', 'loadFinished'} & set(spy.order(stale))
+        [document] = stages['pageCountKnown']
+        assert list(loader.renderer._documents) == [document['digest']]
+
+    def test_release_keeps_displayed_document(self, loader, pdf_factory):
+        """Görüntülenen ve son açılan belge bırakılmamalı"""
+        spy = LoadSpy(loader)
+        [first] = spy.wait(loader.load(pdf_factory('a.pdf', pages=1)))['firstPageReady']
+        loader.keep(first)
+        [second] = spy.wait(loader.load(pdf_factory('b.pdf', pages=2)))['firstPageReady']
+
+        loader.release(first)
+        loader.release(second)
+        assert loader.wait(10000)
+        assert set(loader.renderer._documents) == {first, second}
+
+        loader.keep(second)
+        loader.release(first)
+        assert loader.wait(10000)
+        assert set(loader.renderer._documents) == {second}
+
+
+@pytest.mark.slow
+class TestLoaderBenchmark:
+    """Açılışın GUI iş parçacığını bloklama süresi: eski eşzamanlı yol ve yükleyici"""
+
+    @pytest.mark.parametrize('mode', ['sync', 'loader'])
+    def test_gui_blocked(self, benchmark, loader, large_pdf_factory, mode):
+        """200 sayfalık belgenin açılışı sırasında GUI iş parçacığında geçen süre"""
+        source = large_pdf_factory(200, text='Lorem ipsum', lines=40)
+        benchmark.group = 'load-gui-blocked'
+
+        def reset():
+            loader.wait()
+            for digest in list(loader.renderer._documents):
+                loader.renderer.close_document(digest)
+
+        def run():
+            if mode == 'sync':
+                read_pdf_metadata(source)
+                document = loader.renderer.open_document(source)
+                loader.renderer.tile(document['digest'], 1, 100, 0, 0, 0)
+                return document['digest']
+            return loader.load(source)
+
+        assert benchmark.pedantic(run, setup=reset, rounds=10, iterations=1)
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools Birleştirme Motoru Test Modülü
+Akışlı birleştirme ve kaynak tekilleştirme testleri
+"""
+
+import pytest
+from click.testing import CliRunner
+from pypdf import PdfReader, PdfWriter
+
+from pypdf_tools.core.merge import merge_documents
+from pypdf_tools.cli.cli_handler import cli, merge_pdfs
+
+
+class TestMergeDocuments:
+    """merge_documents fonksiyonu testleri"""
+
+    def test_pages_in_input_order(self, pdf_factory, tmp_path):
+        """Sayfalar girdi sırasıyla birleştirilmeli"""
+        first = pdf_factory('a.pdf', pages=3, title='A')
+        second = pdf_factory('b.pdf', pages=2, title='B')
+        output = tmp_path / 'merged.pdf'
+
+        stats = merge_documents([first, second], output)
+
+        reader = PdfReader(str(output))
+        assert stats['total_pages'] == 5
+        assert len(reader.pages) == 5
+        texts = [page.extract_text() for page in reader.pages]
+        assert 'A page 1' in texts[0]
+        assert 'B page 2' in texts[4]
+
+    def test_shared_resources_deduplicated(self, pdf_factory, tmp_path):
+        """Aynı görsel çıktıya bir kez yazılmalı"""
+        first = pdf_factory('a.pdf', pages=2, with_image=True)
+        second = pdf_factory('b.pdf', pages=2, with_image=True)
+        output = tmp_path / 'merged.pdf'
+
+        stats = merge_documents([first, second], output)
+
+        assert stats['deduplicated_objects'] > 0
+        reader = PdfReader(str(output))
+        images = {
+            page['/Resources']['/XObject'].raw_get(name).idnum
+            for page in reader.pages
+            for name in page['/Resources']['/XObject']
+        }
+        assert len(images) == 1
+
+    def test_keep_bookmarks(self, pdf_factory, tmp_path):
+        """Yer işaretleri yeni sayfa numaralarıyla korunmalı"""
+        first = pdf_factory('a.pdf', pages=2, title='A', with_outline=True)
+        second = pdf_factory('b.pdf', pages=2, title='B', with_outline=True)
+        output = tmp_path / 'merged.pdf'
+
+        merge_documents([first, second], output, keep_bookmarks=True)
+
+        reader = PdfReader(str(output))
+        outline = [(item.title, reader.get_destination_page_number(item))
+                   for item in reader.outline]
+        assert outline == [('A 1', 0), ('A 2', 1), ('B 1', 2), ('B 2', 3)]
+
+    def test_encrypted_input_requires_password(self, pdf_factory, tmp_path):
+        """Şifreli girdi şifresiz birleştirilmemeli"""
+        source = pdf_factory('plain.pdf', pages=1)
+        encrypted = tmp_path / 'secret.pdf'
+        writer = PdfWriter(clone_from=str(source))
+        writer.encrypt('secret')
+        writer.write(str(encrypted))
+
+        with pytest.raises(PermissionError):
+            merge_documents([source, encrypted], tmp_path / 'merged.pdf')
+        assert not (tmp_path / 'merged.pdf').exists()
+
+
+class TestMergeCommand:
+    """pypdf merge komutu testleri"""
+
+    def test_merge_pdfs_result(self, pdf_factory, tmp_path):
+        """merge_pdfs gerçek sayfa sayısını döndürmeli"""
+        first = pdf_factory('a.pdf', pages=4)
+        second = pdf_factory('b.pdf', pages=6)
+
+        result = merge_pdfs([str(first), str(second)], str(tmp_path / 'out.pdf'))
+
+        assert result['success'] is True
+        assert result['total_pages'] == 10
+        assert result['file_size'].endswith('KB')
+
+    def test_verbose_reports_rss_and_speed(self, pdf_factory, tmp_path):
+        """Ayrıntılı çıktıda tepe bellek ve hız raporlanmalı"""
+        first = pdf_factory('a.pdf', pages=2)
+        second = pdf_factory('b.pdf', pages=2)
+        output = tmp_path / 'out.pdf'
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ['--verbose', 'merge', str(first), str(second),
+                                     '-o', str(output)])
+
+        assert result.exit_code == 0
+        assert 'sayfa/sn' in result.output
+        assert 'Tepe bellek (RSS)' in result.output
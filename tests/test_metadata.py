@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools Metadata Okuyucu Test Modülü
+xref tabanlı metadata okuyucu testleri ve dosya boyutuna göre gecikme ölçümü
+"""
+
+import json
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+from pypdf import PdfWriter
+
+from pypdf_tools.core.metadata import read_pdf_metadata, parse_pdf_date
+from pypdf_tools.cli.cli_handler import cli
+
+
+class TestReadMetadata:
+    """read_pdf_metadata fonksiyonu testleri"""
+
+    def test_basic_fields(self, pdf_factory):
+        """Sayfa sayısı ve /Info alanları okunmalı"""
+        source = pdf_factory('doc.pdf', pages=7, title='Quarterly Report')
+
+        info = read_pdf_metadata(source)
+
+        assert info['pages'] == 7
+        assert info['title'] == 'Quarterly Report'
+        assert info['author'] == 'PyPDF-Tools Test'
+        assert info['encrypted'] is False
+        assert 'print' in info['permissions']
+        assert info['pdf_version'].startswith('1.')
+
+    def test_page_content_not_parsed(self, pdf_factory):
+        """Sayfa içerik stream'leri okunmamalı"""
+        source = pdf_factory('doc.pdf', pages=3)
+
+        with patch('pypdf._page.PageObject.get_contents') as get_contents, \
+                patch('pypdf._page.PageObject.extract_text') as extract_text:
+            read_pdf_metadata(source)
+
+        get_contents.assert_not_called()
+        extract_text.assert_not_called()
+
+    def test_encryption_and_permissions(self, pdf_factory, tmp_path):
+        """Şifreleme yöntemi ve izinler raporlanmalı"""
+        source = pdf_factory('plain.pdf', pages=2)
+        encrypted = tmp_path / 'secret.pdf'
+        writer = PdfWriter(clone_from=str(source))
+        writer.encrypt('', 'owner', permissions_flag=0b100 | 0b10000,
+                       algorithm='AES-256')
+        writer.write(str(encrypted))
+
+        info = read_pdf_metadata(encrypted)
+
+        assert info['encrypted'] is True
+        assert info['decrypted'] is True
+        assert info['pages'] == 2
+        assert info['encryption']['algorithm'] == 'AES-256'
+        assert 'print' in info['permissions']
+        assert 'copy' in info['permissions']
+        assert 'modify' not in info['permissions']
+
+    def test_wrong_password_reports_partial_info(self, pdf_factory, tmp_path):
+        """Şifre çözülemezse kısmi bilgi dönmeli"""
+        source = pdf_factory('plain.pdf', pages=2)
+        encrypted = tmp_path / 'secret.pdf'
+        writer = PdfWriter(clone_from=str(source))
+        writer.encrypt('user-secret', algorithm='AES-128')
+        writer.write(str(encrypted))
+
+        info = read_pdf_metadata(encrypted)
+
+        assert info['encrypted'] is True
+        assert info['decrypted'] is False
+        assert info['pages'] is None
+        assert info['encryption']['algorithm'] == 'AES-128'
+
+    def test_corrupt_page_tree(self, tmp_path):
+        """Tanımsız /Pages nesnesi hata fırlatmamalı, sayfa sayısı None kalmalı"""
+        writer = PdfWriter()
+        writer.add_blank_page(100, 100)
+        source = tmp_path / 'plain.pdf'
+        writer.write(str(source))
+
+        data = source.read_bytes()
+        assert b'/Pages 1 0 R' in data
+        corrupt = tmp_path / 'corrupt.pdf'
+        corrupt.write_bytes(data.replace(b'/Pages 1 0 R', b'/Pages 9 0 R'))
+
+        info = read_pdf_metadata(corrupt)
+
+        assert info['pages'] is None
+        assert info['filename'] == 'corrupt.pdf'
+
+    @pytest.mark.parametrize('value, expected', [
+        ("D:20240101120000+03'00'", '2024-01-01T12:00:00+03:00'),
+        ('D:20240315', '2024-03-15T00:00:00'),
+        ('D:20231231235959Z', '2023-12-31T23:59:59+00:00'),
+        ('not a date', None),
+    ])
+    def test_parse_pdf_date(self, value, expected):
+        """PDF tarihleri ISO 8601'e çevrilmeli"""
+        assert parse_pdf_date(value) == expected
+
+    def test_info_command(self, pdf_factory):
+        """info komutu gerçek metadata'yı göstermeli"""
+        source = pdf_factory('doc.pdf', pages=4, title='CLI Title')
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ['info', str(source)])
+
+        assert result.exit_code == 0
+        data = json.loads(result.output)
+        assert data['pages'] == 4
+        assert data['title'] == 'CLI Title'
+
+
+_SIZES = [100 * 1024, 10 * 1024 ** 2, 100 * 1024 ** 2]
+if os.environ.get('PYPDF_BENCH_HUGE'):
+    _SIZES.append(2 * 1024 ** 3)
+
+
+@pytest.mark.slow
+class TestMetadataLatency:
+    """100 KB - 2 GB arası dosyalarda dosya başına okuma gecikmesi"""
+
+    @pytest.fixture(scope='class', params=_SIZES, ids=lambda size: f'{size // 1024}KB')
+    def padded_pdf(self, request, padded_pdf_factory):
+        return padded_pdf_factory(request.param)
+
+    def test_latency(self, benchmark, padded_pdf):
+        """Gecikme dosya boyutundan bağımsız kalmalı"""
+        benchmark.group = 'metadata-latency'
+        info = benchmark(read_pdf_metadata, padded_pdf)
+
+        assert info['pages'] == 1
+        assert info['title'] == 'Padded'
+
+    def test_latency_independent_of_size(self, padded_pdf_factory):
+        """En büyük dosya en küçüğünden kat kat yavaş okunmamalı (en iyi 5 ölçüm)"""
+        def best(path):
+            durations = []
+            for _ in range(5):
+                started = time.perf_counter()
+                read_pdf_metadata(path)
+                durations.append(time.perf_counter() - started)
+            return min(durations)
+
+        small = best(padded_pdf_factory(_SIZES[0]))
+        large = best(padded_pdf_factory(_SIZES[-1]))
+
+        assert large < small * 5, f'{small * 1000:.1f} ms / {large * 1000:.1f} ms'
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools Sayfa Aralığı Test Modülü
+Aralık ifadesi ayrıştırıcısı ve aralık kümesi testleri
+"""
+
+import pytest
+from click.testing import CliRunner
+
+from pypdf_tools.core.page_ranges import (
+    PageRangeSet, compile_page_ranges, parse_page_ranges
+)
+from pypdf_tools.cli.cli_handler import cli, extract_pdf_text
+
+
+class TestPageRangeParsing:
+    """Aralık ifadesi ayrıştırma testleri"""
+
+    @pytest.mark.parametrize('expression, expected', [
+        ('1-5, 3,7,9-12', [(0, 5), (6, 7), (8, 12)]),
+        ('5,4,3', [(2, 5)]),
+        ('18-', [(17, 20)]),
+        ('-1', [(19, 20)]),
+        ('-3--1', [(17, 20)]),
+        ('1--19', [(0, 2)]),
+        ('1-9:4', [(0, 1), (4, 5), (8, 9)]),
+        ('all', [(0, 20)]),
+        ('*', [(0, 20)]),
+    ])
+    def test_intervals(self, expression, expected):
+        """İfadeler birleştirilmiş aralıklara derlenmeli"""
+        ranges = parse_page_ranges(expression, 20)
+        assert list(ranges.intervals) == expected
+
+    def test_odd_and_even(self):
+        """odd/even tek ve çift sayfaları seçmeli"""
+        assert list(parse_page_ranges('odd', 5)) == [0, 2, 4]
+        assert list(parse_page_ranges('even', 5)) == [1, 3]
+        assert len(parse_page_ranges('odd, even', 5).intervals) == 1
+
+    @pytest.mark.parametrize('expression, total_pages, expected', [
+        ('even', 1, []),
+        ('odd', 1, [0]),
+        ('all', 0, []),
+        ('*, even', 0, []),
+        ('even, 1', 1, [0]),
+    ])
+    def test_keywords_clamped_to_document(self, expression, total_pages, expected):
+        """Anahtar sözcükler kısa belgede hata vermeden kırpılmalı"""
+        assert list(parse_page_ranges(expression, total_pages)) == expected
+
+    def test_numeric_terms_not_clamped(self):
+        """Sayısal terimler kısa belgede yine hata vermeli"""
+        with pytest.raises(ValueError):
+            parse_page_ranges('even, 2', 1)
+
+    def test_iteration_is_sorted_and_unique(self):
+        """Sayfalar sıralı ve tekrarsız üretilmeli"""
+        ranges = parse_page_ranges('9-10, 1, 3-4, 2, 10', 10)
+        assert list(ranges) == [0, 1, 2, 3, 8, 9]
+        assert len(ranges) == 6
+        assert 8 in ranges and 5 not in ranges
+
+    def test_empty_expression_selects_all(self):
+        """Boş ifade tüm sayfaları seçmeli"""
+        assert parse_page_ranges(None, 4) == PageRangeSet.full(4)
+        assert parse_page_ranges('  ', 4) == PageRangeSet.full(4)
+
+    @pytest.mark.parametrize('expression', ['0', '21', '5-3', '-21', '1-25'])
+    def test_out_of_range(self, expression):
+        """Belge dışındaki sayfalar hata vermeli"""
+        with pytest.raises(ValueError):
+            parse_page_ranges(expression, 20)
+
+    @pytest.mark.parametrize('expression', ['a-b', '1-2-3', '1:0', ',', '1..4'])
+    def test_syntax_errors(self, expression):
+        """Söz dizimi hataları ValueError vermeli"""
+        with pytest.raises(ValueError):
+            compile_page_ranges(expression)
+
+    def test_to_expression_roundtrip(self):
+        """Küme tekrar ifadeye çevrilebilmeli"""
+        ranges = parse_page_ranges('1-5, 3,7,9-12', 20)
+        assert ranges.to_expression() == '1-5,7,9-12'
+        assert parse_page_ranges(ranges.to_expression(), 20) == ranges
+
+
+class TestRangeCommands:
+    """--range ve --pages kullanan komut testleri"""
+
+    def test_split_by_range(self, pdf_factory, tmp_path):
+        """Her bitişik blok ayrı dosyaya yazılmalı"""
+        source = pdf_factory('doc.pdf', pages=12)
+        output_dir = tmp_path / 'out'
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ['split', str(source), '-d', str(output_dir),
+                                     '-r', '1-5, 3,7,9-12', '--prefix', 'part_',
+                                     '--jobs', '1'])
+
+        assert result.exit_code == 0
+        names = sorted(path.name for path in output_dir.iterdir())
+        assert names == ['part_1-5.pdf', 'part_7.pdf', 'part_9-12.pdf']
+
+    def test_split_keyword_on_short_document(self, pdf_factory, tmp_path):
+        """Tek sayfalık belgede 'even' boş seçimle başarıyla bitmeli"""
+        source = pdf_factory('doc.pdf', pages=1)
+        output_dir = tmp_path / 'out'
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ['split', str(source), '-d', str(output_dir),
+                                     '-r', 'even', '--jobs', '1'])
+
+        assert result.exit_code == 0
+        assert list(output_dir.glob('*.pdf')) == []
+
+    def test_split_invalid_range(self, pdf_factory, tmp_path):
+        """Geçersiz aralık hata koduyla bitmeli"""
+        source = pdf_factory('doc.pdf', pages=3)
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ['split', str(source), '-d', str(tmp_path),
+                                     '-r', '2-9'])
+
+        assert result.exit_code == 1
+
+    def test_extract_selected_pages(self, pdf_factory):
+        """Seçilen sayfaların metni sırayla çıkarılmalı"""
+        source = pdf_factory('doc.pdf', pages=6, title='Doc')
+
+        result = extract_pdf_text(str(source), '5, 2', 'json')
+
+        assert result['success'] is True
+        pages = [item['page'] for item in result['text']['content']]
+        assert pages == [2, 5]
+        assert 'Doc page 5' in result['text']['content'][1]['text']
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools İşlem Hattı Test Modülü
+Belge başına aşama DAG'ı, paralel belgeler ve `pypdf run` komutu testleri
+"""
+
+import io
+import json
+from unittest.mock import patch
+
+import pytest
+import yaml
+from click.testing import CliRunner
+from pypdf import PdfReader
+
+from pypdf_tools.core import pipeline as pipeline_module
+from pypdf_tools.core.encryption import encrypt_document
+from pypdf_tools.core.merge import merge_documents
+from pypdf_tools.core.pipeline import load_pipeline, run_document, run_pipeline
+from pypdf_tools.core.text import PageTextStream, write_page_text
+from pypdf_tools.cli.cli_handler import cli
+
+
+def write_pipeline(path, spec):
+    """İşlem hattı tanımını YAML olarak yaz"""
+    path.write_text(yaml.safe_dump(spec, allow_unicode=True), encoding='utf-8')
+    return path
+
+
+STAGES = [
+    {'op': 'merge', 'files': ['cover.pdf']},
+    {'id': 'summary', 'op': 'select', 'pages': '1-2, -1'},
+    {'op': 'encrypt', 'from': 'merge', 'output': 'out/{name}.pdf',
+     'password': 'pw', 'permissions': ['print']},
+    {'op': 'extract-text', 'from': 'summary', 'format': 'ndjson',
+     'output': 'out/{name}.ndjson'},
+]
+
+
+class TestPipelineDefinition:
+    """İşlem hattı dosyası doğrulama testleri"""
+
+    def test_shared_stages_and_paths(self, tmp_path):
+        """Ortak aşamalar belgelere kopyalanmalı, yollar çözülmeli"""
+        path = write_pipeline(tmp_path / 'pipeline.yaml', {
+            'jobs': 2, 'stages': STAGES,
+            'documents': ['march.pdf', {'name': 'april', 'input': ['a.pdf', 'b.pdf']}],
+        })
+
+        pipeline = load_pipeline(path)
+
+        march, april = pipeline['documents']
+        assert pipeline['jobs'] == 2
+        assert march['name'] == 'march'
+        assert april['inputs'] == [str(tmp_path / 'a.pdf'), str(tmp_path / 'b.pdf')]
+        assert [stage['id'] for stage in march['stages']] == \
+            ['merge', 'summary', 'encrypt', 'extract-text']
+        assert march['stages'][1]['from'] == ['merge']
+        assert april['stages'][2]['options']['output'] == str(tmp_path / 'out' / 'april.pdf')
+
+    @pytest.mark.parametrize('stages, message', [
+        ([{'op': 'shred'}], 'bilinmeyen işlem'),
+        ([{'op': 'select', 'pages': '1', 'from': 'later'},
+          {'id': 'later', 'op': 'info'}], 'bulunamadı'),
+        ([{'op': 'info'}, {'op': 'info', 'id': 'info'}], 'tekrarlanmış'),
+    ])
+    def test_invalid_stages(self, tmp_path, stages, message):
+        """Geçersiz aşamalar ve ileri bağlantılar reddedilmeli"""
+        path = write_pipeline(tmp_path / 'pipeline.yaml', {
+            'documents': [{'input': 'doc.pdf', 'stages': stages}],
+        })
+
+        with pytest.raises(ValueError, match=message):
+            load_pipeline(path)
+
+
+class TestRunDocument:
+    """Tek belgenin aşamalarını çalıştırma testleri"""
+
+    def test_stages_share_parsed_document(self, pdf_factory, tmp_path):
+        """Girdi bir kez açılmalı, çıktılar doğru sayfaları içermeli"""
+        pdf_factory('report.pdf', pages=5, title='Report', with_outline=True)
+        pdf_factory('cover.pdf', pages=1, title='Cover')
+        path = write_pipeline(tmp_path / 'pipeline.yaml', {
+            'stages': STAGES, 'documents': ['report.pdf'],
+        })
+
+        with patch.object(pipeline_module, 'open_reader',
+                          wraps=pipeline_module.open_reader) as open_reader:
+            result = run_document(load_pipeline(path)['documents'][0])
+
+        assert result['success'], result.get('error')
+        # report.pdf ve cover.pdf birer kez
+        assert open_reader.call_count == 2
+        assert [stage['id'] for stage in result['stages']] == \
+            ['source', 'merge', 'summary', 'encrypt', 'extract-text']
+        assert all(stage['seconds'] >= 0 for stage in result['stages'])
+
+        encrypted = PdfReader(str(tmp_path / 'out' / 'report.pdf'))
+        assert encrypted.decrypt('pw')
+        assert len(encrypted.pages) == 6
+        assert 'Cover page 1' in encrypted.pages[5].extract_text()
+        assert len(encrypted.outline) == 5
+
+        lines = (tmp_path / 'out' / 'report.ndjson').read_text(encoding='utf-8').splitlines()
+        texts = [json.loads(line)['text'] for line in lines]
+        assert len(texts) == 3
+        assert 'Report page 2' in texts[1] and 'Cover page 1' in texts[2]
+
+    def test_join_and_repeated_pages(self, pdf_factory, tmp_path):
+        """Birden fazla aşamadan beslenen aşama sayfaları tekrar yazabilmeli"""
+        source = pdf_factory('doc.pdf', pages=3, title='Doc')
+        output = tmp_path / 'twice.pdf'
+        document = {
+            'name': 'doc', 'inputs': [str(source)], 'password': None,
+            'stages': [
+                {'id': 'first', 'op': 'select', 'from': ['source'],
+                 'options': {'pages': '1'}},
+                {'id': 'both', 'op': 'save', 'from': ['first', 'source'],
+                 'options': {'output': str(output)}},
+            ],
+        }
+
+        result = run_document(document)
+
+        assert result['success'], result.get('error')
+        reader = PdfReader(str(output))
+        assert len(reader.pages) == 4
+        assert 'Doc page 1' in reader.pages[1].extract_text()
+
+    def test_extract_text_json(self, pdf_factory, tmp_path):
+        """extract-text aşaması json biçiminde seçili sayfaları yazmalı"""
+        source = pdf_factory('doc.pdf', pages=3, title='Doc')
+        output = tmp_path / 'doc.json'
+        document = {
+            'name': 'doc', 'inputs': [str(source)], 'password': None,
+            'stages': [
+                {'id': 'pick', 'op': 'select', 'from': ['source'],
+                 'options': {'pages': '2-3'}},
+                {'id': 'text', 'op': 'extract-text', 'from': ['pick'],
+                 'options': {'format': 'json', 'output': str(output)}},
+            ],
+        }
+
+        result = run_document(document)
+
+        assert result['success'], result.get('error')
+        data = json.loads(output.read_text(encoding='utf-8'))
+        assert (data['file'], data['pages']) == ('doc', '1-2')
+        assert [item['page'] for item in data['content']] == [1, 2]
+        assert 'Doc page 3' in data['content'][1]['text']
+
+    def test_stage_error_reported(self, pdf_factory, tmp_path):
+        """Hata veren aşama adıyla raporlanmalı, okuyucular kapatılmalı"""
+        source = pdf_factory('doc.pdf', pages=2)
+        document = {
+            'name': 'doc', 'inputs': [str(source)], 'password': None,
+            'stages': [{'id': 'pick', 'op': 'select', 'from': ['source'],
+                        'options': {'pages': '9'}}],
+        }
+
+        result = run_document(document)
+
+        assert result['success'] is False
+        assert "'pick'" in result['error']
+
+
+class TestRunPipeline:
+    """Belgelerin paralel işlenmesi ve `pypdf run` komutu testleri"""
+
+    def test_parallel_documents_with_error(self, pdf_factory, tmp_path):
+        """Hatalı belge diğerlerini durdurmamalı"""
+        for name in ('a', 'b', 'c'):
+            pdf_factory(f'{name}.pdf', pages=2, title=name)
+        path = write_pipeline(tmp_path / 'pipeline.yaml', {
+            'stages': [{'op': 'save', 'output': 'out/{name}.pdf'}],
+            'documents': ['a.pdf', 'missing.pdf', 'b.pdf', 'c.pdf'],
+        })
+
+        results = list(run_pipeline(load_pipeline(path), jobs=2))
+
+        by_name = {result['name']: result for result in results}
+        assert len(results) == 4
+        assert by_name['missing']['success'] is False
+        assert all(by_name[name]['success'] for name in 'abc')
+
+    def test_run_command(self, pdf_factory, tmp_path):
+        """Komut özet ve JSON rapor yazmalı; --config ile de çalışmalı"""
+        pdf_factory('report.pdf', pages=3, title='Report')
+        pdf_factory('cover.pdf', pages=1, title='Cover')
+        path = write_pipeline(tmp_path / 'pipeline.yaml', {
+            'stages': STAGES, 'documents': ['report.pdf'],
+        })
+        report = tmp_path / 'report.json'
+        runner = CliRunner()
+
+        result = runner.invoke(cli, ['-v', 'run', str(path), '--report', str(report),
+                                     '--jobs', '1'])
+
+        assert result.exit_code == 0, result.output
+        assert '1 belge işlendi, 0 hata' in result.stdout
+        assert 'summary [select]: 3 sayfa' in result.stdout
+        data = json.loads(report.read_text(encoding='utf-8'))
+        assert data['operations']['encrypt']['count'] == 1
+        assert data['results'][0]['stages'][3]['output'].endswith('report.pdf')
+
+        result = runner.invoke(cli, ['--config', str(path), 'run'])
+        assert result.exit_code == 0
+
+        result = runner.invoke(cli, ['run'])
+        assert result.exit_code == 2
+
+
+@pytest.mark.slow
+class TestPipelineBenchmark:
+    """Ayrı komutlar ile işlem hattının karşılaştırması"""
+
+    @pytest.mark.parametrize('mode', ['separate', 'pipeline'])
+    def test_merge_encrypt_extract(self, benchmark, large_pdf_factory, tmp_path, mode):
+        """500 sayfalık belge: birleştir, şifrele, metin çıkar"""
+        source = str(large_pdf_factory(pages=500, text='Lorem ipsum dolor sit amet',
+                                       lines=20))
+        cover = str(large_pdf_factory(pages=1))
+        benchmark.group = 'merge-encrypt-extract-500'
+
+        def separate():
+            merged = tmp_path / 'merged.pdf'
+            merge_documents([source, cover], merged)
+            encrypt_document(merged, tmp_path / 'secure.pdf', 'pw')
+            with PageTextStream(merged) as page_stream:
+                return write_page_text(page_stream, io.StringIO(), 'ndjson')
+
+        document = {
+            'name': 'doc', 'inputs': [source], 'password': None,
+            'stages': [
+                {'id': 'merge', 'op': 'merge', 'from': ['source'],
+                 'options': {'files': [cover]}},
+                {'id': 'encrypt', 'op': 'encrypt', 'from': ['merge'],
+                 'options': {'output': str(tmp_path / 'secure.pdf'), 'password': 'pw'}},
+                {'id': 'text', 'op': 'extract-text', 'from': ['merge'],
+                 'options': {'output': str(tmp_path / 'text.ndjson'), 'format': 'ndjson'}},
+            ],
+        }
+
+        def pipeline():
+            result = run_document(document)
+            assert result['success'], result.get('error')
+            return result
+
+        benchmark.pedantic(separate if mode == 'separate' else pipeline,
+                           rounds=3, iterations=1)
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools Sayfa Önden Yükleme Test Modülü
+Yön/hız tahmini, önden işleme, atlamada iptal ve sayfa çevirme gecikmesi testleri
+"""
+
+import threading
+
+import pytest
+from PyQt6.QtCore import QCoreApplication
+from PyQt6.QtGui import QGuiApplication
+
+from pypdf_tools.core.cache import DocumentCache
+from pypdf_tools.features.prefetch import PagePredictor, PrefetchScheduler
+from pypdf_tools.features.render import TileRenderer, page_pixel_size, tile_grid
+
+A4 = (595.28, 841.89)
+
+
+@pytest.fixture(scope='module')
+def app():
+    """QtPdf ile işleme için Qt uygulaması"""
+    return QCoreApplication.instance() or QGuiApplication([])
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeRenderer:
+    """İstenen karoları kaydeden, istenirse ilk karoda bekleyen işleyici"""
+
+    def __init__(self, block: bool = False):
+        self.tiles = []
+        self.started = threading.Event()
+        self.release = threading.Event()
+        if not block:
+            self.release.set()
+
+    def tile(self, digest, page, zoom, rotation, col, row):
+        self.tiles.append((page, zoom, rotation, col, row))
+        self.started.set()
+        self.release.wait(5)
+        return b''
+
+    def pages(self):
+        return sorted({key[0] for key in self.tiles})
+
+
+class TestPagePredictor:
+    """Yön ve hız tahmini testleri"""
+
+    def test_slow_reading_prefetches_default_depth(self):
+        """Sakin okumada iki sayfa önde, bir sayfa geride"""
+        clock = FakeClock()
+        predictor = PagePredictor(clock=clock)
+
+        assert predictor.update(10, 100) == ([11, 12, 9], False)
+        clock.now += 30
+        assert predictor.update(11, 100) == ([12, 13, 10], False)
+
+    def test_fast_flipping_increases_depth(self):
+        """Saniyede 10 sayfa çevrilince derinlik MAX_DEPTH'e çıkmalı"""
+        clock = FakeClock()
+        predictor = PagePredictor(depth=2, max_depth=8, clock=clock)
+        for page in range(1, 6):
+            pages, _jumped = predictor.update(page, 100)
+            clock.now += 0.1
+
+        assert predictor.velocity() == pytest.approx(10)
+        assert pages == [6, 7, 8, 9, 10, 11, 12, 13, 4]
+
+    def test_backward_direction(self):
+        """Geri çevirmede sayfalar azalan sırada olmalı"""
+        clock = FakeClock()
+        predictor = PagePredictor(clock=clock)
+        predictor.update(50, 100)
+        clock.now += 1
+
+        assert predictor.update(49, 100) == ([48, 47, 50], False)
+        assert predictor.direction == -1
+
+    def test_jump_resets_history(self):
+        """Uzak sayfaya geçiş atlama sayılmalı ve hız sıfırlanmalı"""
+        clock = FakeClock()
+        predictor = PagePredictor(jump_pages=5, clock=clock)
+        for page in (1, 2, 3):
+            predictor.update(page, 100)
+            clock.now += 0.1
+
+        assert predictor.update(60, 100) == ([61, 62, 59], True)
+        assert predictor.velocity() == 0
+
+    def test_document_bounds(self):
+        """Belge sınırları dışındaki sayfalar atlanmalı"""
+        predictor = PagePredictor(clock=FakeClock())
+
+        assert predictor.update(1, 2) == ([2], False)
+        assert predictor.update(2, 2) == ([1], False)
+
+
+class TestPrefetchScheduler:
+    """Arka plan önden işleme testleri"""
+
+    def test_prefetches_all_tiles_of_next_pages(self, app):
+        """Sıradaki sayfaların tüm karoları görünümde işlenmeli"""
+        renderer = FakeRenderer()
+        scheduler = PrefetchScheduler(renderer)
+        scheduler.set_document('abc', [A4] * 10)
+
+        assert scheduler.page_changed(5, 150, 90) == [6, 7, 4]
+        assert scheduler.wait(5000)
+
+        cols, rows = tile_grid(*page_pixel_size(*A4, 150, 90))
+        assert renderer.pages() == [4, 6, 7]
+        assert len(renderer.tiles) == 3 * cols * rows
+        assert {key[1:3] for key in renderer.tiles} == {(150, 90)}
+        assert scheduler.stats() == {'pages': 3, 'tiles': 3 * cols * rows, 'cancelled': 0}
+
+    def test_jump_cancels_running_prefetch(self, app):
+        """Atlamada çalışan görev sonraki karodan önce durmalı"""
+        renderer = FakeRenderer(block=True)
+        scheduler = PrefetchScheduler(renderer)
+        scheduler.set_document('abc', [A4] * 100)
+
+        scheduler.page_changed(1, 100, 0)
+        assert renderer.started.wait(5)
+        scheduler.page_changed(50, 100, 0)
+        renderer.release.set()
+        assert scheduler.wait(5000)
+
+        # Sayfa 2'nin yalnızca başlamış karosu, sayfa 3 hiç işlenmemeli
+        assert [key for key in renderer.tiles if key[0] == 2] == [(2, 100, 0, 0, 0)]
+        assert renderer.pages() == [2, 49, 51, 52]
+        assert scheduler.stats()['cancelled'] == 1
+
+    def test_disabled_and_without_document(self, app):
+        """Kapalıyken veya belge yokken görev oluşturulmamalı"""
+        renderer = FakeRenderer()
+        scheduler = PrefetchScheduler(renderer, enabled=False)
+        scheduler.set_document('abc', [A4] * 10)
+        assert scheduler.page_changed(1, 100, 0) == []
+
+        scheduler.enabled = True
+        scheduler.set_document(None)
+        assert scheduler.page_changed(1, 100, 0) == []
+        assert renderer.tiles == []
+
+    def test_invalid_view_rejected(self, app):
+        """Geçersiz zoom veya döndürme reddedilmeli"""
+        scheduler = PrefetchScheduler(FakeRenderer())
+        scheduler.set_document('abc', [A4] * 10)
+
+        with pytest.raises(ValueError):
+            scheduler.page_changed(1, 110, 0)
+        with pytest.raises(ValueError):
+            scheduler.page_changed(1, 100, 45)
+
+
+@pytest.mark.slow
+class TestPrefetchBenchmark:
+    """Sayfa çevirmede ilk boyama süresi: önden yükleme açık/kapalı"""
+
+    @pytest.mark.parametrize('prefetch', [True, False])
+    def test_page_turn_first_paint(self, benchmark, app, large_pdf_factory, tmp_path, prefetch):
+        """%200 zoom'da sonraki sayfanın tüm karolarının hazır olma süresi"""
+        source = large_pdf_factory(40, text='Lorem ipsum dolor sit amet', lines=40)
+        renderer = TileRenderer(DocumentCache(tmp_path / 'cache', shared=True))
+        document = renderer.open_document(source)
+        scheduler = PrefetchScheduler(renderer, enabled=prefetch)
+        scheduler.set_document(document['digest'], document['pages'])
+        cols, rows = tile_grid(*page_pixel_size(*A4, 200))
+        page = [1]
+        scheduler.page_changed(1, 200, 0)
+        benchmark.group = 'prefetch-page-turn'
+
+        def read_page():
+            # Okuma süresi: önden yükleme boşta kalan zamanda çalışır
+            scheduler.wait()
+
+        def turn_page():
+            page[0] += 1
+            scheduler.page_changed(page[0], 200, 0)
+            # Görünür karoların pdftile: istekleri
+            return [renderer.tile(document['digest'], page[0], 200, 0, col, row)
+                    for row in range(rows) for col in range(cols)]
+
+        tiles = benchmark.pedantic(turn_page, setup=read_page, rounds=30, iterations=1)
+        scheduler.cancel()
+        scheduler.wait()
+        benchmark.extra_info['renders'] = renderer.renders
+        renderer.close()
+        assert len(tiles) == cols * rows
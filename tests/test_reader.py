@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools Okuyucu Arka Ucu Test Modülü
+mmap ve tamponlu okuyucu arka uçlarının testleri ve karşılaştırması
+"""
+
+import pytest
+
+from pypdf_tools.core.cache import file_digest
+from pypdf_tools.core.reader import (
+    MappedFile, close_reader, open_document, open_reader, open_stream, page_count
+)
+
+
+class TestReaderBackends:
+    """open_stream ve open_reader arka uç testleri"""
+
+    def test_mmap_is_default(self, pdf_factory):
+        """Varsayılan arka uç bellek eşlemesi olmalı"""
+        source = pdf_factory('doc.pdf', pages=2)
+
+        with open_stream(source) as stream:
+            assert isinstance(stream, MappedFile)
+            with stream.view(0, 5) as header:
+                assert header.tobytes() == b'%PDF-'
+
+    def test_buffered_backend(self, pdf_factory, monkeypatch):
+        """Ortam değişkeni veya parametre ile tamponlu okuma seçilebilmeli"""
+        source = pdf_factory('doc.pdf', pages=2)
+
+        with open_stream(source, 'buffered') as stream:
+            assert not isinstance(stream, MappedFile)
+
+        monkeypatch.setenv('PYPDF_READER_BACKEND', 'buffered')
+        with open_stream(source) as stream:
+            assert not isinstance(stream, MappedFile)
+
+    def test_empty_file_falls_back(self, tmp_path):
+        """Boş dosya eşlenemez; tamponlu okumaya dönülmeli"""
+        empty = tmp_path / 'empty.pdf'
+        empty.write_bytes(b'')
+
+        with open_stream(empty) as stream:
+            assert stream.read() == b''
+
+    def test_unknown_backend(self, pdf_factory):
+        """Bilinmeyen arka uç reddedilmeli"""
+        with pytest.raises(ValueError):
+            open_stream(pdf_factory('doc.pdf'), 'direct-io')
+
+    def test_backends_agree(self, pdf_factory):
+        """İki arka uç aynı metni ve özeti üretmeli"""
+        source = pdf_factory('doc.pdf', pages=5, title='Doc', with_image=True)
+
+        results = {}
+        for backend in ('mmap', 'buffered'):
+            with open_document(source, backend=backend) as reader:
+                texts = [page.extract_text() for page in reader.pages]
+            results[backend] = (texts, file_digest(source, backend))
+
+        assert results['mmap'] == results['buffered']
+
+    def test_close_reader_unmaps(self, pdf_factory):
+        """close_reader eşlemeyi kapatmalı"""
+        reader = open_reader(pdf_factory('doc.pdf'))
+
+        close_reader(reader)
+
+        assert reader.stream.closed
+
+
+@pytest.mark.slow
+class TestReaderBackendBenchmark:
+    """1 GB dosyada mmap ve tamponlu okuyucu karşılaştırması"""
+
+    SIZE = 1024 ** 3
+
+    @pytest.mark.parametrize('backend', ['mmap', 'buffered'])
+    def test_object_lookup(self, benchmark, padded_pdf_factory, backend):
+        """Açma, xref üzerinden katalog/sayfa/bilgi nesnelerine erişim süresi"""
+        source = padded_pdf_factory(self.SIZE)
+        benchmark.group = 'reader-backend-lookup-1GB'
+
+        def run():
+            with open_document(source, backend=backend) as reader:
+                page = reader.pages[0]
+                return page_count(reader), page['/MediaBox'], reader.metadata.title
+
+        pages, _media_box, title = benchmark(run)
+        assert (pages, title) == (1, 'Padded')
+
+    @pytest.mark.parametrize('backend', ['mmap', 'buffered'])
+    def test_digest(self, benchmark, padded_pdf_factory, backend):
+        """Önbellek anahtarı için tüm dosyayı özetleme süresi"""
+        source = padded_pdf_factory(self.SIZE)
+        benchmark.group = 'reader-backend-digest-1GB'
+
+        digest = benchmark.pedantic(file_digest, args=(source, backend),
+                                    rounds=3, iterations=1)
+        assert len(digest) == 64
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools Son Belgeler Test Modülü
+Son belgeler deposu, arka plan varlık denetimi ve değişmemiş belgenin
+metadata okunmadan yeniden açılması testleri
+"""
+
+import os
+import threading
+import time
+import types
+
+import pytest
+from PyQt6.QtCore import QCoreApplication
+from PyQt6.QtGui import QGuiApplication
+
+from pypdf_tools.core.cache import DocumentCache
+from pypdf_tools.features import loader as loader_module
+from pypdf_tools.features import recent as recent_module
+from pypdf_tools.features.loader import DocumentLoader
+from pypdf_tools.features.recent import PathProbe, RecentDocuments
+from pypdf_tools.features.render import TileRenderer
+
+
+@pytest.fixture(scope='module')
+def app():
+    """QtPdf ve kuyruklu sinyaller için Qt uygulaması"""
+    return QCoreApplication.instance() or QGuiApplication([])
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = RecentDocuments(tmp_path / 'recent.db', limit=3)
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def renderer(app, tmp_path):
+    renderer = TileRenderer(DocumentCache(tmp_path / 'cache', shared=True))
+    yield renderer
+    renderer.close()
+
+
+def make_loader(renderer, store=None):
+    return DocumentLoader(renderer, recent=store)
+
+
+def wait_for(loader, request, timeout=10.0):
+    """İstek bitene kadar olay döngüsünü çalıştır; başlık bilgilerini döndür"""
+    events = {}
+    loader.headerParsed.connect(lambda r, info: events.setdefault('header', info))
+    loader.outlineReady.connect(lambda r, outline: events.setdefault('outline', outline))
+    loader.loadFinished.connect(lambda r: events.setdefault('done', True))
+    loader.loadFailed.connect(lambda r, error: events.setdefault('done', error))
+    deadline = time.monotonic() + timeout
+    while 'done' not in events:
+        assert time.monotonic() < deadline, "Belge zamanında açılmadı"
+        QCoreApplication.processEvents()
+        time.sleep(0.005)
+    assert events['done'] is True
+    return events
+
+
+def fingerprint(path):
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+class TestRecentDocuments:
+    """Son belgeler deposu testleri"""
+
+    def test_touch_orders_and_trims(self, store):
+        """En son açılan başta olmalı, sınırı aşan eski kayıt silinmeli"""
+        for path in ('a.pdf', 'b.pdf', 'c.pdf', 'd.pdf'):
+            store.touch(path)
+        store.touch('b.pdf')
+        assert store.paths() == ['b.pdf', 'd.pdf', 'c.pdf']
+
+    def test_lookup_requires_same_fingerprint(self, store):
+        """Saklı bilgiler yalnızca boyut ve mtime aynıysa dönmeli"""
+        info = {'fileName': 'a.pdf', 'totalPages': 2}
+        outline = [{'title': 'Giriş', 'page': 1, 'level': 0}]
+        store.record('a.pdf', 100, 5, info, outline, b'png')
+
+        cached = store.lookup('a.pdf', 100, 5)
+        assert cached == {'info': info, 'outline': outline, 'last_page': 1, 'thumbnail': b'png'}
+        assert store.lookup('a.pdf', 100, 6) is None
+        assert store.lookup('b.pdf', 100, 5) is None
+        assert (store.hits, store.misses) == (1, 2)
+
+        # Yalnızca dokunulmuş kayıtta açılış bilgisi yoktur
+        store.touch('b.pdf')
+        assert store.lookup('b.pdf', None, None) is None
+
+    def test_last_page_reset_when_changed(self, store):
+        """Son sayfa aynı belgede korunmalı, değişmiş belgede sıfırlanmalı"""
+        store.record('a.pdf', 100, 5, {}, [])
+        store.set_last_page('a.pdf', 7)
+        store.record('a.pdf', 100, 5, {}, [])
+        assert store.lookup('a.pdf', 100, 5)['last_page'] == 7
+
+        store.record('a.pdf', 120, 9, {}, [])
+        assert store.lookup('a.pdf', 120, 9)['last_page'] == 1
+
+    def test_import_paths(self, store):
+        """Eski liste sırası korunarak aktarılmalı, var olan kayıtlar değişmemeli"""
+        store.touch('b.pdf')
+        assert store.import_paths(['a.pdf', 'b.pdf', 'c.pdf']) == 2
+        assert set(store.paths()) == {'a.pdf', 'b.pdf', 'c.pdf'}
+        assert store.paths().index('a.pdf') < store.paths().index('c.pdf')
+
+    def test_persists(self, tmp_path):
+        """Kayıtlar depo yeniden açılınca korunmalı"""
+        store = RecentDocuments(tmp_path / 'recent.db')
+        store.record('a.pdf', 1, 2, {'x': 1}, [], None)
+        store.close()
+
+        store = RecentDocuments(tmp_path / 'recent.db')
+        assert store.lookup('a.pdf', 1, 2)['info'] == {'x': 1}
+        store.close()
+
+
+class TestPathProbe:
+    """Arka plan varlık denetimi testleri"""
+
+    def collect(self, probe, count, timeout=5.0):
+        results = []
+        probe.checked.connect(lambda path, status: results.append((path, status)))
+        deadline = time.monotonic() + timeout
+        while len(results) < count:
+            assert time.monotonic() < deadline, "Denetim zamanında bitmedi"
+            QCoreApplication.processEvents()
+            time.sleep(0.005)
+        return results
+
+    def test_exists(self, app, tmp_path):
+        """Var olan ve olmayan yollar ayrı bildirilmeli"""
+        present = tmp_path / 'a.pdf'
+        present.write_bytes(b'%PDF')
+        probe = PathProbe()
+        probe.check([str(present), str(tmp_path / 'missing.pdf')])
+
+        results = dict(self.collect(probe, 2))
+        assert results == {str(present): True, str(tmp_path / 'missing.pdf'): False}
+        assert probe.pending() == []
+
+    def test_timeout(self, app, monkeypatch):
+        """Yanıt vermeyen yol zaman aşımında None ile, geç yanıt sonra bildirilmeli"""
+        release = threading.Event()
+
+        def stat(path):
+            release.wait(5)
+            raise FileNotFoundError(path)
+
+        monkeypatch.setattr(recent_module, 'os', types.SimpleNamespace(stat=stat))
+        probe = PathProbe(timeout=0.05)
+        started = time.monotonic()
+        probe.check(['//offline/share/a.pdf'])
+        probe.check(['//offline/share/a.pdf'])
+
+        assert self.collect(probe, 1) == [('//offline/share/a.pdf', None)]
+        assert time.monotonic() - started < 1
+        assert probe.pending() == ['//offline/share/a.pdf']
+
+        release.set()
+        assert self.collect(probe, 1)[-1] == ('//offline/share/a.pdf', False)
+
+
+class TestCachedReopen:
+    """Değişmemiş belgenin yeniden açılışı"""
+
+    def test_skips_parsing(self, renderer, store, pdf_factory, monkeypatch):
+        """İkinci açılışta metadata ve yer işaretleri dosyadan okunmamalı"""
+        source = pdf_factory('doc.pdf', pages=3, title='Rapor', with_outline=True)
+        loader = make_loader(renderer, store)
+        first = wait_for(loader, loader.load(source))
+        assert 'lastPage' not in first['header']
+        assert store.lookup(str(source), *fingerprint(source))['thumbnail'].startswith(b'\x89PNG')
+        store.set_last_page(str(source), 2)
+
+        def fail(*args):
+            raise AssertionError("Belge yeniden okundu")
+
+        monkeypatch.setattr(loader_module, 'read_pdf_metadata', fail)
+        monkeypatch.setattr(loader_module, 'read_outline', fail)
+        second = wait_for(loader, loader.load(source))
+        assert second['header'] == dict(first['header'], lastPage=2)
+        assert second['outline'] == first['outline']
+        loader.wait()
+
+    def test_changed_file_is_parsed(self, renderer, store, pdf_factory):
+        """Değişmiş belge yeniden okunmalı"""
+        source = pdf_factory('doc.pdf', pages=2, title='Eski')
+        loader = make_loader(renderer, store)
+        wait_for(loader, loader.load(source))
+
+        source = pdf_factory('doc.pdf', pages=4, title='Yeni')
+        stat = os.stat(source)
+        os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        header = wait_for(loader, loader.load(source))['header']
+        assert (header['totalPages'], header['metadata']['title']) == (4, 'Yeni')
+        assert 'lastPage' not in header
+        loader.wait()
+
+
+@pytest.mark.slow
+class TestRecentBenchmark:
+    """Yeniden açılış süresi: metadata okunarak ve son belgeler deposundan"""
+
+    @pytest.mark.parametrize('mode', ['parsed', 'cached'])
+    def test_reopen(self, benchmark, renderer, store, large_pdf_factory, mode):
+        """200 sayfalık belgenin yeniden açılışının loadFinished'e kadar süresi"""
+        source = large_pdf_factory(200, text='Lorem ipsum', lines=40)
+        benchmark.group = 'recent-reopen'
+        loader = make_loader(renderer, store if mode == 'cached' else None)
+        wait_for(loader, loader.load(source))
+
+        def run():
+            return wait_for(loader, loader.load(source))
+
+        assert benchmark.pedantic(run, rounds=10, iterations=1)
+        loader.wait()
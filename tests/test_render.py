@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools Sayfa Karoları Test Modülü
+Karo geometrisi, QtPdf ile işleme ve bellek/disk önbelleği testleri
+"""
+
+import pytest
+from PyQt6.QtCore import QCoreApplication
+from PyQt6.QtGui import QGuiApplication, QImage
+
+from pypdf_tools.core.cache import DocumentCache
+from pypdf_tools.features.render import (
+    BACKGROUND_DOCUMENT_BYTES, TILE_SIZE, TileMemoryCache, TileRenderer, page_pixel_size,
+    parse_tile_path, tile_grid
+)
+
+# reportlab varsayılan sayfası (A4) %100'de 794x1123 piksel, 2x3 karo
+A4 = (595.28, 841.89)
+
+
+@pytest.fixture(scope='module')
+def app():
+    """QtPdf ile işleme için Qt uygulaması"""
+    return QCoreApplication.instance() or QGuiApplication([])
+
+
+@pytest.fixture
+def renderer(app, tmp_path):
+    tile_renderer = TileRenderer(DocumentCache(tmp_path / 'cache', shared=True))
+    yield tile_renderer
+    tile_renderer.close()
+
+
+def tile_size(data: bytes):
+    image = QImage.fromData(data, 'PNG')
+    return image.width(), image.height()
+
+
+class TestTileGeometry:
+    """Karo yolu ve ızgara hesapları"""
+
+    def test_parse_tile_path(self):
+        """Geçerli yol anahtara çevrilmeli"""
+        assert parse_tile_path('/abc/3/150/90/1_2.png') == ('abc', 3, 150, 90, 1, 2)
+
+    @pytest.mark.parametrize('path', [
+        '/abc/3/150/90/1_2.jpg',
+        '/abc/3/150/1_2.png',
+        '/abc/3/130/0/0_0.png',
+        '/abc/3/600/0/0_0.png',
+        '/abc/3/100/45/0_0.png',
+    ])
+    def test_invalid_paths(self, path):
+        """Bozuk yol, adım dışı zoom ve geçersiz döndürme reddedilmeli"""
+        with pytest.raises(ValueError):
+            parse_tile_path(path)
+
+    def test_pixel_size_and_grid(self):
+        """Piksel boyutu CSS ölçeğinde, 90/270'te eksenler yer değiştirmeli"""
+        assert page_pixel_size(*A4, 100) == (794, 1123)
+        assert page_pixel_size(*A4, 100, 90) == (1123, 794)
+        assert page_pixel_size(*A4, 200, 180) == (1587, 2245)
+        assert tile_grid(794, 1123) == (2, 3)
+        assert tile_grid(TILE_SIZE, TILE_SIZE) == (1, 1)
+
+    def test_memory_cache_byte_limit(self):
+        """Bellek önbelleği byte sınırında en eski karoyu bırakmalı"""
+        cache = TileMemoryCache(max_bytes=25)
+        cache.put(('a', 1, 100, 0, 0, 0), b'x' * 10)
+        cache.put(('a', 1, 100, 0, 1, 0), b'x' * 10)
+        assert cache.get(('a', 1, 100, 0, 0, 0)) is not None
+        cache.put(('b', 1, 100, 0, 0, 0), b'x' * 10)
+
+        assert cache.get(('a', 1, 100, 0, 1, 0)) is None
+        assert cache.bytes == 20
+
+        cache.discard_document('a')
+        assert len(cache) == 1
+
+
+class TestTileRenderer:
+    """QtPdf karo işleme ve önbellek testleri"""
+
+    def test_open_document_reports_page_sizes(self, renderer, pdf_factory):
+        """Sayfa boyutları nokta cinsinden dönmeli"""
+        info = renderer.open_document(pdf_factory('doc.pdf', pages=2))
+
+        assert len(info['digest']) == 64
+        assert info['pages'] == [list(A4)] * 2
+
+    @pytest.mark.parametrize('rotation, col, row, expected', [
+        (0, 0, 0, (512, 512)),
+        (0, 1, 2, (282, 99)),
+        (90, 2, 0, (99, 512)),
+        (180, 1, 2, (282, 99)),
+        (270, 0, 1, (512, 282)),
+    ])
+    def test_tile_sizes(self, renderer, pdf_factory, rotation, col, row, expected):
+        """Kenar karoları döndürülmüş sayfaya göre kırpılmalı"""
+        digest = renderer.open_document(pdf_factory('doc.pdf'))['digest']
+
+        assert tile_size(renderer.tile(digest, 1, 100, rotation, col, row)) == expected
+
+    def test_rotated_tile_matches_rotated_page(self, renderer, pdf_factory):
+        """180 derecede sol üstteki metin sağ alttaki karoya düşmeli"""
+        digest = renderer.open_document(pdf_factory('doc.pdf'))['digest']
+        # Metin üstten ~160 piksel aşağıda; 180'de (1, 1) karosuna düşer
+        top_left = QImage.fromData(renderer.tile(digest, 1, 100, 0, 0, 0), 'PNG')
+        rotated = QImage.fromData(renderer.tile(digest, 1, 100, 180, 1, 1), 'PNG')
+
+        def has_ink(image):
+            return any(image.pixelColor(x, y).alpha() and image.pixelColor(x, y).lightness() < 128
+                       for x in range(0, image.width(), 2) for y in range(0, image.height(), 2))
+
+        assert has_ink(top_left)
+        assert has_ink(rotated)
+        assert not has_ink(QImage.fromData(renderer.tile(digest, 1, 100, 180, 0, 0), 'PNG'))
+
+    def test_memory_then_disk_hits(self, app, pdf_factory, tmp_path):
+        """Tekrar eden istek bellekten, yeni süreç diskten karşılanmalı"""
+        source = pdf_factory('doc.pdf')
+        first = TileRenderer(DocumentCache(tmp_path / 'cache', shared=True))
+        digest = first.open_document(source)['digest']
+        data = first.tile(digest, 1, 150, 0, 0, 0)
+        assert first.tile(digest, 1, 150, 0, 0, 0) == data
+        assert (first.renders, first.memory_hits) == (1, 1)
+        first.close()
+
+        second = TileRenderer(DocumentCache(tmp_path / 'cache', shared=True))
+        try:
+            second.open_document(source)
+            assert second.tile(digest, 1, 150, 0, 0, 0) == data
+            assert (second.renders, second.disk_hits) == (0, 1)
+            assert second._disk.stats()['tiles'] == 1
+        finally:
+            second.close()
+
+    def test_invalid_requests(self, renderer, pdf_factory):
+        """Açık olmayan belge, sayfa ve ızgara dışı karo reddedilmeli"""
+        digest = renderer.open_document(pdf_factory('doc.pdf', pages=1))['digest']
+
+        with pytest.raises(KeyError):
+            renderer.tile('0' * 64, 1, 100, 0, 0, 0)
+        with pytest.raises(ValueError):
+            renderer.tile(digest, 2, 100, 0, 0, 0)
+        with pytest.raises(ValueError):
+            renderer.tile(digest, 1, 100, 0, 2, 0)
+
+    def test_shared_cache_required(self, app, tmp_path):
+        """İş parçacıkları arası kullanım için shared=True zorunlu"""
+        with pytest.raises(ValueError):
+            TileRenderer(DocumentCache(tmp_path / 'cache'))
+
+
+class TestDocumentBudgets:
+    """Belge başına bellek bütçesi ve arka plan belgelerinin askıya alınması"""
+
+    def test_memory_cache_document_budget(self):
+        """Bütçesini aşan belgenin yalnızca kendi eski karoları çıkarılmalı"""
+        cache = TileMemoryCache(max_bytes=100)
+        for col in range(3):
+            cache.put(('a', 1, 100, 0, col, 0), b'x' * 10)
+        cache.put(('b', 1, 100, 0, 0, 0), b'x' * 10)
+
+        cache.set_budget('a', 15)
+        assert cache.document_bytes('a') == 10
+        assert cache.get(('a', 1, 100, 0, 2, 0)) is not None
+        assert cache.document_bytes('b') == 10
+
+        # Bütçeden büyük yeni karo tek başına kalabilmeli
+        cache.put(('a', 1, 100, 0, 0, 1), b'x' * 20)
+        assert cache.document_bytes('a') == 20
+        assert cache.bytes == 30
+
+        cache.set_budget('a', None)
+        cache.put(('a', 1, 100, 0, 1, 1), b'x' * 20)
+        assert cache.document_bytes('a') == 40
+
+    def test_background_document_budget(self, renderer, pdf_factory):
+        """Arka plana geçen belgenin karoları bütçeye inmeli, etkin belgeninkiler kalmalı"""
+        renderer.background_bytes = 0
+        digests = [renderer.open_document(pdf_factory(f'doc{index}.pdf', title=f'Doc{index}'))['digest']
+                   for index in range(2)]
+        for digest in digests:
+            renderer.tile(digest, 1, 100, 0, 0, 0)
+
+        renderer.set_active(digests[0], False)
+        assert renderer._memory.document_bytes(digests[0]) == 0
+        assert renderer._memory.document_bytes(digests[1]) > 0
+
+        # Etkinleşen belge bütçesiz; karo diskten geri gelir
+        renderer.set_active(digests[0], True)
+        renderer.tile(digests[0], 1, 100, 0, 0, 0)
+        assert renderer.disk_hits == 1
+        assert renderer._memory.document_bytes(digests[0]) > 0
+
+    def test_background_documents_suspended(self, app, pdf_factory, tmp_path):
+        """Açık belge sınırında en uzun süredir arka planda olan belge askıya alınmalı"""
+        renderer = TileRenderer(DocumentCache(tmp_path / 'cache', shared=True),
+                                max_open_documents=2)
+        try:
+            digests = [renderer.open_document(pdf_factory(f'doc{index}.pdf', title=f'Doc{index}'))['digest']
+                       for index in range(3)]
+            # Hepsi etkinken askıya alınacak belge yok
+            assert len(renderer._documents) == 3
+
+            renderer.set_active(digests[1], False)
+            renderer.set_active(digests[0], False)
+            assert set(renderer._documents) == {digests[0], digests[2]}
+            assert renderer.stats()['suspended_documents'] == 1
+
+            # Askıdaki belge ilk istekte yeniden açılmalı
+            assert renderer.page_text(digests[1], 1).startswith('Doc1')
+            assert renderer.reopened == 1
+            assert renderer.stats()['open_documents'] == 3
+
+            renderer.close_document(digests[1])
+            with pytest.raises(KeyError):
+                renderer.tile(digests[1], 1, 100, 0, 0, 0)
+        finally:
+            renderer.close()
+
+
+    def test_shared_digest_owners(self, renderer, pdf_factory, tmp_path):
+        """Aynı içerikli iki belge: biri kapanınca diğerinin kaydı sürmeli"""
+        renderer.background_bytes = 0
+        source = pdf_factory('doc.pdf', title='Doc')
+        copy = tmp_path / 'copy.pdf'
+        copy.write_bytes(source.read_bytes())
+        first, second = object(), object()
+        digest = renderer.open_document(source, owner=first)['digest']
+        assert renderer.open_document(copy, owner=second)['digest'] == digest
+        renderer.tile(digest, 1, 100, 0, 0, 0)
+
+        # Sahiplerden biri görünürken belge etkin kalmalı
+        renderer.set_active(digest, False, owner=first)
+        assert renderer._memory.document_bytes(digest) > 0
+        renderer.set_active(digest, False, owner=second)
+        assert renderer._memory.document_bytes(digest) == 0
+        renderer.set_active(digest, True, owner=second)
+
+        renderer.close_document(digest, owner=first)
+        renderer.close_document(digest, owner=first)
+        assert renderer.page_text(digest, 1).startswith('Doc')
+        assert renderer.tile(digest, 1, 100, 0, 0, 0)
+
+        renderer.close_document(digest, owner=second)
+        with pytest.raises(KeyError):
+            renderer.tile(digest, 1, 100, 0, 1, 0)
+
+
+class TestTileCache:
+    """DocumentCache karo tablosu testleri"""
+
+    def test_tiles_evicted_with_document(self, pdf_factory, tmp_path):
+        """Karolar belge boyutuna sayılmalı ve belgeyle birlikte silinmeli"""
+        sources = [pdf_factory(f'doc{index}.pdf', title=f'Doc{index}') for index in range(2)]
+
+        with DocumentCache(tmp_path / 'cache', max_bytes=10 ** 9) as cache:
+            digests = [cache.fingerprint(source) for source in sources]
+            for digest in digests:
+                cache.put_tile(digest, 1, 100, 0, 0, 0, b'x' * 1000)
+                cache.put_tile(digest, 1, 100, 0, 1, 0, b'y' * 1000)
+            cache.flush()
+            assert cache.stats()['tiles'] == 4
+            # Okunan karo belgeyi en yeni hale getirir
+            assert cache.get_tile(digests[0], 1, 100, 0, 1, 0) == b'y' * 1000
+
+            cache.max_bytes = 3000
+            assert cache.evict() == 1
+            assert cache.get_tile(digests[1], 1, 100, 0, 0, 0) is None
+            assert cache.get_tile(digests[0], 1, 100, 0, 0, 0) == b'x' * 1000
+            assert cache.stats()['tiles'] == 2
+
+
+@pytest.mark.slow
+class TestRenderBenchmark:
+    """Zoom değişiminde karo gecikmesi: ilk işleme ve önbellekten"""
+
+    @pytest.mark.parametrize('mode', ['cold', 'memory', 'disk'])
+    def test_page_tiles(self, benchmark, app, large_pdf_factory, tmp_path, mode):
+        """%200 zoom'da bir sayfanın tüm karoları"""
+        source = large_pdf_factory(20, text='Lorem ipsum dolor sit amet', lines=40)
+        renderer = TileRenderer(DocumentCache(tmp_path / 'cache', shared=True))
+        digest = renderer.open_document(source)['digest']
+        cols, rows = tile_grid(*page_pixel_size(*A4, 200))
+        page = [0]
+        benchmark.group = 'render-page-tiles'
+
+        def render_page(number):
+            return [renderer.tile(digest, number, 200, 0, col, row)
+                    for row in range(rows) for col in range(cols)]
+
+        if mode != 'cold':
+            for number in range(1, 21):
+                render_page(number)
+            renderer._disk.flush()
+
+        def run():
+            page[0] = page[0] % 20 + 1
+            if mode == 'disk':
+                renderer._memory.discard_document(digest)
+            return render_page(page[0])
+
+        tiles = benchmark.pedantic(run, rounds=20, iterations=1)
+        renderer.close()
+        assert len(tiles) == cols * rows
+
+    @pytest.mark.parametrize('state', ['background', 'released'])
+    def test_activate_background_document(self, benchmark, app, large_pdf_factory, tmp_path, state):
+        """Arka plandaki sekmeye dönüşte görünür sayfanın karoları (%100)"""
+        source = large_pdf_factory(20, text='Lorem ipsum dolor sit amet', lines=40)
+        # released: bellek baskısında karoları ve QtPdf belgesi bırakılmış sekme
+        renderer = TileRenderer(DocumentCache(tmp_path / 'cache', shared=True),
+                                background_bytes=0 if state == 'released' else BACKGROUND_DOCUMENT_BYTES,
+                                max_open_documents=0 if state == 'released' else 6)
+        digest = renderer.open_document(source)['digest']
+        cols, rows = tile_grid(*page_pixel_size(*A4, 100))
+        benchmark.group = 'render-activate-tab'
+
+        def visible_tiles():
+            return [renderer.tile(digest, 1, 100, 0, col, row)
+                    for row in range(rows) for col in range(cols)]
+
+        visible_tiles()
+        renderer._disk.flush()
+
+        def background():
+            renderer.set_active(digest, False)
+
+        def run():
+            renderer.set_active(digest, True)
+            return visible_tiles()
+
+        tiles = benchmark.pedantic(run, setup=background, rounds=20, iterations=1)
+        benchmark.extra_info['stats'] = renderer.stats()
+        renderer.close()
+        assert len(tiles) == cols * rows
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools Dizin Tarayıcı Test Modülü
+Toplu `info` taraması ve NDJSON çıktısı testleri
+"""
+
+import json
+import multiprocessing
+import os
+
+import pytest
+from click.testing import CliRunner
+from pypdf import PdfWriter
+
+from pypdf_tools.core import scan as scan_module
+from pypdf_tools.core.scan import DirectoryScanner, iter_pdf_files, probe_file
+from pypdf_tools.cli.cli_handler import cli
+
+
+@pytest.fixture
+def pdf_tree(pdf_factory, tmp_path):
+    """İç içe dizinlerde sağlam, bozuk ve şifreli PDF'ler içeren ağaç"""
+    root = tmp_path / 'archive'
+    (root / 'a' / 'b').mkdir(parents=True)
+    (root / 'c').mkdir()
+
+    for index, folder in enumerate(['', 'a', 'a/b', 'c']):
+        source = pdf_factory(f'doc{index}.pdf', pages=index + 1)
+        (root / folder / f'doc{index}.pdf').write_bytes(source.read_bytes())
+
+    (root / 'a' / 'broken.pdf').write_bytes(b'%PDF-1.4\nbu bir pdf degil')
+    (root / 'c' / 'notes.txt').write_text('pdf değil')
+
+    writer = PdfWriter(clone_from=str(pdf_factory('plain.pdf', pages=2)))
+    writer.encrypt('user-secret', algorithm='AES-128')
+    writer.write(str(root / 'c' / 'LOCKED.PDF'))
+
+    return root
+
+
+class TestDirectoryScanner:
+    """DirectoryScanner testleri"""
+
+    def test_iter_pdf_files(self, pdf_tree):
+        """Yalnızca .pdf uzantılı dosyalar bulunmalı"""
+        recursive = sorted(iter_pdf_files(pdf_tree))
+        top_level = list(iter_pdf_files(pdf_tree, recursive=False))
+
+        assert len(recursive) == 6
+        assert not any(path.endswith('.txt') for path in recursive)
+        assert top_level == [str(pdf_tree / 'doc0.pdf')]
+
+    @pytest.mark.parametrize('jobs', [1, 2])
+    def test_errors_reported_inline(self, pdf_tree, jobs):
+        """Bozuk ve şifreli dosyalar taramayı durdurmamalı"""
+        scanner = DirectoryScanner(pdf_tree, jobs=jobs)
+        records = {record['path']: record for record in scanner}
+
+        assert len(records) == 6
+        assert records[str(pdf_tree / 'a' / 'broken.pdf')]['error_type'] == 'corrupt'
+        assert records[str(pdf_tree / 'c' / 'LOCKED.PDF')]['error_type'] == 'encrypted'
+        assert records[str(pdf_tree / 'a' / 'b' / 'doc2.pdf')]['info']['pages'] == 3
+
+        summary = scanner.summary()
+        assert summary['files'] == 6
+        assert summary['errors'] == 2
+        assert summary['bytes'] > 0
+
+    @pytest.mark.skipif(multiprocessing.get_start_method() != 'fork',
+                        reason="Yama işçi süreçlerine fork ile aktarılır")
+    def test_worker_crash_reported(self, pdf_tree, monkeypatch):
+        """İşçiyi çökerten dosya hata olarak raporlanmalı, tarama sürmeli"""
+        probe = scan_module.probe_file
+
+        def crashing_probe(path, password=None):
+            if path.endswith('broken.pdf'):
+                os._exit(1)
+            return probe(path, password)
+
+        monkeypatch.setattr(scan_module, 'probe_file', crashing_probe)
+        scanner = DirectoryScanner(pdf_tree, jobs=2)
+        records = {record['path']: record for record in scanner}
+
+        assert len(records) == 6
+        assert records[str(pdf_tree / 'a' / 'broken.pdf')]['error_type'] == 'crash'
+        assert records[str(pdf_tree / 'a' / 'b' / 'doc2.pdf')]['info']['pages'] == 3
+        assert scanner.summary()['errors'] == 2
+
+    def test_probe_missing_file(self, tmp_path):
+        """Okunamayan dosya io hatası olarak raporlanmalı"""
+        record = probe_file(str(tmp_path / 'missing.pdf'))
+
+        assert record['success'] is False
+        assert record['error_type'] == 'io'
+
+
+class TestInfoRecursiveCommand:
+    """`info --recursive` komutu testleri"""
+
+    def test_ndjson_output(self, pdf_tree):
+        """Her dosya için bir JSON satırı, özet stderr'e yazılmalı"""
+        runner = CliRunner()
+        result = runner.invoke(cli, ['info', '--recursive', '--jobs', '2', str(pdf_tree)])
+
+        assert result.exit_code == 0
+        lines = result.stdout.strip().splitlines()
+        records = [json.loads(line) for line in lines]
+        assert len(records) == 6
+        assert sum(1 for record in records if not record['success']) == 2
+        assert 'dosya/sn' in result.stderr
+        assert 'MB/sn' in result.stderr
+
+    def test_single_file_unchanged(self, pdf_factory):
+        """Tek dosya verildiğinde eski çıktı korunmalı"""
+        source = pdf_factory('doc.pdf', pages=2)
+
+        result = CliRunner().invoke(cli, ['info', str(source)])
+
+        assert result.exit_code == 0
+        assert json.loads(result.stdout)['pages'] == 2
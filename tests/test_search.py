@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools Belge İçi Arama Test Modülü
+Sorgu çözümleme, kalıcı dizin, sonuç akışı ve sorgu iptali testleri
+"""
+
+import json
+import time
+
+import pytest
+from PyQt6.QtCore import QCoreApplication
+from PyQt6.QtGui import QGuiApplication
+
+from pypdf_tools.core.cache import DocumentCache
+from pypdf_tools.features.render import TileRenderer
+from pypdf_tools.features.search import (
+    MAX_HITS, SearchService, find_hits, fold, match_expression, parse_query
+)
+
+
+@pytest.fixture(scope='module')
+def app():
+    """QtPdf ve sinyaller için Qt uygulaması"""
+    return QCoreApplication.instance() or QGuiApplication([])
+
+
+@pytest.fixture
+def service(app, tmp_path):
+    renderer = TileRenderer(DocumentCache(tmp_path / 'cache', shared=True))
+    search = SearchService(renderer, DocumentCache(tmp_path / 'cache', shared=True))
+    yield search
+    search.close()
+    renderer.close()
+
+
+@pytest.fixture
+def no_index(monkeypatch):
+    """Arka plan dizinlemesini kapat; sorgular doğrudan taramaya düşer"""
+    monkeypatch.setattr(SearchService, '_build_index', lambda *args: None)
+
+
+class SearchSpy:
+    """Servisin sonuç mesajlarını toplayan yardımcı"""
+
+    def __init__(self, service: SearchService):
+        self.messages = []
+        self.progress = []
+        service.searchResults.connect(lambda message: self.messages.append(json.loads(message)))
+        service.indexProgress.connect(lambda message: self.progress.append(json.loads(message)))
+
+    def wait(self, query_id: str, timeout: float = 10.0) -> dict:
+        """Sorgunun son mesajı gelene kadar olay döngüsünü çalıştır"""
+        deadline = time.monotonic() + timeout
+        while not any(m['queryId'] == query_id and m['done'] for m in self.messages):
+            assert time.monotonic() < deadline, "Arama zamanında bitmedi"
+            QCoreApplication.processEvents()
+            time.sleep(0.005)
+        return self.results(query_id)
+
+    def results(self, query_id: str) -> dict:
+        """Sorgunun parça parça gelen sonuçlarını sayfa -> eşleşmeler olarak birleştir"""
+        return {result['page']: result['hits']
+                for message in self.messages if message['queryId'] == query_id
+                for result in message['results']}
+
+
+def open_document(service, source, index=True):
+    document = service.renderer.open_document(source)
+    digest, pages = document['digest'], len(document['pages'])
+    service.set_document(digest, pages)
+    if index:
+        assert service.wait(30000)
+    return digest
+
+
+class TestQuery:
+    """Sorgu çözümleme ve eşleşme testleri"""
+
+    def test_fold(self):
+        assert fold('Çalışma ŞEKLİ') == 'calısma sekli'
+        assert fold('Crème Brûlée') == 'creme brulee'
+
+    def test_parse_query(self):
+        assert parse_query('  Sayfa 3 ') == (['sayfa', '3'], True)
+        assert parse_query('"Sayfa"') == (['sayfa'], False)
+        assert parse_query('--- !!') == ([], True)
+
+    def test_match_expression(self):
+        assert match_expression(['sample', 'pa'], True) == '"sample pa" *'
+        assert match_expression(['page'], False) == '"page"'
+
+    def test_find_hits(self):
+        text = 'Öğrenci belgesi\r\nöğrenciler, Öğretmen; öğrenci belgesi'
+        assert find_hits(text, ['ogrenci'], False) == [(0, 7), (39, 46)]
+        assert find_hits(text, ['ogren'], True) == [(0, 7), (17, 27), (39, 46)]
+        assert find_hits(text, ['ogrenci', 'belg'], True) == [(0, 15), (39, 54)]
+        assert find_hits(text, ['belgesi', 'ogretmen'], True) == []
+
+
+class TestSearchIndex:
+    """Kalıcı dizin testleri"""
+
+    def test_put_pages_continues_from_progress(self, tmp_path):
+        """Sayfalar yalnızca kaldığı yerden eklenmeli"""
+        with DocumentCache(tmp_path / 'cache') as cache:
+            if not cache.search_available:
+                pytest.skip("SQLite FTS5 yok")
+            digest = 'a' * 64
+            assert cache.put_search_pages(digest, 1, ['bir', 'iki']) == 2
+            assert cache.put_search_pages(digest, 2, ['iki', 'üç']) == 3
+            assert cache.put_search_pages(digest, 5, ['beş']) == 3
+            assert cache.search_progress(digest) == 3
+            assert cache.search_pages(digest, '"uc"') == [(3, 'üç')]
+            assert cache.search_pages(digest, '"i" *') == [(2, 'iki')]
+
+    def test_index_built_in_background(self, service, pdf_factory, tmp_path):
+        """Belge açılınca tüm sayfalar dizinlenmeli ve diske yazılmalı"""
+        spy = SearchSpy(service)
+        digest = open_document(service, pdf_factory('doc.pdf', pages=3))
+        QCoreApplication.processEvents()
+
+        assert spy.progress[-1] == {'digest': digest, 'indexed': 3, 'total': 3}
+        with DocumentCache(tmp_path / 'cache') as cache:
+            assert cache.search_progress(digest) == 3
+            assert cache.stats()['search_pages'] == 3
+
+    def test_index_removed_with_document(self, service, pdf_factory, tmp_path):
+        digest = open_document(service, pdf_factory('doc.pdf', pages=2))
+        with DocumentCache(tmp_path / 'cache') as cache:
+            cache.max_bytes = 0
+            assert cache.evict() == 1
+            assert cache.search_progress(digest) == 0
+            assert cache.stats()['search_pages'] == 0
+
+
+class TestSearchService:
+    """Sonuç akışı ve iptal testleri"""
+
+    def test_search_indexed(self, service, pdf_factory):
+        """Öbek ve önek sorguları sayfaları ve vurgu kutularını döndürmeli"""
+        spy = SearchSpy(service)
+        open_document(service, pdf_factory('doc.pdf', pages=3, title='Rapor'))
+
+        results = spy.wait(service.search('rapor page 2'))
+        assert list(results) == [2]
+        [[rect]] = results[2]
+        x, y, width, height = rect
+        # drawString(72, 720): sol üstten yaklaşık 110 nokta aşağıda
+        assert x == pytest.approx(72, abs=2)
+        assert 100 < y < 125 and width > 50 and height > 5
+
+        results = spy.wait(service.search('RAP'))
+        assert sorted(results) == [1, 2, 3]
+        assert spy.wait(service.search('"rap"')) == {}
+
+        final = spy.messages[-1]
+        assert (final['searched'], final['total'], final['truncated']) == (3, 3, False)
+
+    def test_search_unindexed_pages(self, service, no_index, pdf_factory):
+        """Dizinlenmemiş sayfalar doğrudan taranmalı"""
+        spy = SearchSpy(service)
+        source = pdf_factory('doc.pdf', pages=4, text='ortak satir')
+        digest = open_document(service, source, index=False)
+        with service._cache_lock:
+            service._cache.put_search_pages(
+                digest, 1, [service.renderer.page_text(digest, page) for page in (1, 2)])
+
+        results = spy.wait(service.search('Ortak SATI'))
+        assert sorted(results) == [1, 2, 3, 4]
+        assert spy.messages[-1]['searched'] == 4
+
+    def test_new_query_cancels_previous(self, service, no_index, large_pdf_factory):
+        """Eski sorgu bitmeden durmalı ve son mesajı göndermemeli"""
+        spy = SearchSpy(service)
+        open_document(service, large_pdf_factory(200, text='Lorem ipsum', lines=4), index=False)
+
+        stale = service.search('lorem')
+        current = service.search('ipsum')
+        results = spy.wait(current)
+        assert service.wait(30000)
+        QCoreApplication.processEvents()
+
+        assert len(results) == 200
+        assert not any(m['queryId'] == stale and m['done'] for m in spy.messages)
+
+    def test_results_truncated(self, service, large_pdf_factory):
+        """Sonuç sınırında arama durmalı"""
+        spy = SearchSpy(service)
+        open_document(service, large_pdf_factory(200, text='Lorem ipsum', lines=40))
+
+        results = spy.wait(service.search('lorem'))
+        assert sum(len(hits) for hits in results.values()) == MAX_HITS
+        assert spy.messages[-1]['truncated']
+
+    def test_empty_query_and_no_document(self, service):
+        spy = SearchSpy(service)
+        assert spy.wait(service.search('   ')) == {}
+        assert spy.wait(service.search('sayfa')) == {}
+
+
+@pytest.mark.slow
+class TestSearchBenchmark:
+    """Sorgu gecikmesi: dizinden ve doğrudan tarama"""
+
+    @pytest.mark.parametrize('mode', ['scan', 'index'])
+    def test_query_latency(self, benchmark, service, large_pdf_factory, monkeypatch, mode):
+        """200 sayfada tek eşleşmeli sorgu"""
+        if mode == 'scan':
+            monkeypatch.setattr(SearchService, '_build_index', lambda *args: None)
+        spy = SearchSpy(service)
+        open_document(service, large_pdf_factory(200, text='Lorem ipsum', lines=40))
+        benchmark.group = 'search-query'
+
+        def run():
+            return spy.wait(service.search('large page 150'))
+
+        results = benchmark.pedantic(run, rounds=10, iterations=1)
+        assert list(results) == [150]
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools Bölme Motoru Test Modülü
+Paralel sayfa bölme testleri ve işçi sayısı benchmark'ı
+"""
+
+import threading
+
+import pytest
+from click.testing import CliRunner
+from pypdf import PdfReader
+
+from pypdf_tools.core.split import split_pages, _make_shards
+from pypdf_tools.cli.cli_handler import cli
+
+
+class TestSplitPages:
+    """split_pages fonksiyonu testleri"""
+
+    @pytest.mark.parametrize('jobs', [1, 2])
+    def test_one_file_per_page(self, pdf_factory, tmp_path, jobs):
+        """Her sayfa ayrı dosyaya, doğru içerikle yazılmalı"""
+        source = pdf_factory('doc.pdf', pages=5, title='Doc')
+        output_dir = tmp_path / 'pages'
+        output_dir.mkdir()
+
+        result = split_pages(source, output_dir, prefix='page_', jobs=jobs)
+
+        assert result['files_created'] == 5
+        names = [item['name'] for item in result['files']]
+        assert names == [f'page_{index:03d}.pdf' for index in range(1, 6)]
+        for index, name in enumerate(names, start=1):
+            reader = PdfReader(str(output_dir / name))
+            assert len(reader.pages) == 1
+            assert f'Doc page {index}' in reader.pages[0].extract_text()
+
+    def test_concurrent_in_process(self, pdf_factory, tmp_path):
+        """Aynı süreçteki eşzamanlı bölmeler birbirinin okuyucusunu kullanmamalı"""
+        sources = {title: pdf_factory(f'{title}.pdf', pages=40, title=title)
+                   for title in ('First', 'Second')}
+        barrier = threading.Barrier(len(sources))
+        results, errors = {}, []
+
+        def run(title):
+            output_dir = tmp_path / title
+            output_dir.mkdir()
+            barrier.wait()
+            try:
+                results[title] = split_pages(sources[title], output_dir, jobs=1)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=run, args=(title,)) for title in sources]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        for title in sources:
+            assert results[title]['files_created'] == 40
+            for index in (1, 20, 40):
+                reader = PdfReader(str(tmp_path / title / f'page_{index:03d}.pdf'))
+                assert f'{title} page {index}' in reader.pages[0].extract_text()
+
+    def test_shards_keep_order(self):
+        """Dilimler sırayı korumalı ve tüm parçaları kapsamalı"""
+        parts = [(str(index), [index]) for index in range(10)]
+        shards = _make_shards(parts, 3)
+
+        assert len(shards) == 3
+        assert [part for shard in shards for part in shard] == parts
+        assert _make_shards([], 4) == []
+
+    def test_cli_jobs_option(self, pdf_factory, tmp_path):
+        """--jobs seçeneği kabul edilmeli"""
+        source = pdf_factory('doc.pdf', pages=3)
+        output_dir = tmp_path / 'out'
+
+        runner = CliRunner()
+        result = runner.invoke(cli, ['split', str(source), '-d', str(output_dir),
+                                     '--jobs', '2'])
+
+        assert result.exit_code == 0
+        assert '3 dosya' in result.output
+        assert len(list(output_dir.glob('page_*.pdf'))) == 3
+
+
+@pytest.mark.slow
+class TestSplitBenchmark:
+    """2.000 sayfalık belgede işçi sayısı karşılaştırması"""
+
+    @pytest.mark.parametrize('jobs', [1, 2, 4, 8])
+    def test_split_workers(self, benchmark, large_pdf_factory, tmp_path, jobs):
+        """1/2/4/8 işçi ile tek sayfalık dosyalara bölme süresi"""
+        source = large_pdf_factory(pages=2000)
+        benchmark.group = 'split-2000-pages'
+
+        def run():
+            output_dir = tmp_path / f'run-{run.count}'
+            run.count += 1
+            output_dir.mkdir()
+            return split_pages(source, output_dir, jobs=jobs)
+
+        run.count = 0
+        result = benchmark.pedantic(run, rounds=3, iterations=1)
+        assert result['files_created'] == 2000
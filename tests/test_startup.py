@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools Başlangıç Ölçümleri Test Modülü
+Süreç başlangıcı ve aşama işaretleme testleri
+"""
+
+import time
+
+from pypdf_tools.features.startup import (
+    BRIDGE_READY, FIRST_PAGE, QT_INIT, StartupMetrics, process_start_time, startup_metrics
+)
+
+
+class TestStartupMetrics:
+    """Başlangıç ölçümleri testleri"""
+
+    def test_process_start_before_now(self):
+        """Süreç başlangıcı şimdiden önce ve makul bir geçmişte olmalı"""
+        started = process_start_time()
+        assert started <= time.monotonic()
+        assert time.monotonic() - started < 24 * 3600
+
+    def test_mark_once(self):
+        """Aşama yalnızca ilk işaretlemede kaydedilmeli"""
+        now = [10.0]
+        metrics = StartupMetrics(origin=8.5, clock=lambda: now[0])
+
+        assert metrics.mark('window_shown') == 1.5
+        now[0] = 11.25
+        assert metrics.mark(FIRST_PAGE) == 2.75
+        now[0] = 20.0
+        assert metrics.mark(FIRST_PAGE) is None
+
+        assert metrics.elapsed(FIRST_PAGE) == 2.75
+        assert metrics.elapsed('bridge_ready') is None
+        assert metrics.marks() == [('window_shown', 1.5), (FIRST_PAGE, 2.75)]
+
+    def test_report(self):
+        """Zaman çizelgesi aşamaları sırayla, toplam ve ara sürelerle vermeli"""
+        now = [0.0]
+        metrics = StartupMetrics(origin=0.0, clock=lambda: now[0])
+        for name, at in ((QT_INIT, 0.12), (BRIDGE_READY, 0.5), ('custom', 0.55)):
+            now[0] = at
+            metrics.mark(name)
+
+        lines = metrics.report().splitlines()
+        assert lines[0] == "Başlangıç zaman çizelgesi:"
+        assert lines[1].split() == ['Qt', 'başlatıldı', '120', 'ms', '(+120)']
+        assert lines[2].split() == ['Köprü', 'hazır', '500', 'ms', '(+380)']
+        assert lines[3].split() == ['custom', '550', 'ms', '(+50)']
+
+    def test_shared_metrics(self):
+        assert startup_metrics() is startup_metrics()
+        assert startup_metrics().origin <= time.monotonic()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools Sürümlü Durum Test Modülü
+JSON Patch farkları, sürümleme ve köprü mesaj boyutu testleri
+"""
+
+import copy
+import json
+
+import pytest
+
+from pypdf_tools.features.state import StateStore, apply_patch, diff
+
+
+def document_state(pages: int = 2000) -> dict:
+    """Sayfa listesi, yer işaretleri ve notlar içeren görüntüleyici durumu"""
+    return {
+        'filePath': '/docs/report.pdf',
+        'fileName': 'report.pdf',
+        'totalPages': pages,
+        'metadata': {'title': 'Report', 'author': 'PyPDF-Tools Test'},
+        'pages': [
+            {'number': index + 1, 'label': str(index + 1), 'width': 595.28,
+             'height': 841.89, 'rotation': 0, 'annotations': []}
+            for index in range(pages)
+        ],
+        'outline': [
+            {'title': f"Bölüm {index + 1}", 'page': index + 1, 'level': 0}
+            for index in range(pages)
+        ],
+    }
+
+
+def add_annotation(state: dict, page: int) -> None:
+    state['pages'][page - 1]['annotations'].append(
+        {'id': page, 'type': 'highlight', 'rect': [72, 700, 300, 712]}
+    )
+
+
+class TestDiff:
+    """Fark üretme ve uygulama testleri"""
+
+    @pytest.mark.parametrize('old, new', [
+        ({'a': 1}, {'a': 2}),
+        ({'a': 1, 'b': 2}, {'a': 1}),
+        ({'a': 1}, {'a': 1, 'c': {'d': [1, 2]}}),
+        ({'list': [1, 2, 3]}, {'list': [1, 5]}),
+        ({'list': [1]}, {'list': [1, 2, 3]}),
+        ({'a/b': 1, 'm~n': 2}, {'a/b': 3, 'm~n': 4}),
+        ({'a': {'b': 1}}, {'a': [1]}),
+        ([1, 2], {'root': True}),
+    ])
+    def test_round_trip(self, old, new):
+        """Fark eski duruma uygulanınca yeni durum elde edilmeli"""
+        patch = diff(old, new)
+
+        assert apply_patch(copy.deepcopy(old), patch) == new
+        # Yama JSON ile taşınabilir olmalı
+        assert json.loads(json.dumps(patch)) == patch
+
+    def test_minimal_patch(self):
+        """Değişmeyen alt ağaçlar yamaya girmemeli"""
+        old = document_state(50)
+        new = copy.deepcopy(old)
+        add_annotation(new, 7)
+        new['metadata']['title'] = 'Yeni'
+
+        assert diff(old, new) == [
+            {'op': 'replace', 'path': '/metadata/title', 'value': 'Yeni'},
+            {'op': 'add', 'path': '/pages/6/annotations/-',
+             'value': new['pages'][6]['annotations'][0]},
+        ]
+
+
+class TestStateStore:
+    """Sürümlü depo testleri"""
+
+    def test_snapshot_then_patches(self):
+        """İlk güncelleme anlık görüntü, sonrakiler sürümlü yama olmalı"""
+        store = StateStore()
+        state = document_state(10)
+
+        kind, message = store.update(state)
+        assert kind == 'snapshot'
+        assert json.loads(message) == {'version': 1, 'data': state}
+
+        # Çağıranın sözlüğü yerinde değiştirmesi depoyu etkilememeli
+        add_annotation(state, 3)
+        kind, message = store.update(state)
+        update = json.loads(message)
+        assert kind == 'patch'
+        assert (update['baseVersion'], update['version']) == (1, 2)
+        assert update['patch'][0]['path'] == '/pages/2/annotations/-'
+
+        assert store.update(state) == ('none', '')
+        assert store.version == 2
+        assert json.loads(store.snapshot()) == {'version': 2, 'data': state}
+
+    def test_resync_and_large_diff_send_snapshot(self):
+        """resync ve çok büyük farklar anlık görüntüye düşmeli"""
+        store = StateStore(max_patch_ops=5)
+        state = document_state(20)
+        store.update(state)
+
+        assert store.update(state, resync=True)[0] == 'snapshot'
+        for page in range(1, 11):
+            state['pages'][page - 1]['rotation'] = 90
+        assert store.update(state)[0] == 'snapshot'
+        assert store.version == 3
+
+    def test_patch_much_smaller_than_snapshot(self):
+        """2000 sayfada tek not eklemek birkaç yüz byte göndermeli"""
+        store = StateStore()
+        state = document_state(2000)
+        _kind, snapshot = store.update(state)
+
+        add_annotation(state, 1500)
+        _kind, patch = store.update(state)
+
+        assert len(patch) < 300
+        assert len(patch) * 1000 < len(snapshot)
+
+
+@pytest.mark.slow
+class TestStateBenchmark:
+    """2000 sayfalık belgede köprü mesajı boyutu ve gecikmesi"""
+
+    @pytest.mark.parametrize('mode', ['snapshot', 'patch'])
+    def test_annotation_update(self, benchmark, mode):
+        """Tek not eklenmesinin mesaj üretim gecikmesi ve boyutu"""
+        store = StateStore()
+        state = document_state(2000)
+        store.update(state)
+        page = [0]
+        benchmark.group = 'bridge-state-2000-pages'
+
+        def run():
+            page[0] = page[0] % 2000 + 1
+            add_annotation(state, page[0])
+            kind, message = store.update(state, resync=(mode == 'snapshot'))
+            # React tarafının ayrıştırma maliyeti de mesaj boyutuyla orantılı
+            json.loads(message)
+            return kind, message
+
+        kind, message = benchmark.pedantic(run, rounds=20, iterations=1)
+        benchmark.extra_info['message_bytes'] = len(message.encode('utf-8'))
+        assert kind == mode
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools Metin Çıkarma Test Modülü
+Sayfa akışı ve artımlı txt/json/ndjson/csv çıktısı testleri
+"""
+
+import csv
+import io
+import json
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from pypdf_tools.core.text import PageTextStream, write_page_text
+from pypdf_tools.cli.cli_handler import cli, extract_pdf_text
+
+
+class TestPageTextStream:
+    """PageTextStream ve write_page_text testleri"""
+
+    def test_pages_extracted_lazily(self, pdf_factory):
+        """Sayfa metni yalnızca istendiğinde çıkarılmalı"""
+        source = pdf_factory('doc.pdf', pages=5, title='Doc')
+
+        with patch('pypdf._page.PageObject.extract_text',
+                   return_value='metin') as extract:
+            with PageTextStream(source) as page_stream:
+                pages = iter(page_stream)
+                assert next(pages) == (1, 'metin')
+                assert extract.call_count == 1
+
+    @pytest.mark.parametrize('format', ['txt', 'json', 'ndjson', 'csv'])
+    def test_output_flushed_per_page(self, pdf_factory, format):
+        """Her sayfadan sonra akış boşaltılmalı"""
+        source = pdf_factory('doc.pdf', pages=4, title='Doc')
+        stream = io.StringIO()
+        flushed = []
+        stream.flush = lambda: flushed.append(stream.tell())
+
+        with PageTextStream(source) as page_stream:
+            result = write_page_text(page_stream, stream, format)
+
+        assert result['pages_processed'] == 4
+        # Her sayfa ve kapanış için bir boşaltma, her seferinde daha fazla veri
+        assert len(flushed) == 5
+        assert flushed == sorted(flushed) and flushed[0] > 0
+
+    def test_json_matches_extract_pdf_text(self, pdf_factory):
+        """Akışla yazılan JSON eski sonuçla aynı olmalı"""
+        source = pdf_factory('doc.pdf', pages=6, title='Doc')
+        stream = io.StringIO()
+
+        with PageTextStream(str(source), '2-4') as page_stream:
+            write_page_text(page_stream, stream, 'json')
+
+        expected = extract_pdf_text(str(source), '2-4', 'json')['text']
+        assert json.loads(stream.getvalue()) == expected
+
+    def test_ndjson_and_csv_rows(self, pdf_factory):
+        """NDJSON ve CSV her sayfa için bir kayıt içermeli"""
+        source = pdf_factory('doc.pdf', pages=3, title='Doc')
+
+        ndjson = io.StringIO()
+        with PageTextStream(source) as page_stream:
+            write_page_text(page_stream, ndjson, 'ndjson')
+        records = [json.loads(line) for line in ndjson.getvalue().splitlines()]
+        assert [record['page'] for record in records] == [1, 2, 3]
+        assert 'Doc page 2' in records[1]['text']
+
+        rows_stream = io.StringIO(newline='')
+        with PageTextStream(source) as page_stream:
+            write_page_text(page_stream, rows_stream, 'csv')
+        rows = list(csv.reader(io.StringIO(rows_stream.getvalue())))
+        assert rows[0] == ['page', 'text']
+        assert [row[0] for row in rows[1:]] == ['1', '2', '3']
+
+
+class TestParallelExtraction:
+    """--jobs ile işçi süreçlerinde metin çıkarma testleri"""
+
+    def test_parallel_preserves_page_order(self, pdf_factory):
+        """İşçi sayısı çıktıyı ve sırayı değiştirmemeli"""
+        source = pdf_factory('doc.pdf', pages=40, title='Doc')
+
+        with PageTextStream(source, 'odd, 30-') as page_stream:
+            serial = list(page_stream)
+        with PageTextStream(source, 'odd, 30-', jobs=3) as page_stream:
+            parallel = list(page_stream)
+
+        assert parallel == serial
+        assert [number for number, _text in parallel] == sorted(
+            number for number, _text in serial
+        )
+
+    def test_cli_jobs_option(self, pdf_factory):
+        """--jobs seçeneği kabul edilmeli"""
+        source = pdf_factory('doc.pdf', pages=20, title='Doc')
+
+        result = CliRunner().invoke(cli, ['extract-text', str(source), '-f', 'ndjson',
+                                          '--jobs', '2'])
+
+        assert result.exit_code == 0
+        pages = [json.loads(line)['page'] for line in result.stdout.splitlines()]
+        assert pages == list(range(1, 21))
+
+
+class TestExtractTextCommand:
+    """extract-text komutu testleri"""
+
+    def test_ndjson_to_file(self, pdf_factory, tmp_path):
+        """--output dosyasına NDJSON yazılmalı"""
+        source = pdf_factory('doc.pdf', pages=3, title='Doc')
+        output = tmp_path / 'pages.ndjson'
+
+        result = CliRunner().invoke(cli, ['extract-text', str(source), '-f', 'ndjson',
+                                          '-p', '2-3', '-o', str(output)])
+
+        assert result.exit_code == 0
+        lines = output.read_text(encoding='utf-8').splitlines()
+        assert [json.loads(line)['page'] for line in lines] == [2, 3]
+
+    def test_invalid_range(self, pdf_factory):
+        """Geçersiz aralık hata koduyla bitmeli"""
+        source = pdf_factory('doc.pdf', pages=3)
+
+        result = CliRunner().invoke(cli, ['extract-text', str(source), '-p', '7'])
+
+        assert result.exit_code == 1
+        assert 'aralık dışında' in result.stderr
+
+
+@pytest.mark.slow
+class TestExtractTextBenchmark:
+    """3.000 sayfalık metin ağırlıklı belgede işçi sayısı karşılaştırması"""
+
+    @pytest.mark.parametrize('jobs', [1, 2, 4, 8])
+    def test_extract_workers(self, benchmark, large_pdf_factory, jobs):
+        """1/2/4/8 işçi ile tüm belgenin NDJSON'a çıkarılma süresi"""
+        source = large_pdf_factory(pages=3000, text='Lorem ipsum dolor sit amet ' * 3,
+                                   lines=40)
+        benchmark.group = 'extract-text-3000-pages'
+
+        def run():
+            with PageTextStream(source, jobs=jobs) as page_stream:
+                return write_page_text(page_stream, io.StringIO(), 'ndjson')
+
+        result = benchmark.pedantic(run, rounds=2, iterations=1)
+        assert result['pages_processed'] == 3000
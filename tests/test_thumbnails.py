@@ -0,0 +1,181 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools Küçük Resim Test Modülü
+Paket dosyası, görünen aralık öncelikli üretim ve önbellek entegrasyonu testleri
+"""
+
+import pytest
+from PyQt6.QtCore import QCoreApplication
+from PyQt6.QtGui import QGuiApplication, QImage
+
+from pypdf_tools.core.cache import DocumentCache
+from pypdf_tools.features.render import TileRenderer
+from pypdf_tools.features.thumbnails import (
+    THUMBNAIL_WIDTH, ThumbnailPack, ThumbnailService, parse_thumbnail_path
+)
+
+
+@pytest.fixture(scope='module')
+def app():
+    """QtPdf ile işleme için Qt uygulaması"""
+    return QCoreApplication.instance() or QGuiApplication([])
+
+
+@pytest.fixture
+def service(app, tmp_path):
+    renderer = TileRenderer(DocumentCache(tmp_path / 'cache', shared=True))
+    thumbnails = ThumbnailService(renderer, DocumentCache(tmp_path / 'cache', shared=True))
+    yield thumbnails
+    thumbnails.close()
+    renderer.close()
+
+
+def open_document(service, source):
+    document = service.renderer.open_document(source)
+    service.open_document(document['digest'], len(document['pages']))
+    return document['digest']
+
+
+class TestThumbnailPack:
+    """Paket dosyası testleri"""
+
+    def test_parse_thumbnail_path(self):
+        assert parse_thumbnail_path('/abc/thumb/12.png') == ('abc', 12)
+        for path in ('/abc/thumbs/1.png', '/abc/thumb/1.jpg', '/abc/1/100/0/0_0.png'):
+            with pytest.raises(ValueError):
+                parse_thumbnail_path(path)
+
+    def test_round_trip_and_reopen(self, tmp_path):
+        """Yazılan sayfalar yeniden açılan paketten okunmalı"""
+        path = tmp_path / 'doc.pack'
+        pack = ThumbnailPack(path, pages=5)
+        assert pack.put(2, b'two')
+        assert pack.put(5, b'five!')
+        assert not pack.put(2, b'again')
+        pack.close()
+
+        pack = ThumbnailPack(path, pages=5)
+        try:
+            assert (pack.get(2), pack.get(5), pack.get(1)) == (b'two', b'five!', None)
+            assert len(pack) == 2
+            assert 2 in pack and 3 not in pack
+            assert pack.size == path.stat().st_size
+            with pytest.raises(ValueError):
+                pack.get(6)
+        finally:
+            pack.close()
+
+    def test_incompatible_pack_recreated(self, tmp_path):
+        """Sayfa sayısı veya genişlik farklı paket sıfırdan oluşturulmalı"""
+        path = tmp_path / 'doc.pack'
+        pack = ThumbnailPack(path, pages=3)
+        pack.put(1, b'data')
+        pack.close()
+
+        for pages, width in ((4, THUMBNAIL_WIDTH), (3, THUMBNAIL_WIDTH * 2)):
+            pack = ThumbnailPack(path, pages=pages, width=width)
+            assert len(pack) == 0
+            pack.close()
+
+
+class TestThumbnailService:
+    """Küçük resim servisi testleri"""
+
+    def test_thumbnail_rendered_once(self, service, pdf_factory):
+        """İlk istek işlenmeli, sonrakiler paketten okunmalı"""
+        digest = open_document(service, pdf_factory('doc.pdf', pages=2))
+
+        data = service.thumbnail(digest, 1)
+        image = QImage.fromData(data, 'PNG')
+        assert (image.width(), image.height()) == (THUMBNAIL_WIDTH, 283)
+        # Beyaz zemin (sol alt köşe boş)
+        assert image.pixelColor(0, image.height() - 1).lightness() == 255
+
+        assert service.thumbnail(digest, 1) == data
+        assert service.stats() == {'pack_hits': 1, 'renders': 1}
+
+    def test_shared_pack_owners(self, service, pdf_factory):
+        """Paket son sahibi bırakana kadar açık kalmalı"""
+        digest = open_document(service, pdf_factory('doc.pdf', pages=2))
+        service.open_document(digest, 2, owner='tab')
+
+        service.close_document(digest)
+        assert service.thumbnail(digest, 1).startswith(b'\x89PNG')
+
+        service.close_document(digest, owner='tab')
+        with pytest.raises(KeyError):
+            service.thumbnail(digest, 1)
+
+    def test_pack_persists_across_services(self, service, pdf_factory, tmp_path):
+        """Yeni süreçte küçük resimler yeniden işlenmemeli"""
+        source = pdf_factory('doc.pdf', pages=2)
+        digest = open_document(service, source)
+        data = service.thumbnail(digest, 2)
+        service.close_document(digest)
+
+        other = ThumbnailService(service.renderer, DocumentCache(tmp_path / 'cache', shared=True))
+        try:
+            other.open_document(digest, 2)
+            assert other.thumbnail(digest, 2) == data
+            assert other.stats() == {'pack_hits': 1, 'renders': 0}
+        finally:
+            other.close()
+
+    def test_visible_range_first(self, service, pdf_factory):
+        """Arka plan sırası görünen aralıktan dışa doğru olmalı"""
+        digest = open_document(service, pdf_factory('doc.pdf', pages=10))
+        service.thumbnail(digest, 8)
+
+        assert service.request(digest, 5, 6) == [5, 6, 7, 4, 3, 9, 2, 10, 1]
+        assert service.wait(30000)
+        assert service.request(digest, 1, 3) == []
+        assert service.renders == 10
+
+    def test_pack_counted_and_evicted_with_document(self, service, pdf_factory, tmp_path):
+        """Paket belge boyutuna sayılmalı ve belgeyle birlikte silinmeli"""
+        digest = open_document(service, pdf_factory('doc.pdf', pages=3))
+        for page in (1, 2, 3):
+            service.thumbnail(digest, page)
+        service.close_document(digest)
+
+        with DocumentCache(tmp_path / 'cache') as cache:
+            path = cache.thumbnail_path(digest)
+            assert cache.stats()['thumbnail_packs'] == 1
+            assert cache.stats()['bytes'] >= path.stat().st_size
+
+            cache.max_bytes = 0
+            assert cache.evict() == 1
+            assert not path.exists()
+
+    def test_unknown_document(self, service):
+        with pytest.raises(KeyError):
+            service.thumbnail('0' * 64, 1)
+        assert service.request('0' * 64, 1, 5) == []
+
+
+@pytest.mark.slow
+class TestThumbnailBenchmark:
+    """Kenar çubuğunun ilk ekranı: işleme ve paketten okuma"""
+
+    @pytest.mark.parametrize('mode', ['render', 'pack'])
+    def test_first_screen(self, benchmark, service, large_pdf_factory, mode):
+        """İlk 8 küçük resim"""
+        digest = open_document(service, large_pdf_factory(200, text='Lorem ipsum', lines=40))
+        benchmark.group = 'thumbnails-first-screen'
+        pack_path = service._packs[digest].path
+
+        def reset():
+            if mode == 'render':
+                service.close_document(digest)
+                pack_path.unlink()
+                service.open_document(digest, 200)
+
+        def run():
+            return [service.thumbnail(digest, page) for page in range(1, 9)]
+
+        if mode == 'pack':
+            run()
+        thumbnails = benchmark.pedantic(run, setup=reset, rounds=10, iterations=1)
+        assert len(thumbnails) == 8
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+PyPDF-Tools İş Parçacıkları Test Modülü
+Paylaşımlı havuz ve sıralı kuyruk testleri
+"""
+
+import threading
+
+import pytest
+from PyQt6.QtCore import QCoreApplication, QRunnable, QThreadPool
+
+from pypdf_tools.features.workers import MAX_WORKERS, SerialQueue, default_worker_pool
+
+
+class Task(QRunnable):
+    """Çalıştığını kaydeden, istenirse serbest bırakılana kadar bekleyen görev"""
+
+    def __init__(self, name, log, release=None, started=None):
+        super().__init__()
+        self.name, self.log = name, log
+        self.release, self.started = release, started
+
+    def run(self):
+        if self.started is not None:
+            self.started.set()
+        if self.release is not None:
+            self.release.wait(5)
+        self.log.append((self.name, threading.get_ident()))
+
+
+@pytest.fixture(scope='module')
+def app():
+    """Genel havuz için Qt uygulaması"""
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+@pytest.fixture
+def pool():
+    pool = QThreadPool()
+    pool.setMaxThreadCount(4)
+    yield pool
+    pool.waitForDone()
+
+
+class TestSerialQueue:
+    """Sıralı kuyruk testleri"""
+
+    def test_runs_one_at_a_time_in_priority_order(self, pool):
+        """Görevler aynı anda tek tek, öncelik ve eklenme sırasıyla çalışmalı"""
+        log, release, started = [], threading.Event(), threading.Event()
+        queue = SerialQueue(pool=pool)
+        queue.start(Task('first', log, release, started))
+        assert started.wait(5)
+        for name, priority in (('low', 0), ('high', 2), ('mid', 1), ('low2', 0)):
+            queue.start(Task(name, log), priority)
+        assert len(queue) == 4
+
+        release.set()
+        assert queue.wait(5000)
+        assert [name for name, _thread in log] == ['first', 'high', 'mid', 'low', 'low2']
+
+    def test_clear_keeps_running_task(self, pool):
+        """clear yalnızca bekleyen görevleri atmalı"""
+        log, release, started = [], threading.Event(), threading.Event()
+        queue = SerialQueue(pool=pool)
+        queue.start(Task('running', log, release, started))
+        assert started.wait(5)
+        queue.start(Task('pending', log))
+
+        queue.clear()
+        assert not queue.wait(50)
+        release.set()
+        assert queue.wait(5000)
+        assert [name for name, _thread in log] == ['running']
+
+    def test_queues_share_pool(self):
+        """Kuyruklar tek iş parçacıklı havuzda sırayla ilerlemeli"""
+        pool = QThreadPool()
+        pool.setMaxThreadCount(1)
+        log = []
+        queues = [SerialQueue(pool=pool) for _ in range(2)]
+        for queue in queues:
+            queue.start(Task('a', log))
+            queue.start(Task('b', log))
+
+        assert all(queue.wait(5000) for queue in queues)
+        pool.waitForDone()
+        assert len(log) == 4
+        assert len({thread for _name, thread in log}) == 1
+
+    def test_default_pool(self, app):
+        """Havuz verilmeyen kuyruk Qt'nin genel havuzunu kullanmalı"""
+        assert default_worker_pool() is QThreadPool.globalInstance()
+        assert 1 <= default_worker_pool().maxThreadCount() <= MAX_WORKERS
+
+        log = []
+        queue = SerialQueue()
+        queue.start(Task('a', log))
+        assert queue.wait(5000)
+        assert [name for name, _thread in log] == ['a']
@@ -15,6 +15,8 @@ const App = () => {
     darkMode: false
   });
   const [error, setError] = useState(null);
+  // Arka planda çalışan işler: jobId -> { toolId, status, percent }
+  const [jobs, setJobs] = useState({});
   
   // Refs
   const pdfViewerRef = useRef(null);
@@ -25,8 +27,14 @@ const App = () => {
     window.ReactApp = {
       onBridgeReady: handleBridgeReady,
       onPdfDataChanged: handlePdfDataChanged,
+      onPdfStatePatched: handlePdfStatePatched,
       onThemeChanged: handleThemeChanged,
       onSettingsChanged: handleSettingsChanged,
+      onJobStarted: handleJobStarted,
+      onJobProgress: handleJobProgress,
+      onJobFinished: handleJobFinished,
+      onSearchResults: (message) => pdfViewerRef.current?.applySearchResults(message),
+      onSearchIndexProgress: (message) => pdfViewerRef.current?.setSearchIndexProgress(message),
       // PDF viewer methods
       getCurrentPage: () => pdfViewerRef.current?.getCurrentPage(),
       getTotalPages: () => pdfViewerRef.current?.getTotalPages(),
@@ -35,6 +43,9 @@ const App = () => {
       resetZoom: () => pdfViewerRef.current?.resetZoom(),
       rotatePage: () => pdfViewerRef.current?.rotatePage(),
     };
+    
+    // Python bekleyen güncellemeleri bu el sıkışmadan sonra gönderir
+    window.pypdfTools?.onReactReady?.();
 
     return () => {
       window.ReactApp = null;
@@ -68,6 +79,11 @@ const App = () => {
     }
   }, []);
 
+  // Aynı belgede durum farkı geldiğinde; PDF yeniden yüklenmez
+  const handlePdfStatePatched = useCallback((data) => {
+    setPdfData(data);
+  }, []);
+
   // Tema değiştiğinde
   const handleThemeChanged = useCallback((theme) => {
     console.log('Theme changed to:', theme);
@@ -81,6 +97,44 @@ const App = () => {
     setSettings(prev => ({ ...prev, ...newSettings }));
   }, []);
 
+  // Arka plan işi başladığında
+  const handleJobStarted = useCallback(({ jobId, toolId }) => {
+    setJobs(prev => ({
+      ...prev,
+      [jobId]: { ...prev[jobId], toolId, status: 'running', percent: 0 }
+    }));
+  }, []);
+
+  // Arka plan işi ilerlediğinde
+  const handleJobProgress = useCallback(({ jobId, toolId, percent }) => {
+    setJobs(prev => ({
+      ...prev,
+      [jobId]: { ...prev[jobId], toolId, status: 'running', percent }
+    }));
+  }, []);
+
+  // Arka plan işi bittiğinde
+  const handleJobFinished = useCallback((message) => {
+    setJobs(prev => {
+      const { [message.jobId]: _finished, ...rest } = prev;
+      return rest;
+    });
+    if (message.status === 'failed') {
+      setError(`Tool error: ${message.error}`);
+    } else if (message.status === 'done') {
+      console.log(`Job ${message.jobId} (${message.toolId}) finished:`, message.result);
+    }
+  }, []);
+
+  // Arka plan işini iptal et
+  const handleCancelJob = useCallback(async (jobId) => {
+    try {
+      await window.pypdfTools.cancelJob(jobId);
+    } catch (err) {
+      console.error('Job cancel error:', err);
+    }
+  }, []);
+
   // Tool action handler
   const handleToolAction = useCallback(async (toolId, data) => {
     if (!window.pypdfTools.bridge) {
@@ -101,6 +155,16 @@ const App = () => {
       if (response.success) {
         console.log(`Tool ${toolId} executed successfully:`, response.result);
         
+        // Ağır araçlar iş kimliği döndürür; sonuç jobFinished ile gelir
+        if (response.result && response.result.jobId) {
+          const { jobId } = response.result;
+          setJobs(prev => ({
+            ...prev,
+            [jobId]: { toolId, status: 'queued', percent: 0, ...prev[jobId] }
+          }));
+          return;
+        }
+
         // Sonucu UI'da işle
         if (response.result) {
           if (response.result.zoom !== undefined) {
@@ -122,12 +186,43 @@ const App = () => {
   }, [settings]);
 
   // Sayfa değişikliği handler
-  const handlePageChange = useCallback((pageNumber) => {
+  const handlePageChange = useCallback((pageNumber, view = {}) => {
     console.log('Page changed to:', pageNumber);
     
     // Python'a bildir
     if (window.pypdfTools.notifyPageChange) {
-      window.pypdfTools.notifyPageChange(pageNumber);
+      window.pypdfTools.notifyPageChange(pageNumber, view);
+    }
+  }, []);
+
+  // İlk sayfa karosu çizildi (başlangıç ölçümü)
+  const handleFirstPagePainted = useCallback(() => {
+    window.pypdfTools.notifyFirstPagePainted?.();
+  }, []);
+
+  // Kenar çubuğunda görünen küçük resim aralığı
+  const handleThumbnailsVisible = useCallback((first, last) => {
+    if (window.pypdfTools.requestThumbnails) {
+      window.pypdfTools.requestThumbnails(first, last);
+    }
+  }, []);
+
+  // Belge içi arama; boş sorgu süren aramayı iptal eder
+  const handleSearch = useCallback(async (query) => {
+    if (!query) {
+      window.pypdfTools.cancelSearch?.();
+      return null;
+    }
+    try {
+      const response = JSON.parse(await window.pypdfTools.search(query));
+      if (!response.success) {
+        console.error('Search error:', response.error);
+        return null;
+      }
+      return response.queryId;
+    } catch (err) {
+      console.error('Search error:', err);
+      return null;
     }
   }, []);
 
@@ -217,6 +312,25 @@ const App = () => {
               ↻
             </button>
           </div>
+
+          {/* Arka plan işleri */}
+          {Object.keys(jobs).length > 0 && (
+            <div className="job-list">
+              {Object.entries(jobs).map(([jobId, job]) => (
+                <div key={jobId} className="job-item">
+                  <span className="job-tool">{job.toolId}</span>
+                  <progress max="100" value={job.percent || 0} />
+                  <button
+                    onClick={() => handleCancelJob(jobId)}
+                    className="tool-button"
+                    title="İptal"
+                  >
+                    ✕
+                  </button>
+                </div>
+              ))}
+            </div>
+          )}
         </div>
       </header>
 
@@ -231,6 +345,9 @@ const App = () => {
             onToolAction={handleToolAction}
             onPageChange={handlePageChange}
             onAnnotationAdd={handleAnnotationAdd}
+            onThumbnailsVisible={handleThumbnailsVisible}
+            onSearch={handleSearch}
+            onFirstPagePainted={handleFirstPagePainted}
             isLoading={isLoading}
           />
         ) : (
@@ -7,6 +7,23 @@ import {
   Layers, Grid3X3, Bookmark, Share2, Settings, RefreshCw,
   FileText, Save, Printer, Mail, Cloud, Users, Target, Wand2
 } from 'lucide-react';
+import ThumbnailList from './ThumbnailList';
+import TiledPage, { CSS_SCALE } from './TiledPage';
+
+// Yazma durduktan sonra aramanın başlatılmasından önceki bekleme (ms)
+const SEARCH_DEBOUNCE = 250;
+
+// Nokta cinsinden vurgu kutusunu döndürülmüş sayfanın CSS piksellerine çevir
+const hitStyle = ([x, y, w, h], [pageWidth, pageHeight], zoom, rotation) => {
+  const scale = (zoom / 100) * CSS_SCALE;
+  const [left, top, width, height] = {
+    0: [x, y, w, h],
+    90: [pageHeight - y - h, x, h, w],
+    180: [pageWidth - x - w, pageHeight - y - h, w, h],
+    270: [y, pageWidth - x - w, h, w]
+  }[rotation];
+  return { left: left * scale, top: top * scale, width: width * scale, height: height * scale };
+};
 
 // PyPDF-Tools'a entegre PDF Viewer Component
 const EmbeddedPDFViewer = forwardRef(({
@@ -14,6 +31,9 @@ const EmbeddedPDFViewer = forwardRef(({
   onToolAction,
   onPageChange,
   onAnnotationAdd,
+  onThumbnailsVisible,
+  onSearch,
+  onFirstPagePainted,
   theme = 'light',
   settings = {},
   isLoading = false,
@@ -31,6 +51,8 @@ const EmbeddedPDFViewer = forwardRef(({
   const [annotations, setAnnotations] = useState([]);
   const [searchTerm, setSearchTerm] = useState('');
   const [searchResults, setSearchResults] = useState([]);
+  const [searchStatus, setSearchStatus] = useState(null);
+  const [searchIndex, setSearchIndex] = useState(null);
   const [selectedText, setSelectedText] = useState('');
   const [bookmarks, setBookmarks] = useState([]);
 
@@ -53,6 +75,8 @@ const EmbeddedPDFViewer = forwardRef(({
   // Refs
   const canvasRef = useRef(null);
   const viewerRef = useRef(null);
+  // Güncel sorgu; eski sorgulardan gelen sonuçlar atılır
+  const searchQueryRef = useRef({ query: '', queryId: null });
 
   // Imperative handle for parent component
   useImperativeHandle(ref, () => ({
@@ -67,8 +91,24 @@ const EmbeddedPDFViewer = forwardRef(({
     resetZoom: () => setZoom(100),
     rotatePage: () => setRotation(prev => (prev + 90) % 360),
     goToPage: (page) => goToPage(page),
+    applySearchResults: (message) => {
+      const current = searchQueryRef.current;
+      if (message.query !== current.query || (current.queryId && message.queryId !== current.queryId)) {
+        return;
+      }
+      if (message.results.length) {
+        setSearchResults(prev => [...prev, ...message.results]);
+      }
+      setSearchStatus({
+        searched: message.searched,
+        total: message.total,
+        done: message.done,
+        truncated: message.truncated
+      });
+    },
+    setSearchIndexProgress: ({ indexed, total }) => setSearchIndex({ indexed, total }),
     loadPDF: async (filePath) => {
-      // Mock PDF loading - gerçek implementasyon PDF.js kullanmalı
+      // Belge Python tarafında açılır; sayfalar pdfData.tileUrl karolarından çizilir
       console.log('Loading PDF:', filePath);
       return Promise.resolve();
     }
@@ -88,12 +128,20 @@ const EmbeddedPDFViewer = forwardRef(({
     }
   }, [pdfData]);
 
+  // Effect: Yeni belge son görüntülenen sayfada açılır
+  useEffect(() => {
+    if (pdfData?.filePath) {
+      setCurrentPage(Math.min(pdfData.lastPage || 1, pdfData.totalPages || 1));
+    }
+  }, [pdfData?.filePath]);
+
   // Effect: Notify parent of page changes
+  // Zoom ve döndürme de gönderilir; Python sıradaki sayfaları bu görünümde önden işler
   useEffect(() => {
     if (onPageChange) {
-      onPageChange(currentPage);
+      onPageChange(currentPage, { zoom, rotation });
     }
-  }, [currentPage, onPageChange]);
+  }, [currentPage, zoom, rotation, onPageChange]);
 
   // Theme configuration
   const getThemeClasses = () => {
@@ -269,6 +317,64 @@ const EmbeddedPDFViewer = forwardRef(({
     return () => window.removeEventListener('keydown', handleKeyPress);
   }, [currentPage, totalPages, pdfData]);
 
+  // Effect: Arama kutusu; yazma durunca Python'da arama başlatılır
+  useEffect(() => {
+    const query = searchTerm.trim();
+    searchQueryRef.current = { query, queryId: null };
+    setSearchResults([]);
+    setSearchStatus(null);
+    if (!onSearch) return;
+    if (!query) {
+      onSearch('');
+      return;
+    }
+
+    const timer = setTimeout(async () => {
+      const queryId = await onSearch(query);
+      if (searchQueryRef.current.query === query) {
+        searchQueryRef.current = { query, queryId };
+      }
+    }, SEARCH_DEBOUNCE);
+    return () => clearTimeout(timer);
+  }, [searchTerm, pdfData?.tileUrl, onSearch]);
+
+  // Geçerli sayfadaki arama eşleşmelerinin vurguları
+  const pageHits = pdfData?.pageSizes?.[currentPage - 1]
+    ? searchResults
+        .filter(result => result.page === currentPage)
+        .flatMap(result => result.hits)
+        .flatMap((rects, hitIndex) => rects.map((rect, rectIndex) => (
+          <div
+            key={`hit-${hitIndex}-${rectIndex}`}
+            className="absolute pointer-events-none bg-yellow-300 opacity-40"
+            style={hitStyle(rect, pdfData.pageSizes[currentPage - 1], zoom, rotation)}
+          />
+        )))
+    : [];
+
+  // Geçerli sayfanın notları (karolu ve simüle sayfada ortak)
+  const pageAnnotations = annotations
+    .filter(ann => ann.page === currentPage)
+    .map(annotation => (
+      <div
+        key={annotation.id}
+        className="absolute rounded transition-all hover:shadow-md"
+        style={{
+          left: annotation.position?.x || 100,
+          top: annotation.position?.y || 100,
+          backgroundColor: annotation.color,
+          padding: annotation.type === 'highlight' ? '2px 4px' : '4px 8px',
+        }}
+      >
+        {annotation.type === 'text-note' && (
+          <div className="text-sm text-black">{annotation.content}</div>
+        )}
+        {annotation.type === 'sticky-note' && (
+          <MessageSquare className="w-4 h-4" />
+        )}
+      </div>
+    ));
+
   // Loading state
   if (isLoading) {
     return (
@@ -324,7 +430,22 @@ const EmbeddedPDFViewer = forwardRef(({
 
         {/* Sidebar Content */}
         <div className="flex-1 overflow-y-auto p-2">
-          {sidebarTab === 'thumbnails' && (
+          {sidebarTab === 'thumbnails' && pdfData?.thumbnailUrl && (
+            <div>
+              <div className="text-sm font-medium mb-2">Sayfa Küçük Resimleri</div>
+              <ThumbnailList
+                thumbnailUrl={pdfData.thumbnailUrl}
+                pageSizes={pdfData.pageSizes}
+                totalPages={totalPages}
+                currentPage={currentPage}
+                onSelect={setCurrentPage}
+                onVisibleRange={onThumbnailsVisible}
+                themeClasses={themeClasses}
+              />
+            </div>
+          )}
+
+          {sidebarTab === 'thumbnails' && !pdfData?.thumbnailUrl && (
             <div className="space-y-2">
               <div className="text-sm font-medium mb-2">Sayfa Küçük Resimleri</div>
               {Array.from({ length: totalPages }, (_, i) => (
@@ -349,7 +470,18 @@ const EmbeddedPDFViewer = forwardRef(({
           {sidebarTab === 'bookmarks' && (
             <div className="space-y-2">
               <div className="text-sm font-medium mb-2">Yer İşaretleri</div>
-              {bookmarks.length === 0 ? (
+              {pdfData?.outline?.map((entry, index) => (
+                <div
+                  key={`outline-${index}`}
+                  onClick={() => goToPage(entry.page)}
+                  className={`p-2 rounded cursor-pointer ${themeClasses.button}`}
+                  style={{ paddingLeft: `${0.5 + entry.level}rem` }}
+                >
+                  <div className="text-sm">{entry.title}</div>
+                  <div className="text-xs opacity-70">Sayfa {entry.page}</div>
+                </div>
+              ))}
+              {bookmarks.length === 0 && !pdfData?.outline?.length ? (
                 <div className="text-xs opacity-70 text-center py-4">
                   Henüz yer işareti eklenmedi
                 </div>
@@ -401,14 +533,28 @@ const EmbeddedPDFViewer = forwardRef(({
                   className={`w-full pl-8 pr-3 py-2 text-sm border rounded ${themeClasses.button} ${themeClasses.border} focus:outline-none focus:ring-2 focus:ring-blue-500`}
                 />
               </div>
-              {searchResults.map((result, index) => (
+              {searchStatus && (
+                <div className="text-xs opacity-70">
+                  {searchStatus.done
+                    ? `${searchResults.length} sayfada eşleşme${searchStatus.truncated ? ' (ilk sonuçlar)' : ''}`
+                    : `Aranıyor... ${searchStatus.searched}/${searchStatus.total}`}
+                </div>
+              )}
+              {searchIndex && searchIndex.indexed < searchIndex.total && (
+                <div className="text-xs opacity-50">
+                  Dizinleniyor: {searchIndex.indexed}/{searchIndex.total}
+                </div>
+              )}
+              {searchResults.map(result => (
                 <div
-                  key={index}
-                  onClick={() => setCurrentPage(result.page)}
-                  className={`p-2 cursor-pointer rounded ${themeClasses.button}`}
+                  key={result.page}
+                  onClick={() => goToPage(result.page)}
+                  className={`p-2 cursor-pointer rounded ${
+                    currentPage === result.page ? themeClasses.accent : themeClasses.button
+                  }`}
                 >
                   <div className="text-sm font-medium">Sayfa {result.page}</div>
-                  <div className="text-xs opacity-70">{result.context}</div>
+                  <div className="text-xs opacity-70">{result.hits.length} eşleşme</div>
                 </div>
               ))}
             </div>
@@ -517,6 +663,28 @@ const EmbeddedPDFViewer = forwardRef(({
         {/* PDF Viewer Ana Alanı */}
         <div className="flex-1 overflow-auto p-4 bg-gray-100 dark:bg-gray-900">
           <div className="flex justify-center">
+            {pdfData?.tileUrl && pdfData.pageSizes?.[currentPage - 1] ? (
+              // Python'da işlenen karolar; zoom ve döndürme karolara uygulanmış gelir
+              <div ref={viewerRef} className="relative shadow-lg">
+                <TiledPage
+                  tileUrl={pdfData.tileUrl}
+                  tileSize={pdfData.tileSize}
+                  pageSize={pdfData.pageSizes[currentPage - 1]}
+                  page={currentPage}
+                  zoom={zoom}
+                  rotation={rotation}
+                  onTileLoad={onFirstPagePainted}
+                >
+                  {pageHits}
+                  {pageAnnotations}
+                </TiledPage>
+              </div>
+            ) : pdfData?.loadStage === 'header' && !pdfData.encrypted ? (
+              // Belge Python tarafında açılıyor; sayfa boyutları gelince karolar çizilir
+              <div className="flex items-center justify-center w-96 h-[32rem] bg-white shadow-lg text-gray-500">
+                <div className="text-sm opacity-70">Belge açılıyor...</div>
+              </div>
+            ) : (
             <div
               ref={viewerRef}
               className="relative bg-white shadow-lg transition-transform"
@@ -554,27 +722,7 @@ const EmbeddedPDFViewer = forwardRef(({
                     <div className="h-3 bg-gray-300 rounded w-2/3 animate-pulse"></div>
                     
                     {/* Render annotations */}
-                    {annotations
-                      .filter(ann => ann.page === currentPage)
-                      .map(annotation => (
-                        <div
-                          key={annotation.id}
-                          className="absolute rounded transition-all hover:shadow-md"
-                          style={{
-                            left: annotation.position?.x || 100,
-                            top: annotation.position?.y || 100,
-                            backgroundColor: annotation.color,
-                            padding: annotation.type === 'highlight' ? '2px 4px' : '4px 8px',
-                          }}
-                        >
-                          {annotation.type === 'text-note' && (
-                            <div className="text-sm text-black">{annotation.content}</div>
-                          )}
-                          {annotation.type === 'sticky-note' && (
-                            <MessageSquare className="w-4 h-4" />
-                          )}
-                        </div>
-                      ))}
+                    {pageAnnotations}
                   </div>
                 </div>
 
@@ -584,6 +732,7 @@ const EmbeddedPDFViewer = forwardRef(({
                 </div>
               </div>
             </div>
+            )}
           </div>
         </div>
 
@@ -0,0 +1,71 @@
+import React, { useEffect, useRef } from 'react';
+
+// Görünen aralığın Python'a bildirilmesinden önceki bekleme (ms)
+const RANGE_DEBOUNCE = 150;
+
+// Python'da üretilen küçük resimlerle sayfa listesi
+// Görüntüler loading="lazy" ile yalnızca görünüme yaklaşınca istenir;
+// görünen aralık bildirilir ve arka plan üretimi oradan başlar.
+const ThumbnailList = ({
+  thumbnailUrl, pageSizes, totalPages, currentPage, onSelect, onVisibleRange, themeClasses
+}) => {
+  const listRef = useRef(null);
+
+  useEffect(() => {
+    if (!listRef.current || !onVisibleRange) return;
+
+    const visible = new Set();
+    let timer = null;
+    const observer = new IntersectionObserver(entries => {
+      entries.forEach(entry => {
+        const page = Number(entry.target.dataset.page);
+        entry.isIntersecting ? visible.add(page) : visible.delete(page);
+      });
+      clearTimeout(timer);
+      timer = setTimeout(() => {
+        if (visible.size) {
+          onVisibleRange(Math.min(...visible), Math.max(...visible));
+        }
+      }, RANGE_DEBOUNCE);
+    });
+
+    listRef.current.querySelectorAll('[data-page]').forEach(item => observer.observe(item));
+    return () => {
+      clearTimeout(timer);
+      observer.disconnect();
+    };
+  }, [thumbnailUrl, totalPages, onVisibleRange]);
+
+  return (
+    <div ref={listRef} className="space-y-2">
+      {Array.from({ length: totalPages }, (_, i) => {
+        const [width, height] = pageSizes?.[i] || [3, 4];
+        return (
+          <div
+            key={i + 1}
+            data-page={i + 1}
+            onClick={() => onSelect(i + 1)}
+            className={`relative p-2 border rounded cursor-pointer transition-all ${
+              currentPage === i + 1
+                ? `${themeClasses.accent} border-blue-500`
+                : `${themeClasses.button} ${themeClasses.border}`
+            }`}
+          >
+            <img
+              src={`${thumbnailUrl}/${i + 1}.png`}
+              alt={`Sayfa ${i + 1}`}
+              loading="lazy"
+              decoding="async"
+              draggable={false}
+              className="w-full bg-white rounded mb-1"
+              style={{ aspectRatio: `${width} / ${height}` }}
+            />
+            <div className="text-xs text-center">Sayfa {i + 1}</div>
+          </div>
+        );
+      })}
+    </div>
+  );
+};
+
+export default ThumbnailList;
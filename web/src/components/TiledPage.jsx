@@ -0,0 +1,56 @@
+import React, { useMemo } from 'react';
+
+// %100 yakınlaştırmada nokta başına CSS pikseli (Python: render.CSS_SCALE)
+export const CSS_SCALE = 96 / 72;
+
+// Sayfanın döndürülmüş piksel boyutu (Python: render.page_pixel_size)
+export const pagePixelSize = ([width, height], zoom, rotation) => {
+  const scale = (zoom / 100) * CSS_SCALE;
+  const pixels = [Math.round(width * scale), Math.round(height * scale)];
+  return rotation % 180 === 0 ? pixels : [pixels[1], pixels[0]];
+};
+
+// Python tarafında işlenen karolardan oluşan sayfa
+// Karolar pdftile: şemasından gelir; loading="lazy" ile yalnızca görünüme
+// yaklaşan karolar istenir, daha önce işlenmiş karolar önbellekten döner.
+const TiledPage = ({ tileUrl, tileSize, pageSize, page, zoom, rotation, onTileLoad, children }) => {
+  const [width, height] = pagePixelSize(pageSize, zoom, rotation);
+
+  const tiles = useMemo(() => {
+    const result = [];
+    for (let row = 0; row * tileSize < height; row++) {
+      for (let col = 0; col * tileSize < width; col++) {
+        result.push({
+          key: `${col}_${row}`,
+          src: `${tileUrl}/${page}/${zoom}/${rotation}/${col}_${row}.png`,
+          left: col * tileSize,
+          top: row * tileSize,
+          width: Math.min(tileSize, width - col * tileSize),
+          height: Math.min(tileSize, height - row * tileSize)
+        });
+      }
+    }
+    return result;
+  }, [tileUrl, tileSize, page, zoom, rotation, width, height]);
+
+  return (
+    <div className="relative bg-white" style={{ width, height }}>
+      {tiles.map(tile => (
+        <img
+          key={tile.key}
+          src={tile.src}
+          alt=""
+          loading="lazy"
+          decoding="async"
+          draggable={false}
+          onLoad={onTileLoad}
+          className="absolute select-none"
+          style={{ left: tile.left, top: tile.top, width: tile.width, height: tile.height }}
+        />
+      ))}
+      {children}
+    </div>
+  );
+};
+
+export default TiledPage;